@@ -1,28 +1,34 @@
+from collections.abc import Sequence
 from uuid import UUID
 
-from app.application.dto.city import NewCityDTO, UpdatedCityDTO
-from app.application.errors import EntityNotExistsError
-from app.application.interface.city.city import CityReader, CitySaver, CityUpdater
-from app.application.interface.district.district import DistrictReader
+from app.application.dto.city import CreatedCityDTO, NewCityDTO, UpdatedCityDTO
+from app.application.interface.city.city import CitySaver, CityUpdater
+from app.application.interface.stats.stats import PopulationStatsRefresher
+from app.application.interface.transaction import TransactionManager
 from app.application.interface.uuid_generator import UUIDGenerator
+from app.application.interface.version.version import VersionBumper
+from app.application.versions import CITIES, district_cities
 from app.domain.entities.city import CityDM
 
+MAX_BATCH_SIZE = 1000
+
 
 class CreateCityCommand:
     def __init__(
         self,
         city_gateway: CitySaver,
-        district_gateway: DistrictReader,
         uuid_generator: UUIDGenerator,
+        stats_refresher: PopulationStatsRefresher,
+        version_gateway: VersionBumper,
+        transaction_manager: TransactionManager,
     ):
         self._city_gateway = city_gateway
-        self._district_gateway = district_gateway
         self._uuid_generator = uuid_generator
+        self._stats_refresher = stats_refresher
+        self._version_gateway = version_gateway
+        self._transaction_manager = transaction_manager
 
     async def __call__(self, city_dto: NewCityDTO) -> UUID:
-        if await self._district_gateway.get_by_uuid(city_dto.district_id) is None:
-            raise EntityNotExistsError
-
         city_id = self._uuid_generator()
         city = CityDM(
             id=city_id,
@@ -33,27 +39,76 @@ class CreateCityCommand:
         )
 
         await self._city_gateway.save(city)
+        await self._version_gateway.bump([CITIES, district_cities(city.district_id)])
+        await self._transaction_manager.commit()
+        self._stats_refresher.request_refresh()
         return city_id
 
 
-class UpdateCityCommand:
+class CreateCitiesBatchCommand:
     def __init__(
         self,
-        city_read_gateway: CityReader,
-        city_update_gateway: CityUpdater,
-        district_gateway: DistrictReader,
+        city_gateway: CitySaver,
+        uuid_generator: UUIDGenerator,
+        stats_refresher: PopulationStatsRefresher,
+        version_gateway: VersionBumper,
+        transaction_manager: TransactionManager,
     ):
-        self._city_read_gateway = city_read_gateway
-        self._city_update_gateway = city_update_gateway
-        self._district_gateway = district_gateway
+        self._city_gateway = city_gateway
+        self._uuid_generator = uuid_generator
+        self._stats_refresher = stats_refresher
+        self._version_gateway = version_gateway
+        self._transaction_manager = transaction_manager
 
-    async def __call__(self, city_dto: UpdatedCityDTO):
-        if await self._district_gateway.get_by_uuid(city_dto.district_id) is None:
-            raise EntityNotExistsError('District does not exist')
+    async def __call__(
+        self, city_dtos: Sequence[NewCityDTO]
+    ) -> Sequence[CreatedCityDTO]:
+        if not city_dtos:
+            return []
+
+        cities = [
+            CityDM(
+                id=self._uuid_generator(),
+                district_id=city_dto.district_id,
+                name=city_dto.name,
+                obj_type=city_dto.obj_type,
+                population=city_dto.population,
+            )
+            for city_dto in city_dtos
+        ]
+
+        # Cities whose district is missing or deleted are skipped by the insert.
+        saved_ids = await self._city_gateway.save_many(cities)
+        saved = [city for city in cities if city.id in saved_ids]
+        if saved:
+            await self._version_gateway.bump(
+                [CITIES, *(district_cities(city.district_id) for city in saved)]
+            )
+            await self._transaction_manager.commit()
+            self._stats_refresher.request_refresh()
 
-        if await self._city_read_gateway.get_by_uuid(city_dto.city_id) is None:
-            raise EntityNotExistsError('City does not exist')
+        return [
+            CreatedCityDTO(city_id=city.id)
+            if city.id in saved_ids
+            else CreatedCityDTO(error='District not found')
+            for city in cities
+        ]
 
+
+class UpdateCityCommand:
+    def __init__(
+        self,
+        city_gateway: CityUpdater,
+        stats_refresher: PopulationStatsRefresher,
+        version_gateway: VersionBumper,
+        transaction_manager: TransactionManager,
+    ):
+        self._city_gateway = city_gateway
+        self._stats_refresher = stats_refresher
+        self._version_gateway = version_gateway
+        self._transaction_manager = transaction_manager
+
+    async def __call__(self, city_dto: UpdatedCityDTO):
         city = CityDM(
             id=city_dto.city_id,
             district_id=city_dto.district_id,
@@ -61,6 +116,14 @@ class UpdateCityCommand:
             obj_type=city_dto.obj_type,
             population=city_dto.population,
         )
-        await self._city_update_gateway.update_by_uuid(city)
+        previous_district_id = await self._city_gateway.update_by_uuid(city)
+
+        # The city may move, so the list of the district it leaves changes too.
+        versions = [CITIES, district_cities(city.district_id)]
+        if previous_district_id != city.district_id:
+            versions.append(district_cities(previous_district_id))
+        await self._version_gateway.bump(versions)
+        await self._transaction_manager.commit()
+        self._stats_refresher.request_refresh()
 
         return city.id
@@ -10,6 +10,12 @@ class NewCityDTO:
     population: int
 
 
+@dataclass(slots=True)
+class CreatedCityDTO:
+    city_id: uuid.UUID | None = None
+    error: str | None = None
+
+
 @dataclass(slots=True)
 class UpdatedCityDTO:
     city_id: uuid.UUID
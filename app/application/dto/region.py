@@ -1,7 +1,31 @@
+import uuid
 from dataclasses import dataclass
 
+from app.domain.entities.city import CityDM
+
+# Tree depth: 0 is the region alone, 1 adds its districts, 2 adds their cities.
+MAX_TREE_DEPTH = 2
+
 
 @dataclass(slots=True)
 class NewRegionDTO:
     name: str
     capital: str
+
+
+@dataclass(slots=True)
+class DistrictTreeDTO:
+    id: uuid.UUID
+    region_id: uuid.UUID
+    name: str
+    # None when the requested depth does not reach the cities.
+    cities: list[CityDM] | None = None
+
+
+@dataclass(slots=True)
+class RegionTreeDTO:
+    id: uuid.UUID
+    name: str
+    capital: str
+    # None when the requested depth does not reach the districts.
+    districts: list[DistrictTreeDTO] | None = None
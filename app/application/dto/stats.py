@@ -0,0 +1,26 @@
+import uuid
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class ObjTypeStatsDTO:
+    obj_type: str | None
+    city_count: int
+    population: int
+
+
+@dataclass(slots=True)
+class RegionStatsDTO:
+    region_id: uuid.UUID
+    city_count: int = 0
+    population: int = 0
+    by_obj_type: list[ObjTypeStatsDTO] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class DistrictStatsDTO:
+    district_id: uuid.UUID
+    region_id: uuid.UUID
+    city_count: int = 0
+    population: int = 0
+    by_obj_type: list[ObjTypeStatsDTO] = field(default_factory=list)
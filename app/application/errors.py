@@ -23,3 +23,10 @@ class EntityNotExistsError(ApplicationError):
     @property
     def message(self) -> str:
         return self.msg
+
+
+@dataclass(eq=False)
+class InvalidCursorError(ApplicationError):
+    @property
+    def message(self) -> str:
+        return 'Invalid pagination cursor'
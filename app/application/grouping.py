@@ -0,0 +1,43 @@
+import uuid
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+MAX_PARENT_IDS = 1000
+
+T = TypeVar('T')
+
+
+@dataclass(slots=True)
+class Group(Generic[T]):
+    parent_id: uuid.UUID
+    items: Sequence[T]
+
+
+@dataclass(slots=True)
+class Grouped(Generic[T]):
+    groups: Sequence[Group[T]]
+    missing_parent_ids: Sequence[uuid.UUID]
+
+
+def unique_ids(ids: Sequence[uuid.UUID]) -> list[uuid.UUID]:
+    return list(dict.fromkeys(ids))
+
+
+def group_by_parent(
+    parent_ids: Sequence[uuid.UUID], found: Mapping[uuid.UUID, Sequence[T]]
+) -> Grouped[T]:
+    """Arrange a gateway lookup in the order the parents were requested.
+
+    ``found`` holds an entry for every parent that exists, including the ones
+    without children, so any other requested id is reported as missing.
+    """
+    groups = []
+    missing_parent_ids = []
+    for parent_id in parent_ids:
+        if parent_id in found:
+            groups.append(Group(parent_id=parent_id, items=found[parent_id]))
+        else:
+            missing_parent_ids.append(parent_id)
+
+    return Grouped(groups=groups, missing_parent_ids=missing_parent_ids)
@@ -1,10 +1,23 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from uuid import UUID
 
+from app.application.grouping import Grouped, group_by_parent, unique_ids
 from app.application.interface.city.city import (
     CityDeleter,
     CityReader,
 )
+from app.application.interface.stats.stats import PopulationStatsRefresher
+from app.application.interface.transaction import TransactionManager
+from app.application.interface.version.version import VersionBumper
+from app.application.lookup import in_request_order
+from app.application.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    decode_cursor,
+    make_page,
+)
+from app.application.search import DEFAULT_SEARCH_LIMIT, SearchMode
+from app.application.versions import CITIES, district_cities
 from app.domain.entities.city import CityDM
 
 
@@ -12,8 +25,13 @@ class GetCitiesInteractor:
     def __init__(self, city_gateway: CityReader):
         self._city_gateway = city_gateway
 
-    async def __call__(self) -> Sequence[CityDM]:
-        return await self._city_gateway.get_cities()
+    async def __call__(
+        self, limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+    ) -> Page[CityDM]:
+        city_dms = await self._city_gateway.get_cities(
+            limit=limit + 1, after_id=decode_cursor(cursor)
+        )
+        return make_page(city_dms, limit)
 
 
 class GetCitiesByDistrictIdInteractor:
@@ -24,6 +42,54 @@ class GetCitiesByDistrictIdInteractor:
         return await self._city_gateway.get_cities_by_district_uuid(district_id)
 
 
+class GetCitiesByDistrictIdsInteractor:
+    def __init__(self, city_gateway: CityReader):
+        self._city_gateway = city_gateway
+
+    async def __call__(self, district_ids: Sequence[UUID]) -> Grouped[CityDM]:
+        district_ids = unique_ids(district_ids)
+        if not district_ids:
+            return Grouped(groups=[], missing_parent_ids=[])
+
+        cities = await self._city_gateway.get_cities_by_district_uuids(district_ids)
+        return group_by_parent(district_ids, cities)
+
+
+class SearchCitiesInteractor:
+    def __init__(self, city_gateway: CityReader):
+        self._city_gateway = city_gateway
+
+    async def __call__(
+        self,
+        query: str,
+        mode: SearchMode = SearchMode.SUBSTRING,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+    ) -> Sequence[CityDM]:
+        query = query.strip()
+        if not query:
+            return []
+
+        return await self._city_gateway.search_by_name(query, mode, limit)
+
+
+class StreamCitiesInteractor:
+    def __init__(self, city_gateway: CityReader):
+        self._city_gateway = city_gateway
+
+    def __call__(self, chunk_size: int) -> AsyncIterator[CityDM]:
+        return self._city_gateway.stream_cities(chunk_size=chunk_size)
+
+
+class StreamCitiesByDistrictIdInteractor:
+    def __init__(self, city_gateway: CityReader):
+        self._city_gateway = city_gateway
+
+    def __call__(self, district_id: UUID, chunk_size: int) -> AsyncIterator[CityDM]:
+        return self._city_gateway.stream_cities_by_district_uuid(
+            district_id=district_id, chunk_size=chunk_size
+        )
+
+
 class GetCityByIdInteractor:
     def __init__(self, city_gateway: CityReader):
         self._city_gateway = city_gateway
@@ -32,9 +98,35 @@ class GetCityByIdInteractor:
         return await self._city_gateway.get_by_uuid(city_id)
 
 
+class GetCitiesByIdsInteractor:
+    def __init__(self, city_gateway: CityReader):
+        self._city_gateway = city_gateway
+
+    async def __call__(self, city_ids: Sequence[UUID]) -> Sequence[CityDM | None]:
+        if not city_ids:
+            return []
+
+        cities = await self._city_gateway.get_by_uuids(unique_ids(city_ids))
+        return in_request_order(city_ids, cities)
+
+
 class DeleteCityInteractor:
-    def __init__(self, city_gateway: CityDeleter):
+    def __init__(
+        self,
+        city_gateway: CityDeleter,
+        stats_refresher: PopulationStatsRefresher,
+        version_gateway: VersionBumper,
+        transaction_manager: TransactionManager,
+    ):
         self._city_gateway = city_gateway
+        self._stats_refresher = stats_refresher
+        self._version_gateway = version_gateway
+        self._transaction_manager = transaction_manager
 
     async def __call__(self, city_id: UUID) -> None:
-        await self._city_gateway.delete_by_uuid(city_id)
+        district_id = await self._city_gateway.delete_by_uuid(city_id)
+
+        if district_id is not None:
+            await self._version_gateway.bump([CITIES, district_cities(district_id)])
+            await self._transaction_manager.commit()
+        self._stats_refresher.request_refresh()
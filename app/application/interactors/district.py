@@ -1,10 +1,22 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from uuid import UUID
 
+from app.application.grouping import Grouped, group_by_parent, unique_ids
 from app.application.interface.district.district import (
     DistrictDeleter,
     DistrictReader,
 )
+from app.application.interface.stats.stats import PopulationStatsRefresher
+from app.application.interface.transaction import TransactionManager
+from app.application.interface.version.version import VersionBumper
+from app.application.lookup import in_request_order
+from app.application.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    decode_cursor,
+    make_page,
+)
+from app.application.versions import DISTRICTS, region_districts
 from app.domain.entities.district import DistrictDM
 
 
@@ -12,8 +24,13 @@ class GetDistrictsInteractor:
     def __init__(self, district_gateway: DistrictReader):
         self._district_gateway = district_gateway
 
-    async def __call__(self) -> Sequence[DistrictDM]:
-        return await self._district_gateway.get_districts()
+    async def __call__(
+        self, limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+    ) -> Page[DistrictDM]:
+        district_dms = await self._district_gateway.get_districts(
+            limit=limit + 1, after_id=decode_cursor(cursor)
+        )
+        return make_page(district_dms, limit)
 
 
 class GetDistrictsByRegionIdInteractor:
@@ -24,6 +41,39 @@ class GetDistrictsByRegionIdInteractor:
         return await self._district_gateway.get_districts_by_region_uuid(region_id)
 
 
+class GetDistrictsByRegionIdsInteractor:
+    def __init__(self, district_gateway: DistrictReader):
+        self._district_gateway = district_gateway
+
+    async def __call__(self, region_ids: Sequence[UUID]) -> Grouped[DistrictDM]:
+        region_ids = unique_ids(region_ids)
+        if not region_ids:
+            return Grouped(groups=[], missing_parent_ids=[])
+
+        districts = await self._district_gateway.get_districts_by_region_uuids(
+            region_ids
+        )
+        return group_by_parent(region_ids, districts)
+
+
+class StreamDistrictsInteractor:
+    def __init__(self, district_gateway: DistrictReader):
+        self._district_gateway = district_gateway
+
+    def __call__(self, chunk_size: int) -> AsyncIterator[DistrictDM]:
+        return self._district_gateway.stream_districts(chunk_size=chunk_size)
+
+
+class StreamDistrictsByRegionIdInteractor:
+    def __init__(self, district_gateway: DistrictReader):
+        self._district_gateway = district_gateway
+
+    def __call__(self, region_id: UUID, chunk_size: int) -> AsyncIterator[DistrictDM]:
+        return self._district_gateway.stream_districts_by_region_uuid(
+            region_id=region_id, chunk_size=chunk_size
+        )
+
+
 class GetDistrictByIdInteractor:
     def __init__(self, district_gateway: DistrictReader):
         self._district_gateway = district_gateway
@@ -32,9 +82,37 @@ class GetDistrictByIdInteractor:
         return await self._district_gateway.get_by_uuid(district_id)
 
 
+class GetDistrictsByIdsInteractor:
+    def __init__(self, district_gateway: DistrictReader):
+        self._district_gateway = district_gateway
+
+    async def __call__(
+        self, district_ids: Sequence[UUID]
+    ) -> Sequence[DistrictDM | None]:
+        if not district_ids:
+            return []
+
+        districts = await self._district_gateway.get_by_uuids(unique_ids(district_ids))
+        return in_request_order(district_ids, districts)
+
+
 class DeleteDistrictInteractor:
-    def __init__(self, district_gateway: DistrictDeleter):
+    def __init__(
+        self,
+        district_gateway: DistrictDeleter,
+        stats_refresher: PopulationStatsRefresher,
+        version_gateway: VersionBumper,
+        transaction_manager: TransactionManager,
+    ):
         self._district_gateway = district_gateway
+        self._stats_refresher = stats_refresher
+        self._version_gateway = version_gateway
+        self._transaction_manager = transaction_manager
 
     async def __call__(self, district_id: UUID) -> None:
-        await self._district_gateway.delete_by_uuid(district_id)
+        region_id = await self._district_gateway.delete_by_uuid(district_id)
+
+        if region_id is not None:
+            await self._version_gateway.bump([DISTRICTS, region_districts(region_id)])
+            await self._transaction_manager.commit()
+        self._stats_refresher.request_refresh()
@@ -1,10 +1,23 @@
 import uuid
 from collections.abc import Sequence
 
+from app.application.dto.region import MAX_TREE_DEPTH, RegionTreeDTO
+from app.application.grouping import unique_ids
 from app.application.interface.region.region import (
     RegionDeleter,
     RegionReader,
 )
+from app.application.interface.stats.stats import PopulationStatsRefresher
+from app.application.interface.transaction import TransactionManager
+from app.application.interface.version.version import VersionBumper
+from app.application.lookup import in_request_order
+from app.application.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    decode_cursor,
+    make_page,
+)
+from app.application.versions import REGIONS
 from app.domain.entities.region import RegionDM
 
 
@@ -12,8 +25,13 @@ class GetRegionsInteractor:
     def __init__(self, region_gateway: RegionReader):
         self._region_gateway = region_gateway
 
-    async def __call__(self) -> Sequence[RegionDM]:
-        return await self._region_gateway.get_regions()
+    async def __call__(
+        self, limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+    ) -> Page[RegionDM]:
+        region_dms = await self._region_gateway.get_regions(
+            limit=limit + 1, after_id=decode_cursor(cursor)
+        )
+        return make_page(region_dms, limit)
 
 
 class GetRegionByIdInteractor:
@@ -24,9 +42,45 @@ class GetRegionByIdInteractor:
         return await self._region_gateway.get_by_uuid(region_id)
 
 
+class GetRegionsByIdsInteractor:
+    def __init__(self, region_gateway: RegionReader):
+        self._region_gateway = region_gateway
+
+    async def __call__(
+        self, region_ids: Sequence[uuid.UUID]
+    ) -> Sequence[RegionDM | None]:
+        if not region_ids:
+            return []
+
+        regions = await self._region_gateway.get_by_uuids(unique_ids(region_ids))
+        return in_request_order(region_ids, regions)
+
+
+class GetRegionTreeInteractor:
+    def __init__(self, region_gateway: RegionReader):
+        self._region_gateway = region_gateway
+
+    async def __call__(
+        self, region_id: uuid.UUID, depth: int = MAX_TREE_DEPTH
+    ) -> RegionTreeDTO | None:
+        return await self._region_gateway.get_tree(region_id, depth)
+
+
 class DeleteRegionInteractor:
-    def __init__(self, region_gateway: RegionDeleter):
+    def __init__(
+        self,
+        region_gateway: RegionDeleter,
+        stats_refresher: PopulationStatsRefresher,
+        version_gateway: VersionBumper,
+        transaction_manager: TransactionManager,
+    ):
         self._region_gateway = region_gateway
+        self._stats_refresher = stats_refresher
+        self._version_gateway = version_gateway
+        self._transaction_manager = transaction_manager
 
     async def __call__(self, region_id: uuid.UUID) -> None:
         await self._region_gateway.delete_by_uuid(region_id)
+        await self._version_gateway.bump([REGIONS])
+        await self._transaction_manager.commit()
+        self._stats_refresher.request_refresh()
@@ -0,0 +1,29 @@
+import uuid
+from collections.abc import Sequence
+
+from app.application.dto.stats import DistrictStatsDTO, RegionStatsDTO
+from app.application.interface.stats.stats import PopulationStatsReader
+
+
+class GetRegionsStatsInteractor:
+    def __init__(self, stats_gateway: PopulationStatsReader):
+        self._stats_gateway = stats_gateway
+
+    async def __call__(self) -> Sequence[RegionStatsDTO]:
+        return await self._stats_gateway.get_regions_stats()
+
+
+class GetRegionStatsInteractor:
+    def __init__(self, stats_gateway: PopulationStatsReader):
+        self._stats_gateway = stats_gateway
+
+    async def __call__(self, region_id: uuid.UUID) -> RegionStatsDTO | None:
+        return await self._stats_gateway.get_region_stats(region_id)
+
+
+class GetDistrictsStatsByRegionIdInteractor:
+    def __init__(self, stats_gateway: PopulationStatsReader):
+        self._stats_gateway = stats_gateway
+
+    async def __call__(self, region_id: uuid.UUID) -> Sequence[DistrictStatsDTO]:
+        return await self._stats_gateway.get_districts_stats_by_region_uuid(region_id)
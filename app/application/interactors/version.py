@@ -0,0 +1,9 @@
+from app.application.interface.version.version import VersionReader
+
+
+class GetVersionInteractor:
+    def __init__(self, version_gateway: VersionReader):
+        self._version_gateway = version_gateway
+
+    async def __call__(self, key: str) -> int:
+        return await self._version_gateway.get_version(key)
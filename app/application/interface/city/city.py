@@ -1,8 +1,9 @@
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Mapping, Sequence
 from typing import Protocol
 from uuid import UUID
 
+from app.application.search import SearchMode
 from app.domain.entities.city import CityDM
 
 
@@ -10,25 +11,51 @@ class CitySaver(Protocol):
     @abstractmethod
     async def save(self, city: CityDM) -> None: ...
 
+    @abstractmethod
+    async def save_many(self, cities: Sequence[CityDM]) -> set[UUID]: ...
+
 
 class CityReader(Protocol):
     @abstractmethod
-    async def get_cities(self) -> Sequence[CityDM]: ...
+    async def get_cities(
+        self, limit: int, after_id: UUID | None = None
+    ) -> Sequence[CityDM]: ...
 
     @abstractmethod
     async def get_cities_by_district_uuid(
         self, district_id: UUID
     ) -> Sequence[CityDM]: ...
 
+    @abstractmethod
+    async def get_cities_by_district_uuids(
+        self, district_ids: Sequence[UUID]
+    ) -> Mapping[UUID, Sequence[CityDM]]: ...
+
     @abstractmethod
     async def get_by_uuid(self, city_id: UUID) -> CityDM | None: ...
 
+    @abstractmethod
+    async def get_by_uuids(self, city_ids: Sequence[UUID]) -> Mapping[UUID, CityDM]: ...
+
+    @abstractmethod
+    async def search_by_name(
+        self, query: str, mode: SearchMode, limit: int
+    ) -> Sequence[CityDM]: ...
+
+    @abstractmethod
+    def stream_cities(self, chunk_size: int) -> AsyncIterator[CityDM]: ...
+
+    @abstractmethod
+    def stream_cities_by_district_uuid(
+        self, district_id: UUID, chunk_size: int
+    ) -> AsyncIterator[CityDM]: ...
+
 
 class CityDeleter(Protocol):
     @abstractmethod
-    async def delete_by_uuid(self, city_id: UUID) -> None: ...
+    async def delete_by_uuid(self, city_id: UUID) -> UUID | None: ...
 
 
 class CityUpdater(Protocol):
     @abstractmethod
-    async def update_by_uuid(self, city: CityDM) -> None: ...
+    async def update_by_uuid(self, city: CityDM) -> UUID: ...
@@ -1,5 +1,6 @@
 import uuid
 from abc import abstractmethod
+from collections.abc import AsyncIterator, Mapping
 from typing import Protocol
 
 from sqlalchemy import Sequence
@@ -14,17 +15,42 @@ class DistrictSaver(Protocol):
 
 class DistrictReader(Protocol):
     @abstractmethod
-    async def get_districts(self) -> Sequence[DistrictDM] | None: ...
+    async def get_districts(
+        self, limit: int, after_id: uuid.UUID | None = None
+    ) -> Sequence[DistrictDM]: ...
 
     @abstractmethod
     async def get_districts_by_region_uuid(
         self, region_id: uuid.UUID
     ) -> Sequence[DistrictDM]: ...
 
+    @abstractmethod
+    async def get_districts_by_region_uuids(
+        self, region_ids: Sequence[uuid.UUID]
+    ) -> Mapping[uuid.UUID, Sequence[DistrictDM]]: ...
+
     @abstractmethod
     async def get_by_uuid(self, district_id: uuid.UUID) -> DistrictDM | None: ...
 
+    @abstractmethod
+    async def get_by_uuids(
+        self, district_ids: Sequence[uuid.UUID]
+    ) -> Mapping[uuid.UUID, DistrictDM]: ...
+
+    @abstractmethod
+    async def get_existing_uuids(
+        self, district_ids: Sequence[uuid.UUID]
+    ) -> set[uuid.UUID]: ...
+
+    @abstractmethod
+    def stream_districts(self, chunk_size: int) -> AsyncIterator[DistrictDM]: ...
+
+    @abstractmethod
+    def stream_districts_by_region_uuid(
+        self, region_id: uuid.UUID, chunk_size: int
+    ) -> AsyncIterator[DistrictDM]: ...
+
 
 class DistrictDeleter(Protocol):
     @abstractmethod
-    async def delete_by_uuid(self, district_id: uuid.UUID) -> None: ...
+    async def delete_by_uuid(self, district_id: uuid.UUID) -> uuid.UUID | None: ...
@@ -1,9 +1,11 @@
 import uuid
 from abc import abstractmethod
+from collections.abc import Mapping
 from typing import Protocol
 
 from sqlalchemy import Sequence
 
+from app.application.dto.region import RegionTreeDTO
 from app.domain.entities.region import RegionDM
 
 
@@ -17,11 +19,23 @@ class RegionSaver(Protocol):
 
 class RegionReader(Protocol):
     @abstractmethod
-    async def get_regions(self) -> Sequence[RegionDM] | None: ...
+    async def get_regions(
+        self, limit: int, after_id: uuid.UUID | None = None
+    ) -> Sequence[RegionDM]: ...
 
     @abstractmethod
     async def get_by_uuid(self, region_id: uuid.UUID) -> RegionDM | None: ...
 
+    @abstractmethod
+    async def get_by_uuids(
+        self, region_ids: Sequence[uuid.UUID]
+    ) -> Mapping[uuid.UUID, RegionDM]: ...
+
+    @abstractmethod
+    async def get_tree(
+        self, region_id: uuid.UUID, depth: int
+    ) -> RegionTreeDTO | None: ...
+
 
 class RegionDeleter(Protocol):
     @abstractmethod
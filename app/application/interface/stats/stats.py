@@ -0,0 +1,24 @@
+import uuid
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Protocol
+
+from app.application.dto.stats import DistrictStatsDTO, RegionStatsDTO
+
+
+class PopulationStatsReader(Protocol):
+    @abstractmethod
+    async def get_regions_stats(self) -> Sequence[RegionStatsDTO]: ...
+
+    @abstractmethod
+    async def get_region_stats(self, region_id: uuid.UUID) -> RegionStatsDTO | None: ...
+
+    @abstractmethod
+    async def get_districts_stats_by_region_uuid(
+        self, region_id: uuid.UUID
+    ) -> Sequence[DistrictStatsDTO]: ...
+
+
+class PopulationStatsRefresher(Protocol):
+    @abstractmethod
+    def request_refresh(self) -> None: ...
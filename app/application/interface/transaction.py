@@ -0,0 +1,7 @@
+from abc import abstractmethod
+from typing import Protocol
+
+
+class TransactionManager(Protocol):
+    @abstractmethod
+    async def commit(self) -> None: ...
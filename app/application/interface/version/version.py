@@ -0,0 +1,13 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Protocol
+
+
+class VersionReader(Protocol):
+    @abstractmethod
+    async def get_version(self, key: str) -> int: ...
+
+
+class VersionBumper(Protocol):
+    @abstractmethod
+    async def bump(self, keys: Sequence[str]) -> None: ...
@@ -0,0 +1,14 @@
+import uuid
+from collections.abc import Mapping, Sequence
+from typing import TypeVar
+
+MAX_LOOKUP_IDS = 1000
+
+T = TypeVar('T')
+
+
+def in_request_order(
+    ids: Sequence[uuid.UUID], found: Mapping[uuid.UUID, T]
+) -> list[T | None]:
+    """Line a multi-get up with the ids it was asked for, ``None`` if missing."""
+    return [found.get(id_) for id_ in ids]
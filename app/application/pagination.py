@@ -0,0 +1,58 @@
+import base64
+import binascii
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Generic, Protocol, TypeVar
+
+from app.application.errors import InvalidCursorError
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+class Identified(Protocol):
+    id: uuid.UUID
+
+
+T = TypeVar('T', bound=Identified)
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    items: Sequence[T]
+    next_cursor: str | None
+
+
+def clamp_page_size(limit: int) -> int:
+    if limit <= 0:
+        return DEFAULT_PAGE_SIZE
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def encode_cursor(last_id: uuid.UUID) -> str:
+    return base64.urlsafe_b64encode(last_id.bytes).rstrip(b'=').decode()
+
+
+def decode_cursor(cursor: str | None) -> uuid.UUID | None:
+    if not cursor:
+        return None
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        return uuid.UUID(bytes=raw)
+    except (binascii.Error, ValueError):
+        raise InvalidCursorError
+
+
+def make_page(rows: Sequence[T], limit: int) -> Page[T]:
+    """Build a page from ``limit + 1`` rows fetched in keyset order.
+
+    The extra row only signals that another page exists; it is dropped and
+    the cursor points at the last row that is actually returned.
+    """
+    if len(rows) <= limit:
+        return Page(items=rows, next_cursor=None)
+
+    items = rows[:limit]
+    return Page(items=items, next_cursor=encode_cursor(items[-1].id))
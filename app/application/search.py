@@ -0,0 +1,17 @@
+from enum import StrEnum
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+MAX_SEARCH_QUERY_LENGTH = 100
+
+
+class SearchMode(StrEnum):
+    SUBSTRING = 'substring'
+    PREFIX = 'prefix'
+    SIMILAR = 'similar'
+
+
+def clamp_search_limit(limit: int) -> int:
+    if limit <= 0:
+        return DEFAULT_SEARCH_LIMIT
+    return min(limit, MAX_SEARCH_LIMIT)
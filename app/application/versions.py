@@ -0,0 +1,15 @@
+import uuid
+
+# Keys of the change counters behind conditional reads. A write bumps the
+# key of every list it changes; the table keys also cover entity reads.
+CITIES = 'city'
+DISTRICTS = 'district'
+REGIONS = 'region'
+
+
+def district_cities(district_id: uuid.UUID) -> str:
+    return f'district:{district_id}:cities'
+
+
+def region_districts(region_id: uuid.UUID) -> str:
+    return f'region:{region_id}:districts'
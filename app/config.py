@@ -1,4 +1,6 @@
 from os import environ as env
+from pathlib import Path
+from typing import Literal
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
@@ -12,7 +14,86 @@ class PostgresConfig(BaseModel):
     user: str = Field(alias='POSTGRES_USER')
     password: str = Field(alias='POSTGRES_PASSWORD')
     database: str = Field(alias='POSTGRES_DB')
+    stream_chunk_size: int = Field(alias='POSTGRES_STREAM_CHUNK_SIZE', default=1000)
+    # Totals for the service; HTTP workers each get an equal share.
+    pool_size: int = Field(alias='POSTGRES_POOL_SIZE', default=15)
+    max_overflow: int = Field(alias='POSTGRES_MAX_OVERFLOW', default=15)
+    pool_timeout: float = Field(alias='POSTGRES_POOL_TIMEOUT_SECONDS', default=30.0)
+    # -1 keeps connections open indefinitely.
+    pool_recycle: int = Field(alias='POSTGRES_POOL_RECYCLE_SECONDS', default=-1)
+    pool_pre_ping: bool = Field(alias='POSTGRES_POOL_PRE_PING', default=False)
+    connect_timeout: int = Field(alias='POSTGRES_CONNECT_TIMEOUT_SECONDS', default=5)
+    # 0 leaves statements without a server-side limit.
+    statement_timeout_ms: int = Field(alias='POSTGRES_STATEMENT_TIMEOUT_MS', default=0)
+    # Unset leaves the slow query log off.
+    slow_query_threshold_ms: float | None = Field(
+        alias='POSTGRES_SLOW_QUERY_THRESHOLD_MS', default=None
+    )
+    slow_query_explain: bool = Field(alias='POSTGRES_SLOW_QUERY_EXPLAIN', default=False)
+    # Runs of a statement on a connection before psycopg prepares it on the
+    # server. 0 prepares on first use; -1 never prepares, as PgBouncer in
+    # transaction mode requires.
+    prepare_threshold: int = Field(alias='POSTGRES_PREPARE_THRESHOLD', default=5, ge=-1)
+
+
+class ReplicaConfig(BaseModel):
+    # Comma-separated SQLAlchemy URLs; empty sends every query to the primary.
+    dsns: str = Field(alias='POSTGRES_REPLICA_DSNS', default='')
+    ejection_seconds: float = Field(
+        alias='POSTGRES_REPLICA_EJECTION_SECONDS', default=30.0
+    )
+    # 0 turns read-your-writes pinning off.
+    read_your_writes_seconds: float = Field(
+        alias='POSTGRES_READ_YOUR_WRITES_SECONDS', default=0.0
+    )
+
+    @property
+    def urls(self) -> list[str]:
+        return [dsn.strip() for dsn in self.dsns.split(',') if dsn.strip()]
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.urls)
+
+
+class CacheConfig(BaseModel):
+    # Entity caches are per process and only see the writes that process
+    # serves, so a change made elsewhere (the gRPC server, another instance)
+    # shows after at most the TTL. With HTTP_WORKERS > 1 they are disabled.
+    max_size: int = Field(alias='CACHE_MAX_SIZE', default=10_000)
+    ttl: float = Field(alias='CACHE_TTL_SECONDS', default=30.0)
+
+
+class HttpConfig(BaseModel):
+    host: str = Field(alias='HTTP_HOST', default='127.0.0.1')
+    port: int = Field(alias='HTTP_PORT', default=8000)
+    workers: int = Field(alias='HTTP_WORKERS', default=1, ge=1)
+
+
+class HttpCacheConfig(BaseModel):
+    max_age: int = Field(alias='HTTP_CACHE_MAX_AGE_SECONDS', default=0)
+
+
+class StatsConfig(BaseModel):
+    refresh_delay: float = Field(alias='STATS_REFRESH_DELAY_SECONDS', default=5.0)
+
+
+class TracingConfig(BaseModel):
+    exporter: Literal['none', 'memory', 'jsonl'] = Field(
+        alias='TRACING_EXPORTER', default='none'
+    )
+    jsonl_path: Path = Field(alias='TRACING_JSONL_PATH', default=Path('traces.jsonl'))
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter != 'none'
 
 
 class Config(BaseModel):
     postgres: PostgresConfig = Field(default_factory=lambda: PostgresConfig(**env))
+    replicas: ReplicaConfig = Field(default_factory=lambda: ReplicaConfig(**env))
+    cache: CacheConfig = Field(default_factory=lambda: CacheConfig(**env))
+    stats: StatsConfig = Field(default_factory=lambda: StatsConfig(**env))
+    http: HttpConfig = Field(default_factory=lambda: HttpConfig(**env))
+    http_cache: HttpCacheConfig = Field(default_factory=lambda: HttpCacheConfig(**env))
+    tracing: TracingConfig = Field(default_factory=lambda: TracingConfig(**env))
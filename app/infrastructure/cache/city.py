@@ -0,0 +1,107 @@
+import uuid
+from collections.abc import AsyncIterator, Mapping, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.interface.city.city import (
+    CityDeleter,
+    CityReader,
+    CitySaver,
+    CityUpdater,
+)
+from app.application.search import SearchMode
+from app.domain.entities.city import CityDM
+from app.infrastructure.cache.invalidation import invalidate_on_commit
+from app.infrastructure.cache.lru import LRUCache
+from app.infrastructure.cache.routing import may_fill_cache, may_read_cache
+from app.infrastructure.gateway.city import CityGateway
+
+
+class CityCache(LRUCache[uuid.UUID, CityDM]):
+    pass
+
+
+class CachedCityGateway(CitySaver, CityReader, CityDeleter, CityUpdater):
+    def __init__(
+        self,
+        city_gateway: CityGateway,
+        cache: CityCache,
+        session: AsyncSession,
+    ):
+        self._city_gateway = city_gateway
+        self._cache = cache
+        self._session = session
+
+    async def get_cities(
+        self, limit: int, after_id: uuid.UUID | None = None
+    ) -> Sequence[CityDM]:
+        return await self._city_gateway.get_cities(limit=limit, after_id=after_id)
+
+    async def get_cities_by_district_uuid(
+        self, district_id: uuid.UUID
+    ) -> Sequence[CityDM]:
+        return await self._city_gateway.get_cities_by_district_uuid(district_id)
+
+    async def get_cities_by_district_uuids(
+        self, district_ids: Sequence[uuid.UUID]
+    ) -> Mapping[uuid.UUID, Sequence[CityDM]]:
+        return await self._city_gateway.get_cities_by_district_uuids(district_ids)
+
+    async def get_by_uuid(self, city_id: uuid.UUID) -> CityDM | None:
+        if may_read_cache():
+            city = self._cache.get(city_id)
+            if city is not None:
+                return city
+
+        city = await self._city_gateway.get_by_uuid(city_id)
+        if city is not None and may_fill_cache():
+            self._cache.set(city_id, city)
+
+        return city
+
+    async def get_by_uuids(
+        self, city_ids: Sequence[uuid.UUID]
+    ) -> Mapping[uuid.UUID, CityDM]:
+        if may_read_cache():
+            cities, missing = self._cache.get_many(city_ids)
+        else:
+            cities, missing = {}, list(city_ids)
+        if missing:
+            loaded = await self._city_gateway.get_by_uuids(missing)
+            if may_fill_cache():
+                for city_id, city in loaded.items():
+                    self._cache.set(city_id, city)
+            cities.update(loaded)
+
+        return cities
+
+    async def search_by_name(
+        self, query: str, mode: SearchMode, limit: int
+    ) -> Sequence[CityDM]:
+        return await self._city_gateway.search_by_name(query, mode, limit)
+
+    def stream_cities(self, chunk_size: int) -> AsyncIterator[CityDM]:
+        return self._city_gateway.stream_cities(chunk_size=chunk_size)
+
+    def stream_cities_by_district_uuid(
+        self, district_id: uuid.UUID, chunk_size: int
+    ) -> AsyncIterator[CityDM]:
+        return self._city_gateway.stream_cities_by_district_uuid(
+            district_id=district_id, chunk_size=chunk_size
+        )
+
+    async def save(self, city: CityDM) -> None:
+        await self._city_gateway.save(city)
+
+    async def save_many(self, cities: Sequence[CityDM]) -> set[uuid.UUID]:
+        return await self._city_gateway.save_many(cities)
+
+    async def delete_by_uuid(self, city_id: uuid.UUID) -> uuid.UUID | None:
+        district_id = await self._city_gateway.delete_by_uuid(city_id)
+        invalidate_on_commit(self._session, self._cache, city_id)
+        return district_id
+
+    async def update_by_uuid(self, city: CityDM) -> uuid.UUID:
+        previous_district_id = await self._city_gateway.update_by_uuid(city)
+        invalidate_on_commit(self._session, self._cache, city.id)
+        return previous_district_id
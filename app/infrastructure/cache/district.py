@@ -0,0 +1,99 @@
+import uuid
+from collections.abc import AsyncIterator, Mapping, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.interface.district.district import (
+    DistrictDeleter,
+    DistrictReader,
+    DistrictSaver,
+)
+from app.domain.entities.district import DistrictDM
+from app.infrastructure.cache.invalidation import invalidate_on_commit
+from app.infrastructure.cache.lru import LRUCache
+from app.infrastructure.cache.routing import may_fill_cache, may_read_cache
+from app.infrastructure.gateway.district import DistrictGateway
+
+
+class DistrictCache(LRUCache[uuid.UUID, DistrictDM]):
+    pass
+
+
+class CachedDistrictGateway(DistrictSaver, DistrictReader, DistrictDeleter):
+    def __init__(
+        self,
+        district_gateway: DistrictGateway,
+        cache: DistrictCache,
+        session: AsyncSession,
+    ):
+        self._district_gateway = district_gateway
+        self._cache = cache
+        self._session = session
+
+    async def get_districts(
+        self, limit: int, after_id: uuid.UUID | None = None
+    ) -> Sequence[DistrictDM]:
+        return await self._district_gateway.get_districts(
+            limit=limit, after_id=after_id
+        )
+
+    async def get_districts_by_region_uuid(
+        self, region_id: uuid.UUID
+    ) -> Sequence[DistrictDM]:
+        return await self._district_gateway.get_districts_by_region_uuid(region_id)
+
+    async def get_districts_by_region_uuids(
+        self, region_ids: Sequence[uuid.UUID]
+    ) -> Mapping[uuid.UUID, Sequence[DistrictDM]]:
+        return await self._district_gateway.get_districts_by_region_uuids(region_ids)
+
+    async def get_by_uuid(self, district_id: uuid.UUID) -> DistrictDM | None:
+        if may_read_cache():
+            district = self._cache.get(district_id)
+            if district is not None:
+                return district
+
+        district = await self._district_gateway.get_by_uuid(district_id)
+        if district is not None and may_fill_cache():
+            self._cache.set(district_id, district)
+
+        return district
+
+    async def get_by_uuids(
+        self, district_ids: Sequence[uuid.UUID]
+    ) -> Mapping[uuid.UUID, DistrictDM]:
+        if may_read_cache():
+            districts, missing = self._cache.get_many(district_ids)
+        else:
+            districts, missing = {}, list(district_ids)
+        if missing:
+            loaded = await self._district_gateway.get_by_uuids(missing)
+            if may_fill_cache():
+                for district_id, district in loaded.items():
+                    self._cache.set(district_id, district)
+            districts.update(loaded)
+
+        return districts
+
+    async def get_existing_uuids(
+        self, district_ids: Sequence[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        return await self._district_gateway.get_existing_uuids(district_ids)
+
+    def stream_districts(self, chunk_size: int) -> AsyncIterator[DistrictDM]:
+        return self._district_gateway.stream_districts(chunk_size=chunk_size)
+
+    def stream_districts_by_region_uuid(
+        self, region_id: uuid.UUID, chunk_size: int
+    ) -> AsyncIterator[DistrictDM]:
+        return self._district_gateway.stream_districts_by_region_uuid(
+            region_id=region_id, chunk_size=chunk_size
+        )
+
+    async def save(self, district: DistrictDM) -> None:
+        await self._district_gateway.save(district)
+
+    async def delete_by_uuid(self, district_id: uuid.UUID) -> uuid.UUID | None:
+        region_id = await self._district_gateway.delete_by_uuid(district_id)
+        invalidate_on_commit(self._session, self._cache, district_id)
+        return region_id
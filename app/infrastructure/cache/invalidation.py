@@ -0,0 +1,21 @@
+from collections.abc import Hashable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.cache.lru import LRUCache
+
+
+def invalidate_on_commit(session: AsyncSession, cache: LRUCache, key: Hashable) -> None:
+    """Drop ``key`` now and again once ``session`` commits.
+
+    Writes are committed by the command after the version bump, so until
+    then another request can still load the old row into the cache.
+    """
+    cache.invalidate(key)
+    event.listen(
+        session.sync_session,
+        'after_commit',
+        lambda _: cache.invalidate(key),
+        once=True,
+    )
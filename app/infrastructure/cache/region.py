@@ -0,0 +1,80 @@
+import uuid
+from collections.abc import Mapping, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.dto.region import RegionTreeDTO
+from app.application.interface.region.region import (
+    RegionDeleter,
+    RegionReader,
+    RegionSaver,
+)
+from app.domain.entities.region import RegionDM
+from app.infrastructure.cache.invalidation import invalidate_on_commit
+from app.infrastructure.cache.lru import LRUCache
+from app.infrastructure.cache.routing import may_fill_cache, may_read_cache
+from app.infrastructure.gateway.region import RegionGateway
+
+
+class RegionCache(LRUCache[uuid.UUID, RegionDM]):
+    pass
+
+
+class CachedRegionGateway(RegionSaver, RegionReader, RegionDeleter):
+    def __init__(
+        self,
+        region_gateway: RegionGateway,
+        cache: RegionCache,
+        session: AsyncSession,
+    ):
+        self._region_gateway = region_gateway
+        self._cache = cache
+        self._session = session
+
+    async def get_regions(
+        self, limit: int, after_id: uuid.UUID | None = None
+    ) -> Sequence[RegionDM]:
+        return await self._region_gateway.get_regions(limit=limit, after_id=after_id)
+
+    async def get_by_uuid(self, region_id: uuid.UUID) -> RegionDM | None:
+        if may_read_cache():
+            region = self._cache.get(region_id)
+            if region is not None:
+                return region
+
+        region = await self._region_gateway.get_by_uuid(region_id)
+        if region is not None and may_fill_cache():
+            self._cache.set(region_id, region)
+
+        return region
+
+    async def get_by_uuids(
+        self, region_ids: Sequence[uuid.UUID]
+    ) -> Mapping[uuid.UUID, RegionDM]:
+        if may_read_cache():
+            regions, missing = self._cache.get_many(region_ids)
+        else:
+            regions, missing = {}, list(region_ids)
+        if missing:
+            loaded = await self._region_gateway.get_by_uuids(missing)
+            if may_fill_cache():
+                for region_id, region in loaded.items():
+                    self._cache.set(region_id, region)
+            regions.update(loaded)
+
+        return regions
+
+    async def get_tree(self, region_id: uuid.UUID, depth: int) -> RegionTreeDTO | None:
+        # Trees change with every district and city write, which this cache
+        # does not see, so they are always read through.
+        return await self._region_gateway.get_tree(region_id, depth)
+
+    async def save(self, region: RegionDM) -> None:
+        await self._region_gateway.save(region)
+
+    async def exist_with_name(self, region_name: str) -> bool:
+        return await self._region_gateway.exist_with_name(region_name)
+
+    async def delete_by_uuid(self, region_id: uuid.UUID) -> None:
+        await self._region_gateway.delete_by_uuid(region_id)
+        invalidate_on_commit(self._session, self._cache, region_id)
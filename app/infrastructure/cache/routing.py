@@ -0,0 +1,11 @@
+from app.infrastructure.replicas.routing import client_pinned, reads_from_replica
+
+
+def may_read_cache() -> bool:
+    """Pinned clients skip the cache, which can predate their own writes."""
+    return not client_pinned()
+
+
+def may_fill_cache() -> bool:
+    """Rows from a lagging replica can predate the write that invalidated them."""
+    return not reads_from_replica()
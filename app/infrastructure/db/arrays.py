@@ -0,0 +1,12 @@
+from sqlalchemy import Uuid, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql.elements import BindParameter
+
+
+def uuid_array(name: str) -> BindParameter:
+    """A ``uuid[]`` parameter called ``name``, for ``col = ANY(...)``.
+
+    Unlike ``in_()``, the statement text does not depend on the number of ids,
+    so it stays one parameter however long the list is. Bind the ids as a list.
+    """
+    return bindparam(name, type_=ARRAY(Uuid))
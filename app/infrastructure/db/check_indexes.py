@@ -0,0 +1,193 @@
+"""Check that every gateway read query is served by its intended index.
+
+Each gateway read is executed once, the SQL it emits is captured and
+re-run as ``EXPLAIN (FORMAT JSON)``. Sequential scans are disabled by
+default because on a small dev database the planner would pick them
+regardless of the available indexes; pass ``--allow-seqscan`` to see the
+plans the planner chooses for the data that is actually there.
+
+Usage: python -m app.infrastructure.db.check_indexes [--allow-seqscan]
+"""
+
+import argparse
+import asyncio
+import sys
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.search import SearchMode
+from app.config import Config
+from app.infrastructure.db.main import new_session_maker
+from app.infrastructure.gateway.city import CityGateway
+from app.infrastructure.gateway.district import DistrictGateway
+from app.infrastructure.gateway.region import RegionGateway
+
+
+@dataclass(frozen=True, slots=True)
+class IndexCheck:
+    name: str
+    indexes: frozenset[str]
+    call: Callable[[AsyncSession], Awaitable[Any]]
+
+
+async def _drain(rows: AsyncIterator[Any]) -> None:
+    async for _ in rows:
+        pass
+
+
+CHECKS = [
+    IndexCheck(
+        'CityGateway.get_cities',
+        frozenset({'ix_city_id_active'}),
+        lambda s: CityGateway(s).get_cities(limit=100, after_id=uuid.uuid4()),
+    ),
+    IndexCheck(
+        'CityGateway.get_cities_by_district_uuid',
+        frozenset({'ix_city_district_id_active'}),
+        lambda s: CityGateway(s).get_cities_by_district_uuid(uuid.uuid4()),
+    ),
+    IndexCheck(
+        'CityGateway.get_by_uuid',
+        frozenset({'city_pkey', 'ix_city_id_active'}),
+        lambda s: CityGateway(s).get_by_uuid(uuid.uuid4()),
+    ),
+    IndexCheck(
+        'CityGateway.search_by_name',
+        frozenset({'ix_city_name_trgm'}),
+        lambda s: CityGateway(s).search_by_name(
+            'check', SearchMode.SUBSTRING, limit=20
+        ),
+    ),
+    IndexCheck(
+        'CityGateway.stream_cities',
+        frozenset({'ix_city_id_active', 'ix_city_district_id_active'}),
+        lambda s: _drain(CityGateway(s).stream_cities(chunk_size=1000)),
+    ),
+    IndexCheck(
+        'CityGateway.stream_cities_by_district_uuid',
+        frozenset({'ix_city_district_id_active'}),
+        lambda s: _drain(
+            CityGateway(s).stream_cities_by_district_uuid(uuid.uuid4(), chunk_size=1000)
+        ),
+    ),
+    IndexCheck(
+        'DistrictGateway.get_districts',
+        frozenset({'ix_district_id_active'}),
+        lambda s: DistrictGateway(s).get_districts(limit=100, after_id=uuid.uuid4()),
+    ),
+    IndexCheck(
+        'DistrictGateway.get_districts_by_region_uuid',
+        frozenset({'ix_district_region_id_active'}),
+        lambda s: DistrictGateway(s).get_districts_by_region_uuid(uuid.uuid4()),
+    ),
+    IndexCheck(
+        'DistrictGateway.get_by_uuid',
+        frozenset({'district_pkey', 'ix_district_id_active'}),
+        lambda s: DistrictGateway(s).get_by_uuid(uuid.uuid4()),
+    ),
+    IndexCheck(
+        'DistrictGateway.stream_districts_by_region_uuid',
+        frozenset({'ix_district_region_id_active'}),
+        lambda s: _drain(
+            DistrictGateway(s).stream_districts_by_region_uuid(
+                uuid.uuid4(), chunk_size=1000
+            )
+        ),
+    ),
+    IndexCheck(
+        'RegionGateway.get_regions',
+        frozenset({'ix_region_id_active'}),
+        lambda s: RegionGateway(s).get_regions(limit=100, after_id=uuid.uuid4()),
+    ),
+    IndexCheck(
+        'RegionGateway.get_by_uuid',
+        frozenset({'region_pkey', 'ix_region_id_active'}),
+        lambda s: RegionGateway(s).get_by_uuid(uuid.uuid4()),
+    ),
+    IndexCheck(
+        'RegionGateway.exist_with_name',
+        frozenset({'ix_region_name_active'}),
+        lambda s: RegionGateway(s).exist_with_name(region_name='check'),
+    ),
+]
+
+
+async def capture_statements(
+    session: AsyncSession, call: Callable[[AsyncSession], Awaitable[Any]]
+) -> list[tuple[str, Any]]:
+    statements = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    sync_engine = session.bind.sync_engine
+    event.listen(sync_engine, 'before_cursor_execute', on_execute)
+    try:
+        await call(session)
+    finally:
+        event.remove(sync_engine, 'before_cursor_execute', on_execute)
+
+    return statements
+
+
+def scanned_indexes(plan: dict[str, Any]) -> list[tuple[str, str]]:
+    scans = []
+    nodes = [plan['Plan']]
+    while nodes:
+        node = nodes.pop()
+        if 'Index Name' in node:
+            scans.append((node['Node Type'], node['Index Name']))
+        elif node['Node Type'] == 'Seq Scan':
+            scans.append((node['Node Type'], node['Relation Name']))
+        nodes.extend(node.get('Plans', []))
+
+    return scans
+
+
+async def run_check(session: AsyncSession, check: IndexCheck) -> bool:
+    statements = await capture_statements(session, check.call)
+    connection = await session.connection()
+
+    ok = bool(statements)
+    descriptions = []
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(
+            f'EXPLAIN (FORMAT JSON) {statement}', parameters
+        )
+        scans = scanned_indexes(result.scalar()[0])
+        ok = ok and any(name in check.indexes for _, name in scans)
+        descriptions.extend(f'{node} on {name}' for node, name in scans)
+
+    status = 'OK  ' if ok else 'FAIL'
+    print(f'{status} {check.name}: {", ".join(descriptions) or "no query"}')
+    return ok
+
+
+async def main(allow_seqscan: bool) -> int:
+    session_maker = new_session_maker(Config().postgres)
+
+    async with session_maker() as session:
+        if not allow_seqscan:
+            await session.execute(text('SET LOCAL enable_seqscan = off'))
+
+        results = [await run_check(session, check) for check in CHECKS]
+        await session.rollback()
+
+    await session_maker.kw['bind'].dispose()
+    return 0 if all(results) else 1
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--allow-seqscan',
+        action='store_true',
+        help='keep the planner defaults instead of disabling sequential scans',
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.allow_seqscan)))
@@ -0,0 +1,7 @@
+from sqlalchemy.exc import IntegrityError
+
+FOREIGN_KEY_VIOLATION = '23503'
+
+
+def is_foreign_key_violation(error: IntegrityError) -> bool:
+    return getattr(error.orig, 'sqlstate', None) == FOREIGN_KEY_VIOLATION
@@ -1,19 +1,130 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
-from app.config import PostgresConfig
+from app.config import PostgresConfig, ReplicaConfig
+from app.infrastructure.db.pool import PoolMetrics
+from app.infrastructure.db.slow_query import SlowQueryLog
+from app.infrastructure.metrics.latency import LatencyMetric
+from app.infrastructure.metrics.queries import time_queries
+from app.infrastructure.replicas.replica_set import ReplicaSet
+from app.infrastructure.replicas.routing import RoutingSession
+from app.infrastructure.tracing.queries import trace_queries
+from app.infrastructure.tracing.tracer import Tracer
 
 
-def new_session_maker(psql_config: PostgresConfig) -> async_sessionmaker[AsyncSession]:
+def new_session_maker(
+    psql_config: PostgresConfig,
+    pool_metrics: PoolMetrics | None = None,
+    query_metrics: LatencyMetric | None = None,
+    tracer: Tracer | None = None,
+    replica_config: ReplicaConfig | None = None,
+) -> async_sessionmaker[AsyncSession]:
     database_uri = f'postgresql+psycopg://{psql_config.user}:{psql_config.password}@{psql_config.host}:{psql_config.port}/{psql_config.database}'
 
-    engine = create_async_engine(
-        database_uri,
-        pool_size=15,
-        max_overflow=15,
-        connect_args={
-            'connect_timeout': 5,
-        },
+    pool_options = {}
+    if pool_metrics is not None:
+        pool_options['poolclass'] = pool_metrics.pool_class
+
+    engine = _new_engine(
+        database_uri, psql_config, query_metrics, tracer, **pool_options
     )
+    if pool_metrics is not None:
+        pool_metrics.bind(engine.sync_engine)
+
+    session_options = {}
+    if replica_config is not None and replica_config.enabled:
+        # Replicas get the primary's pool settings; pool metrics stay on the
+        # primary, which every write goes through.
+        replicas = [
+            _new_engine(_psycopg_url(url), psql_config, query_metrics, tracer)
+            for url in replica_config.urls
+        ]
+        session_options['sync_session_class'] = RoutingSession
+        session_options['replicas'] = ReplicaSet(
+            replicas, ejection=replica_config.ejection_seconds
+        )
+
     return async_sessionmaker(
-        engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+        engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+        **session_options,
+    )
+
+
+def _new_engine(
+    url: str | URL,
+    psql_config: PostgresConfig,
+    query_metrics: LatencyMetric | None,
+    tracer: Tracer | None,
+    **pool_options,
+) -> AsyncEngine:
+    connect_args = {
+        'connect_timeout': psql_config.connect_timeout,
+        'prepare_threshold': (
+            psql_config.prepare_threshold
+            if psql_config.prepare_threshold >= 0
+            else None
+        ),
+    }
+    if psql_config.statement_timeout_ms:
+        connect_args['options'] = (
+            f'-c statement_timeout={psql_config.statement_timeout_ms}'
+        )
+
+    engine = create_async_engine(
+        url,
+        pool_size=psql_config.pool_size,
+        max_overflow=psql_config.max_overflow,
+        pool_timeout=psql_config.pool_timeout,
+        pool_recycle=psql_config.pool_recycle,
+        pool_pre_ping=psql_config.pool_pre_ping,
+        connect_args=connect_args,
+        **pool_options,
+    )
+    if query_metrics is not None:
+        time_queries(engine.sync_engine, query_metrics)
+    if tracer is not None and tracer.enabled:
+        trace_queries(engine.sync_engine, tracer)
+    if psql_config.slow_query_threshold_ms is not None:
+        SlowQueryLog(
+            psql_config.slow_query_threshold_ms / 1000,
+            explain=psql_config.slow_query_explain,
+        ).bind(engine.sync_engine)
+    return engine
+
+
+def _psycopg_url(dsn: str) -> URL:
+    # Plain postgresql:// DSNs would pick psycopg2, which is not installed.
+    url = make_url(dsn)
+    if url.drivername in ('postgres', 'postgresql'):
+        url = url.set(drivername='postgresql+psycopg')
+    return url
+
+
+def split_pool(psql_config: PostgresConfig, workers: int) -> PostgresConfig:
+    """Divide the pool between ``workers`` processes.
+
+    Shares are rounded down, so the workers together never open more than
+    the configured totals; an overflow smaller than ``workers`` leaves them
+    none. Every worker needs a connection, so more workers than
+    ``pool_size`` is rejected.
+    """
+    if workers > psql_config.pool_size:
+        raise ValueError(
+            f'{workers} workers need POSTGRES_POOL_SIZE of at least {workers}, '
+            f'got {psql_config.pool_size}'
+        )
+
+    return psql_config.model_copy(
+        update={
+            'pool_size': psql_config.pool_size // workers,
+            'max_overflow': psql_config.max_overflow // workers,
+        }
     )
@@ -36,6 +36,14 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = BaseModel.metadata
 
+# Indexes that only exist in migrations because they depend on extensions;
+# autogenerate must not offer to drop them.
+MIGRATION_ONLY_INDEXES = {"ix_city_name_trgm"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    return not (type_ == "index" and reflected and name in MIGRATION_ONLY_INDEXES)
+
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -61,6 +69,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -81,7 +90,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
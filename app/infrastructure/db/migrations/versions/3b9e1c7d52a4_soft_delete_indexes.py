@@ -0,0 +1,63 @@
+"""partial covering indexes for active rows
+
+Revision ID: 3b9e1c7d52a4
+Revises: f53038e97d0c
+Create Date: 2026-10-17 10:12:40.318502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9e1c7d52a4'
+down_revision: Union[str, Sequence[str], None] = 'f53038e97d0c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_city_id_active', 'city', ['id'],
+     ['district_id', 'name', 'obj_type', 'population', 'is_deleted']),
+    ('ix_city_district_id_active', 'city', ['district_id'],
+     ['id', 'name', 'obj_type', 'population', 'is_deleted']),
+    ('ix_district_id_active', 'district', ['id'],
+     ['region_id', 'name', 'is_deleted']),
+    ('ix_district_region_id_active', 'district', ['region_id'],
+     ['id', 'name', 'is_deleted']),
+    ('ix_region_id_active', 'region', ['id'],
+     ['name', 'capital', 'is_deleted']),
+    ('ix_region_name_active', 'region', ['name'],
+     ['id', 'capital', 'is_deleted']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps the tables writable while the indexes are built,
+    # but it cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_include=include,
+                postgresql_where=sa.text('is_deleted = false'),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,35 @@
+"""change counters for conditional reads
+
+Revision ID: 4a7c0e5b9d21
+Revises: e2b6f9d4a130
+Create Date: 2026-10-17 15:21:07.403816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a7c0e5b9d21'
+down_revision: Union[str, Sequence[str], None] = 'e2b6f9d4a130'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'entity_version',
+        sa.Column('key', sa.String(length=100), nullable=False),
+        sa.Column(
+            'version', sa.BigInteger(), server_default=sa.text('0'), nullable=False
+        ),
+        sa.PrimaryKeyConstraint('key'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('entity_version')
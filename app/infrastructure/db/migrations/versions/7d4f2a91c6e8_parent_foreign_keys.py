@@ -0,0 +1,45 @@
+"""foreign keys to parent entities
+
+Revision ID: 7d4f2a91c6e8
+Revises: 3b9e1c7d52a4
+Create Date: 2026-10-17 11:04:18.562910
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d4f2a91c6e8'
+down_revision: Union[str, Sequence[str], None] = '3b9e1c7d52a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+FOREIGN_KEYS = [
+    ('city_district_id_fkey', 'city', 'district', 'district_id'),
+    ('district_region_id_fkey', 'district', 'region', 'region_id'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # NOT VALID skips the scan of existing rows, so ADD CONSTRAINT holds its
+    # locks only briefly. Those locks last until the transaction ends, so
+    # VALIDATE runs after it is committed, where it scans the rows without
+    # blocking writes.
+    for name, table, referent, column in FOREIGN_KEYS:
+        op.create_foreign_key(
+            name, table, referent, [column], ['id'], postgresql_not_valid=True
+        )
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in FOREIGN_KEYS:
+            op.execute(sa.text(f'ALTER TABLE {table} VALIDATE CONSTRAINT {name}'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _, _ in reversed(FOREIGN_KEYS):
+        op.drop_constraint(name, table, type_='foreignkey')
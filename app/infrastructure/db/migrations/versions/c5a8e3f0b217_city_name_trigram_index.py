@@ -0,0 +1,47 @@
+"""trigram index for city name search
+
+Revision ID: c5a8e3f0b217
+Revises: 7d4f2a91c6e8
+Create Date: 2026-10-17 13:21:06.904417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a8e3f0b217'
+down_revision: Union[str, Sequence[str], None] = '7d4f2a91c6e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The index is not declared on the City model: it needs the pg_trgm
+    # extension, which plain metadata.create_all does not install.
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_city_name_trgm',
+            'city',
+            ['name'],
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_where=sa.text('is_deleted = false'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_city_name_trgm',
+            table_name='city',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,63 @@
+"""materialized views with population rollups
+
+Revision ID: e2b6f9d4a130
+Revises: c5a8e3f0b217
+Create Date: 2026-10-17 14:02:51.118260
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b6f9d4a130'
+down_revision: Union[str, Sequence[str], None] = 'c5a8e3f0b217'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+UPGRADE = [
+    """
+    CREATE MATERIALIZED VIEW district_population_stats AS
+    SELECT d.id AS district_id,
+           d.region_id,
+           c.obj_type,
+           count(*) AS city_count,
+           coalesce(sum(c.population), 0)::bigint AS population
+    FROM city c
+    JOIN district d ON d.id = c.district_id AND d.is_deleted = false
+    JOIN region r ON r.id = d.region_id AND r.is_deleted = false
+    WHERE c.is_deleted = false
+    GROUP BY d.id, d.region_id, c.obj_type
+    """,
+    # REFRESH ... CONCURRENTLY needs a unique index over plain columns.
+    'CREATE UNIQUE INDEX ux_district_population_stats '
+    'ON district_population_stats (district_id, obj_type)',
+    'CREATE INDEX ix_district_population_stats_region_id '
+    'ON district_population_stats (region_id)',
+    """
+    CREATE MATERIALIZED VIEW region_population_stats AS
+    SELECT region_id,
+           obj_type,
+           sum(city_count)::bigint AS city_count,
+           sum(population)::bigint AS population
+    FROM district_population_stats
+    GROUP BY region_id, obj_type
+    """,
+    'CREATE UNIQUE INDEX ux_region_population_stats '
+    'ON region_population_stats (region_id, obj_type)',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for statement in UPGRADE:
+        op.execute(sa.text(statement))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS region_population_stats')
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS district_population_stats')
@@ -2,5 +2,15 @@ from .base import BaseModel
 from .city import City
 from .district import District
 from .region import Region
+from .stats import district_population_stats, region_population_stats
+from .version import EntityVersion
 
-__all__ = ['BaseModel', 'District', 'City', 'Region']
+__all__ = [
+    'BaseModel',
+    'District',
+    'City',
+    'Region',
+    'EntityVersion',
+    'district_population_stats',
+    'region_population_stats',
+]
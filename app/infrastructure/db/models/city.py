@@ -1,13 +1,44 @@
-from sqlalchemy import Boolean, Column, Integer, String, Uuid
+from sqlalchemy import (
+    Boolean,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Uuid,
+    text,
+)
 
 from app.infrastructure.db.models.base import BaseModel
 
 
 class City(BaseModel):
     __tablename__ = 'city'
+    # The ix_city_name_trgm GIN index used by name search is created by a
+    # migration only, as it depends on the pg_trgm extension.
+    __table_args__ = (
+        Index(
+            'ix_city_id_active',
+            'id',
+            postgresql_include=[
+                'district_id',
+                'name',
+                'obj_type',
+                'population',
+                'is_deleted',
+            ],
+            postgresql_where=text('is_deleted = false'),
+        ),
+        Index(
+            'ix_city_district_id_active',
+            'district_id',
+            postgresql_include=['id', 'name', 'obj_type', 'population', 'is_deleted'],
+            postgresql_where=text('is_deleted = false'),
+        ),
+    )
 
     id = Column(Uuid, primary_key=True)
-    district_id = Column(Uuid)
+    district_id = Column(Uuid, ForeignKey('district.id'))
     name = Column(String(100), nullable=False)
     obj_type = Column(String(50))
     population = Column(Integer)
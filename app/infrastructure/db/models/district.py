@@ -1,12 +1,26 @@
-from sqlalchemy import Boolean, Column, String, Uuid
+from sqlalchemy import Boolean, Column, ForeignKey, Index, String, Uuid, text
 
 from app.infrastructure.db.models.base import BaseModel
 
 
 class District(BaseModel):
     __tablename__ = 'district'
+    __table_args__ = (
+        Index(
+            'ix_district_id_active',
+            'id',
+            postgresql_include=['region_id', 'name', 'is_deleted'],
+            postgresql_where=text('is_deleted = false'),
+        ),
+        Index(
+            'ix_district_region_id_active',
+            'region_id',
+            postgresql_include=['id', 'name', 'is_deleted'],
+            postgresql_where=text('is_deleted = false'),
+        ),
+    )
 
     id = Column(Uuid, primary_key=True)
-    region_id = Column(Uuid)
+    region_id = Column(Uuid, ForeignKey('region.id'))
     name = Column(String(100), nullable=False)
     is_deleted = Column(Boolean, default=False)
@@ -1,10 +1,24 @@
-from sqlalchemy import Boolean, Column, String, Uuid
+from sqlalchemy import Boolean, Column, Index, String, Uuid, text
 
 from app.infrastructure.db.models.base import BaseModel
 
 
 class Region(BaseModel):
     __tablename__ = 'region'
+    __table_args__ = (
+        Index(
+            'ix_region_id_active',
+            'id',
+            postgresql_include=['name', 'capital', 'is_deleted'],
+            postgresql_where=text('is_deleted = false'),
+        ),
+        Index(
+            'ix_region_name_active',
+            'name',
+            postgresql_include=['id', 'capital', 'is_deleted'],
+            postgresql_where=text('is_deleted = false'),
+        ),
+    )
 
     id = Column(Uuid, primary_key=True)
     name = Column(String(100), nullable=False)
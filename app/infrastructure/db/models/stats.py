@@ -0,0 +1,35 @@
+from sqlalchemy import DDL, BigInteger, String, Uuid, column, event, table
+
+from app.infrastructure.db.models.base import BaseModel
+from app.infrastructure.db.views import POPULATION_STATS_DDL
+
+# Population rollups are materialized views, created by a migration and,
+# for databases built from the metadata (tests, benchmarks), by the DDL
+# hooks below.
+STATS_VIEWS = ('district_population_stats', 'region_population_stats')
+
+district_population_stats = table(
+    'district_population_stats',
+    column('district_id', Uuid),
+    column('region_id', Uuid),
+    column('obj_type', String),
+    column('city_count', BigInteger),
+    column('population', BigInteger),
+)
+region_population_stats = table(
+    'region_population_stats',
+    column('region_id', Uuid),
+    column('obj_type', String),
+    column('city_count', BigInteger),
+    column('population', BigInteger),
+)
+
+for statement in POPULATION_STATS_DDL:
+    event.listen(BaseModel.metadata, 'after_create', DDL(statement))
+
+for view in reversed(STATS_VIEWS):
+    event.listen(
+        BaseModel.metadata,
+        'before_drop',
+        DDL(f'DROP MATERIALIZED VIEW IF EXISTS {view}'),
+    )
@@ -0,0 +1,10 @@
+from sqlalchemy import BigInteger, Column, String, text
+
+from app.infrastructure.db.models.base import BaseModel
+
+
+class EntityVersion(BaseModel):
+    __tablename__ = 'entity_version'
+
+    key = Column(String(100), primary_key=True)
+    version = Column(BigInteger, nullable=False, server_default=text('0'))
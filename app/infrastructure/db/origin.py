@@ -0,0 +1,73 @@
+import functools
+import inspect
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+T = TypeVar('T')
+
+_origin: ContextVar[str | None] = ContextVar('query_origin', default=None)
+
+
+def query_origin() -> str | None:
+    """The gateway method running the current query, e.g. ``CityGateway.save``."""
+    return _origin.get()
+
+
+def tracks_query_origin(cls: type[T]) -> type[T]:
+    """Label the queries run by each public async method of ``cls``.
+
+    SQLAlchemy runs the driver calls of the async engine in a greenlet that
+    shares the caller's context, so engine event listeners can read the
+    label with ``query_origin``.
+    """
+    for name, member in list(vars(cls).items()):
+        if name.startswith('_'):
+            continue
+        origin = f'{cls.__name__}.{name}'
+        if inspect.isasyncgenfunction(member):
+            setattr(cls, name, _label_async_gen(origin, member))
+        elif inspect.iscoroutinefunction(member):
+            setattr(cls, name, _label_coroutine(origin, member))
+    return cls
+
+
+def _label_coroutine(
+    origin: str, method: Callable[..., Awaitable[Any]]
+) -> Callable[..., Awaitable[Any]]:
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = _origin.set(origin)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            _origin.reset(token)
+
+    return wrapper
+
+
+def _label_async_gen(
+    origin: str, method: Callable[..., AsyncIterator[Any]]
+) -> Callable[..., AsyncIterator[Any]]:
+    # Only the first step is labelled: that is where the statement runs, and
+    # later rows come from the open server-side cursor without new cursor
+    # executions. Keeping the label off between items also stops the
+    # consumer's own queries from inheriting it.
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        items = method(*args, **kwargs)
+        try:
+            token = _origin.set(origin)
+            try:
+                first = await items.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                _origin.reset(token)
+            yield first
+            async for item in items:
+                yield item
+        finally:
+            await items.aclose()
+
+    return wrapper
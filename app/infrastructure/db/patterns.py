@@ -0,0 +1,10 @@
+LIKE_ESCAPE = '\\'
+
+
+def escape_like(value: str) -> str:
+    """Make user input match literally inside a ``LIKE`` pattern."""
+    return (
+        value.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace('%', LIKE_ESCAPE + '%')
+        .replace('_', LIKE_ESCAPE + '_')
+    )
@@ -0,0 +1,86 @@
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from app.infrastructure.metrics.histogram import Histogram
+
+
+@dataclass(slots=True)
+class PoolStats:
+    size: int
+    checked_out: int
+    overflow: int
+    waiters: int
+    checkouts: int
+    connects: int
+    invalidations: int
+
+
+class PoolMetrics:
+    """Live view of one engine's connection pool.
+
+    Checkouts, new connections and invalidations come from pool events.
+    Waiters and the checkout wait are measured around ``Pool.connect``,
+    which the pool has no event for: the wait covers queueing for a free
+    connection as well as opening a new one.
+    """
+
+    def __init__(self) -> None:
+        self.checkout_wait = Histogram()
+        self.waiters = 0
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self._engine: Engine | None = None
+
+        metrics = self
+
+        class InstrumentedPool(AsyncAdaptedQueuePool):
+            # Pool.recreate() builds the replacement from this class, so the
+            # timing survives engine.dispose().
+            def connect(self) -> PoolProxiedConnection:
+                metrics.waiters += 1
+                start = time.perf_counter()
+                try:
+                    return super().connect()
+                finally:
+                    metrics.waiters -= 1
+                    metrics.checkout_wait.observe(time.perf_counter() - start)
+
+        self.pool_class = InstrumentedPool
+
+    def bind(self, engine: Engine) -> None:
+        """Listen to ``engine``, whose pool must be ``pool_class``."""
+        self._engine = engine
+        event.listen(engine, 'checkout', self._on_checkout)
+        event.listen(engine, 'connect', self._on_connect)
+        event.listen(engine, 'invalidate', self._on_invalidate)
+
+    def stats(self) -> PoolStats:
+        size = checked_out = overflow = 0
+        if self._engine is not None:
+            # Read from the engine each time: dispose() swaps in a new pool.
+            pool = self._engine.pool
+            size, checked_out = pool.size(), pool.checkedout()
+            overflow = max(pool.overflow(), 0)
+        return PoolStats(
+            size=size,
+            checked_out=checked_out,
+            overflow=overflow,
+            waiters=self.waiters,
+            checkouts=self.checkouts,
+            connects=self.connects,
+            invalidations=self.invalidations,
+        )
+
+    def _on_checkout(self, *_) -> None:
+        self.checkouts += 1
+
+    def _on_connect(self, *_) -> None:
+        self.connects += 1
+
+    def _on_invalidate(self, *_) -> None:
+        self.invalidations += 1
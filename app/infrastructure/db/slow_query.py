@@ -0,0 +1,125 @@
+import logging
+import time
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from psycopg.pq import TransactionStatus
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext, ExecutionContext
+
+from app.infrastructure.db.origin import query_origin
+
+logger = logging.getLogger(__name__)
+
+_STARTED = 'slow_query_started'
+# EXPLAIN accepts these; anything else would fail and abort the transaction.
+_EXPLAINABLE = ('select', 'insert', 'update', 'delete', 'with', 'values')
+# Statements are explained once each; the set stops growing at this size.
+MAX_EXPLAINED = 1000
+
+
+class SlowQueryLog:
+    """Logs statements that run longer than ``threshold`` seconds.
+
+    Each entry has the originating gateway method, the duration, the row
+    count, the SQL and the shape of its parameters. Parameter values are
+    left out, as they may hold personal data. With ``explain`` the first
+    slow run of each statement also logs its plan. The plan comes from a
+    plain EXPLAIN on the same connection, inside a savepoint, so it sees
+    the same data and cannot break the caller's transaction. That run is
+    paid by the request that hit the slow statement.
+    """
+
+    def __init__(self, threshold: float, explain: bool = False):
+        self._threshold = threshold
+        self._explain = explain
+        self._explained: set[str] = set()
+
+    def bind(self, engine: Engine) -> None:
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+        event.listen(engine, 'handle_error', self._handle_error)
+
+    def _before_cursor_execute(self, conn: Connection, *_: Any) -> None:
+        conn.info.setdefault(_STARTED, []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        elapsed = time.perf_counter() - conn.info[_STARTED].pop()
+        if elapsed < self._threshold:
+            return
+
+        message = 'Slow query from %s: %.1f ms, %s rows, parameters %s\n%s'
+        args: list[Any] = [
+            query_origin() or 'unknown',
+            elapsed * 1000,
+            cursor.rowcount,
+            parameter_shapes(parameters),
+            statement,
+        ]
+        if self._explain and not executemany and self._should_explain(statement):
+            plan = self._plan(conn, statement, parameters)
+            if plan is not None:
+                message += '\n%s'
+                args.append(plan)
+        logger.warning(message, *args)
+
+    def _handle_error(self, context: ExceptionContext) -> None:
+        conn = context.connection
+        if conn is not None and conn.info.get(_STARTED):
+            conn.info[_STARTED].pop()
+
+    def _should_explain(self, statement: str) -> bool:
+        if statement in self._explained or len(self._explained) >= MAX_EXPLAINED:
+            return False
+        if not statement.lstrip().lower().startswith(_EXPLAINABLE):
+            return False
+        self._explained.add(statement)
+        return True
+
+    @staticmethod
+    def _plan(conn: Connection, statement: str, parameters: Any) -> str | None:
+        # Runs on the DBAPI connection, so no cursor events fire for it.
+        cursor = conn.connection.cursor()
+        status = conn.connection.driver_connection.info.transaction_status
+        in_transaction = status == TransactionStatus.INTRANS
+        try:
+            if in_transaction:
+                cursor.execute('SAVEPOINT slow_query_explain')
+            try:
+                cursor.execute(f'EXPLAIN {statement}', parameters)
+                plan = '\n'.join(row[0] for row in cursor.fetchall())
+            except Exception:
+                logger.exception('Could not explain a slow query')
+                if in_transaction:
+                    cursor.execute('ROLLBACK TO SAVEPOINT slow_query_explain')
+                return None
+            if in_transaction:
+                cursor.execute('RELEASE SAVEPOINT slow_query_explain')
+            return plan
+        finally:
+            cursor.close()
+
+
+def parameter_shapes(parameters: Any) -> Any:
+    """Types and sizes of bound parameters, without their values."""
+    if isinstance(parameters, Mapping):
+        return {name: _shape(value) for name, value in parameters.items()}
+    if isinstance(parameters, Sequence) and not isinstance(parameters, str | bytes):
+        if parameters and isinstance(parameters[0], Mapping):
+            return f'{len(parameters)} x {parameter_shapes(parameters[0])}'
+        return [_shape(value) for value in parameters]
+    return _shape(parameters)
+
+
+def _shape(value: Any) -> str:
+    if isinstance(value, list | tuple):
+        return f'{type(value).__name__}[{len(value)}]'
+    return type(value).__name__
@@ -0,0 +1,11 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.interface.transaction import TransactionManager
+
+
+class SessionTransactionManager(TransactionManager):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def commit(self) -> None:
+        await self._session.commit()
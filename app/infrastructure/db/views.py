@@ -0,0 +1,38 @@
+# Current definitions of the population rollup views, for databases built
+# from the metadata (tests, benchmarks). Migrations keep their own frozen
+# copies; a migration that redefines a view updates this module too.
+DISTRICT_POPULATION_STATS_SQL = """
+CREATE MATERIALIZED VIEW district_population_stats AS
+SELECT d.id AS district_id,
+       d.region_id,
+       c.obj_type,
+       count(*) AS city_count,
+       coalesce(sum(c.population), 0)::bigint AS population
+FROM city c
+JOIN district d ON d.id = c.district_id AND d.is_deleted = false
+JOIN region r ON r.id = d.region_id AND r.is_deleted = false
+WHERE c.is_deleted = false
+GROUP BY d.id, d.region_id, c.obj_type
+"""
+REGION_POPULATION_STATS_SQL = """
+CREATE MATERIALIZED VIEW region_population_stats AS
+SELECT region_id,
+       obj_type,
+       sum(city_count)::bigint AS city_count,
+       sum(population)::bigint AS population
+FROM district_population_stats
+GROUP BY region_id, obj_type
+"""
+
+# Both views carry a unique index so they can be refreshed CONCURRENTLY
+# without blocking readers.
+POPULATION_STATS_DDL = (
+    DISTRICT_POPULATION_STATS_SQL,
+    'CREATE UNIQUE INDEX ux_district_population_stats '
+    'ON district_population_stats (district_id, obj_type)',
+    'CREATE INDEX ix_district_population_stats_region_id '
+    'ON district_population_stats (region_id)',
+    REGION_POPULATION_STATS_SQL,
+    'CREATE UNIQUE INDEX ux_region_population_stats '
+    'ON region_population_stats (region_id, obj_type)',
+)
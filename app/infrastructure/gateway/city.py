@@ -1,84 +1,353 @@
 import uuid
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Mapping, Sequence
 
-from sqlalchemy import and_, insert, select, update
+from sqlalchemy import (
+    Integer,
+    Select,
+    String,
+    Uuid,
+    and_,
+    any_,
+    bindparam,
+    column,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 
+from app.application.errors import EntityNotExistsError
 from app.application.interface.city.city import (
     CityDeleter,
     CityReader,
     CitySaver,
     CityUpdater,
 )
+from app.application.search import SearchMode
 from app.domain.entities.city import CityDM
-from app.infrastructure.db.models import City
+from app.infrastructure.db.arrays import uuid_array
+from app.infrastructure.db.errors import is_foreign_key_violation
+from app.infrastructure.db.models import City, District
+from app.infrastructure.db.origin import tracks_query_origin
+from app.infrastructure.db.patterns import LIKE_ESCAPE, escape_like
+
+# Reads select plain table columns in CityDM field order and build the domain
+# objects straight from the row tuples, without loading ORM entities.
+_city = City.__table__
+_CITY_COLUMNS = (
+    _city.c.id,
+    _city.c.district_id,
+    _city.c.name,
+    _city.c.obj_type,
+    _city.c.population,
+)
+_district = District.__table__
+
+# Read statements are built once here and take their values as bind
+# parameters, so a call skips building the construct and SQLAlchemy's cache
+# key walk, and always sends the same SQL for psycopg to prepare.
+_ACTIVE = _city.c.is_deleted == False
+_SELECT_CITIES = select(*_CITY_COLUMNS)
+
+_FIRST_PAGE = (
+    _SELECT_CITIES.where(_ACTIVE).order_by(_city.c.id).limit(bindparam('limit'))
+)
+_NEXT_PAGE = (
+    _SELECT_CITIES.where(and_(_ACTIVE, _city.c.id > bindparam('after_id')))
+    .order_by(_city.c.id)
+    .limit(bindparam('limit'))
+)
+_BY_DISTRICT = _SELECT_CITIES.where(
+    and_(_city.c.district_id == bindparam('district_id'), _ACTIVE)
+)
+# Cities are outer joined to the requested districts, so a district without
+# cities still gets an empty entry and only the ids that do not name a live
+# district are left out of the result.
+_BY_DISTRICTS = (
+    select(_district.c.id, *_CITY_COLUMNS)
+    .select_from(
+        _district.outerjoin(_city, and_(_city.c.district_id == _district.c.id, _ACTIVE))
+    )
+    .where(
+        and_(
+            _district.c.id == any_(uuid_array('district_ids')),
+            _district.c.is_deleted == False,
+        )
+    )
+    .order_by(_city.c.id)
+)
+_BY_ID = _SELECT_CITIES.where(and_(_city.c.id == bindparam('city_id'), _ACTIVE))
+_BY_IDS = _SELECT_CITIES.where(
+    and_(_city.c.id == any_(uuid_array('city_ids')), _ACTIVE)
+)
+_ALL = _SELECT_CITIES.where(_ACTIVE)
+
+
+def _search(condition: ColumnElement[bool], *order_by: ColumnElement) -> Select:
+    return (
+        _SELECT_CITIES.where(and_(condition, _ACTIVE))
+        .order_by(*order_by, _city.c.name, _city.c.id)
+        .limit(bindparam('limit'))
+    )
+
 
+# All three modes are served by the ix_city_name_trgm GIN index. Pattern
+# matches rank names where the query starts earlier and that are shorter
+# first; similarity matches rank by trigram similarity.
+_name = _city.c.name
+_SEARCH = {
+    SearchMode.SIMILAR: _search(
+        _name.op('%')(bindparam('query', type_=String)),
+        func.similarity(_name, bindparam('query', type_=String)).desc(),
+    ),
+    SearchMode.PREFIX: _search(
+        _name.ilike(bindparam('pattern', type_=String), escape=LIKE_ESCAPE),
+        func.length(_name),
+    ),
+    SearchMode.SUBSTRING: _search(
+        _name.ilike(bindparam('pattern', type_=String), escape=LIKE_ESCAPE),
+        func.strpos(func.lower(_name), bindparam('query', type_=String)),
+        func.length(_name),
+    ),
+}
 
+
+@tracks_query_origin
 class CityGateway(CitySaver, CityReader, CityDeleter, CityUpdater):
     def __init__(self, session: AsyncSession):
         self._session = session
 
-    async def get_cities(self) -> Sequence[CityDM]:
-        query = select(City).where(and_(City.is_deleted == False))
-        result = await self._session.execute(query)
+    async def get_cities(
+        self, limit: int, after_id: uuid.UUID | None = None
+    ) -> Sequence[CityDM]:
+        if after_id is None:
+            result = await self._session.execute(_FIRST_PAGE, {'limit': limit})
+        else:
+            result = await self._session.execute(
+                _NEXT_PAGE, {'limit': limit, 'after_id': after_id}
+            )
 
-        return [self._map_row_to_read_model(row) for row in result.scalars()]
+        return [self._map_row_to_read_model(row) for row in result]
 
     async def get_cities_by_district_uuid(
         self, district_id: uuid.UUID
     ) -> Sequence[CityDM]:
-        query = select(City).where(
-            and_(City.district_id == district_id, City.is_deleted == False)
+        result = await self._session.execute(_BY_DISTRICT, {'district_id': district_id})
+
+        return [self._map_row_to_read_model(row) for row in result]
+
+    async def get_cities_by_district_uuids(
+        self, district_ids: Sequence[uuid.UUID]
+    ) -> Mapping[uuid.UUID, Sequence[CityDM]]:
+        result = await self._session.execute(
+            _BY_DISTRICTS, {'district_ids': list(district_ids)}
         )
-        result = await self._session.execute(query)
 
-        return [self._map_row_to_read_model(row) for row in result.scalars()]
+        cities: dict[uuid.UUID, list[CityDM]] = {}
+        for district_id, *city in result:
+            district_cities = cities.setdefault(district_id, [])
+            if city[0] is not None:
+                district_cities.append(self._map_row_to_read_model(city))
+
+        return cities
 
     async def get_by_uuid(self, city_id: uuid.UUID) -> CityDM | None:
-        query = select(City).where(and_(City.id == city_id, City.is_deleted == False))
-        result = await self._session.execute(query)
+        result = await self._session.execute(_BY_ID, {'city_id': city_id})
 
-        row = result.scalar_one_or_none()
-        if not row:
+        row = result.one_or_none()
+        if row is None:
             return None
 
         return self._map_row_to_read_model(row)
 
+    async def get_by_uuids(
+        self, city_ids: Sequence[uuid.UUID]
+    ) -> Mapping[uuid.UUID, CityDM]:
+        result = await self._session.execute(_BY_IDS, {'city_ids': list(city_ids)})
+
+        return {row.id: self._map_row_to_read_model(row) for row in result}
+
+    async def search_by_name(
+        self, query: str, mode: SearchMode, limit: int
+    ) -> Sequence[CityDM]:
+        if mode is SearchMode.SIMILAR:
+            parameters = {'query': query}
+        elif mode is SearchMode.PREFIX:
+            parameters = {'pattern': f'{escape_like(query)}%'}
+        else:
+            parameters = {'pattern': f'%{escape_like(query)}%', 'query': query.lower()}
+        result = await self._session.execute(
+            _SEARCH[mode], {**parameters, 'limit': limit}
+        )
+
+        return [self._map_row_to_read_model(row) for row in result]
+
+    async def stream_cities(self, chunk_size: int) -> AsyncIterator[CityDM]:
+        result = await self._session.stream(
+            _ALL, execution_options={'yield_per': chunk_size}
+        )
+
+        async for row in result:
+            yield self._map_row_to_read_model(row)
+
+    async def stream_cities_by_district_uuid(
+        self, district_id: uuid.UUID, chunk_size: int
+    ) -> AsyncIterator[CityDM]:
+        result = await self._session.stream(
+            _BY_DISTRICT,
+            {'district_id': district_id},
+            execution_options={'yield_per': chunk_size},
+        )
+
+        async for row in result:
+            yield self._map_row_to_read_model(row)
+
     async def save(self, city: CityDM) -> None:
-        query = insert(City).values(
-            id=city.id,
-            district_id=city.district_id,
-            name=city.name,
-            obj_type=city.obj_type,
-            population=city.population,
+        # The foreign key cannot see soft-deleted districts, so the insert
+        # also requires an active one and inserts nothing otherwise.
+        district_exists = exists().where(
+            and_(District.id == city.district_id, District.is_deleted == False)
+        )
+        query = (
+            insert(City)
+            .from_select(
+                ['id', 'district_id', 'name', 'obj_type', 'population'],
+                select(
+                    literal(city.id, Uuid),
+                    literal(city.district_id, Uuid),
+                    literal(city.name, String),
+                    literal(city.obj_type, String),
+                    literal(city.population, Integer),
+                ).where(district_exists),
+            )
+            .returning(City.id)
+        )
+
+        try:
+            result = await self._session.execute(query)
+        except IntegrityError as e:
+            await self._session.rollback()
+            if not is_foreign_key_violation(e):
+                raise
+            raise EntityNotExistsError('District does not exist')
+
+        if result.scalar_one_or_none() is None:
+            raise EntityNotExistsError('District does not exist')
+
+    async def save_many(self, cities: Sequence[CityDM]) -> set[uuid.UUID]:
+        if not cities:
+            return set()
+
+        # As in save, only cities of active districts are inserted. The
+        # districts are locked FOR SHARE, so one deleted concurrently is
+        # either seen as deleted or waits for this transaction.
+        new_cities = values(
+            column('id', Uuid),
+            column('district_id', Uuid),
+            column('name', String),
+            column('obj_type', String),
+            column('population', Integer),
+            name='new_city',
+        ).data(
+            [
+                (city.id, city.district_id, city.name, city.obj_type, city.population)
+                for city in cities
+            ]
+        )
+        query = (
+            insert(City)
+            .from_select(
+                ['id', 'district_id', 'name', 'obj_type', 'population'],
+                select(new_cities)
+                .join(
+                    District,
+                    and_(
+                        District.id == new_cities.c.district_id,
+                        District.is_deleted == False,
+                    ),
+                )
+                .with_for_update(read=True, of=District),
+            )
+            .returning(City.id)
         )
 
-        await self._session.execute(query)
-        await self._session.commit()
+        try:
+            result = await self._session.execute(query)
+        except IntegrityError as e:
+            await self._session.rollback()
+            if not is_foreign_key_violation(e):
+                raise
+            raise EntityNotExistsError('District does not exist')
+
+        return set(result.scalars())
 
-    async def delete_by_uuid(self, city_id: uuid.UUID) -> None:
+    async def delete_by_uuid(self, city_id: uuid.UUID) -> uuid.UUID | None:
         stmt = (
             update(City)
-            .where(
-                and_(City.id == city_id),
-            )
+            .where(and_(City.id == city_id, City.is_deleted == False))
             .values(is_deleted=True)
+            .returning(City.district_id)
         )
 
-        await self._session.execute(stmt)
-        await self._session.commit()
+        return (await self._session.execute(stmt)).scalar_one_or_none()
 
-    async def update_by_uuid(self, city: CityDM) -> None:
-        stmt = update(City).where(and_(City.id == city.id)).values(**city.__dict__)
-        await self._session.execute(stmt)
-        await self._session.commit()
+    async def update_by_uuid(self, city: CityDM) -> uuid.UUID:
+        # Both existence checks and the update run as one statement; the
+        # selected flag tells a missing district apart from a missing city.
+        district_exists = select(
+            exists().where(
+                and_(District.id == city.district_id, District.is_deleted == False)
+            )
+        ).scalar_subquery()
+        # The old row is locked and read in the same statement, so the
+        # district the city leaves comes from the database, not a cache.
+        previous = (
+            select(City.id, City.district_id)
+            .where(and_(City.id == city.id, City.is_deleted == False))
+            .with_for_update()
+            .subquery('previous')
+        )
+        updated = (
+            update(City)
+            .where(and_(City.id == previous.c.id, district_exists))
+            .values(
+                district_id=city.district_id,
+                name=city.name,
+                obj_type=city.obj_type,
+                population=city.population,
+            )
+            .returning(previous.c.district_id)
+            .cte('updated')
+        )
+        query = select(
+            district_exists.label('district_exists'),
+            select(updated.c.district_id)
+            .scalar_subquery()
+            .label('previous_district_id'),
+        )
+
+        try:
+            result = (await self._session.execute(query)).one()
+        except IntegrityError as e:
+            await self._session.rollback()
+            if not is_foreign_key_violation(e):
+                raise
+            raise EntityNotExistsError('District does not exist')
+
+        if not result.district_exists:
+            raise EntityNotExistsError('District does not exist')
+        if result.previous_district_id is None:
+            raise EntityNotExistsError('City does not exist')
+
+        return result.previous_district_id
 
     @staticmethod
-    def _map_row_to_read_model(row: City) -> CityDM:
-        return CityDM(
-            id=row.id,
-            district_id=row.district_id,
-            name=row.name,
-            obj_type=row.obj_type,
-            population=row.population,
-        )
+    def _map_row_to_read_model(row: Row) -> CityDM:
+        return CityDM(*row)
@@ -1,73 +1,210 @@
 import uuid
-
-from sqlalchemy import Sequence, and_, insert, select, update
+from collections.abc import AsyncIterator, Mapping
+
+from sqlalchemy import (
+    Sequence,
+    String,
+    Uuid,
+    and_,
+    any_,
+    bindparam,
+    exists,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.errors import EntityNotExistsError
 from app.application.interface.district.district import (
     DistrictDeleter,
     DistrictReader,
     DistrictSaver,
 )
 from app.domain.entities.district import DistrictDM
-from app.infrastructure.db.models import District
+from app.infrastructure.db.arrays import uuid_array
+from app.infrastructure.db.errors import is_foreign_key_violation
+from app.infrastructure.db.models import District, Region
+from app.infrastructure.db.origin import tracks_query_origin
+
+# Reads select plain table columns in DistrictDM field order and build the
+# domain objects straight from the row tuples, without loading ORM entities.
+_district = District.__table__
+_DISTRICT_COLUMNS = (_district.c.id, _district.c.region_id, _district.c.name)
+_region = Region.__table__
+
+# Read statements are built once, with bind parameters; see CityGateway.
+_ACTIVE = _district.c.is_deleted == False
+_SELECT_DISTRICTS = select(*_DISTRICT_COLUMNS)
+
+_FIRST_PAGE = (
+    _SELECT_DISTRICTS.where(_ACTIVE).order_by(_district.c.id).limit(bindparam('limit'))
+)
+_NEXT_PAGE = (
+    _SELECT_DISTRICTS.where(and_(_ACTIVE, _district.c.id > bindparam('after_id')))
+    .order_by(_district.c.id)
+    .limit(bindparam('limit'))
+)
+_BY_REGION = _SELECT_DISTRICTS.where(
+    and_(_district.c.region_id == bindparam('region_id'), _ACTIVE)
+)
+# Same shape as the city lookup by districts: regions without districts map
+# to an empty list, unknown ones are left out.
+_BY_REGIONS = (
+    select(_region.c.id, *_DISTRICT_COLUMNS)
+    .select_from(
+        _region.outerjoin(
+            _district, and_(_district.c.region_id == _region.c.id, _ACTIVE)
+        )
+    )
+    .where(
+        and_(
+            _region.c.id == any_(uuid_array('region_ids')),
+            _region.c.is_deleted == False,
+        )
+    )
+    .order_by(_district.c.id)
+)
+_BY_ID = _SELECT_DISTRICTS.where(
+    and_(_district.c.id == bindparam('district_id'), _ACTIVE)
+)
+_BY_IDS = _SELECT_DISTRICTS.where(
+    and_(_district.c.id == any_(uuid_array('district_ids')), _ACTIVE)
+)
+_EXISTING_IDS = select(_district.c.id).where(
+    and_(_district.c.id == any_(uuid_array('district_ids')), _ACTIVE)
+)
+_ALL = _SELECT_DISTRICTS.where(_ACTIVE)
 
 
+@tracks_query_origin
 class DistrictGateway(DistrictSaver, DistrictReader, DistrictDeleter):
     def __init__(self, session: AsyncSession):
         self._session = session
 
-    async def get_districts(self) -> Sequence[DistrictDM] | None:
-        query = select(District).where(and_(District.is_deleted == False))
-        result = await self._session.execute(query)
+    async def get_districts(
+        self, limit: int, after_id: uuid.UUID | None = None
+    ) -> Sequence[DistrictDM]:
+        if after_id is None:
+            result = await self._session.execute(_FIRST_PAGE, {'limit': limit})
+        else:
+            result = await self._session.execute(
+                _NEXT_PAGE, {'limit': limit, 'after_id': after_id}
+            )
 
-        return [self._map_row_to_read_model(row) for row in result.scalars()]
+        return [self._map_row_to_read_model(row) for row in result]
 
     async def get_districts_by_region_uuid(
         self, region_id: uuid.UUID
     ) -> Sequence[DistrictDM]:
-        query = select(District).where(
-            and_(District.region_id == region_id, District.is_deleted == False)
+        result = await self._session.execute(_BY_REGION, {'region_id': region_id})
+
+        return [self._map_row_to_read_model(row) for row in result]
+
+    async def get_districts_by_region_uuids(
+        self, region_ids: Sequence[uuid.UUID]
+    ) -> Mapping[uuid.UUID, Sequence[DistrictDM]]:
+        result = await self._session.execute(
+            _BY_REGIONS, {'region_ids': list(region_ids)}
         )
-        result = await self._session.execute(query)
 
-        return [self._map_row_to_read_model(row) for row in result.scalars()]
+        districts: dict[uuid.UUID, list[DistrictDM]] = {}
+        for region_id, *district in result:
+            region_districts = districts.setdefault(region_id, [])
+            if district[0] is not None:
+                region_districts.append(self._map_row_to_read_model(district))
+
+        return districts
 
     async def get_by_uuid(self, district_id: uuid.UUID) -> DistrictDM | None:
-        query = select(District).where(
-            and_(District.id == district_id, District.is_deleted == False)
-        )
-        result = await self._session.execute(query)
+        result = await self._session.execute(_BY_ID, {'district_id': district_id})
 
-        row = result.scalar_one_or_none()
-        if not row:
+        row = result.one_or_none()
+        if row is None:
             return None
 
         return self._map_row_to_read_model(row)
 
+    async def get_by_uuids(
+        self, district_ids: Sequence[uuid.UUID]
+    ) -> Mapping[uuid.UUID, DistrictDM]:
+        result = await self._session.execute(
+            _BY_IDS, {'district_ids': list(district_ids)}
+        )
+
+        return {row.id: self._map_row_to_read_model(row) for row in result}
+
+    async def get_existing_uuids(
+        self, district_ids: Sequence[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        result = await self._session.execute(
+            _EXISTING_IDS, {'district_ids': list(district_ids)}
+        )
+
+        return set(result.scalars())
+
+    async def stream_districts(self, chunk_size: int) -> AsyncIterator[DistrictDM]:
+        result = await self._session.stream(
+            _ALL, execution_options={'yield_per': chunk_size}
+        )
+
+        async for row in result:
+            yield self._map_row_to_read_model(row)
+
+    async def stream_districts_by_region_uuid(
+        self, region_id: uuid.UUID, chunk_size: int
+    ) -> AsyncIterator[DistrictDM]:
+        result = await self._session.stream(
+            _BY_REGION,
+            {'region_id': region_id},
+            execution_options={'yield_per': chunk_size},
+        )
+
+        async for row in result:
+            yield self._map_row_to_read_model(row)
+
     async def save(self, district: DistrictDM) -> None:
-        query = insert(District).values(
-            id=district.id, region_id=district.region_id, name=district.name
+        # Requires an active region, like CityGateway.save.
+        region_exists = exists().where(
+            and_(Region.id == district.region_id, Region.is_deleted == False)
+        )
+        query = (
+            insert(District)
+            .from_select(
+                ['id', 'region_id', 'name'],
+                select(
+                    literal(district.id, Uuid),
+                    literal(district.region_id, Uuid),
+                    literal(district.name, String),
+                ).where(region_exists),
+            )
+            .returning(District.id)
         )
 
-        await self._session.execute(query)
-        await self._session.commit()
+        try:
+            result = await self._session.execute(query)
+        except IntegrityError as e:
+            await self._session.rollback()
+            if not is_foreign_key_violation(e):
+                raise
+            raise EntityNotExistsError('Region does not exist')
+
+        if result.scalar_one_or_none() is None:
+            raise EntityNotExistsError('Region does not exist')
 
-    async def delete_by_uuid(self, district_id: uuid.UUID) -> None:
+    async def delete_by_uuid(self, district_id: uuid.UUID) -> uuid.UUID | None:
         stmt = (
             update(District)
-            .where(
-                and_(District.id == district_id),
-            )
+            .where(and_(District.id == district_id, District.is_deleted == False))
             .values(is_deleted=True)
+            .returning(District.region_id)
         )
 
-        await self._session.execute(stmt)
-        await self._session.commit()
+        return (await self._session.execute(stmt)).scalar_one_or_none()
 
     @staticmethod
-    def _map_row_to_read_model(row: District) -> DistrictDM:
-        return DistrictDM(
-            id=row.id,
-            region_id=row.region_id,
-            name=row.name,
-        )
+    def _map_row_to_read_model(row: Row) -> DistrictDM:
+        return DistrictDM(*row)
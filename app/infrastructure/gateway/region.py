@@ -1,54 +1,168 @@
 import uuid
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 
-from sqlalchemy import and_, insert, select, update
+from sqlalchemy import Select, and_, any_, bindparam, insert, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.dto.region import MAX_TREE_DEPTH, DistrictTreeDTO, RegionTreeDTO
 from app.application.interface.region.region import (
     RegionDeleter,
     RegionReader,
     RegionSaver,
 )
+from app.domain.entities.city import CityDM
 from app.domain.entities.region import RegionDM
-from app.infrastructure.db.models import Region
+from app.infrastructure.db.arrays import uuid_array
+from app.infrastructure.db.models import City, District, Region
+from app.infrastructure.db.origin import tracks_query_origin
+
+# Reads select plain table columns in RegionDM field order and build the
+# domain objects straight from the row tuples, without loading ORM entities.
+_region = Region.__table__
+_REGION_COLUMNS = (_region.c.id, _region.c.name, _region.c.capital)
+_district = District.__table__
+_city = City.__table__
+_TREE_CITY_COLUMNS = (
+    _city.c.id,
+    _city.c.district_id,
+    _city.c.name,
+    _city.c.obj_type,
+    _city.c.population,
+)
+
+# Read statements are built once, with bind parameters; see CityGateway.
+_ACTIVE = _region.c.is_deleted == False
+_SELECT_REGIONS = select(*_REGION_COLUMNS)
+
+_FIRST_PAGE = (
+    _SELECT_REGIONS.where(_ACTIVE).order_by(_region.c.id).limit(bindparam('limit'))
+)
+_NEXT_PAGE = (
+    _SELECT_REGIONS.where(and_(_ACTIVE, _region.c.id > bindparam('after_id')))
+    .order_by(_region.c.id)
+    .limit(bindparam('limit'))
+)
+_BY_ID = _SELECT_REGIONS.where(and_(_region.c.id == bindparam('region_id'), _ACTIVE))
+_BY_IDS = _SELECT_REGIONS.where(
+    and_(_region.c.id == any_(uuid_array('region_ids')), _ACTIVE)
+)
+_BY_NAME = select(_region.c.id).where(
+    and_(_region.c.name == bindparam('name'), _ACTIVE)
+)
+
+
+def _tree(depth: int) -> Select:
+    # One statement for the whole tree: the region is outer joined to its
+    # districts and, at full depth, to their cities, and the flat rows are
+    # folded back into the nested structure in id order.
+    columns = [*_REGION_COLUMNS]
+    order_by = []
+    from_clause = _region
+    if depth >= 1:
+        columns += [_district.c.id, _district.c.name]
+        order_by.append(_district.c.id)
+        from_clause = from_clause.outerjoin(
+            _district,
+            and_(
+                _district.c.region_id == _region.c.id,
+                _district.c.is_deleted == False,
+            ),
+        )
+    if depth >= 2:
+        columns += _TREE_CITY_COLUMNS
+        order_by.append(_city.c.id)
+        from_clause = from_clause.outerjoin(
+            _city,
+            and_(
+                _city.c.district_id == _district.c.id,
+                _city.c.is_deleted == False,
+            ),
+        )
+
+    return (
+        select(*columns)
+        .select_from(from_clause)
+        .where(and_(_region.c.id == bindparam('region_id'), _ACTIVE))
+        .order_by(*order_by)
+    )
 
 
+_TREES = [_tree(depth) for depth in range(MAX_TREE_DEPTH + 1)]
+
+
+@tracks_query_origin
 class RegionGateway(RegionSaver, RegionReader, RegionDeleter):
     def __init__(self, session: AsyncSession):
         self._session = session
 
-    async def get_regions(self) -> Sequence[RegionDM]:
-        query = select(Region).where(and_(Region.is_deleted == False))
-        result = await self._session.execute(query)
+    async def get_regions(
+        self, limit: int, after_id: uuid.UUID | None = None
+    ) -> Sequence[RegionDM]:
+        if after_id is None:
+            result = await self._session.execute(_FIRST_PAGE, {'limit': limit})
+        else:
+            result = await self._session.execute(
+                _NEXT_PAGE, {'limit': limit, 'after_id': after_id}
+            )
 
-        return [self._map_row_to_read_model(row) for row in result.scalars()]
+        return [self._map_row_to_read_model(row) for row in result]
 
     async def get_by_uuid(self, region_id: uuid.UUID) -> RegionDM | None:
-        query = select(Region).where(
-            and_(Region.id == region_id, Region.is_deleted == False)
-        )
-        result = await self._session.execute(query)
+        result = await self._session.execute(_BY_ID, {'region_id': region_id})
 
-        row = result.scalar_one_or_none()
-        if not row:
+        row = result.one_or_none()
+        if row is None:
             return None
 
         return self._map_row_to_read_model(row)
 
+    async def get_by_uuids(
+        self, region_ids: Sequence[uuid.UUID]
+    ) -> Mapping[uuid.UUID, RegionDM]:
+        result = await self._session.execute(_BY_IDS, {'region_ids': list(region_ids)})
+
+        return {row.id: self._map_row_to_read_model(row) for row in result}
+
+    async def get_tree(self, region_id: uuid.UUID, depth: int) -> RegionTreeDTO | None:
+        query = _TREES[min(depth, MAX_TREE_DEPTH)]
+        rows = (await self._session.execute(query, {'region_id': region_id})).all()
+        if not rows:
+            return None
+
+        region = RegionDM(*rows[0][:3])
+        tree = RegionTreeDTO(id=region.id, name=region.name, capital=region.capital)
+        if depth < 1:
+            return tree
+
+        tree.districts = []
+        for row in rows:
+            district_id, district_name = row[3:5]
+            if district_id is None:
+                continue
+            if not tree.districts or tree.districts[-1].id != district_id:
+                tree.districts.append(
+                    DistrictTreeDTO(
+                        id=district_id,
+                        region_id=region.id,
+                        name=district_name,
+                        cities=[] if depth >= 2 else None,
+                    )
+                )
+            if depth >= 2 and row[5] is not None:
+                tree.districts[-1].cities.append(CityDM(*row[5:]))
+
+        return tree
+
     async def save(self, region: RegionDM) -> None:
         query = insert(Region).values(
             id=region.id, name=region.name, capital=region.capital
         )
 
         await self._session.execute(query)
-        await self._session.commit()
 
     async def exist_with_name(self, region_name: str) -> bool:
-        query = select(Region).where(
-            and_(Region.name == region_name, Region.is_deleted == False)
-        )
-
-        result = await self._session.execute(query)
+        result = await self._session.execute(_BY_NAME, {'name': region_name})
         return bool(result.scalar())
 
     async def delete_by_uuid(self, region_id: uuid.UUID) -> None:
@@ -61,8 +175,7 @@ class RegionGateway(RegionSaver, RegionReader, RegionDeleter):
         )
 
         await self._session.execute(stmt)
-        await self._session.commit()
 
     @staticmethod
-    def _map_row_to_read_model(row: Region) -> RegionDM:
-        return RegionDM(id=row.id, name=row.name, capital=row.capital)
+    def _map_row_to_read_model(row: Row) -> RegionDM:
+        return RegionDM(*row)
@@ -0,0 +1,143 @@
+import uuid
+from collections.abc import Sequence
+
+from sqlalchemy import and_, bindparam, select, text
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.dto.stats import (
+    DistrictStatsDTO,
+    ObjTypeStatsDTO,
+    RegionStatsDTO,
+)
+from app.application.interface.stats.stats import PopulationStatsReader
+from app.infrastructure.db.models import (
+    District,
+    Region,
+    district_population_stats,
+    region_population_stats,
+)
+from app.infrastructure.db.models.stats import STATS_VIEWS
+from app.infrastructure.db.origin import tracks_query_origin
+
+_region = Region.__table__
+_district = District.__table__
+_region_stats = region_population_stats
+_district_stats = district_population_stats
+
+# Read statements are built once, with bind parameters; see CityGateway.
+_REGION_STATS = (
+    select(
+        _region.c.id,
+        _region_stats.c.obj_type,
+        _region_stats.c.city_count,
+        _region_stats.c.population,
+    )
+    .select_from(
+        _region.outerjoin(_region_stats, _region_stats.c.region_id == _region.c.id)
+    )
+    .order_by(_region.c.id, _region_stats.c.obj_type)
+)
+_ALL_REGIONS_STATS = _REGION_STATS.where(_region.c.is_deleted == False)
+_ONE_REGION_STATS = _REGION_STATS.where(
+    and_(_region.c.id == bindparam('region_id'), _region.c.is_deleted == False)
+)
+_DISTRICTS_STATS = (
+    select(
+        _district.c.id,
+        _district.c.region_id,
+        _district_stats.c.obj_type,
+        _district_stats.c.city_count,
+        _district_stats.c.population,
+    )
+    .select_from(
+        _district.outerjoin(
+            _district_stats,
+            _district_stats.c.district_id == _district.c.id,
+        )
+    )
+    .where(
+        and_(
+            _district.c.region_id == bindparam('region_id'),
+            _district.c.is_deleted == False,
+        )
+    )
+    .order_by(_district.c.id, _district_stats.c.obj_type)
+)
+
+
+@tracks_query_origin
+class PopulationStatsGateway(PopulationStatsReader):
+    """Reads the population rollups from their materialized views.
+
+    Entities are outer joined to the views, so one without live cities
+    still gets zero totals, and a read touches one row per entity and
+    ``obj_type`` instead of every city.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_regions_stats(self) -> Sequence[RegionStatsDTO]:
+        result = await self._session.execute(_ALL_REGIONS_STATS)
+
+        return self._fold_region_rows(result)
+
+    async def get_region_stats(self, region_id: uuid.UUID) -> RegionStatsDTO | None:
+        result = await self._session.execute(
+            _ONE_REGION_STATS, {'region_id': region_id}
+        )
+
+        regions = self._fold_region_rows(result)
+        return regions[0] if regions else None
+
+    async def get_districts_stats_by_region_uuid(
+        self, region_id: uuid.UUID
+    ) -> Sequence[DistrictStatsDTO]:
+        result = await self._session.execute(_DISTRICTS_STATS, {'region_id': region_id})
+
+        districts: list[DistrictStatsDTO] = []
+        for district_id, district_region_id, *obj_type_row in result:
+            if not districts or districts[-1].district_id != district_id:
+                districts.append(
+                    DistrictStatsDTO(
+                        district_id=district_id, region_id=district_region_id
+                    )
+                )
+            self._add_obj_type(districts[-1], obj_type_row)
+
+        return districts
+
+    async def refresh(self) -> None:
+        # Regions are rolled up from districts, so the order matters.
+        for view in STATS_VIEWS:
+            await self._session.execute(
+                text(f'REFRESH MATERIALIZED VIEW CONCURRENTLY {view}')
+            )
+        await self._session.commit()
+
+    def _fold_region_rows(self, rows: Sequence[Row]) -> list[RegionStatsDTO]:
+        regions: list[RegionStatsDTO] = []
+        for region_id, *obj_type_row in rows:
+            if not regions or regions[-1].region_id != region_id:
+                regions.append(RegionStatsDTO(region_id=region_id))
+            self._add_obj_type(regions[-1], obj_type_row)
+
+        return regions
+
+    @staticmethod
+    def _add_obj_type(
+        stats: RegionStatsDTO | DistrictStatsDTO, obj_type_row: Sequence
+    ) -> None:
+        obj_type, city_count, population = obj_type_row
+        if city_count is None:
+            # Outer join without a match: the entity has no live cities.
+            return
+
+        stats.city_count += city_count
+        stats.population += population
+        stats.by_obj_type.append(
+            ObjTypeStatsDTO(
+                obj_type=obj_type, city_count=city_count, population=population
+            )
+        )
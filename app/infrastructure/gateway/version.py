@@ -0,0 +1,41 @@
+from collections.abc import Sequence
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.interface.version.version import VersionBumper, VersionReader
+from app.infrastructure.db.models import EntityVersion
+from app.infrastructure.db.origin import tracks_query_origin
+
+_version = EntityVersion.__table__
+# Read on every conditional GET, so built once with a bind parameter.
+_VERSION = select(_version.c.version).where(_version.c.key == bindparam('key'))
+
+
+@tracks_query_origin
+class VersionGateway(VersionReader, VersionBumper):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_version(self, key: str) -> int:
+        version = await self._session.scalar(_VERSION, {'key': key})
+
+        # A key nothing has bumped yet has not changed since it was created.
+        return version or 0
+
+    async def bump(self, keys: Sequence[str]) -> None:
+        if not keys:
+            return
+
+        # One row per key, in a fixed order, so a single upsert never hits
+        # the same row twice and concurrent bumps lock rows in one order.
+        stmt = insert(EntityVersion).values(
+            [{'key': key, 'version': 1} for key in sorted(set(keys))]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EntityVersion.key],
+            set_={'version': EntityVersion.version + 1},
+        )
+
+        await self._session.execute(stmt)
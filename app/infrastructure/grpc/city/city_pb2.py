@@ -26,25 +26,49 @@ from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 from google.protobuf import wrappers_pb2 as google_dot_protobuf_dot_wrappers__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ncity.proto\x12\x04\x63ity\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1egoogle/protobuf/wrappers.proto\"[\n\x04\x43ity\x12\n\n\x02id\x18\x01 \x01(\t\x12\x13\n\x0b\x64istrict_id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x10\n\x08obj_type\x18\x04 \x01(\t\x12\x12\n\npopulation\x18\x05 \x01(\x05\"U\n\nNewCityDTO\x12\x13\n\x0b\x64istrict_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x10\n\x08obj_type\x18\x03 \x01(\t\x12\x12\n\npopulation\x18\x04 \x01(\x05\" \n\rCityIdRequest\x12\x0f\n\x07\x63ity_id\x18\x01 \x01(\t\"(\n\x11\x44istrictIdRequest\x12\x13\n\x0b\x64istrict_id\x18\x01 \x01(\t\"&\n\x08\x43ityList\x12\x1a\n\x06\x63ities\x18\x01 \x03(\x0b\x32\n.city.City\"!\n\x0e\x43ityIdResponse\x12\x0f\n\x07\x63ity_id\x18\x01 \x01(\t2\xa5\x02\n\x0b\x43ityService\x12\x33\n\tGetCities\x12\x16.google.protobuf.Empty\x1a\x0e.city.CityList\x12@\n\x15GetCitiesByDistrictId\x12\x17.city.DistrictIdRequest\x1a\x0e.city.CityList\x12.\n\x0bGetCityById\x12\x13.city.CityIdRequest\x1a\n.city.City\x12\x34\n\nCreateCity\x12\x10.city.NewCityDTO\x1a\x14.city.CityIdResponse\x12\x39\n\nDeleteCity\x12\x13.city.CityIdRequest\x1a\x16.google.protobuf.Emptyb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ncity.proto\x12\x04\x63ity\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1egoogle/protobuf/wrappers.proto\"[\n\x04\x43ity\x12\n\n\x02id\x18\x01 \x01(\t\x12\x13\n\x0b\x64istrict_id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x10\n\x08obj_type\x18\x04 \x01(\t\x12\x12\n\npopulation\x18\x05 \x01(\x05\"U\n\nNewCityDTO\x12\x13\n\x0b\x64istrict_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x10\n\x08obj_type\x18\x03 \x01(\t\x12\x12\n\npopulation\x18\x04 \x01(\x05\"/\n\x0bNewCityList\x12 \n\x06\x63ities\x18\x01 \x03(\x0b\x32\x10.city.NewCityDTO\"-\n\x0b\x43reatedCity\x12\x0f\n\x07\x63ity_id\x18\x01 \x01(\t\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"5\n\x0f\x43reatedCityList\x12\"\n\x07results\x18\x01 \x03(\x0b\x32\x11.city.CreatedCity\" \n\rCityIdRequest\x12\x0f\n\x07\x63ity_id\x18\x01 \x01(\t\"(\n\x11\x44istrictIdRequest\x12\x13\n\x0b\x64istrict_id\x18\x01 \x01(\t\"*\n\x12\x44istrictIdsRequest\x12\x14\n\x0c\x64istrict_ids\x18\x01 \x03(\t\"A\n\x0e\x44istrictCities\x12\x13\n\x0b\x64istrict_id\x18\x01 \x01(\t\x12\x1a\n\x06\x63ities\x18\x02 \x03(\x0b\x32\n.city.City\"W\n\x11\x43itiesByDistricts\x12$\n\x06groups\x18\x01 \x03(\x0b\x32\x14.city.DistrictCities\x12\x1c\n\x14missing_district_ids\x18\x02 \x03(\t\"\"\n\x0e\x43ityIdsRequest\x12\x10\n\x08\x63ity_ids\x18\x01 \x03(\t\"2\n\nCityLookup\x12\n\n\x02id\x18\x01 \x01(\t\x12\x18\n\x04\x63ity\x18\x02 \x01(\x0b\x32\n.city.City\"3\n\x0e\x43ityLookupList\x12!\n\x07results\x18\x01 \x03(\x0b\x32\x10.city.CityLookup\"S\n\x13SearchCitiesRequest\x12\r\n\x05query\x18\x01 \x01(\t\x12\x1e\n\x04mode\x18\x02 \x01(\x0e\x32\x10.city.SearchMode\x12\r\n\x05limit\x18\x03 \x01(\x05\",\n\x0bPageRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x0e\n\x06\x63ursor\x18\x02 \x01(\t\";\n\x08\x43ityList\x12\x1a\n\x06\x63ities\x18\x01 \x03(\x0b\x32\n.city.City\x12\x13\n\x0bnext_cursor\x18\x02 \x01(\t\"!\n\x0e\x43ityIdResponse\x12\x0f\n\x07\x63ity_id\x18\x01 \x01(\t*4\n\nSearchMode\x12\r\n\tSUBSTRING\x10\x00\x12\n\n\x06PREFIX\x10\x01\x12\x0b\n\x07SIMILAR\x10\x02\x32\x99\x05\n\x0b\x43ityService\x12.\n\tGetCities\x12\x11.city.PageRequest\x1a\x0e.city.CityList\x12@\n\x15GetCitiesByDistrictId\x12\x17.city.DistrictIdRequest\x1a\x0e.city.CityList\x12K\n\x16GetCitiesByDistrictIds\x12\x18.city.DistrictIdsRequest\x1a\x17.city.CitiesByDistricts\x12<\n\x0eGetCitiesByIds\x12\x14.city.CityIdsRequest\x1a\x14.city.CityLookupList\x12\x39\n\x0cSearchCities\x12\x19.city.SearchCitiesRequest\x1a\x0e.city.CityList\x12.\n\x0bGetCityById\x12\x13.city.CityIdRequest\x1a\n.city.City\x12\x34\n\x0cStreamCities\x12\x16.google.protobuf.Empty\x1a\n.city.City0\x01\x12\x41\n\x18StreamCitiesByDistrictId\x12\x17.city.DistrictIdRequest\x1a\n.city.City0\x01\x12\x34\n\nCreateCity\x12\x10.city.NewCityDTO\x1a\x14.city.CityIdResponse\x12\x38\n\x0c\x43reateCities\x12\x11.city.NewCityList\x1a\x15.city.CreatedCityList\x12\x39\n\nDeleteCity\x12\x13.city.CityIdRequest\x1a\x16.google.protobuf.Emptyb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'city_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_SEARCHMODE']._serialized_start=1056
+  _globals['_SEARCHMODE']._serialized_end=1108
   _globals['_CITY']._serialized_start=81
   _globals['_CITY']._serialized_end=172
   _globals['_NEWCITYDTO']._serialized_start=174
   _globals['_NEWCITYDTO']._serialized_end=259
-  _globals['_CITYIDREQUEST']._serialized_start=261
-  _globals['_CITYIDREQUEST']._serialized_end=293
-  _globals['_DISTRICTIDREQUEST']._serialized_start=295
-  _globals['_DISTRICTIDREQUEST']._serialized_end=335
-  _globals['_CITYLIST']._serialized_start=337
-  _globals['_CITYLIST']._serialized_end=375
-  _globals['_CITYIDRESPONSE']._serialized_start=377
-  _globals['_CITYIDRESPONSE']._serialized_end=410
-  _globals['_CITYSERVICE']._serialized_start=413
-  _globals['_CITYSERVICE']._serialized_end=706
+  _globals['_NEWCITYLIST']._serialized_start=261
+  _globals['_NEWCITYLIST']._serialized_end=308
+  _globals['_CREATEDCITY']._serialized_start=310
+  _globals['_CREATEDCITY']._serialized_end=355
+  _globals['_CREATEDCITYLIST']._serialized_start=357
+  _globals['_CREATEDCITYLIST']._serialized_end=410
+  _globals['_CITYIDREQUEST']._serialized_start=412
+  _globals['_CITYIDREQUEST']._serialized_end=444
+  _globals['_DISTRICTIDREQUEST']._serialized_start=446
+  _globals['_DISTRICTIDREQUEST']._serialized_end=486
+  _globals['_DISTRICTIDSREQUEST']._serialized_start=488
+  _globals['_DISTRICTIDSREQUEST']._serialized_end=530
+  _globals['_DISTRICTCITIES']._serialized_start=532
+  _globals['_DISTRICTCITIES']._serialized_end=597
+  _globals['_CITIESBYDISTRICTS']._serialized_start=599
+  _globals['_CITIESBYDISTRICTS']._serialized_end=686
+  _globals['_CITYIDSREQUEST']._serialized_start=688
+  _globals['_CITYIDSREQUEST']._serialized_end=722
+  _globals['_CITYLOOKUP']._serialized_start=724
+  _globals['_CITYLOOKUP']._serialized_end=774
+  _globals['_CITYLOOKUPLIST']._serialized_start=776
+  _globals['_CITYLOOKUPLIST']._serialized_end=827
+  _globals['_SEARCHCITIESREQUEST']._serialized_start=829
+  _globals['_SEARCHCITIESREQUEST']._serialized_end=912
+  _globals['_PAGEREQUEST']._serialized_start=914
+  _globals['_PAGEREQUEST']._serialized_end=958
+  _globals['_CITYLIST']._serialized_start=960
+  _globals['_CITYLIST']._serialized_end=1019
+  _globals['_CITYIDRESPONSE']._serialized_start=1021
+  _globals['_CITYIDRESPONSE']._serialized_end=1054
+  _globals['_CITYSERVICE']._serialized_start=1111
+  _globals['_CITYSERVICE']._serialized_end=1776
 # @@protoc_insertion_point(module_scope)
@@ -1,6 +1,7 @@
 from google.protobuf import empty_pb2 as _empty_pb2
 from google.protobuf import wrappers_pb2 as _wrappers_pb2
 from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from collections.abc import Iterable as _Iterable, Mapping as _Mapping
@@ -8,6 +9,15 @@ from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class SearchMode(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    SUBSTRING: _ClassVar[SearchMode]
+    PREFIX: _ClassVar[SearchMode]
+    SIMILAR: _ClassVar[SearchMode]
+SUBSTRING: SearchMode
+PREFIX: SearchMode
+SIMILAR: SearchMode
+
 class City(_message.Message):
     __slots__ = ("id", "district_id", "name", "obj_type", "population")
     ID_FIELD_NUMBER: _ClassVar[int]
@@ -34,6 +44,26 @@ class NewCityDTO(_message.Message):
     population: int
     def __init__(self, district_id: _Optional[str] = ..., name: _Optional[str] = ..., obj_type: _Optional[str] = ..., population: _Optional[int] = ...) -> None: ...
 
+class NewCityList(_message.Message):
+    __slots__ = ("cities",)
+    CITIES_FIELD_NUMBER: _ClassVar[int]
+    cities: _containers.RepeatedCompositeFieldContainer[NewCityDTO]
+    def __init__(self, cities: _Optional[_Iterable[_Union[NewCityDTO, _Mapping]]] = ...) -> None: ...
+
+class CreatedCity(_message.Message):
+    __slots__ = ("city_id", "error")
+    CITY_ID_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    city_id: str
+    error: str
+    def __init__(self, city_id: _Optional[str] = ..., error: _Optional[str] = ...) -> None: ...
+
+class CreatedCityList(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[CreatedCity]
+    def __init__(self, results: _Optional[_Iterable[_Union[CreatedCity, _Mapping]]] = ...) -> None: ...
+
 class CityIdRequest(_message.Message):
     __slots__ = ("city_id",)
     CITY_ID_FIELD_NUMBER: _ClassVar[int]
@@ -46,11 +76,73 @@ class DistrictIdRequest(_message.Message):
     district_id: str
     def __init__(self, district_id: _Optional[str] = ...) -> None: ...
 
+class DistrictIdsRequest(_message.Message):
+    __slots__ = ("district_ids",)
+    DISTRICT_IDS_FIELD_NUMBER: _ClassVar[int]
+    district_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, district_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class DistrictCities(_message.Message):
+    __slots__ = ("district_id", "cities")
+    DISTRICT_ID_FIELD_NUMBER: _ClassVar[int]
+    CITIES_FIELD_NUMBER: _ClassVar[int]
+    district_id: str
+    cities: _containers.RepeatedCompositeFieldContainer[City]
+    def __init__(self, district_id: _Optional[str] = ..., cities: _Optional[_Iterable[_Union[City, _Mapping]]] = ...) -> None: ...
+
+class CitiesByDistricts(_message.Message):
+    __slots__ = ("groups", "missing_district_ids")
+    GROUPS_FIELD_NUMBER: _ClassVar[int]
+    MISSING_DISTRICT_IDS_FIELD_NUMBER: _ClassVar[int]
+    groups: _containers.RepeatedCompositeFieldContainer[DistrictCities]
+    missing_district_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, groups: _Optional[_Iterable[_Union[DistrictCities, _Mapping]]] = ..., missing_district_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class CityIdsRequest(_message.Message):
+    __slots__ = ("city_ids",)
+    CITY_IDS_FIELD_NUMBER: _ClassVar[int]
+    city_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, city_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class CityLookup(_message.Message):
+    __slots__ = ("id", "city")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    CITY_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    city: City
+    def __init__(self, id: _Optional[str] = ..., city: _Optional[_Union[City, _Mapping]] = ...) -> None: ...
+
+class CityLookupList(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[CityLookup]
+    def __init__(self, results: _Optional[_Iterable[_Union[CityLookup, _Mapping]]] = ...) -> None: ...
+
+class SearchCitiesRequest(_message.Message):
+    __slots__ = ("query", "mode", "limit")
+    QUERY_FIELD_NUMBER: _ClassVar[int]
+    MODE_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    query: str
+    mode: SearchMode
+    limit: int
+    def __init__(self, query: _Optional[str] = ..., mode: _Optional[_Union[SearchMode, str]] = ..., limit: _Optional[int] = ...) -> None: ...
+
+class PageRequest(_message.Message):
+    __slots__ = ("limit", "cursor")
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    CURSOR_FIELD_NUMBER: _ClassVar[int]
+    limit: int
+    cursor: str
+    def __init__(self, limit: _Optional[int] = ..., cursor: _Optional[str] = ...) -> None: ...
+
 class CityList(_message.Message):
-    __slots__ = ("cities",)
+    __slots__ = ("cities", "next_cursor")
     CITIES_FIELD_NUMBER: _ClassVar[int]
+    NEXT_CURSOR_FIELD_NUMBER: _ClassVar[int]
     cities: _containers.RepeatedCompositeFieldContainer[City]
-    def __init__(self, cities: _Optional[_Iterable[_Union[City, _Mapping]]] = ...) -> None: ...
+    next_cursor: str
+    def __init__(self, cities: _Optional[_Iterable[_Union[City, _Mapping]]] = ..., next_cursor: _Optional[str] = ...) -> None: ...
 
 class CityIdResponse(_message.Message):
     __slots__ = ("city_id",)
@@ -37,7 +37,7 @@ class CityServiceStub(object):
         """
         self.GetCities = channel.unary_unary(
                 '/city.CityService/GetCities',
-                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                request_serializer=city__pb2.PageRequest.SerializeToString,
                 response_deserializer=city__pb2.CityList.FromString,
                 _registered_method=True)
         self.GetCitiesByDistrictId = channel.unary_unary(
@@ -45,16 +45,46 @@ class CityServiceStub(object):
                 request_serializer=city__pb2.DistrictIdRequest.SerializeToString,
                 response_deserializer=city__pb2.CityList.FromString,
                 _registered_method=True)
+        self.GetCitiesByDistrictIds = channel.unary_unary(
+                '/city.CityService/GetCitiesByDistrictIds',
+                request_serializer=city__pb2.DistrictIdsRequest.SerializeToString,
+                response_deserializer=city__pb2.CitiesByDistricts.FromString,
+                _registered_method=True)
+        self.GetCitiesByIds = channel.unary_unary(
+                '/city.CityService/GetCitiesByIds',
+                request_serializer=city__pb2.CityIdsRequest.SerializeToString,
+                response_deserializer=city__pb2.CityLookupList.FromString,
+                _registered_method=True)
+        self.SearchCities = channel.unary_unary(
+                '/city.CityService/SearchCities',
+                request_serializer=city__pb2.SearchCitiesRequest.SerializeToString,
+                response_deserializer=city__pb2.CityList.FromString,
+                _registered_method=True)
         self.GetCityById = channel.unary_unary(
                 '/city.CityService/GetCityById',
                 request_serializer=city__pb2.CityIdRequest.SerializeToString,
                 response_deserializer=city__pb2.City.FromString,
                 _registered_method=True)
+        self.StreamCities = channel.unary_stream(
+                '/city.CityService/StreamCities',
+                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                response_deserializer=city__pb2.City.FromString,
+                _registered_method=True)
+        self.StreamCitiesByDistrictId = channel.unary_stream(
+                '/city.CityService/StreamCitiesByDistrictId',
+                request_serializer=city__pb2.DistrictIdRequest.SerializeToString,
+                response_deserializer=city__pb2.City.FromString,
+                _registered_method=True)
         self.CreateCity = channel.unary_unary(
                 '/city.CityService/CreateCity',
                 request_serializer=city__pb2.NewCityDTO.SerializeToString,
                 response_deserializer=city__pb2.CityIdResponse.FromString,
                 _registered_method=True)
+        self.CreateCities = channel.unary_unary(
+                '/city.CityService/CreateCities',
+                request_serializer=city__pb2.NewCityList.SerializeToString,
+                response_deserializer=city__pb2.CreatedCityList.FromString,
+                _registered_method=True)
         self.DeleteCity = channel.unary_unary(
                 '/city.CityService/DeleteCity',
                 request_serializer=city__pb2.CityIdRequest.SerializeToString,
@@ -77,18 +107,54 @@ class CityServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetCitiesByDistrictIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetCitiesByIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SearchCities(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetCityById(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamCities(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamCitiesByDistrictId(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CreateCity(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def CreateCities(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def DeleteCity(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -100,7 +166,7 @@ def add_CityServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
             'GetCities': grpc.unary_unary_rpc_method_handler(
                     servicer.GetCities,
-                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    request_deserializer=city__pb2.PageRequest.FromString,
                     response_serializer=city__pb2.CityList.SerializeToString,
             ),
             'GetCitiesByDistrictId': grpc.unary_unary_rpc_method_handler(
@@ -108,16 +174,46 @@ def add_CityServiceServicer_to_server(servicer, server):
                     request_deserializer=city__pb2.DistrictIdRequest.FromString,
                     response_serializer=city__pb2.CityList.SerializeToString,
             ),
+            'GetCitiesByDistrictIds': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetCitiesByDistrictIds,
+                    request_deserializer=city__pb2.DistrictIdsRequest.FromString,
+                    response_serializer=city__pb2.CitiesByDistricts.SerializeToString,
+            ),
+            'GetCitiesByIds': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetCitiesByIds,
+                    request_deserializer=city__pb2.CityIdsRequest.FromString,
+                    response_serializer=city__pb2.CityLookupList.SerializeToString,
+            ),
+            'SearchCities': grpc.unary_unary_rpc_method_handler(
+                    servicer.SearchCities,
+                    request_deserializer=city__pb2.SearchCitiesRequest.FromString,
+                    response_serializer=city__pb2.CityList.SerializeToString,
+            ),
             'GetCityById': grpc.unary_unary_rpc_method_handler(
                     servicer.GetCityById,
                     request_deserializer=city__pb2.CityIdRequest.FromString,
                     response_serializer=city__pb2.City.SerializeToString,
             ),
+            'StreamCities': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamCities,
+                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    response_serializer=city__pb2.City.SerializeToString,
+            ),
+            'StreamCitiesByDistrictId': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamCitiesByDistrictId,
+                    request_deserializer=city__pb2.DistrictIdRequest.FromString,
+                    response_serializer=city__pb2.City.SerializeToString,
+            ),
             'CreateCity': grpc.unary_unary_rpc_method_handler(
                     servicer.CreateCity,
                     request_deserializer=city__pb2.NewCityDTO.FromString,
                     response_serializer=city__pb2.CityIdResponse.SerializeToString,
             ),
+            'CreateCities': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateCities,
+                    request_deserializer=city__pb2.NewCityList.FromString,
+                    response_serializer=city__pb2.CreatedCityList.SerializeToString,
+            ),
             'DeleteCity': grpc.unary_unary_rpc_method_handler(
                     servicer.DeleteCity,
                     request_deserializer=city__pb2.CityIdRequest.FromString,
@@ -149,7 +245,7 @@ class CityService(object):
             request,
             target,
             '/city.CityService/GetCities',
-            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            city__pb2.PageRequest.SerializeToString,
             city__pb2.CityList.FromString,
             options,
             channel_credentials,
@@ -188,6 +284,87 @@ class CityService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetCitiesByDistrictIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/city.CityService/GetCitiesByDistrictIds',
+            city__pb2.DistrictIdsRequest.SerializeToString,
+            city__pb2.CitiesByDistricts.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetCitiesByIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/city.CityService/GetCitiesByIds',
+            city__pb2.CityIdsRequest.SerializeToString,
+            city__pb2.CityLookupList.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SearchCities(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/city.CityService/SearchCities',
+            city__pb2.SearchCitiesRequest.SerializeToString,
+            city__pb2.CityList.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetCityById(request,
             target,
@@ -215,6 +392,60 @@ class CityService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamCities(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/city.CityService/StreamCities',
+            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            city__pb2.City.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamCitiesByDistrictId(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/city.CityService/StreamCitiesByDistrictId',
+            city__pb2.DistrictIdRequest.SerializeToString,
+            city__pb2.City.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def CreateCity(request,
             target,
@@ -242,6 +473,33 @@ class CityService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def CreateCities(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/city.CityService/CreateCities',
+            city__pb2.NewCityList.SerializeToString,
+            city__pb2.CreatedCityList.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def DeleteCity(request,
             target,
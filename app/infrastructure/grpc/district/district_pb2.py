@@ -26,7 +26,7 @@ from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 from google.protobuf import wrappers_pb2 as google_dot_protobuf_dot_wrappers__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0e\x64istrict.proto\x12\x08\x64istrict\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1egoogle/protobuf/wrappers.proto\"7\n\x08\x44istrict\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\tregion_id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\"1\n\x0eNewDistrictDTO\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"(\n\x11\x44istrictIdRequest\x12\x13\n\x0b\x64istrict_id\x18\x01 \x01(\t\"$\n\x0fRegionIdRequest\x12\x11\n\tregion_id\x18\x01 \x01(\t\"5\n\x0c\x44istrictList\x12%\n\tdistricts\x18\x01 \x03(\x0b\x32\x12.district.District\")\n\x12\x44istrictIdResponse\x12\x13\n\x0b\x64istrict_id\x18\x01 \x01(\t2\xf3\x02\n\x0f\x44istrictService\x12>\n\x0cGetDistricts\x12\x16.google.protobuf.Empty\x1a\x16.district.DistrictList\x12K\n\x16GetDistrictsByRegionId\x12\x19.district.RegionIdRequest\x1a\x16.district.DistrictList\x12\x42\n\x0fGetDistrictById\x12\x1b.district.DistrictIdRequest\x1a\x12.district.District\x12H\n\x0e\x43reateDistrict\x12\x18.district.NewDistrictDTO\x1a\x1c.district.DistrictIdResponse\x12\x45\n\x0e\x44\x65leteDistrict\x12\x1b.district.DistrictIdRequest\x1a\x16.google.protobuf.Emptyb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0e\x64istrict.proto\x12\x08\x64istrict\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1egoogle/protobuf/wrappers.proto\"7\n\x08\x44istrict\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\tregion_id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\"1\n\x0eNewDistrictDTO\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"(\n\x11\x44istrictIdRequest\x12\x13\n\x0b\x64istrict_id\x18\x01 \x01(\t\"$\n\x0fRegionIdRequest\x12\x11\n\tregion_id\x18\x01 \x01(\t\"&\n\x10RegionIdsRequest\x12\x12\n\nregion_ids\x18\x01 \x03(\t\"K\n\x0fRegionDistricts\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12%\n\tdistricts\x18\x02 \x03(\x0b\x32\x12.district.District\"[\n\x12\x44istrictsByRegions\x12)\n\x06groups\x18\x01 \x03(\x0b\x32\x19.district.RegionDistricts\x12\x1a\n\x12missing_region_ids\x18\x02 \x03(\t\"*\n\x12\x44istrictIdsRequest\x12\x14\n\x0c\x64istrict_ids\x18\x01 \x03(\t\"B\n\x0e\x44istrictLookup\x12\n\n\x02id\x18\x01 \x01(\t\x12$\n\x08\x64istrict\x18\x02 \x01(\x0b\x32\x12.district.District\"?\n\x12\x44istrictLookupList\x12)\n\x07results\x18\x01 \x03(\x0b\x32\x18.district.DistrictLookup\",\n\x0bPageRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x0e\n\x06\x63ursor\x18\x02 \x01(\t\"J\n\x0c\x44istrictList\x12%\n\tdistricts\x18\x01 \x03(\x0b\x32\x12.district.District\x12\x13\n\x0bnext_cursor\x18\x02 \x01(\t\")\n\x12\x44istrictIdResponse\x12\x13\n\x0b\x64istrict_id\x18\x01 \x01(\t2\xa7\x05\n\x0f\x44istrictService\x12=\n\x0cGetDistricts\x12\x15.district.PageRequest\x1a\x16.district.DistrictList\x12K\n\x16GetDistrictsByRegionId\x12\x19.district.RegionIdRequest\x1a\x16.district.DistrictList\x12S\n\x17GetDistrictsByRegionIds\x12\x1a.district.RegionIdsRequest\x1a\x1c.district.DistrictsByRegions\x12O\n\x11GetDistrictsByIds\x12\x1c.district.DistrictIdsRequest\x1a\x1c.district.DistrictLookupList\x12\x42\n\x0fGetDistrictById\x12\x1b.district.DistrictIdRequest\x1a\x12.district.District\x12?\n\x0fStreamDistricts\x12\x16.google.protobuf.Empty\x1a\x12.district.District0\x01\x12L\n\x19StreamDistrictsByRegionId\x12\x19.district.RegionIdRequest\x1a\x12.district.District0\x01\x12H\n\x0e\x43reateDistrict\x12\x18.district.NewDistrictDTO\x1a\x1c.district.DistrictIdResponse\x12\x45\n\x0e\x44\x65leteDistrict\x12\x1b.district.DistrictIdRequest\x1a\x16.google.protobuf.Emptyb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -41,10 +41,24 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_DISTRICTIDREQUEST']._serialized_end=237
   _globals['_REGIONIDREQUEST']._serialized_start=239
   _globals['_REGIONIDREQUEST']._serialized_end=275
-  _globals['_DISTRICTLIST']._serialized_start=277
-  _globals['_DISTRICTLIST']._serialized_end=330
-  _globals['_DISTRICTIDRESPONSE']._serialized_start=332
-  _globals['_DISTRICTIDRESPONSE']._serialized_end=373
-  _globals['_DISTRICTSERVICE']._serialized_start=376
-  _globals['_DISTRICTSERVICE']._serialized_end=747
+  _globals['_REGIONIDSREQUEST']._serialized_start=277
+  _globals['_REGIONIDSREQUEST']._serialized_end=315
+  _globals['_REGIONDISTRICTS']._serialized_start=317
+  _globals['_REGIONDISTRICTS']._serialized_end=392
+  _globals['_DISTRICTSBYREGIONS']._serialized_start=394
+  _globals['_DISTRICTSBYREGIONS']._serialized_end=485
+  _globals['_DISTRICTIDSREQUEST']._serialized_start=487
+  _globals['_DISTRICTIDSREQUEST']._serialized_end=529
+  _globals['_DISTRICTLOOKUP']._serialized_start=531
+  _globals['_DISTRICTLOOKUP']._serialized_end=597
+  _globals['_DISTRICTLOOKUPLIST']._serialized_start=599
+  _globals['_DISTRICTLOOKUPLIST']._serialized_end=662
+  _globals['_PAGEREQUEST']._serialized_start=664
+  _globals['_PAGEREQUEST']._serialized_end=708
+  _globals['_DISTRICTLIST']._serialized_start=710
+  _globals['_DISTRICTLIST']._serialized_end=784
+  _globals['_DISTRICTIDRESPONSE']._serialized_start=786
+  _globals['_DISTRICTIDRESPONSE']._serialized_end=827
+  _globals['_DISTRICTSERVICE']._serialized_start=830
+  _globals['_DISTRICTSERVICE']._serialized_end=1509
 # @@protoc_insertion_point(module_scope)
@@ -38,11 +38,63 @@ class RegionIdRequest(_message.Message):
     region_id: str
     def __init__(self, region_id: _Optional[str] = ...) -> None: ...
 
+class RegionIdsRequest(_message.Message):
+    __slots__ = ("region_ids",)
+    REGION_IDS_FIELD_NUMBER: _ClassVar[int]
+    region_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, region_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class RegionDistricts(_message.Message):
+    __slots__ = ("region_id", "districts")
+    REGION_ID_FIELD_NUMBER: _ClassVar[int]
+    DISTRICTS_FIELD_NUMBER: _ClassVar[int]
+    region_id: str
+    districts: _containers.RepeatedCompositeFieldContainer[District]
+    def __init__(self, region_id: _Optional[str] = ..., districts: _Optional[_Iterable[_Union[District, _Mapping]]] = ...) -> None: ...
+
+class DistrictsByRegions(_message.Message):
+    __slots__ = ("groups", "missing_region_ids")
+    GROUPS_FIELD_NUMBER: _ClassVar[int]
+    MISSING_REGION_IDS_FIELD_NUMBER: _ClassVar[int]
+    groups: _containers.RepeatedCompositeFieldContainer[RegionDistricts]
+    missing_region_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, groups: _Optional[_Iterable[_Union[RegionDistricts, _Mapping]]] = ..., missing_region_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class DistrictIdsRequest(_message.Message):
+    __slots__ = ("district_ids",)
+    DISTRICT_IDS_FIELD_NUMBER: _ClassVar[int]
+    district_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, district_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class DistrictLookup(_message.Message):
+    __slots__ = ("id", "district")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    DISTRICT_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    district: District
+    def __init__(self, id: _Optional[str] = ..., district: _Optional[_Union[District, _Mapping]] = ...) -> None: ...
+
+class DistrictLookupList(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[DistrictLookup]
+    def __init__(self, results: _Optional[_Iterable[_Union[DistrictLookup, _Mapping]]] = ...) -> None: ...
+
+class PageRequest(_message.Message):
+    __slots__ = ("limit", "cursor")
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    CURSOR_FIELD_NUMBER: _ClassVar[int]
+    limit: int
+    cursor: str
+    def __init__(self, limit: _Optional[int] = ..., cursor: _Optional[str] = ...) -> None: ...
+
 class DistrictList(_message.Message):
-    __slots__ = ("districts",)
+    __slots__ = ("districts", "next_cursor")
     DISTRICTS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_CURSOR_FIELD_NUMBER: _ClassVar[int]
     districts: _containers.RepeatedCompositeFieldContainer[District]
-    def __init__(self, districts: _Optional[_Iterable[_Union[District, _Mapping]]] = ...) -> None: ...
+    next_cursor: str
+    def __init__(self, districts: _Optional[_Iterable[_Union[District, _Mapping]]] = ..., next_cursor: _Optional[str] = ...) -> None: ...
 
 class DistrictIdResponse(_message.Message):
     __slots__ = ("district_id",)
@@ -37,7 +37,7 @@ class DistrictServiceStub(object):
         """
         self.GetDistricts = channel.unary_unary(
                 '/district.DistrictService/GetDistricts',
-                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                request_serializer=district__pb2.PageRequest.SerializeToString,
                 response_deserializer=district__pb2.DistrictList.FromString,
                 _registered_method=True)
         self.GetDistrictsByRegionId = channel.unary_unary(
@@ -45,11 +45,31 @@ class DistrictServiceStub(object):
                 request_serializer=district__pb2.RegionIdRequest.SerializeToString,
                 response_deserializer=district__pb2.DistrictList.FromString,
                 _registered_method=True)
+        self.GetDistrictsByRegionIds = channel.unary_unary(
+                '/district.DistrictService/GetDistrictsByRegionIds',
+                request_serializer=district__pb2.RegionIdsRequest.SerializeToString,
+                response_deserializer=district__pb2.DistrictsByRegions.FromString,
+                _registered_method=True)
+        self.GetDistrictsByIds = channel.unary_unary(
+                '/district.DistrictService/GetDistrictsByIds',
+                request_serializer=district__pb2.DistrictIdsRequest.SerializeToString,
+                response_deserializer=district__pb2.DistrictLookupList.FromString,
+                _registered_method=True)
         self.GetDistrictById = channel.unary_unary(
                 '/district.DistrictService/GetDistrictById',
                 request_serializer=district__pb2.DistrictIdRequest.SerializeToString,
                 response_deserializer=district__pb2.District.FromString,
                 _registered_method=True)
+        self.StreamDistricts = channel.unary_stream(
+                '/district.DistrictService/StreamDistricts',
+                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                response_deserializer=district__pb2.District.FromString,
+                _registered_method=True)
+        self.StreamDistrictsByRegionId = channel.unary_stream(
+                '/district.DistrictService/StreamDistrictsByRegionId',
+                request_serializer=district__pb2.RegionIdRequest.SerializeToString,
+                response_deserializer=district__pb2.District.FromString,
+                _registered_method=True)
         self.CreateDistrict = channel.unary_unary(
                 '/district.DistrictService/CreateDistrict',
                 request_serializer=district__pb2.NewDistrictDTO.SerializeToString,
@@ -77,12 +97,36 @@ class DistrictServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetDistrictsByRegionIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetDistrictsByIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetDistrictById(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamDistricts(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamDistrictsByRegionId(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CreateDistrict(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -100,7 +144,7 @@ def add_DistrictServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
             'GetDistricts': grpc.unary_unary_rpc_method_handler(
                     servicer.GetDistricts,
-                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    request_deserializer=district__pb2.PageRequest.FromString,
                     response_serializer=district__pb2.DistrictList.SerializeToString,
             ),
             'GetDistrictsByRegionId': grpc.unary_unary_rpc_method_handler(
@@ -108,11 +152,31 @@ def add_DistrictServiceServicer_to_server(servicer, server):
                     request_deserializer=district__pb2.RegionIdRequest.FromString,
                     response_serializer=district__pb2.DistrictList.SerializeToString,
             ),
+            'GetDistrictsByRegionIds': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetDistrictsByRegionIds,
+                    request_deserializer=district__pb2.RegionIdsRequest.FromString,
+                    response_serializer=district__pb2.DistrictsByRegions.SerializeToString,
+            ),
+            'GetDistrictsByIds': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetDistrictsByIds,
+                    request_deserializer=district__pb2.DistrictIdsRequest.FromString,
+                    response_serializer=district__pb2.DistrictLookupList.SerializeToString,
+            ),
             'GetDistrictById': grpc.unary_unary_rpc_method_handler(
                     servicer.GetDistrictById,
                     request_deserializer=district__pb2.DistrictIdRequest.FromString,
                     response_serializer=district__pb2.District.SerializeToString,
             ),
+            'StreamDistricts': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamDistricts,
+                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    response_serializer=district__pb2.District.SerializeToString,
+            ),
+            'StreamDistrictsByRegionId': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamDistrictsByRegionId,
+                    request_deserializer=district__pb2.RegionIdRequest.FromString,
+                    response_serializer=district__pb2.District.SerializeToString,
+            ),
             'CreateDistrict': grpc.unary_unary_rpc_method_handler(
                     servicer.CreateDistrict,
                     request_deserializer=district__pb2.NewDistrictDTO.FromString,
@@ -149,7 +213,7 @@ class DistrictService(object):
             request,
             target,
             '/district.DistrictService/GetDistricts',
-            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            district__pb2.PageRequest.SerializeToString,
             district__pb2.DistrictList.FromString,
             options,
             channel_credentials,
@@ -188,6 +252,60 @@ class DistrictService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetDistrictsByRegionIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/district.DistrictService/GetDistrictsByRegionIds',
+            district__pb2.RegionIdsRequest.SerializeToString,
+            district__pb2.DistrictsByRegions.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetDistrictsByIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/district.DistrictService/GetDistrictsByIds',
+            district__pb2.DistrictIdsRequest.SerializeToString,
+            district__pb2.DistrictLookupList.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetDistrictById(request,
             target,
@@ -215,6 +333,60 @@ class DistrictService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamDistricts(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/district.DistrictService/StreamDistricts',
+            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            district__pb2.District.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamDistrictsByRegionId(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/district.DistrictService/StreamDistrictsByRegionId',
+            district__pb2.RegionIdRequest.SerializeToString,
+            district__pb2.District.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def CreateDistrict(request,
             target,
@@ -1,3 +1,4 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # NO CHECKED-IN PROTOBUF GENCODE
 # source: region.proto
@@ -8,10 +9,6 @@ from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import runtime_version as _runtime_version
 from google.protobuf import symbol_database as _symbol_database
 from google.protobuf.internal import builder as _builder
-from google.protobuf import empty_pb2
-from google.protobuf import wrappers_pb2
-
-
 _runtime_version.ValidateProtobufRuntimeVersion(
     _runtime_version.Domain.PUBLIC,
     6,
@@ -25,8 +22,11 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+from google.protobuf import wrappers_pb2 as google_dot_protobuf_dot_wrappers__pb2
+
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0cregion.proto\x12\x06region\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1egoogle/protobuf/wrappers.proto\"3\n\x06Region\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07\x63\x61pital\x18\x03 \x01(\t\"-\n\x0cNewRegionDTO\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x63\x61pital\x18\x02 \x01(\t\"$\n\x0fRegionIdRequest\x12\x11\n\tregion_id\x18\x01 \x01(\t\"%\n\x10RegionIdResponse\x12\x11\n\tregion_id\x18\x01 \x01(\t\"-\n\nRegionList\x12\x1f\n\x07regions\x18\x01 \x03(\x0b\x32\x0e.region.Region2\x84\x02\n\rRegionService\x12\x38\n\nGetRegions\x12\x16.google.protobuf.Empty\x1a\x12.region.RegionList\x12\x38\n\rGetRegionById\x12\x17.region.RegionIdRequest\x1a\x0e.region.Region\x12>\n\x0c\x43reateRegion\x12\x14.region.NewRegionDTO\x1a\x18.region.RegionIdResponse\x12?\n\x0c\x44\x65leteRegion\x12\x17.region.RegionIdRequest\x1a\x16.google.protobuf.Emptyb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0cregion.proto\x12\x06region\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1egoogle/protobuf/wrappers.proto\"3\n\x06Region\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07\x63\x61pital\x18\x03 \x01(\t\"-\n\x0cNewRegionDTO\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x63\x61pital\x18\x02 \x01(\t\"&\n\x10RegionIdsRequest\x12\x12\n\nregion_ids\x18\x01 \x03(\t\":\n\x0cRegionLookup\x12\n\n\x02id\x18\x01 \x01(\t\x12\x1e\n\x06region\x18\x02 \x01(\x0b\x32\x0e.region.Region\"9\n\x10RegionLookupList\x12%\n\x07results\x18\x01 \x03(\x0b\x32\x14.region.RegionLookup\",\n\x0bPageRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x0e\n\x06\x63ursor\x18\x02 \x01(\t\"$\n\x0fRegionIdRequest\x12\x11\n\tregion_id\x18\x01 \x01(\t\"D\n\x11RegionTreeRequest\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12\x12\n\x05\x64\x65pth\x18\x02 \x01(\x05H\x00\x88\x01\x01\x42\x08\n\x06_depth\"J\n\x08TreeCity\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x10\n\x08obj_type\x18\x03 \x01(\t\x12\x12\n\npopulation\x18\x04 \x01(\x05\"J\n\x0cTreeDistrict\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12 \n\x06\x63ities\x18\x03 \x03(\x0b\x32\x10.region.TreeCity\"`\n\nRegionTree\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07\x63\x61pital\x18\x03 \x01(\t\x12\'\n\tdistricts\x18\x04 \x03(\x0b\x32\x14.region.TreeDistrict\"%\n\x10RegionIdResponse\x12\x11\n\tregion_id\x18\x01 \x01(\t\"B\n\nRegionList\x12\x1f\n\x07regions\x18\x01 \x03(\x0b\x32\x0e.region.Region\x12\x13\n\x0bnext_cursor\x18\x02 \x01(\t2\x88\x03\n\rRegionService\x12\x35\n\nGetRegions\x12\x13.region.PageRequest\x1a\x12.region.RegionList\x12\x45\n\x0fGetRegionsByIds\x12\x18.region.RegionIdsRequest\x1a\x18.region.RegionLookupList\x12\x38\n\rGetRegionById\x12\x17.region.RegionIdRequest\x1a\x0e.region.Region\x12>\n\rGetRegionTree\x12\x19.region.RegionTreeRequest\x1a\x12.region.RegionTree\x12>\n\x0c\x43reateRegion\x12\x14.region.NewRegionDTO\x1a\x18.region.RegionIdResponse\x12?\n\x0c\x44\x65leteRegion\x12\x17.region.RegionIdRequest\x1a\x16.google.protobuf.Emptyb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -37,12 +37,28 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_REGION']._serialized_end=136
   _globals['_NEWREGIONDTO']._serialized_start=138
   _globals['_NEWREGIONDTO']._serialized_end=183
-  _globals['_REGIONIDREQUEST']._serialized_start=185
-  _globals['_REGIONIDREQUEST']._serialized_end=221
-  _globals['_REGIONIDRESPONSE']._serialized_start=223
-  _globals['_REGIONIDRESPONSE']._serialized_end=260
-  _globals['_REGIONLIST']._serialized_start=262
-  _globals['_REGIONLIST']._serialized_end=307
-  _globals['_REGIONSERVICE']._serialized_start=310
-  _globals['_REGIONSERVICE']._serialized_end=570
+  _globals['_REGIONIDSREQUEST']._serialized_start=185
+  _globals['_REGIONIDSREQUEST']._serialized_end=223
+  _globals['_REGIONLOOKUP']._serialized_start=225
+  _globals['_REGIONLOOKUP']._serialized_end=283
+  _globals['_REGIONLOOKUPLIST']._serialized_start=285
+  _globals['_REGIONLOOKUPLIST']._serialized_end=342
+  _globals['_PAGEREQUEST']._serialized_start=344
+  _globals['_PAGEREQUEST']._serialized_end=388
+  _globals['_REGIONIDREQUEST']._serialized_start=390
+  _globals['_REGIONIDREQUEST']._serialized_end=426
+  _globals['_REGIONTREEREQUEST']._serialized_start=428
+  _globals['_REGIONTREEREQUEST']._serialized_end=496
+  _globals['_TREECITY']._serialized_start=498
+  _globals['_TREECITY']._serialized_end=572
+  _globals['_TREEDISTRICT']._serialized_start=574
+  _globals['_TREEDISTRICT']._serialized_end=648
+  _globals['_REGIONTREE']._serialized_start=650
+  _globals['_REGIONTREE']._serialized_end=746
+  _globals['_REGIONIDRESPONSE']._serialized_start=748
+  _globals['_REGIONIDRESPONSE']._serialized_end=785
+  _globals['_REGIONLIST']._serialized_start=787
+  _globals['_REGIONLIST']._serialized_end=853
+  _globals['_REGIONSERVICE']._serialized_start=856
+  _globals['_REGIONSERVICE']._serialized_end=1248
 # @@protoc_insertion_point(module_scope)
@@ -1,12 +1,10 @@
-from collections.abc import Iterable as _Iterable
-from collections.abc import Mapping as _Mapping
-from typing import ClassVar as _ClassVar
-from typing import Optional as _Optional
-from typing import Union as _Union
-
+from google.protobuf import empty_pb2 as _empty_pb2
+from google.protobuf import wrappers_pb2 as _wrappers_pb2
+from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from google.protobuf.internal import containers as _containers
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
@@ -28,12 +26,82 @@ class NewRegionDTO(_message.Message):
     capital: str
     def __init__(self, name: _Optional[str] = ..., capital: _Optional[str] = ...) -> None: ...
 
+class RegionIdsRequest(_message.Message):
+    __slots__ = ("region_ids",)
+    REGION_IDS_FIELD_NUMBER: _ClassVar[int]
+    region_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, region_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class RegionLookup(_message.Message):
+    __slots__ = ("id", "region")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    REGION_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    region: Region
+    def __init__(self, id: _Optional[str] = ..., region: _Optional[_Union[Region, _Mapping]] = ...) -> None: ...
+
+class RegionLookupList(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[RegionLookup]
+    def __init__(self, results: _Optional[_Iterable[_Union[RegionLookup, _Mapping]]] = ...) -> None: ...
+
+class PageRequest(_message.Message):
+    __slots__ = ("limit", "cursor")
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    CURSOR_FIELD_NUMBER: _ClassVar[int]
+    limit: int
+    cursor: str
+    def __init__(self, limit: _Optional[int] = ..., cursor: _Optional[str] = ...) -> None: ...
+
 class RegionIdRequest(_message.Message):
     __slots__ = ("region_id",)
     REGION_ID_FIELD_NUMBER: _ClassVar[int]
     region_id: str
     def __init__(self, region_id: _Optional[str] = ...) -> None: ...
 
+class RegionTreeRequest(_message.Message):
+    __slots__ = ("region_id", "depth")
+    REGION_ID_FIELD_NUMBER: _ClassVar[int]
+    DEPTH_FIELD_NUMBER: _ClassVar[int]
+    region_id: str
+    depth: int
+    def __init__(self, region_id: _Optional[str] = ..., depth: _Optional[int] = ...) -> None: ...
+
+class TreeCity(_message.Message):
+    __slots__ = ("id", "name", "obj_type", "population")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    OBJ_TYPE_FIELD_NUMBER: _ClassVar[int]
+    POPULATION_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    name: str
+    obj_type: str
+    population: int
+    def __init__(self, id: _Optional[str] = ..., name: _Optional[str] = ..., obj_type: _Optional[str] = ..., population: _Optional[int] = ...) -> None: ...
+
+class TreeDistrict(_message.Message):
+    __slots__ = ("id", "name", "cities")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    CITIES_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    name: str
+    cities: _containers.RepeatedCompositeFieldContainer[TreeCity]
+    def __init__(self, id: _Optional[str] = ..., name: _Optional[str] = ..., cities: _Optional[_Iterable[_Union[TreeCity, _Mapping]]] = ...) -> None: ...
+
+class RegionTree(_message.Message):
+    __slots__ = ("id", "name", "capital", "districts")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    CAPITAL_FIELD_NUMBER: _ClassVar[int]
+    DISTRICTS_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    name: str
+    capital: str
+    districts: _containers.RepeatedCompositeFieldContainer[TreeDistrict]
+    def __init__(self, id: _Optional[str] = ..., name: _Optional[str] = ..., capital: _Optional[str] = ..., districts: _Optional[_Iterable[_Union[TreeDistrict, _Mapping]]] = ...) -> None: ...
+
 class RegionIdResponse(_message.Message):
     __slots__ = ("region_id",)
     REGION_ID_FIELD_NUMBER: _ClassVar[int]
@@ -41,7 +109,9 @@ class RegionIdResponse(_message.Message):
     def __init__(self, region_id: _Optional[str] = ...) -> None: ...
 
 class RegionList(_message.Message):
-    __slots__ = ("regions",)
+    __slots__ = ("regions", "next_cursor")
     REGIONS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_CURSOR_FIELD_NUMBER: _ClassVar[int]
     regions: _containers.RepeatedCompositeFieldContainer[Region]
-    def __init__(self, regions: _Optional[_Iterable[_Union[Region, _Mapping]]] = ...) -> None: ...
+    next_cursor: str
+    def __init__(self, regions: _Optional[_Iterable[_Union[Region, _Mapping]]] = ..., next_cursor: _Optional[str] = ...) -> None: ...
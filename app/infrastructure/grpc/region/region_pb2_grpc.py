@@ -1,9 +1,9 @@
 # Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
 """Client and server classes corresponding to protobuf-defined services."""
-
 import grpc
-from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+import warnings
 
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 import app.infrastructure.grpc.region.region_pb2 as region__pb2
 
 GRPC_GENERATED_VERSION = '1.74.0'
@@ -19,14 +19,14 @@ except ImportError:
 if _version_not_supported:
     raise RuntimeError(
         f'The grpc package installed is at version {GRPC_VERSION},'
-        + ' but the generated code in region_pb2_grpc.py depends on'
+        + f' but the generated code in region_pb2_grpc.py depends on'
         + f' grpcio>={GRPC_GENERATED_VERSION}.'
         + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
         + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
     )
 
 
-class RegionServiceStub:
+class RegionServiceStub(object):
     """Missing associated documentation comment in .proto file."""
 
     def __init__(self, channel):
@@ -37,14 +37,24 @@ class RegionServiceStub:
         """
         self.GetRegions = channel.unary_unary(
                 '/region.RegionService/GetRegions',
-                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                request_serializer=region__pb2.PageRequest.SerializeToString,
                 response_deserializer=region__pb2.RegionList.FromString,
                 _registered_method=True)
+        self.GetRegionsByIds = channel.unary_unary(
+                '/region.RegionService/GetRegionsByIds',
+                request_serializer=region__pb2.RegionIdsRequest.SerializeToString,
+                response_deserializer=region__pb2.RegionLookupList.FromString,
+                _registered_method=True)
         self.GetRegionById = channel.unary_unary(
                 '/region.RegionService/GetRegionById',
                 request_serializer=region__pb2.RegionIdRequest.SerializeToString,
                 response_deserializer=region__pb2.Region.FromString,
                 _registered_method=True)
+        self.GetRegionTree = channel.unary_unary(
+                '/region.RegionService/GetRegionTree',
+                request_serializer=region__pb2.RegionTreeRequest.SerializeToString,
+                response_deserializer=region__pb2.RegionTree.FromString,
+                _registered_method=True)
         self.CreateRegion = channel.unary_unary(
                 '/region.RegionService/CreateRegion',
                 request_serializer=region__pb2.NewRegionDTO.SerializeToString,
@@ -57,7 +67,7 @@ class RegionServiceStub:
                 _registered_method=True)
 
 
-class RegionServiceServicer:
+class RegionServiceServicer(object):
     """Missing associated documentation comment in .proto file."""
 
     def GetRegions(self, request, context):
@@ -66,12 +76,24 @@ class RegionServiceServicer:
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetRegionsByIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetRegionById(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetRegionTree(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CreateRegion(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -89,14 +111,24 @@ def add_RegionServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
             'GetRegions': grpc.unary_unary_rpc_method_handler(
                     servicer.GetRegions,
-                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    request_deserializer=region__pb2.PageRequest.FromString,
                     response_serializer=region__pb2.RegionList.SerializeToString,
             ),
+            'GetRegionsByIds': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetRegionsByIds,
+                    request_deserializer=region__pb2.RegionIdsRequest.FromString,
+                    response_serializer=region__pb2.RegionLookupList.SerializeToString,
+            ),
             'GetRegionById': grpc.unary_unary_rpc_method_handler(
                     servicer.GetRegionById,
                     request_deserializer=region__pb2.RegionIdRequest.FromString,
                     response_serializer=region__pb2.Region.SerializeToString,
             ),
+            'GetRegionTree': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetRegionTree,
+                    request_deserializer=region__pb2.RegionTreeRequest.FromString,
+                    response_serializer=region__pb2.RegionTree.SerializeToString,
+            ),
             'CreateRegion': grpc.unary_unary_rpc_method_handler(
                     servicer.CreateRegion,
                     request_deserializer=region__pb2.NewRegionDTO.FromString,
@@ -115,7 +147,7 @@ def add_RegionServiceServicer_to_server(servicer, server):
 
 
  # This class is part of an EXPERIMENTAL API.
-class RegionService:
+class RegionService(object):
     """Missing associated documentation comment in .proto file."""
 
     @staticmethod
@@ -133,7 +165,7 @@ class RegionService:
             request,
             target,
             '/region.RegionService/GetRegions',
-            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            region__pb2.PageRequest.SerializeToString,
             region__pb2.RegionList.FromString,
             options,
             channel_credentials,
@@ -145,6 +177,33 @@ class RegionService:
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetRegionsByIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/region.RegionService/GetRegionsByIds',
+            region__pb2.RegionIdsRequest.SerializeToString,
+            region__pb2.RegionLookupList.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetRegionById(request,
             target,
@@ -172,6 +231,33 @@ class RegionService:
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetRegionTree(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/region.RegionService/GetRegionTree',
+            region__pb2.RegionTreeRequest.SerializeToString,
+            region__pb2.RegionTree.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def CreateRegion(request,
             target,
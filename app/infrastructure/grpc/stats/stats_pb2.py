@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: stats.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'stats.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0bstats.proto\x12\x05stats\x1a\x1bgoogle/protobuf/empty.proto\"Z\n\x0cObjTypeStats\x12\x15\n\x08obj_type\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x12\n\ncity_count\x18\x02 \x01(\x03\x12\x12\n\npopulation\x18\x03 \x01(\x03\x42\x0b\n\t_obj_type\"r\n\x0bRegionStats\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12\x12\n\ncity_count\x18\x02 \x01(\x03\x12\x12\n\npopulation\x18\x03 \x01(\x03\x12(\n\x0b\x62y_obj_type\x18\x04 \x03(\x0b\x32\x13.stats.ObjTypeStats\"6\n\x0fRegionStatsList\x12#\n\x07regions\x18\x01 \x03(\x0b\x32\x12.stats.RegionStats\"\x89\x01\n\rDistrictStats\x12\x13\n\x0b\x64istrict_id\x18\x01 \x01(\t\x12\x11\n\tregion_id\x18\x02 \x01(\t\x12\x12\n\ncity_count\x18\x03 \x01(\x03\x12\x12\n\npopulation\x18\x04 \x01(\x03\x12(\n\x0b\x62y_obj_type\x18\x05 \x03(\x0b\x32\x13.stats.ObjTypeStats\"<\n\x11\x44istrictStatsList\x12\'\n\tdistricts\x18\x01 \x03(\x0b\x32\x14.stats.DistrictStats\"$\n\x0fRegionIdRequest\x12\x11\n\tregion_id\x18\x01 \x01(\t2\xd6\x01\n\x0cStatsService\x12\x41\n\x0fGetRegionsStats\x12\x16.google.protobuf.Empty\x1a\x16.stats.RegionStatsList\x12<\n\x0eGetRegionStats\x12\x16.stats.RegionIdRequest\x1a\x12.stats.RegionStats\x12\x45\n\x11GetDistrictsStats\x12\x16.stats.RegionIdRequest\x1a\x18.stats.DistrictStatsListb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'stats_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_OBJTYPESTATS']._serialized_start=51
+  _globals['_OBJTYPESTATS']._serialized_end=141
+  _globals['_REGIONSTATS']._serialized_start=143
+  _globals['_REGIONSTATS']._serialized_end=257
+  _globals['_REGIONSTATSLIST']._serialized_start=259
+  _globals['_REGIONSTATSLIST']._serialized_end=313
+  _globals['_DISTRICTSTATS']._serialized_start=316
+  _globals['_DISTRICTSTATS']._serialized_end=453
+  _globals['_DISTRICTSTATSLIST']._serialized_start=455
+  _globals['_DISTRICTSTATSLIST']._serialized_end=515
+  _globals['_REGIONIDREQUEST']._serialized_start=517
+  _globals['_REGIONIDREQUEST']._serialized_end=553
+  _globals['_STATSSERVICE']._serialized_start=556
+  _globals['_STATSSERVICE']._serialized_end=770
+# @@protoc_insertion_point(module_scope)
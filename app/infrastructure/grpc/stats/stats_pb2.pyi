@@ -0,0 +1,62 @@
+from google.protobuf import empty_pb2 as _empty_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class ObjTypeStats(_message.Message):
+    __slots__ = ("obj_type", "city_count", "population")
+    OBJ_TYPE_FIELD_NUMBER: _ClassVar[int]
+    CITY_COUNT_FIELD_NUMBER: _ClassVar[int]
+    POPULATION_FIELD_NUMBER: _ClassVar[int]
+    obj_type: str
+    city_count: int
+    population: int
+    def __init__(self, obj_type: _Optional[str] = ..., city_count: _Optional[int] = ..., population: _Optional[int] = ...) -> None: ...
+
+class RegionStats(_message.Message):
+    __slots__ = ("region_id", "city_count", "population", "by_obj_type")
+    REGION_ID_FIELD_NUMBER: _ClassVar[int]
+    CITY_COUNT_FIELD_NUMBER: _ClassVar[int]
+    POPULATION_FIELD_NUMBER: _ClassVar[int]
+    BY_OBJ_TYPE_FIELD_NUMBER: _ClassVar[int]
+    region_id: str
+    city_count: int
+    population: int
+    by_obj_type: _containers.RepeatedCompositeFieldContainer[ObjTypeStats]
+    def __init__(self, region_id: _Optional[str] = ..., city_count: _Optional[int] = ..., population: _Optional[int] = ..., by_obj_type: _Optional[_Iterable[_Union[ObjTypeStats, _Mapping]]] = ...) -> None: ...
+
+class RegionStatsList(_message.Message):
+    __slots__ = ("regions",)
+    REGIONS_FIELD_NUMBER: _ClassVar[int]
+    regions: _containers.RepeatedCompositeFieldContainer[RegionStats]
+    def __init__(self, regions: _Optional[_Iterable[_Union[RegionStats, _Mapping]]] = ...) -> None: ...
+
+class DistrictStats(_message.Message):
+    __slots__ = ("district_id", "region_id", "city_count", "population", "by_obj_type")
+    DISTRICT_ID_FIELD_NUMBER: _ClassVar[int]
+    REGION_ID_FIELD_NUMBER: _ClassVar[int]
+    CITY_COUNT_FIELD_NUMBER: _ClassVar[int]
+    POPULATION_FIELD_NUMBER: _ClassVar[int]
+    BY_OBJ_TYPE_FIELD_NUMBER: _ClassVar[int]
+    district_id: str
+    region_id: str
+    city_count: int
+    population: int
+    by_obj_type: _containers.RepeatedCompositeFieldContainer[ObjTypeStats]
+    def __init__(self, district_id: _Optional[str] = ..., region_id: _Optional[str] = ..., city_count: _Optional[int] = ..., population: _Optional[int] = ..., by_obj_type: _Optional[_Iterable[_Union[ObjTypeStats, _Mapping]]] = ...) -> None: ...
+
+class DistrictStatsList(_message.Message):
+    __slots__ = ("districts",)
+    DISTRICTS_FIELD_NUMBER: _ClassVar[int]
+    districts: _containers.RepeatedCompositeFieldContainer[DistrictStats]
+    def __init__(self, districts: _Optional[_Iterable[_Union[DistrictStats, _Mapping]]] = ...) -> None: ...
+
+class RegionIdRequest(_message.Message):
+    __slots__ = ("region_id",)
+    REGION_ID_FIELD_NUMBER: _ClassVar[int]
+    region_id: str
+    def __init__(self, region_id: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,184 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+import app.infrastructure.grpc.stats.stats_pb2 as stats__pb2
+
+GRPC_GENERATED_VERSION = '1.74.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + f' but the generated code in stats_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class StatsServiceStub(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.GetRegionsStats = channel.unary_unary(
+                '/stats.StatsService/GetRegionsStats',
+                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                response_deserializer=stats__pb2.RegionStatsList.FromString,
+                _registered_method=True)
+        self.GetRegionStats = channel.unary_unary(
+                '/stats.StatsService/GetRegionStats',
+                request_serializer=stats__pb2.RegionIdRequest.SerializeToString,
+                response_deserializer=stats__pb2.RegionStats.FromString,
+                _registered_method=True)
+        self.GetDistrictsStats = channel.unary_unary(
+                '/stats.StatsService/GetDistrictsStats',
+                request_serializer=stats__pb2.RegionIdRequest.SerializeToString,
+                response_deserializer=stats__pb2.DistrictStatsList.FromString,
+                _registered_method=True)
+
+
+class StatsServiceServicer(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def GetRegionsStats(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetRegionStats(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetDistrictsStats(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_StatsServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'GetRegionsStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetRegionsStats,
+                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    response_serializer=stats__pb2.RegionStatsList.SerializeToString,
+            ),
+            'GetRegionStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetRegionStats,
+                    request_deserializer=stats__pb2.RegionIdRequest.FromString,
+                    response_serializer=stats__pb2.RegionStats.SerializeToString,
+            ),
+            'GetDistrictsStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetDistrictsStats,
+                    request_deserializer=stats__pb2.RegionIdRequest.FromString,
+                    response_serializer=stats__pb2.DistrictStatsList.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'stats.StatsService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('stats.StatsService', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class StatsService(object):
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def GetRegionsStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/stats.StatsService/GetRegionsStats',
+            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            stats__pb2.RegionStatsList.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetRegionStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/stats.StatsService/GetRegionStats',
+            stats__pb2.RegionIdRequest.SerializeToString,
+            stats__pb2.RegionStats.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetDistrictsStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/stats.StatsService/GetDistrictsStats',
+            stats__pb2.RegionIdRequest.SerializeToString,
+            stats__pb2.DistrictStatsList.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,80 @@
+import time
+from collections.abc import Awaitable, Callable
+from inspect import iscoroutine
+from typing import Any
+
+from dishka import AsyncContainer
+from grpc import (
+    HandlerCallDetails,
+    RpcMethodHandler,
+    unary_stream_rpc_method_handler,
+    unary_unary_rpc_method_handler,
+)
+from grpc.aio import ServerInterceptor, ServicerContext
+
+from app.infrastructure.metrics.registry import MetricsRegistry
+
+
+class MetricsInterceptor(ServerInterceptor):
+    """Times unary and server-streaming calls under their full method name.
+
+    Place it before ``DishkaAioInterceptor`` so the request scope setup is
+    part of the measured time. A call that raises, including
+    ``context.abort``, counts as an error.
+    """
+
+    def __init__(self, container: AsyncContainer):
+        self._container = container
+        self._registry: MetricsRegistry | None = None
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[HandlerCallDetails], Awaitable[RpcMethodHandler]],
+        handler_call_details: HandlerCallDetails,
+    ) -> RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return handler
+
+        if self._registry is None:
+            self._registry = await self._container.get(MetricsRegistry)
+        metric = self._registry.grpc
+        labels = (handler_call_details.method,)
+
+        async def timed(call: Awaitable[Any]) -> Any:
+            start = time.perf_counter()
+            try:
+                return await call
+            except BaseException:
+                metric.error(labels)
+                raise
+            finally:
+                metric.observe(labels, time.perf_counter() - start)
+
+        async def unary_unary(request: Any, context: ServicerContext) -> Any:
+            return await timed(handler.unary_unary(request, context))
+
+        async def unary_stream(request: Any, context: ServicerContext) -> None:
+            async def stream() -> None:
+                result = handler.unary_stream(request, context)
+                if iscoroutine(result):
+                    await result
+                    return
+                async for message in result:
+                    await context.write(message)
+
+            await timed(stream())
+
+        if handler.unary_unary:
+            return unary_unary_rpc_method_handler(
+                unary_unary,
+                handler.request_deserializer,
+                handler.response_serializer,
+            )
+        if handler.unary_stream:
+            return unary_stream_rpc_method_handler(
+                unary_stream,
+                handler.request_deserializer,
+                handler.response_serializer,
+            )
+        return handler
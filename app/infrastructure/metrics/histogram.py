@@ -0,0 +1,49 @@
+import math
+from bisect import bisect_left
+from collections.abc import Iterable
+
+# Seconds, from a cached lookup up to a request that should have timed out.
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Histogram:
+    """Counts observations into fixed buckets, each bounded by its upper edge.
+
+    Buckets follow the Prometheus convention: a value equal to an edge falls
+    into that bucket and anything above the last edge is counted under +Inf.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """``(upper edge, observations at or below it)`` pairs, ending at +Inf."""
+        total = 0
+        result = []
+        for edge, count in zip((*self.buckets, math.inf), self._counts, strict=True):
+            total += count
+            result.append((edge, total))
+        return result
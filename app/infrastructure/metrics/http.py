@@ -0,0 +1,51 @@
+import time
+
+from dishka import AsyncContainer
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.metrics.registry import MetricsRegistry
+
+# Requests that matched no route share one label, so a scan of random
+# paths cannot grow the metrics without bound.
+UNMATCHED_ROUTE = 'unmatched'
+
+
+class MetricsMiddleware:
+    """Times each HTTP request under its route template.
+
+    The duration runs until the last body chunk is sent, so streamed
+    exports are measured in full. 5xx responses and unhandled exceptions
+    count as errors.
+    """
+
+    def __init__(self, app: ASGIApp, container: AsyncContainer):
+        self._app = app
+        self._container = container
+        self._registry: MetricsRegistry | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self._app(scope, receive, send)
+            return
+
+        if self._registry is None:
+            self._registry = await self._container.get(MetricsRegistry)
+        metric = self._registry.http
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self._app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the shared scope.
+            route = scope.get('route')
+            labels = (scope['method'], getattr(route, 'path', UNMATCHED_ROUTE))
+            metric.observe(labels, time.perf_counter() - start)
+            if status >= 500:
+                metric.error(labels)
@@ -0,0 +1,34 @@
+from collections.abc import Iterable
+
+from app.infrastructure.metrics.histogram import DEFAULT_BUCKETS, Histogram
+
+
+class LatencyMetric:
+    """Latency histogram and error count for each combination of label values.
+
+    ``name`` is the metric family prefix: it is exported as
+    ``<name>_duration_seconds`` and ``<name>_errors_total``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: tuple[str, ...],
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self._buckets = tuple(buckets)
+        self.histograms: dict[tuple[str, ...], Histogram] = {}
+        self.errors: dict[tuple[str, ...], int] = {}
+
+    def observe(self, values: tuple[str, ...], seconds: float) -> None:
+        histogram = self.histograms.get(values)
+        if histogram is None:
+            histogram = self.histograms[values] = Histogram(self._buckets)
+        histogram.observe(seconds)
+
+    def error(self, values: tuple[str, ...]) -> None:
+        self.errors[values] = self.errors.get(values, 0) + 1
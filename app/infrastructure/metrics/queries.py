@@ -0,0 +1,33 @@
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+
+from app.infrastructure.db.origin import query_origin
+from app.infrastructure.metrics.latency import LatencyMetric
+
+_STARTED = 'query_metrics_started'
+# Statements run outside a gateway: migrations, DDL, ad hoc scripts.
+UNKNOWN_ORIGIN = 'unknown'
+
+
+def time_queries(engine: Engine, metric: LatencyMetric) -> None:
+    """Record every statement ``engine`` runs under its gateway method."""
+
+    def before_cursor_execute(conn: Connection, *_: Any) -> None:
+        conn.info.setdefault(_STARTED, []).append(time.perf_counter())
+
+    def after_cursor_execute(conn: Connection, *_: Any) -> None:
+        elapsed = time.perf_counter() - conn.info[_STARTED].pop()
+        metric.observe((query_origin() or UNKNOWN_ORIGIN,), elapsed)
+
+    def handle_error(context: ExceptionContext) -> None:
+        conn = context.connection
+        if conn is not None and conn.info.get(_STARTED):
+            conn.info[_STARTED].pop()
+        metric.error((query_origin() or UNKNOWN_ORIGIN,))
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+    event.listen(engine, 'handle_error', handle_error)
@@ -0,0 +1,130 @@
+import math
+from collections.abc import Iterator, Mapping
+
+from app.infrastructure.cache.lru import LRUCache
+from app.infrastructure.db.pool import PoolMetrics
+from app.infrastructure.metrics.histogram import Histogram
+from app.infrastructure.metrics.latency import LatencyMetric
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class MetricsRegistry:
+    """Everything one process measures, rendered in the Prometheus text format.
+
+    Each process keeps its own numbers; with several HTTP workers a scrape
+    sees the worker that answered it.
+    """
+
+    def __init__(self, pool: PoolMetrics, caches: Mapping[str, LRUCache]):
+        self.pool = pool
+        self.caches = caches
+        self.http = LatencyMetric(
+            'http_request', 'HTTP requests by route.', ('method', 'route')
+        )
+        self.grpc = LatencyMetric('grpc_request', 'gRPC calls by method.', ('method',))
+        self.queries = LatencyMetric(
+            'db_query', 'SQL statements by gateway method.', ('gateway_method',)
+        )
+
+    def render(self) -> str:
+        lines = [
+            *_latency_lines(self.http),
+            *_latency_lines(self.grpc),
+            *_latency_lines(self.queries),
+            *_pool_lines(self.pool),
+            *_cache_lines(self.caches),
+        ]
+        return '\n'.join(lines) + '\n'
+
+
+def _latency_lines(metric: LatencyMetric) -> Iterator[str]:
+    duration = f'{metric.name}_duration_seconds'
+    yield f'# HELP {duration} {metric.description}'
+    yield f'# TYPE {duration} histogram'
+    for values, histogram in sorted(metric.histograms.items()):
+        yield from _histogram_lines(duration, _labels(metric.labels, values), histogram)
+
+    errors = f'{metric.name}_errors_total'
+    yield f'# HELP {errors} Failures, labelled like {duration}.'
+    yield f'# TYPE {errors} counter'
+    for values, count in sorted(metric.errors.items()):
+        yield f'{errors}{{{_labels(metric.labels, values)}}} {count}'
+
+
+def _pool_lines(pool: PoolMetrics) -> Iterator[str]:
+    stats = pool.stats()
+    gauges = (
+        ('db_pool_size', 'Connections the pool keeps open.', stats.size),
+        ('db_pool_checked_out', 'Connections in use.', stats.checked_out),
+        ('db_pool_overflow', 'Connections open above the pool size.', stats.overflow),
+        ('db_pool_waiters', 'Checkouts waiting for a connection.', stats.waiters),
+    )
+    for name, description, value in gauges:
+        yield f'# HELP {name} {description}'
+        yield f'# TYPE {name} gauge'
+        yield f'{name} {value}'
+
+    counters = (
+        ('db_pool_checkouts_total', 'Connections handed out.', stats.checkouts),
+        ('db_pool_connects_total', 'Connections opened.', stats.connects),
+        (
+            'db_pool_invalidations_total',
+            'Connections invalidated.',
+            stats.invalidations,
+        ),
+    )
+    for name, description, value in counters:
+        yield f'# HELP {name} {description}'
+        yield f'# TYPE {name} counter'
+        yield f'{name} {value}'
+
+    name = 'db_pool_checkout_wait_seconds'
+    yield f'# HELP {name} Time to get a connection from the pool.'
+    yield f'# TYPE {name} histogram'
+    yield from _histogram_lines(name, '', pool.checkout_wait)
+
+
+def _cache_lines(caches: Mapping[str, LRUCache]) -> Iterator[str]:
+    name = 'cache_entries'
+    yield f'# HELP {name} Entries held by each cache.'
+    yield f'# TYPE {name} gauge'
+    for cache_name, cache in sorted(caches.items()):
+        yield f'{name}{{cache="{cache_name}"}} {len(cache)}'
+
+    counters = (
+        ('cache_hits_total', 'Lookups answered from the cache.', 'hits'),
+        ('cache_misses_total', 'Lookups that went to the database.', 'misses'),
+        ('cache_evictions_total', 'Entries dropped to stay in size.', 'evictions'),
+        ('cache_expirations_total', 'Entries dropped for their TTL.', 'expirations'),
+        (
+            'cache_invalidations_total',
+            'Entries dropped after a write.',
+            'invalidations',
+        ),
+    )
+    for name, description, field in counters:
+        yield f'# HELP {name} {description}'
+        yield f'# TYPE {name} counter'
+        for cache_name, cache in sorted(caches.items()):
+            yield f'{name}{{cache="{cache_name}"}} {getattr(cache.stats, field)}'
+
+
+def _histogram_lines(name: str, labels: str, histogram: Histogram) -> Iterator[str]:
+    prefix = f'{labels},' if labels else ''
+    for edge, count in histogram.cumulative():
+        le = '+Inf' if math.isinf(edge) else str(edge)
+        yield f'{name}_bucket{{{prefix}le="{le}"}} {count}'
+    suffix = f'{{{labels}}}' if labels else ''
+    yield f'{name}_sum{suffix} {histogram.sum}'
+    yield f'{name}_count{suffix} {histogram.count}'
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    return ','.join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,90 @@
+import time
+from collections.abc import Awaitable, Callable
+from inspect import iscoroutine
+from typing import Any
+
+from dishka import AsyncContainer
+from grpc import (
+    HandlerCallDetails,
+    RpcMethodHandler,
+    unary_stream_rpc_method_handler,
+    unary_unary_rpc_method_handler,
+)
+from grpc.aio import ServerInterceptor, ServicerContext
+
+from app.config import Config
+from app.infrastructure.replicas.routing import ClientRouting, client_routing
+
+METADATA_KEY = 'db-primary-until'
+
+
+class ReadYourWritesInterceptor(ServerInterceptor):
+    """Keeps a client's reads on the primary for a while after it writes.
+
+    A call that writes returns the deadline in its trailing metadata; the
+    client sends it back as request metadata to stay pinned.
+    """
+
+    def __init__(self, container: AsyncContainer):
+        self._container = container
+        self._window: float | None = None
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[HandlerCallDetails], Awaitable[RpcMethodHandler]],
+        handler_call_details: HandlerCallDetails,
+    ) -> RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+        if self._window is None:
+            replicas = (await self._container.get(Config)).replicas
+            self._window = replicas.read_your_writes_seconds if replicas.enabled else 0
+        window = self._window
+        if handler is None or not window:
+            return handler
+
+        pinned = _pinned_until(handler_call_details) > time.time()
+
+        def pin(client: ClientRouting, context: ServicerContext) -> None:
+            if client.wrote:
+                until = f'{time.time() + window:.3f}'
+                context.set_trailing_metadata(((METADATA_KEY, until),))
+
+        async def unary_unary(request: Any, context: ServicerContext) -> Any:
+            with client_routing(pinned) as client:
+                response = await handler.unary_unary(request, context)
+                pin(client, context)
+                return response
+
+        async def unary_stream(request: Any, context: ServicerContext) -> None:
+            with client_routing(pinned) as client:
+                result = handler.unary_stream(request, context)
+                if iscoroutine(result):
+                    await result
+                else:
+                    async for message in result:
+                        await context.write(message)
+                pin(client, context)
+
+        if handler.unary_unary:
+            return unary_unary_rpc_method_handler(
+                unary_unary,
+                handler.request_deserializer,
+                handler.response_serializer,
+            )
+        if handler.unary_stream:
+            return unary_stream_rpc_method_handler(
+                unary_stream,
+                handler.request_deserializer,
+                handler.response_serializer,
+            )
+        return handler
+
+
+def _pinned_until(handler_call_details: HandlerCallDetails) -> float:
+    for key, value in handler_call_details.invocation_metadata or ():
+        if key == METADATA_KEY:
+            try:
+                return float(value)
+            except ValueError:
+                return 0
+    return 0
@@ -0,0 +1,60 @@
+import math
+import time
+
+from dishka import AsyncContainer
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import Config
+from app.infrastructure.replicas.routing import client_routing
+
+COOKIE = 'db_primary_until'
+
+
+class ReadYourWritesMiddleware:
+    """Keeps a client's reads on the primary for a while after it writes.
+
+    The deadline travels in a cookie rather than in process memory, so it
+    holds across HTTP workers and instances.
+    """
+
+    def __init__(self, app: ASGIApp, container: AsyncContainer):
+        self._app = app
+        self._container = container
+        self._window: float | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self._window is None and scope['type'] == 'http':
+            replicas = (await self._container.get(Config)).replicas
+            self._window = replicas.read_your_writes_seconds if replicas.enabled else 0
+        if scope['type'] != 'http' or not self._window:
+            await self._app(scope, receive, send)
+            return
+
+        window = self._window
+        with client_routing(pinned=_pinned_until(scope) > time.time()) as client:
+
+            async def send_with_cookie(message: Message) -> None:
+                if message['type'] == 'http.response.start' and client.wrote:
+                    cookie = (
+                        f'{COOKIE}={time.time() + window:.3f}; '
+                        f'Max-Age={math.ceil(window)}; Path=/; HttpOnly; SameSite=Lax'
+                    )
+                    headers = [
+                        *message.get('headers', ()),
+                        (b'set-cookie', cookie.encode()),
+                    ]
+                    message = {**message, 'headers': headers}
+                await send(message)
+
+            await self._app(scope, receive, send_with_cookie)
+
+
+def _pinned_until(scope: Scope) -> float:
+    for name, value in scope['headers']:
+        if name == b'cookie':
+            try:
+                return float(cookie_parser(value.decode('latin-1')).get(COOKIE, 0))
+            except ValueError:
+                return 0
+    return 0
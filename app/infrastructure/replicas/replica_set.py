@@ -0,0 +1,67 @@
+import itertools
+import logging
+import time
+from collections.abc import Callable, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaSet:
+    """Hands out read replicas in turn, skipping the ones that recently failed.
+
+    A replica is ejected for ``ejection`` seconds when connecting to it
+    fails or an open connection to it is lost. Statement errors such as
+    timeouts say nothing about its health and do not eject it. While every
+    replica is ejected ``pick`` returns None and reads go to the primary.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        ejection: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.engines = list(engines)
+        self._ejection = ejection
+        self._clock = clock
+        self._ejected_until = [0.0] * len(self.engines)
+        self._turn = itertools.count()
+        for index, engine in enumerate(self.engines):
+            event.listen(engine.sync_engine, 'handle_error', self._on_error(index))
+
+    def pick(self) -> AsyncEngine | None:
+        now = self._clock()
+        start = next(self._turn)
+        for offset in range(len(self.engines)):
+            index = (start + offset) % len(self.engines)
+            if self._ejected_until[index] <= now:
+                return self.engines[index]
+        return None
+
+    def is_ejected(self, engine: AsyncEngine) -> bool:
+        return self._ejected_until[self.engines.index(engine)] > self._clock()
+
+    def eject(self, engine: AsyncEngine) -> None:
+        index = self.engines.index(engine)
+        self._ejected_until[index] = self._clock() + self._ejection
+        logger.warning(
+            'Ejected replica %s for %.0f s',
+            engine.url.render_as_string(hide_password=True),
+            self._ejection,
+        )
+
+    async def dispose(self) -> None:
+        for engine in self.engines:
+            await engine.dispose()
+
+    def _on_error(self, index: int) -> Callable[[ExceptionContext], None]:
+        def on_error(context: ExceptionContext) -> None:
+            # Failed connects come without a connection.
+            if context.is_disconnect or context.connection is None:
+                self.eject(self.engines[index])
+
+        return on_error
@@ -0,0 +1,148 @@
+import inspect
+from collections.abc import AsyncIterator, Awaitable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.infrastructure.replicas.replica_set import ReplicaSet
+
+# Use cases whose names start with these only read.
+QUERY_PREFIXES = ('Get', 'Search', 'Stream')
+
+_replica_reads: ContextVar[bool] = ContextVar('replica_reads', default=False)
+_client: ContextVar['ClientRouting | None'] = ContextVar('client_routing', default=None)
+
+
+@dataclass(slots=True)
+class ClientRouting:
+    """Read-your-writes state of the request being served.
+
+    ``pinned`` keeps the client's reads on the primary; ``wrote`` is set
+    once the request runs a command, so the client can be pinned next time.
+    """
+
+    pinned: bool = False
+    wrote: bool = False
+
+
+@contextmanager
+def client_routing(pinned: bool) -> Iterator[ClientRouting]:
+    state = ClientRouting(pinned=pinned)
+    token = _client.set(state)
+    try:
+        yield state
+    finally:
+        _client.reset(token)
+
+
+def reads_from_replica() -> bool:
+    """Whether the running query use case may read from a replica."""
+    return _replica_reads.get()
+
+
+def client_pinned() -> bool:
+    """Whether the client of the request being served must read its own writes."""
+    client = _client.get()
+    return client is not None and client.pinned
+
+
+def is_query(use_case: type) -> bool:
+    return use_case.__name__.startswith(QUERY_PREFIXES)
+
+
+class RoutingSession(Session):
+    """Sends the SELECTs of query use cases to a replica, the rest to the primary.
+
+    A session keeps the replica it picked first, so one request reads a
+    single snapshot. Once it has written, its reads stay on the primary to
+    see its own changes.
+    """
+
+    def __init__(self, *args: Any, replicas: ReplicaSet, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._replicas = replicas
+        self._replica: Engine | None = None
+        self._wrote = False
+
+    def get_bind(self, mapper: Any = None, **kw: Any) -> Engine | Connection:
+        clause = kw.get('clause')
+        is_select = clause is not None and clause.is_select and not self._flushing
+        if not is_select:
+            self._wrote = True
+        elif reads_from_replica() and not self._wrote:
+            if self._replica is None:
+                replica = self._replicas.pick()
+                if replica is not None:
+                    self._replica = replica.sync_engine
+            if self._replica is not None:
+                return self._replica
+        return super().get_bind(mapper, **kw)
+
+
+class ReplicaReadUseCase:
+    """Lets a query use case read from a replica unless the client is pinned.
+
+    Streams are routed on their first step, where the statement runs.
+    """
+
+    __slots__ = ('_use_case',)
+
+    def __init__(self, use_case: Any):
+        self._use_case = use_case
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if client_pinned():
+            return self._use_case(*args, **kwargs)
+        result = self._use_case(*args, **kwargs)
+        if inspect.iscoroutine(result):
+            return self._read(result)
+        if inspect.isasyncgen(result):
+            return self._read_stream(result)
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._use_case, name)
+
+    async def _read(self, call: Awaitable[Any]) -> Any:
+        token = _replica_reads.set(True)
+        try:
+            return await call
+        finally:
+            _replica_reads.reset(token)
+
+    async def _read_stream(self, items: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        try:
+            token = _replica_reads.set(True)
+            try:
+                first = await items.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                _replica_reads.reset(token)
+            yield first
+            async for item in items:
+                yield item
+        finally:
+            await items.aclose()
+
+
+class PrimaryWriteUseCase:
+    """Records that the request wrote, for read-your-writes pinning."""
+
+    __slots__ = ('_use_case',)
+
+    def __init__(self, use_case: Any):
+        self._use_case = use_case
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        client = _client.get()
+        if client is not None:
+            client.wrote = True
+        return self._use_case(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._use_case, name)
@@ -0,0 +1,66 @@
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.interface.stats.stats import PopulationStatsRefresher
+from app.infrastructure.gateway.stats import PopulationStatsGateway
+
+logger = logging.getLogger(__name__)
+
+
+class DebouncedStatsRefresher(PopulationStatsRefresher):
+    """Coalesces refresh requests into one view refresh per ``delay``.
+
+    Writes only mark the stats as stale; the refresh runs in the background
+    in its own session, so a burst of city writes costs one refresh and
+    never waits on it. Requests made while a refresh runs schedule one more.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        delay: float,
+    ):
+        self._session_maker = session_maker
+        self._delay = delay
+        self._pending = False
+        self._task: asyncio.Task | None = None
+        self.refreshes = 0
+
+    def request_refresh(self) -> None:
+        self._pending = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the timer and run a refresh that is still owed."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        if self._pending:
+            self._pending = False
+            await self._refresh_logged()
+
+    async def _run(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self._delay)
+            self._pending = False
+            try:
+                await self._refresh_logged()
+            except asyncio.CancelledError:
+                # Interrupted by close(), which runs it again.
+                self._pending = True
+                raise
+
+    async def _refresh_logged(self) -> None:
+        try:
+            await self._refresh()
+        except Exception:
+            # The stats stay stale until the next write asks again.
+            logger.exception('Population stats refresh failed')
+
+    async def _refresh(self) -> None:
+        async with self._session_maker() as session:
+            await PopulationStatsGateway(session).refresh()
+        self.refreshes += 1
@@ -0,0 +1,60 @@
+import json
+from abc import abstractmethod
+from pathlib import Path
+from typing import Any, Protocol
+
+from app.infrastructure.tracing.span import Span
+
+
+class SpanExporter(Protocol):
+    @abstractmethod
+    def export(self, span: Span) -> None: ...
+
+    @abstractmethod
+    def close(self) -> None: ...
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps finished spans in a list, for tests and debugging."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def close(self) -> None:
+        pass
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """Appends one JSON object per finished span to a file.
+
+    Field names follow the OTLP JSON encoding, so the file can be replayed
+    into a collector later.
+    """
+
+    def __init__(self, path: Path):
+        self._file = path.open('a', encoding='utf-8')
+
+    def export(self, span: Span) -> None:
+        self._file.write(json.dumps(span_to_otlp(span), default=str) + '\n')
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def span_to_otlp(span: Span) -> dict[str, Any]:
+    return {
+        'traceId': span.context.trace_id,
+        'spanId': span.context.span_id,
+        'parentSpanId': span.parent_id or '',
+        'name': span.name,
+        'kind': span.kind,
+        'startTimeUnixNano': span.start_ns,
+        'endTimeUnixNano': span.end_ns,
+        'attributes': span.attributes,
+        'status': {'code': 'ERROR', 'message': span.error}
+        if span.error
+        else {'code': 'OK'},
+    }
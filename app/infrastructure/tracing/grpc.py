@@ -0,0 +1,77 @@
+from collections.abc import Awaitable, Callable
+from inspect import iscoroutine
+from typing import Any
+
+from dishka import AsyncContainer
+from grpc import (
+    HandlerCallDetails,
+    RpcMethodHandler,
+    unary_stream_rpc_method_handler,
+    unary_unary_rpc_method_handler,
+)
+from grpc.aio import ServerInterceptor, ServicerContext
+
+from app.infrastructure.tracing.propagation import TRACEPARENT, parse_traceparent
+from app.infrastructure.tracing.span import SpanContext
+from app.infrastructure.tracing.tracer import Tracer
+
+
+class TracingInterceptor(ServerInterceptor):
+    """Runs unary and server-streaming calls in a server span.
+
+    The caller's trace continues from the ``traceparent`` metadata entry.
+    """
+
+    def __init__(self, container: AsyncContainer):
+        self._container = container
+        self._tracer: Tracer | None = None
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[HandlerCallDetails], Awaitable[RpcMethodHandler]],
+        handler_call_details: HandlerCallDetails,
+    ) -> RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+        if self._tracer is None:
+            self._tracer = await self._container.get(Tracer)
+        tracer = self._tracer
+        if handler is None or not tracer.enabled:
+            return handler
+
+        method = handler_call_details.method
+        parent = _parent(handler_call_details)
+        attributes = {'rpc.system': 'grpc', 'rpc.method': method}
+
+        async def unary_unary(request: Any, context: ServicerContext) -> Any:
+            with tracer.span(method, 'server', attributes, parent):
+                return await handler.unary_unary(request, context)
+
+        async def unary_stream(request: Any, context: ServicerContext) -> None:
+            with tracer.span(method, 'server', attributes, parent):
+                result = handler.unary_stream(request, context)
+                if iscoroutine(result):
+                    await result
+                    return
+                async for message in result:
+                    await context.write(message)
+
+        if handler.unary_unary:
+            return unary_unary_rpc_method_handler(
+                unary_unary,
+                handler.request_deserializer,
+                handler.response_serializer,
+            )
+        if handler.unary_stream:
+            return unary_stream_rpc_method_handler(
+                unary_stream,
+                handler.request_deserializer,
+                handler.response_serializer,
+            )
+        return handler
+
+
+def _parent(handler_call_details: HandlerCallDetails) -> SpanContext | None:
+    for key, value in handler_call_details.invocation_metadata or ():
+        if key == TRACEPARENT:
+            return parse_traceparent(value)
+    return None
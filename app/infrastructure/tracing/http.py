@@ -0,0 +1,56 @@
+from dishka import AsyncContainer
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.tracing.propagation import TRACEPARENT, parse_traceparent
+from app.infrastructure.tracing.tracer import Tracer
+
+_TRACEPARENT = TRACEPARENT.encode()
+
+
+class TracingMiddleware:
+    """Runs each HTTP request in a server span, continuing the caller's trace.
+
+    The span is renamed to the route template once routing has run.
+    """
+
+    def __init__(self, app: ASGIApp, container: AsyncContainer):
+        self._app = app
+        self._container = container
+        self._tracer: Tracer | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self._tracer is None and scope['type'] == 'http':
+            self._tracer = await self._container.get(Tracer)
+        if scope['type'] != 'http' or not self._tracer.enabled:
+            await self._app(scope, receive, send)
+            return
+
+        header = next(
+            (value for name, value in scope['headers'] if name == _TRACEPARENT), None
+        )
+        parent = parse_traceparent(header.decode('latin-1') if header else None)
+        method = scope['method']
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        with self._tracer.span(
+            f'{method} {scope["path"]}',
+            kind='server',
+            attributes={'http.request.method': method, 'url.path': scope['path']},
+            parent=parent,
+        ) as span:
+            try:
+                await self._app(scope, receive, send_with_status)
+            finally:
+                route = scope.get('route')
+                if route is not None:
+                    span.name = f'{method} {route.path}'
+                    span.attributes['http.route'] = route.path
+                span.attributes['http.response.status_code'] = status
+                if status >= 500 and span.error is None:
+                    span.error = f'HTTP {status}'
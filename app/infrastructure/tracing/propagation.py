@@ -0,0 +1,28 @@
+import re
+
+from app.infrastructure.tracing.span import SpanContext
+
+TRACEPARENT = 'traceparent'
+
+_TRACEPARENT = re.compile(r'^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$')
+_INVALID_TRACE_ID = '0' * 32
+_INVALID_SPAN_ID = '0' * 16
+
+
+def parse_traceparent(value: str | None) -> SpanContext | None:
+    """Read a W3C ``traceparent`` header; anything malformed starts a new trace."""
+    if value is None:
+        return None
+    match = _TRACEPARENT.match(value.strip().lower())
+    if match is None:
+        return None
+    trace_id, span_id, flags = match.groups()
+    if trace_id == _INVALID_TRACE_ID or span_id == _INVALID_SPAN_ID:
+        return None
+    return SpanContext(trace_id, span_id, sampled=bool(int(flags, 16) & 1))
+
+
+def format_traceparent(context: SpanContext) -> str:
+    return (
+        f'00-{context.trace_id}-{context.span_id}-{"01" if context.sampled else "00"}'
+    )
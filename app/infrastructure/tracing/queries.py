@@ -0,0 +1,45 @@
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+
+from app.infrastructure.db.origin import query_origin
+from app.infrastructure.tracing.tracer import Tracer
+
+_SPANS = 'tracing_spans'
+
+
+def trace_queries(engine: Engine, tracer: Tracer) -> None:
+    """Record a client span for every statement ``engine`` runs.
+
+    The SQL text is kept; bound parameter values are not.
+    """
+
+    def before_cursor_execute(
+        conn: Connection, cursor: Any, statement: str, *_: Any
+    ) -> None:
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement else ''
+        attributes = {
+            'db.system': 'postgresql',
+            'db.operation': operation,
+            'db.statement': statement,
+        }
+        origin = query_origin()
+        if origin is not None:
+            attributes['code.function'] = origin
+        span = tracer.start_span(f'SQL {operation}', 'client', attributes)
+        conn.info.setdefault(_SPANS, []).append(span)
+
+    def after_cursor_execute(conn: Connection, cursor: Any, *_: Any) -> None:
+        span = conn.info[_SPANS].pop()
+        span.attributes['db.rowcount'] = cursor.rowcount
+        tracer.end_span(span)
+
+    def handle_error(context: ExceptionContext) -> None:
+        conn = context.connection
+        if conn is not None and conn.info.get(_SPANS):
+            tracer.end_span(conn.info[_SPANS].pop(), context.original_exception)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+    event.listen(engine, 'handle_error', handle_error)
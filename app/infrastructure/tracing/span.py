@@ -0,0 +1,33 @@
+import os
+from dataclasses import dataclass, field
+from typing import Any
+
+
+def new_trace_id() -> str:
+    return os.urandom(16).hex()
+
+
+def new_span_id() -> str:
+    return os.urandom(8).hex()
+
+
+@dataclass(slots=True)
+class SpanContext:
+    """The part of a span that crosses process boundaries."""
+
+    trace_id: str
+    span_id: str
+    sampled: bool = True
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    kind: str
+    context: SpanContext
+    parent_id: str | None
+    start_ns: int
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    # Why the span failed: an exception type name or an error status.
+    error: str | None = None
@@ -0,0 +1,103 @@
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from app.infrastructure.tracing.exporters import SpanExporter
+from app.infrastructure.tracing.span import (
+    Span,
+    SpanContext,
+    new_span_id,
+    new_trace_id,
+)
+
+_current: ContextVar[Span | None] = ContextVar('current_span', default=None)
+
+
+def current_span() -> Span | None:
+    return _current.get()
+
+
+@contextmanager
+def activated(span: Span) -> Iterator[Span]:
+    """Make ``span`` the parent of spans started inside the block."""
+    token = _current.set(span)
+    try:
+        yield span
+    finally:
+        _current.reset(token)
+
+
+class Tracer:
+    """Starts spans and hands finished ones to the exporters.
+
+    Without exporters the tracer is disabled; callers check ``enabled`` and
+    skip span bookkeeping entirely.
+    """
+
+    def __init__(self, exporters: Sequence[SpanExporter] = ()):
+        self.exporters = tuple(exporters)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.exporters)
+
+    def start_span(
+        self,
+        name: str,
+        kind: str = 'internal',
+        attributes: Mapping[str, Any] | None = None,
+        parent: SpanContext | None = None,
+    ) -> Span:
+        """Start a span under ``parent``, or else under the current span.
+
+        The span does not become current; use ``span`` for a block of code
+        or ``activated`` for work that resumes several times.
+        """
+        if parent is None:
+            current = _current.get()
+            parent = current.context if current is not None else None
+        if parent is None:
+            context = SpanContext(new_trace_id(), new_span_id())
+        else:
+            context = SpanContext(parent.trace_id, new_span_id(), parent.sampled)
+        return Span(
+            name=name,
+            kind=kind,
+            context=context,
+            parent_id=parent.span_id if parent is not None else None,
+            start_ns=time.time_ns(),
+            attributes=dict(attributes or {}),
+        )
+
+    def end_span(self, span: Span, error: BaseException | None = None) -> None:
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = type(error).__name__
+        if span.context.sampled:
+            for exporter in self.exporters:
+                exporter.export(span)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        kind: str = 'internal',
+        attributes: Mapping[str, Any] | None = None,
+        parent: SpanContext | None = None,
+    ) -> Iterator[Span]:
+        span = self.start_span(name, kind, attributes, parent)
+        error = None
+        try:
+            with activated(span):
+                yield span
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            self.end_span(span, error)
+
+    def close(self) -> None:
+        for exporter in self.exporters:
+            exporter.close()
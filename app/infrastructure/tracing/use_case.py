@@ -0,0 +1,57 @@
+import inspect
+from collections.abc import AsyncIterator, Awaitable
+from typing import Any
+
+from app.infrastructure.tracing.tracer import Tracer, activated
+
+
+class TracedUseCase:
+    """Runs each call of an interactor or command in a span of its class name.
+
+    Streaming use cases get one span for the whole iteration; it is current
+    only while the stream produces an item, so the consumer's own work
+    between items is not attributed to it.
+    """
+
+    __slots__ = ('_use_case', '_tracer', '_name')
+
+    def __init__(self, use_case: Any, tracer: Tracer):
+        self._use_case = use_case
+        self._tracer = tracer
+        self._name = type(use_case).__name__
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        result = self._use_case(*args, **kwargs)
+        if inspect.iscoroutine(result):
+            return self._traced(result)
+        if inspect.isasyncgen(result):
+            return self._traced_stream(result)
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._use_case, name)
+
+    async def _traced(self, call: Awaitable[Any]) -> Any:
+        with self._tracer.span(self._name):
+            return await call
+
+    async def _traced_stream(self, items: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        span = self._tracer.start_span(self._name)
+        error = None
+        try:
+            while True:
+                with activated(span):
+                    try:
+                        item = await items.__anext__()
+                    except StopAsyncIteration:
+                        return
+                yield item
+        except GeneratorExit:
+            # The consumer stopped early, which is not a failure.
+            raise
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            await items.aclose()
+            self._tracer.end_span(span, error)
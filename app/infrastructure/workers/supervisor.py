@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import multiprocessing
+import signal
+from collections.abc import Callable
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerSupervisor:
+    """Keeps ``workers`` processes running ``target(*args)`` until stopped.
+
+    Workers are spawned rather than forked, so none of them inherits the
+    parent's event loop or connections. A worker that exits on its own is
+    replaced on the next check; SIGINT or SIGTERM stops the supervisor,
+    which then terminates the workers and waits for them to finish.
+    """
+
+    def __init__(
+        self,
+        target: Callable[..., None],
+        args: tuple[Any, ...],
+        workers: int,
+        check_interval: float = 0.5,
+        shutdown_timeout: float = 10.0,
+    ):
+        self._target = target
+        self._args = args
+        self._workers = workers
+        self._check_interval = check_interval
+        self._shutdown_timeout = shutdown_timeout
+        self._context = multiprocessing.get_context('spawn')
+        self._processes: list[BaseProcess] = []
+        self._stop = asyncio.Event()
+        self.restarts = 0
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self.stop)
+
+        self._processes = [self._spawn() for _ in range(self._workers)]
+        try:
+            while not self._stop.is_set():
+                try:
+                    await asyncio.wait_for(self._stop.wait(), self._check_interval)
+                except TimeoutError:
+                    self._replace_exited()
+        finally:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(sig)
+            await asyncio.to_thread(self._shutdown)
+
+    def _spawn(self) -> BaseProcess:
+        process = self._context.Process(target=self._target, args=self._args)
+        process.start()
+        return process
+
+    def _replace_exited(self) -> None:
+        for index, process in enumerate(self._processes):
+            if process.is_alive():
+                continue
+            logger.warning(
+                'Worker %s exited with code %s, restarting',
+                process.pid,
+                process.exitcode,
+            )
+            self._processes[index] = self._spawn()
+            self.restarts += 1
+
+    def _shutdown(self) -> None:
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+        for process in self._processes:
+            process.join(self._shutdown_timeout)
+            if process.is_alive():
+                logger.warning('Worker %s did not stop in time, killing', process.pid)
+                process.kill()
+                process.join()
@@ -1,29 +1,51 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Iterator
+from typing import Any
 from uuid import uuid4
 
 from dishka import AnyOf, Provider, Scope, from_context, provide
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.application.commands.city import CreateCityCommand, UpdateCityCommand
+from app.application.commands.city import (
+    CreateCitiesBatchCommand,
+    CreateCityCommand,
+    UpdateCityCommand,
+)
 from app.application.commands.district import CreateDistrictCommand
 from app.application.commands.region import CreateRegionCommand
 from app.application.interactors.city import (
     DeleteCityInteractor,
     GetCitiesByDistrictIdInteractor,
+    GetCitiesByDistrictIdsInteractor,
+    GetCitiesByIdsInteractor,
     GetCitiesInteractor,
     GetCityByIdInteractor,
+    SearchCitiesInteractor,
+    StreamCitiesByDistrictIdInteractor,
+    StreamCitiesInteractor,
 )
 from app.application.interactors.district import (
     DeleteDistrictInteractor,
     GetDistrictByIdInteractor,
+    GetDistrictsByIdsInteractor,
     GetDistrictsByRegionIdInteractor,
+    GetDistrictsByRegionIdsInteractor,
     GetDistrictsInteractor,
+    StreamDistrictsByRegionIdInteractor,
+    StreamDistrictsInteractor,
 )
 from app.application.interactors.region import (
     DeleteRegionInteractor,
     GetRegionByIdInteractor,
+    GetRegionsByIdsInteractor,
     GetRegionsInteractor,
+    GetRegionTreeInteractor,
+)
+from app.application.interactors.stats import (
+    GetDistrictsStatsByRegionIdInteractor,
+    GetRegionsStatsInteractor,
+    GetRegionStatsInteractor,
 )
+from app.application.interactors.version import GetVersionInteractor
 from app.application.interface.city.city import (
     CityDeleter,
     CityReader,
@@ -40,13 +62,40 @@ from app.application.interface.region.region import (
     RegionReader,
     RegionSaver,
 )
+from app.application.interface.stats.stats import (
+    PopulationStatsReader,
+    PopulationStatsRefresher,
+)
+from app.application.interface.transaction import TransactionManager
 from app.application.interface.uuid_generator import UUIDGenerator
+from app.application.interface.version.version import VersionBumper, VersionReader
 from app.config import Config
+from app.infrastructure.cache.city import CachedCityGateway, CityCache
+from app.infrastructure.cache.district import CachedDistrictGateway, DistrictCache
+from app.infrastructure.cache.region import CachedRegionGateway, RegionCache
 from app.infrastructure.db.main import new_session_maker
+from app.infrastructure.db.pool import PoolMetrics
+from app.infrastructure.db.transaction import SessionTransactionManager
 from app.infrastructure.gateway.city import CityGateway
 from app.infrastructure.gateway.district import DistrictGateway
 from app.infrastructure.gateway.region import RegionGateway
+from app.infrastructure.gateway.stats import PopulationStatsGateway
+from app.infrastructure.gateway.version import VersionGateway
 from app.infrastructure.grpc.region.region_pb2_grpc import RegionService
+from app.infrastructure.metrics.registry import MetricsRegistry
+from app.infrastructure.replicas.routing import (
+    PrimaryWriteUseCase,
+    ReplicaReadUseCase,
+    is_query,
+)
+from app.infrastructure.stats.refresher import DebouncedStatsRefresher
+from app.infrastructure.tracing.exporters import (
+    InMemorySpanExporter,
+    JsonLinesSpanExporter,
+    SpanExporter,
+)
+from app.infrastructure.tracing.tracer import Tracer
+from app.infrastructure.tracing.use_case import TracedUseCase
 
 
 class AppProvider(Provider):
@@ -57,8 +106,71 @@ class AppProvider(Provider):
         return uuid4
 
     @provide(scope=Scope.APP)
-    def get_session_maker(self, config: Config) -> async_sessionmaker[AsyncSession]:
-        return new_session_maker(config.postgres)
+    def get_pool_metrics(self) -> PoolMetrics:
+        return PoolMetrics()
+
+    @provide(scope=Scope.APP)
+    def get_metrics_registry(
+        self,
+        pool_metrics: PoolMetrics,
+        city_cache: CityCache,
+        district_cache: DistrictCache,
+        region_cache: RegionCache,
+    ) -> MetricsRegistry:
+        return MetricsRegistry(
+            pool_metrics,
+            {'city': city_cache, 'district': district_cache, 'region': region_cache},
+        )
+
+    @provide(scope=Scope.APP)
+    def get_tracer(self, config: Config) -> Iterator[Tracer]:
+        exporters: list[SpanExporter] = []
+        if config.tracing.exporter == 'memory':
+            exporters.append(InMemorySpanExporter())
+        elif config.tracing.exporter == 'jsonl':
+            exporters.append(JsonLinesSpanExporter(config.tracing.jsonl_path))
+
+        tracer = Tracer(exporters)
+        yield tracer
+        tracer.close()
+
+    @provide(scope=Scope.APP)
+    async def get_session_maker(
+        self,
+        config: Config,
+        pool_metrics: PoolMetrics,
+        metrics: MetricsRegistry,
+        tracer: Tracer,
+    ) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+        session_maker = new_session_maker(
+            config.postgres, pool_metrics, metrics.queries, tracer, config.replicas
+        )
+        yield session_maker
+        await session_maker.kw['bind'].dispose()
+        if 'replicas' in session_maker.kw:
+            await session_maker.kw['replicas'].dispose()
+
+    @provide(scope=Scope.APP)
+    def get_region_cache(self, config: Config) -> RegionCache:
+        return RegionCache(max_size=config.cache.max_size, ttl=config.cache.ttl)
+
+    @provide(scope=Scope.APP)
+    def get_district_cache(self, config: Config) -> DistrictCache:
+        return DistrictCache(max_size=config.cache.max_size, ttl=config.cache.ttl)
+
+    @provide(scope=Scope.APP)
+    def get_city_cache(self, config: Config) -> CityCache:
+        return CityCache(max_size=config.cache.max_size, ttl=config.cache.ttl)
+
+    @provide(scope=Scope.APP)
+    async def get_stats_refresher(
+        self, session_maker: async_sessionmaker[AsyncSession], config: Config
+    ) -> AsyncGenerator[PopulationStatsRefresher, None]:
+        refresher = DebouncedStatsRefresher(
+            session_maker, delay=config.stats.refresh_delay
+        )
+        yield refresher
+        await refresher.close()
 
     @provide(scope=Scope.REQUEST)
     async def get_session(
@@ -67,23 +179,41 @@ class AppProvider(Provider):
         async with session_maker() as session:
             yield session
 
+    transaction_manager = provide(
+        SessionTransactionManager,
+        scope=Scope.REQUEST,
+        provides=TransactionManager,
+    )
+    version_gateway = provide(
+        VersionGateway,
+        scope=Scope.REQUEST,
+        provides=AnyOf[VersionReader, VersionBumper],
+    )
+    get_version_interactor = provide(GetVersionInteractor, scope=Scope.REQUEST)
+
     # region
-    region_gateway = provide(
-        RegionGateway,
+    region_gateway = provide(RegionGateway, scope=Scope.REQUEST)
+    cached_region_gateway = provide(
+        CachedRegionGateway,
         scope=Scope.REQUEST,
         provides=AnyOf[RegionSaver, RegionReader, RegionDeleter],
     )
 
     get_region_interactor = provide(GetRegionByIdInteractor, scope=Scope.REQUEST)
+    get_regions_by_ids_interactor = provide(
+        GetRegionsByIdsInteractor, scope=Scope.REQUEST
+    )
     get_regions_interactor = provide(GetRegionsInteractor, scope=Scope.REQUEST)
+    get_region_tree_interactor = provide(GetRegionTreeInteractor, scope=Scope.REQUEST)
     create_region_interactor = provide(CreateRegionCommand, scope=Scope.REQUEST)
     delete_region_interactor = provide(DeleteRegionInteractor, scope=Scope.REQUEST)
 
     region_grpc_service = provide(RegionService, scope=Scope.REQUEST)
 
     # district
-    district_gateway = provide(
-        DistrictGateway,
+    district_gateway = provide(DistrictGateway, scope=Scope.REQUEST)
+    cached_district_gateway = provide(
+        CachedDistrictGateway,
         scope=Scope.REQUEST,
         provides=AnyOf[DistrictSaver, DistrictReader, DistrictDeleter],
     )
@@ -92,15 +222,28 @@ class AppProvider(Provider):
     get_districts_by_region_id_interactor = provide(
         GetDistrictsByRegionIdInteractor, scope=Scope.REQUEST
     )
+    get_districts_by_region_ids_interactor = provide(
+        GetDistrictsByRegionIdsInteractor, scope=Scope.REQUEST
+    )
     get_district_by_id_interactor = provide(
         GetDistrictByIdInteractor, scope=Scope.REQUEST
     )
+    get_districts_by_ids_interactor = provide(
+        GetDistrictsByIdsInteractor, scope=Scope.REQUEST
+    )
+    stream_districts_interactor = provide(
+        StreamDistrictsInteractor, scope=Scope.REQUEST
+    )
+    stream_districts_by_region_id_interactor = provide(
+        StreamDistrictsByRegionIdInteractor, scope=Scope.REQUEST
+    )
     create_district_interactor = provide(CreateDistrictCommand, scope=Scope.REQUEST)
     delete_district_interactor = provide(DeleteDistrictInteractor, scope=Scope.REQUEST)
 
     # city
-    city_gateway = provide(
-        CityGateway,
+    city_gateway = provide(CityGateway, scope=Scope.REQUEST)
+    cached_city_gateway = provide(
+        CachedCityGateway,
         scope=Scope.REQUEST,
         provides=AnyOf[CitySaver, CityReader, CityDeleter, CityUpdater],
     )
@@ -108,7 +251,92 @@ class AppProvider(Provider):
     get_cities_by_district_id_interactor = provide(
         GetCitiesByDistrictIdInteractor, scope=Scope.REQUEST
     )
+    get_cities_by_district_ids_interactor = provide(
+        GetCitiesByDistrictIdsInteractor, scope=Scope.REQUEST
+    )
     get_city_by_id_interactor = provide(GetCityByIdInteractor, scope=Scope.REQUEST)
+    get_cities_by_ids_interactor = provide(
+        GetCitiesByIdsInteractor, scope=Scope.REQUEST
+    )
+    search_cities_interactor = provide(SearchCitiesInteractor, scope=Scope.REQUEST)
+    stream_cities_interactor = provide(StreamCitiesInteractor, scope=Scope.REQUEST)
+    stream_cities_by_district_id_interactor = provide(
+        StreamCitiesByDistrictIdInteractor, scope=Scope.REQUEST
+    )
     create_city_interactor = provide(CreateCityCommand, scope=Scope.REQUEST)
+    create_cities_batch_interactor = provide(
+        CreateCitiesBatchCommand, scope=Scope.REQUEST
+    )
     delete_city_interactor = provide(DeleteCityInteractor, scope=Scope.REQUEST)
     update_city_interactor = provide(UpdateCityCommand, scope=Scope.REQUEST)
+
+    # stats
+    stats_gateway = provide(
+        PopulationStatsGateway, scope=Scope.REQUEST, provides=PopulationStatsReader
+    )
+    get_regions_stats_interactor = provide(
+        GetRegionsStatsInteractor, scope=Scope.REQUEST
+    )
+    get_region_stats_interactor = provide(GetRegionStatsInteractor, scope=Scope.REQUEST)
+    get_districts_stats_by_region_id_interactor = provide(
+        GetDistrictsStatsByRegionIdInteractor, scope=Scope.REQUEST
+    )
+
+
+_USE_CASE_MODULES = ('app.application.interactors.', 'app.application.commands.')
+
+
+def _use_cases(app_provider: AppProvider) -> Iterator[type]:
+    for factory in app_provider.factories:
+        use_case = factory.provides.type_hint
+        if getattr(use_case, '__module__', '').startswith(_USE_CASE_MODULES):
+            yield use_case
+
+
+class ReplicaRoutingProvider(Provider):
+    """Lets the query use cases of ``app_provider`` read from replicas.
+
+    ``Get*``, ``Search*`` and ``Stream*`` use cases may read from a replica;
+    the others are marked as writes and stay on the primary. It is only
+    added to the container when replicas are configured.
+    """
+
+    def __init__(self, app_provider: AppProvider):
+        super().__init__()
+        for use_case in _use_cases(app_provider):
+            proxy = ReplicaReadUseCase if is_query(use_case) else PrimaryWriteUseCase
+            self.decorate(_wrapped(use_case, proxy), provides=use_case)
+
+
+class TracingProvider(Provider):
+    """Runs every interactor and command of ``app_provider`` in a span.
+
+    It is only added to the container when tracing is on, so untraced
+    processes call the use cases directly.
+    """
+
+    def __init__(self, app_provider: AppProvider):
+        super().__init__()
+        for use_case in _use_cases(app_provider):
+            self.decorate(_traced(use_case), provides=use_case)
+
+
+def _wrapped(use_case: type, proxy: Callable[[Any], Any]) -> Callable[..., Any]:
+    def decorate(instance: Any) -> Any:
+        return proxy(instance)
+
+    # dishka finds the decorated dependency through the annotations.
+    decorate.__annotations__ = {'instance': use_case, 'return': use_case}
+    return decorate
+
+
+def _traced(use_case: type) -> Callable[..., Any]:
+    def decorate(instance: Any, tracer: Tracer) -> Any:
+        return TracedUseCase(instance, tracer)
+
+    decorate.__annotations__ = {
+        'instance': use_case,
+        'tracer': Tracer,
+        'return': use_case,
+    }
+    return decorate
@@ -1,13 +1,18 @@
+import asyncio
+import socket
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 
 import uvicorn
-from dishka import make_async_container
+from dishka import AsyncContainer, Provider, make_async_container
 from dishka.integrations.fastapi import FastapiProvider, setup_dishka
 from dishka.integrations.grpcio import DishkaAioInterceptor, GrpcioProvider
 from fastapi import FastAPI
+from grpc.aio import Server
 from grpc.aio import server as make_server
 
-from app.config import Config
+from app.config import Config, HttpConfig
+from app.infrastructure.db.main import split_pool
 from app.infrastructure.grpc.city.city_pb2_grpc import add_CityServiceServicer_to_server
 from app.infrastructure.grpc.district.district_pb2_grpc import (
     add_DistrictServiceServicer_to_server,
@@ -15,69 +20,181 @@ from app.infrastructure.grpc.district.district_pb2_grpc import (
 from app.infrastructure.grpc.region.region_pb2_grpc import (
     add_RegionServiceServicer_to_server,
 )
-from app.ioc import AppProvider
+from app.infrastructure.grpc.stats.stats_pb2_grpc import (
+    add_StatsServiceServicer_to_server,
+)
+from app.infrastructure.metrics.grpc import MetricsInterceptor
+from app.infrastructure.metrics.http import MetricsMiddleware
+from app.infrastructure.replicas.grpc import ReadYourWritesInterceptor
+from app.infrastructure.replicas.http import ReadYourWritesMiddleware
+from app.infrastructure.tracing.grpc import TracingInterceptor
+from app.infrastructure.tracing.http import TracingMiddleware
+from app.infrastructure.workers.supervisor import WorkerSupervisor
+from app.ioc import AppProvider, ReplicaRoutingProvider, TracingProvider
 from app.presentation.api.city import city_router
 from app.presentation.api.district import district_router
+from app.presentation.api.metrics import metrics_router
+from app.presentation.api.pool import pool_router
 from app.presentation.api.region import region_router
+from app.presentation.api.stats import stats_router
 from app.presentation.grpc.city import CityGRPCService
 from app.presentation.grpc.district import DistrictGRPCService
 from app.presentation.grpc.region import RegionGRPCService
+from app.presentation.grpc.stats import StatsGRPCService
 
+# How long in-flight RPCs get to finish once shutdown starts.
+GRPC_SHUTDOWN_GRACE = 5.0
 
-def get_fastapi_app() -> FastAPI:
-    config = Config()
+
+def make_container(config: Config, *providers: Provider) -> AsyncContainer:
+    app_provider = AppProvider()
+    if config.replicas.enabled:
+        providers = (*providers, ReplicaRoutingProvider(app_provider))
+    # Added after routing, so use case spans also cover the routing.
+    if config.tracing.enabled:
+        providers = (*providers, TracingProvider(app_provider))
+    return make_async_container(app_provider, *providers, context={Config: config})
+
+
+def create_fastapi_app(container: AsyncContainer) -> FastAPI:
     app = FastAPI()
 
     app.include_router(region_router)
     app.include_router(district_router)
     app.include_router(city_router)
+    app.include_router(stats_router)
+    app.include_router(pool_router)
+    app.include_router(metrics_router)
 
-    async_container = make_async_container(
-        AppProvider(), FastapiProvider(), context={Config: config}
-    )
-    setup_dishka(container=async_container, app=app)
+    app.add_middleware(ReadYourWritesMiddleware, container=container)
+    app.add_middleware(MetricsMiddleware, container=container)
+    # Added last, so it is outermost and the span covers the metrics too.
+    app.add_middleware(TracingMiddleware, container=container)
+
+    setup_dishka(container=container, app=app)
 
     return app
 
 
-async def run_api(app: FastAPI) -> None:
-    config = uvicorn.Config(
-        app,
-        host='127.0.0.1',
-        port=8000,
+def create_grpc_server(container: AsyncContainer) -> Server:
+    server = make_server(
+        ThreadPoolExecutor(max_workers=10),
+        interceptors=[
+            TracingInterceptor(container),
+            MetricsInterceptor(container),
+            ReadYourWritesInterceptor(container),
+            DishkaAioInterceptor(container),
+        ],
     )
-    server = uvicorn.Server(config)
-    await server.serve()
 
+    add_RegionServiceServicer_to_server(RegionGRPCService(), server)
+    add_DistrictServiceServicer_to_server(DistrictGRPCService(), server)
+    add_CityServiceServicer_to_server(CityGRPCService(), server)
+    add_StatsServiceServicer_to_server(StatsGRPCService(), server)
+
+    server.add_insecure_port('[::]:50051')
 
-async def run_http_app():
-    app = get_fastapi_app()
-    await run_api(app)
+    return server
 
 
-async def run_grpc_app():
+def get_fastapi_app() -> FastAPI:
     config = Config()
-    container = make_async_container(
-        AppProvider(), GrpcioProvider(), context={Config: config}
+    async_container = make_container(config, FastapiProvider())
+    return create_fastapi_app(async_container)
+
+
+async def run_api(
+    app: FastAPI, config: HttpConfig, sockets: list[socket.socket] | None = None
+) -> None:
+    uvicorn_config = uvicorn.Config(
+        app,
+        host=config.host,
+        port=config.port,
     )
+    server = uvicorn.Server(uvicorn_config)
+    await server.serve(sockets)
 
-    server = make_server(
-        ThreadPoolExecutor(max_workers=10),
-        interceptors=[DishkaAioInterceptor(container)],
+
+async def serve_http(config: Config, sockets: list[socket.socket] | None = None):
+    container = make_container(config, FastapiProvider())
+    try:
+        await run_api(create_fastapi_app(container), config.http, sockets)
+    finally:
+        await container.close()
+
+
+def run_http_worker(config: Config, sock: socket.socket) -> None:
+    # uvicorn re-raises the SIGINT it drained on; the worker is done by then.
+    with suppress(KeyboardInterrupt):
+        asyncio.run(serve_http(config, [sock]))
+
+
+def http_worker_config(config: Config) -> Config:
+    return config.model_copy(
+        update={
+            'postgres': split_pool(config.postgres, config.http.workers),
+            # A write only invalidates the caches of the worker serving it,
+            # so workers read entities through instead of serving stale ones.
+            'cache': config.cache.model_copy(update={'max_size': 0}),
+        }
     )
 
-    add_RegionServiceServicer_to_server(RegionGRPCService(), server)
-    add_DistrictServiceServicer_to_server(DistrictGRPCService(), server)
-    add_CityServiceServicer_to_server(CityGRPCService(), server)
 
-    server.add_insecure_port('[::]:50051')
+async def run_http_workers(config: Config) -> None:
+    worker_config = http_worker_config(config)
+
+    # The parent binds once and every worker accepts on that same socket.
+    family = socket.AF_INET6 if ':' in config.http.host else socket.AF_INET
+    sock = socket.create_server((config.http.host, config.http.port), family=family)
+    sock.set_inheritable(True)
+    supervisor = WorkerSupervisor(
+        run_http_worker, (worker_config, sock), workers=config.http.workers
+    )
+    try:
+        await supervisor.run()
+    finally:
+        sock.close()
+
+
+async def run_http_app():
+    config = Config()
+    if config.http.workers > 1:
+        await run_http_workers(config)
+    else:
+        await serve_http(config)
+
+
+async def run_grpc_app():
+    config = Config()
+    container = make_container(config, GrpcioProvider())
+    server = create_grpc_server(container)
 
     await server.start()
     await server.wait_for_termination()
 
 
+async def run_combined_app():
+    # Both protocols resolve from one container, so they share the engine,
+    # its connection pool, the caches and the stats refresher.
+    config = Config()
+    container = make_container(config, FastapiProvider(), GrpcioProvider())
+    grpc_server = create_grpc_server(container)
+
+    # gRPC binds first so a port conflict fails before HTTP takes traffic.
+    # uvicorn owns the signal handlers: once it has drained HTTP requests,
+    # in-flight RPCs get their grace period and the container closes last.
+    await grpc_server.start()
+    try:
+        await run_api(create_fastapi_app(container), config.http)
+    finally:
+        await grpc_server.stop(GRPC_SHUTDOWN_GRACE)
+        await container.close()
+
+
 async def main(server_type: str) -> None:
     if server_type == 'HTTP':
         await run_http_app()
     elif server_type == 'GRPC':
         await run_grpc_app()
+    elif server_type == 'ALL':
+        await run_combined_app()
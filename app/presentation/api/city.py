@@ -1,21 +1,53 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
+from typing import Annotated
 from uuid import UUID
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Body, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from starlette import status
 
-from app.application.commands.city import CreateCityCommand, UpdateCityCommand
+from app.application.commands.city import (
+    MAX_BATCH_SIZE,
+    CreateCitiesBatchCommand,
+    CreateCityCommand,
+    UpdateCityCommand,
+)
 from app.application.dto.city import NewCityDTO, UpdatedCityDTO
-from app.application.errors import EntityNotExistsError
+from app.application.errors import EntityNotExistsError, InvalidCursorError
+from app.application.grouping import MAX_PARENT_IDS
 from app.application.interactors.city import (
     DeleteCityInteractor,
     GetCitiesByDistrictIdInteractor,
+    GetCitiesByDistrictIdsInteractor,
+    GetCitiesByIdsInteractor,
     GetCitiesInteractor,
     GetCityByIdInteractor,
+    SearchCitiesInteractor,
+    StreamCitiesInteractor,
+)
+from app.application.interactors.version import GetVersionInteractor
+from app.application.lookup import MAX_LOOKUP_IDS
+from app.application.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.application.search import (
+    DEFAULT_SEARCH_LIMIT,
+    MAX_SEARCH_LIMIT,
+    MAX_SEARCH_QUERY_LENGTH,
+    SearchMode,
+)
+from app.application.versions import CITIES, district_cities
+from app.config import Config
+from app.presentation.api.conditional import conditional_response, entity_response
+from app.presentation.api.encoding import CITIES_ENCODER, CITY_ENCODER, json_response
+from app.presentation.api.streaming import ExportFormat, stream_models
+from app.presentation.schemas.city import (
+    CitiesByDistricts,
+    City,
+    CityLookup,
+    CreatedCity,
+    DistrictCities,
 )
-from app.presentation.schemas.city import City
 
 city_router = APIRouter(prefix='/cities', tags=['cities'])
 
@@ -24,31 +56,82 @@ city_router = APIRouter(prefix='/cities', tags=['cities'])
 @inject
 async def get_cities(
     interactor: FromDishka[GetCitiesInteractor],
+    version_interactor: FromDishka[GetVersionInteractor],
+    config: FromDishka[Config],
+    response: Response,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> Sequence[City]:
-    city_dms = await interactor()
-    if not city_dms:
+    not_modified = conditional_response(
+        response,
+        if_none_match,
+        CITIES,
+        await version_interactor(CITIES),
+        config.http_cache.max_age,
+    )
+    if not_modified:
+        return not_modified
+
+    try:
+        page = await interactor(limit=limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+    if not page.items:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail='Cities not found'
         )
 
-    return [
-        City(
-            id=city_dm.id,
-            district_id=city_dm.district_id,
-            name=city_dm.name,
-            obj_type=city_dm.obj_type,
-            population=city_dm.population,
-        )
-        for city_dm in city_dms
-    ]
+    if page.next_cursor:
+        response.headers['X-Next-Cursor'] = page.next_cursor
+
+    return json_response(CITIES_ENCODER.dump_json(page.items), response.headers)
+
+
+@city_router.get('/export_cities', response_class=StreamingResponse)
+@inject
+async def export_cities(
+    interactor: FromDishka[StreamCitiesInteractor],
+    config: FromDishka[Config],
+    export_format: Annotated[ExportFormat, Query(alias='format')] = (
+        ExportFormat.NDJSON
+    ),
+) -> StreamingResponse:
+    async def cities() -> AsyncIterator[City]:
+        async for city_dm in interactor(chunk_size=config.postgres.stream_chunk_size):
+            yield City(
+                id=city_dm.id,
+                district_id=city_dm.district_id,
+                name=city_dm.name,
+                obj_type=city_dm.obj_type,
+                population=city_dm.population,
+            )
+
+    return stream_models(cities(), export_format)
 
 
 @city_router.get('/get_cities_by_district')
 @inject
 async def get_cities_by_district_id(
     interactor: FromDishka[GetCitiesByDistrictIdInteractor],
+    version_interactor: FromDishka[GetVersionInteractor],
+    config: FromDishka[Config],
+    response: Response,
     district_id: UUID,
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> Sequence[City]:
+    key = district_cities(district_id)
+    not_modified = conditional_response(
+        response,
+        if_none_match,
+        key,
+        await version_interactor(key),
+        config.http_cache.max_age,
+    )
+    if not_modified:
+        return not_modified
+
     city_dms = await interactor(district_id=district_id)
     if not city_dms:
         raise HTTPException(
@@ -56,23 +139,87 @@ async def get_cities_by_district_id(
             detail='Cities not found for this district',
         )
 
+    return json_response(CITIES_ENCODER.dump_json(city_dms), response.headers)
+
+
+@city_router.post('/get_cities_by_districts')
+@inject
+async def get_cities_by_district_ids(
+    interactor: FromDishka[GetCitiesByDistrictIdsInteractor],
+    district_ids: Annotated[list[UUID], Body(max_length=MAX_PARENT_IDS)],
+) -> CitiesByDistricts:
+    grouped = await interactor(district_ids=district_ids)
+
+    return CitiesByDistricts(
+        groups=[
+            DistrictCities(
+                district_id=group.parent_id,
+                cities=[
+                    City(
+                        id=city_dm.id,
+                        district_id=city_dm.district_id,
+                        name=city_dm.name,
+                        obj_type=city_dm.obj_type,
+                        population=city_dm.population,
+                    )
+                    for city_dm in group.items
+                ],
+            )
+            for group in grouped.groups
+        ],
+        missing_district_ids=grouped.missing_parent_ids,
+    )
+
+
+@city_router.post('/get_cities_by_ids')
+@inject
+async def get_cities_by_ids(
+    interactor: FromDishka[GetCitiesByIdsInteractor],
+    city_ids: Annotated[list[UUID], Body(max_length=MAX_LOOKUP_IDS)],
+) -> Sequence[CityLookup]:
+    city_dms = await interactor(city_ids=city_ids)
+
     return [
-        City(
-            id=city_dm.id,
-            district_id=city_dm.district_id,
-            name=city_dm.name,
-            obj_type=city_dm.obj_type,
-            population=city_dm.population,
+        CityLookup(
+            id=city_id,
+            city=None
+            if city_dm is None
+            else City(
+                id=city_dm.id,
+                district_id=city_dm.district_id,
+                name=city_dm.name,
+                obj_type=city_dm.obj_type,
+                population=city_dm.population,
+            ),
         )
-        for city_dm in city_dms
+        for city_id, city_dm in zip(city_ids, city_dms, strict=True)
     ]
 
 
+@city_router.get('/search_cities')
+@inject
+async def search_cities(
+    interactor: FromDishka[SearchCitiesInteractor],
+    query: Annotated[str, Query(min_length=1, max_length=MAX_SEARCH_QUERY_LENGTH)],
+    mode: SearchMode = SearchMode.SUBSTRING,
+    limit: Annotated[int, Query(ge=1, le=MAX_SEARCH_LIMIT)] = DEFAULT_SEARCH_LIMIT,
+) -> Sequence[City]:
+    city_dms = await interactor(query=query, mode=mode, limit=limit)
+    if not city_dms:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail='Cities not found'
+        )
+
+    return json_response(CITIES_ENCODER.dump_json(city_dms))
+
+
 @city_router.get('/get_city_by_id')
 @inject
 async def get_city_by_id(
     interactor: FromDishka[GetCityByIdInteractor],
+    config: FromDishka[Config],
     city_id: UUID,
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> City:
     city_dm = await interactor(city_id=city_id)
     if not city_dm:
@@ -80,12 +227,8 @@ async def get_city_by_id(
             status_code=status.HTTP_404_NOT_FOUND, detail='City not found'
         )
 
-    return City(
-        id=city_dm.id,
-        district_id=city_dm.district_id,
-        name=city_dm.name,
-        obj_type=city_dm.obj_type,
-        population=city_dm.population,
+    return entity_response(
+        CITY_ENCODER.dump_json(city_dm), if_none_match, config.http_cache.max_age
     )
 
 
@@ -105,6 +248,26 @@ async def create_city(
     return city_id
 
 
+@city_router.post('/create_cities')
+@inject
+async def create_cities(
+    interactor: FromDishka[CreateCitiesBatchCommand],
+    city_schemas: Annotated[list[NewCityDTO], Body(max_length=MAX_BATCH_SIZE)],
+) -> Sequence[CreatedCity]:
+    try:
+        results = await interactor(city_schemas)
+    except EntityNotExistsError:
+        # A district was deleted after the batch checked it.
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='District not found. Please check if this district exists',
+        )
+
+    return [
+        CreatedCity(city_id=result.city_id, error=result.error) for result in results
+    ]
+
+
 @city_router.delete('/delete_city')
 @inject
 async def delete_city(
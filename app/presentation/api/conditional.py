@@ -0,0 +1,61 @@
+import hashlib
+
+from fastapi import Response
+from starlette import status
+
+from app.presentation.api.encoding import json_response
+
+
+def make_etag(key: str, version: int) -> str:
+    return f'"{key}-{version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+
+    # If-None-Match compares weakly, so a W/ prefix does not matter.
+    return etag in (tag.strip().removeprefix('W/') for tag in if_none_match.split(','))
+
+
+def _cache_headers(etag: str, max_age: int) -> dict[str, str]:
+    return {'ETag': etag, 'Cache-Control': f'max-age={max_age}'}
+
+
+def conditional_response(
+    response: Response,
+    if_none_match: str | None,
+    key: str,
+    version: int,
+    max_age: int,
+) -> Response | None:
+    """Return a 304 when the client's copy of ``key`` is current.
+
+    Otherwise the validators are set on ``response`` and ``None`` is
+    returned, so the route goes on to run the query. The version is read
+    before the query, so a concurrent write can only make the ETag older
+    than the body, which costs the client one more full response.
+    """
+    headers = _cache_headers(make_etag(key, version), max_age)
+    if etag_matches(if_none_match, headers['ETag']):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
+
+
+def entity_response(body: bytes, if_none_match: str | None, max_age: int) -> Response:
+    """Send an encoded entity, validated by a hash of the body.
+
+    Entity reads are mostly served from the cache, so reading a change
+    counter first would cost more than the read itself.
+    """
+    headers = _cache_headers(
+        f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"', max_age
+    )
+    if etag_matches(if_none_match, headers['ETag']):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return json_response(body, headers)
@@ -1,21 +1,41 @@
 from collections.abc import Sequence
+from typing import Annotated
 from uuid import UUID
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Body, Header, HTTPException, Query, Response
 from starlette import status
 
 from app.application.commands.district import CreateDistrictCommand
 from app.application.dto.district import NewDistrictDTO
-from app.application.errors import EntityNotExistsError
+from app.application.errors import EntityNotExistsError, InvalidCursorError
+from app.application.grouping import MAX_PARENT_IDS
 from app.application.interactors.district import (
     DeleteDistrictInteractor,
     GetDistrictByIdInteractor,
+    GetDistrictsByIdsInteractor,
     GetDistrictsByRegionIdInteractor,
+    GetDistrictsByRegionIdsInteractor,
     GetDistrictsInteractor,
 )
-from app.presentation.schemas.district import District
+from app.application.interactors.version import GetVersionInteractor
+from app.application.lookup import MAX_LOOKUP_IDS
+from app.application.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.application.versions import DISTRICTS, region_districts
+from app.config import Config
+from app.presentation.api.conditional import conditional_response, entity_response
+from app.presentation.api.encoding import (
+    DISTRICT_ENCODER,
+    DISTRICTS_ENCODER,
+    json_response,
+)
+from app.presentation.schemas.district import (
+    District,
+    DistrictLookup,
+    DistrictsByRegions,
+    RegionDistricts,
+)
 
 district_router = APIRouter(prefix='/districts', tags=['districts'])
 
@@ -24,42 +44,116 @@ district_router = APIRouter(prefix='/districts', tags=['districts'])
 @inject
 async def get_districts(
     interactor: FromDishka[GetDistrictsInteractor],
+    version_interactor: FromDishka[GetVersionInteractor],
+    config: FromDishka[Config],
+    response: Response,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> Sequence[District]:
-    district_dms = await interactor()
-    if not district_dms:
+    not_modified = conditional_response(
+        response,
+        if_none_match,
+        DISTRICTS,
+        await version_interactor(DISTRICTS),
+        config.http_cache.max_age,
+    )
+    if not_modified:
+        return not_modified
+
+    try:
+        page = await interactor(limit=limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+    if not page.items:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail='Districts not found'
         )
 
-    return [
-        District(
-            id=district_dm.id,
-            region_id=district_dm.region_id,
-            name=district_dm.name,
-        )
-        for district_dm in district_dms
-    ]
+    if page.next_cursor:
+        response.headers['X-Next-Cursor'] = page.next_cursor
+
+    return json_response(DISTRICTS_ENCODER.dump_json(page.items), response.headers)
 
 
 @district_router.get('/get_districts_by_region')
 @inject
 async def get_districts_by_region_id(
     interactor: FromDishka[GetDistrictsByRegionIdInteractor],
+    version_interactor: FromDishka[GetVersionInteractor],
+    config: FromDishka[Config],
+    response: Response,
     region_id: UUID,
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> Sequence[District]:
+    key = region_districts(region_id)
+    not_modified = conditional_response(
+        response,
+        if_none_match,
+        key,
+        await version_interactor(key),
+        config.http_cache.max_age,
+    )
+    if not_modified:
+        return not_modified
+
     district_dms = await interactor(region_id=region_id)
     if not district_dms:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail='District not found'
         )
 
+    return json_response(DISTRICTS_ENCODER.dump_json(district_dms), response.headers)
+
+
+@district_router.post('/get_districts_by_regions')
+@inject
+async def get_districts_by_region_ids(
+    interactor: FromDishka[GetDistrictsByRegionIdsInteractor],
+    region_ids: Annotated[list[UUID], Body(max_length=MAX_PARENT_IDS)],
+) -> DistrictsByRegions:
+    grouped = await interactor(region_ids=region_ids)
+
+    return DistrictsByRegions(
+        groups=[
+            RegionDistricts(
+                region_id=group.parent_id,
+                districts=[
+                    District(
+                        id=district_dm.id,
+                        region_id=district_dm.region_id,
+                        name=district_dm.name,
+                    )
+                    for district_dm in group.items
+                ],
+            )
+            for group in grouped.groups
+        ],
+        missing_region_ids=grouped.missing_parent_ids,
+    )
+
+
+@district_router.post('/get_districts_by_ids')
+@inject
+async def get_districts_by_ids(
+    interactor: FromDishka[GetDistrictsByIdsInteractor],
+    district_ids: Annotated[list[UUID], Body(max_length=MAX_LOOKUP_IDS)],
+) -> Sequence[DistrictLookup]:
+    district_dms = await interactor(district_ids=district_ids)
+
     return [
-        District(
-            id=district_dm.id,
-            region_id=district_dm.region_id,
-            name=district_dm.name,
+        DistrictLookup(
+            id=district_id,
+            district=None
+            if district_dm is None
+            else District(
+                id=district_dm.id,
+                region_id=district_dm.region_id,
+                name=district_dm.name,
+            ),
         )
-        for district_dm in district_dms
+        for district_id, district_dm in zip(district_ids, district_dms, strict=True)
     ]
 
 
@@ -67,7 +161,9 @@ async def get_districts_by_region_id(
 @inject
 async def get_district_by_id(
     interactor: FromDishka[GetDistrictByIdInteractor],
+    config: FromDishka[Config],
     district_id: UUID,
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> District:
     district_dm = await interactor(district_id=district_id)
     if not district_dm:
@@ -75,10 +171,10 @@ async def get_district_by_id(
             status_code=status.HTTP_404_NOT_FOUND, detail='District not found'
         )
 
-    return District(
-        id=district_dm.id,
-        region_id=district_dm.region_id,
-        name=district_dm.name,
+    return entity_response(
+        DISTRICT_ENCODER.dump_json(district_dm),
+        if_none_match,
+        config.http_cache.max_age,
     )
 
 
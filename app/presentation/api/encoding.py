@@ -0,0 +1,29 @@
+from collections.abc import Mapping
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.domain.entities.city import CityDM
+from app.domain.entities.district import DistrictDM
+from app.domain.entities.region import RegionDM
+
+# The domain models have the fields of the City, District and Region
+# schemas, in the same order, so pydantic-core can write them straight to
+# JSON bytes: no schema instance per row and no validation of the result
+# against the declared response model. Built once, as building the
+# serializer is the expensive part.
+CITY_ENCODER = TypeAdapter(CityDM)
+CITIES_ENCODER = TypeAdapter(list[CityDM])
+DISTRICT_ENCODER = TypeAdapter(DistrictDM)
+DISTRICTS_ENCODER = TypeAdapter(list[DistrictDM])
+REGION_ENCODER = TypeAdapter(RegionDM)
+REGIONS_ENCODER = TypeAdapter(list[RegionDM])
+
+
+def json_response(body: bytes, headers: Mapping[str, str] | None = None) -> Response:
+    """Send an encoded body as is.
+
+    A returned Response bypasses FastAPI's response model, and the headers
+    set on the injected response with it, so routes pass those along.
+    """
+    return Response(content=body, media_type='application/json', headers=headers)
@@ -0,0 +1,13 @@
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Response
+
+from app.infrastructure.metrics.registry import CONTENT_TYPE, MetricsRegistry
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get('/metrics', response_class=Response)
+@inject
+async def get_metrics(metrics: FromDishka[MetricsRegistry]) -> Response:
+    return Response(metrics.render(), media_type=CONTENT_TYPE)
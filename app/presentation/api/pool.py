@@ -0,0 +1,37 @@
+import math
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter
+
+from app.infrastructure.db.pool import PoolMetrics
+from app.presentation.schemas.pool import CheckoutWait, HistogramBucket, PoolStats
+
+pool_router = APIRouter(
+    prefix='/pool',
+)
+
+
+@pool_router.get('/get_pool_stats')
+@inject
+async def get_pool_stats(pool_metrics: FromDishka[PoolMetrics]) -> PoolStats:
+    # Per process: with several HTTP workers each one reports its own pool.
+    stats = pool_metrics.stats()
+    wait = pool_metrics.checkout_wait
+    return PoolStats(
+        size=stats.size,
+        checked_out=stats.checked_out,
+        overflow=stats.overflow,
+        waiters=stats.waiters,
+        checkouts=stats.checkouts,
+        connects=stats.connects,
+        invalidations=stats.invalidations,
+        checkout_wait=CheckoutWait(
+            count=wait.count,
+            sum_seconds=wait.sum,
+            buckets=[
+                HistogramBucket(le='+Inf' if math.isinf(le) else str(le), count=count)
+                for le, count in wait.cumulative()
+            ],
+        ),
+    )
@@ -1,20 +1,36 @@
 import uuid
 from collections.abc import Sequence
 from http import HTTPStatus
+from typing import Annotated
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Body, Header, HTTPException, Query, Response
 
 from app.application.commands.region import CreateRegionCommand
-from app.application.dto.region import NewRegionDTO
-from app.application.errors import EntityAlreadyExistsError
+from app.application.dto.region import MAX_TREE_DEPTH, NewRegionDTO
+from app.application.errors import EntityAlreadyExistsError, InvalidCursorError
 from app.application.interactors.region import (
     DeleteRegionInteractor,
     GetRegionByIdInteractor,
+    GetRegionsByIdsInteractor,
     GetRegionsInteractor,
+    GetRegionTreeInteractor,
+)
+from app.application.interactors.version import GetVersionInteractor
+from app.application.lookup import MAX_LOOKUP_IDS
+from app.application.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.application.versions import REGIONS
+from app.config import Config
+from app.presentation.api.conditional import conditional_response, entity_response
+from app.presentation.api.encoding import REGION_ENCODER, REGIONS_ENCODER, json_response
+from app.presentation.schemas.city import City
+from app.presentation.schemas.region import (
+    DistrictTree,
+    Region,
+    RegionLookup,
+    RegionTree,
 )
-from app.presentation.schemas.region import Region
 
 region_router = APIRouter(
     prefix='/region',
@@ -25,36 +41,115 @@ region_router = APIRouter(
 @inject
 async def get_regions(
     interactor: FromDishka[GetRegionsInteractor],
+    version_interactor: FromDishka[GetVersionInteractor],
+    config: FromDishka[Config],
+    response: Response,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> Sequence[Region]:
-    region_dms = await interactor()
-    if not region_dms:
+    not_modified = conditional_response(
+        response,
+        if_none_match,
+        REGIONS,
+        await version_interactor(REGIONS),
+        config.http_cache.max_age,
+    )
+    if not_modified:
+        return not_modified
+
+    try:
+        page = await interactor(limit=limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=e.message)
+
+    if not page.items:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND, detail='Regions not found'
         )
 
+    if page.next_cursor:
+        response.headers['X-Next-Cursor'] = page.next_cursor
+
+    return json_response(REGIONS_ENCODER.dump_json(page.items), response.headers)
+
+
+@region_router.post('/get_regions_by_ids')
+@inject
+async def get_regions_by_ids(
+    interactor: FromDishka[GetRegionsByIdsInteractor],
+    region_ids: Annotated[list[uuid.UUID], Body(max_length=MAX_LOOKUP_IDS)],
+) -> Sequence[RegionLookup]:
+    region_dms = await interactor(region_ids=region_ids)
+
     return [
-        Region(
-            id=region_dm.id,
-            name=region_dm.name,
-            capital=region_dm.capital,
+        RegionLookup(
+            id=region_id,
+            region=None
+            if region_dm is None
+            else Region(
+                id=region_dm.id,
+                name=region_dm.name,
+                capital=region_dm.capital,
+            ),
         )
-        for region_dm in region_dms
+        for region_id, region_dm in zip(region_ids, region_dms, strict=True)
     ]
 
 
 @region_router.get('/get_by_id')
 @inject
 async def get_by_id(
-    interactor: FromDishka[GetRegionByIdInteractor], region_id: uuid.UUID
+    interactor: FromDishka[GetRegionByIdInteractor],
+    config: FromDishka[Config],
+    region_id: uuid.UUID,
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> Region:
     region_dm = await interactor(region_id=region_id)
     if not region_dm:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail='Region not found')
 
-    return Region(
-        id=region_dm.id,
-        name=region_dm.name,
-        capital=region_dm.capital,
+    return entity_response(
+        REGION_ENCODER.dump_json(region_dm), if_none_match, config.http_cache.max_age
+    )
+
+
+@region_router.get('/get_region_tree')
+@inject
+async def get_region_tree(
+    interactor: FromDishka[GetRegionTreeInteractor],
+    region_id: uuid.UUID,
+    depth: Annotated[int, Query(ge=0, le=MAX_TREE_DEPTH)] = MAX_TREE_DEPTH,
+) -> RegionTree:
+    tree = await interactor(region_id=region_id, depth=depth)
+    if not tree:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail='Region not found')
+
+    return RegionTree(
+        id=tree.id,
+        name=tree.name,
+        capital=tree.capital,
+        districts=None
+        if tree.districts is None
+        else [
+            DistrictTree(
+                id=district.id,
+                name=district.name,
+                cities=None
+                if district.cities is None
+                else [
+                    City(
+                        id=city_dm.id,
+                        district_id=city_dm.district_id,
+                        name=city_dm.name,
+                        obj_type=city_dm.obj_type,
+                        population=city_dm.population,
+                    )
+                    for city_dm in district.cities
+                ],
+            )
+            for district in tree.districts
+        ],
     )
 
 
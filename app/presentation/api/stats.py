@@ -0,0 +1,94 @@
+import uuid
+from collections.abc import Sequence
+from http import HTTPStatus
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, HTTPException
+
+from app.application.dto.stats import (
+    DistrictStatsDTO,
+    ObjTypeStatsDTO,
+    RegionStatsDTO,
+)
+from app.application.interactors.stats import (
+    GetDistrictsStatsByRegionIdInteractor,
+    GetRegionsStatsInteractor,
+    GetRegionStatsInteractor,
+)
+from app.presentation.schemas.stats import DistrictStats, ObjTypeStats, RegionStats
+
+stats_router = APIRouter(
+    prefix='/stats',
+)
+
+
+def _obj_type_stats(stats: list[ObjTypeStatsDTO]) -> list[ObjTypeStats]:
+    return [
+        ObjTypeStats(
+            obj_type=item.obj_type,
+            city_count=item.city_count,
+            population=item.population,
+        )
+        for item in stats
+    ]
+
+
+def _region_stats(stats: RegionStatsDTO) -> RegionStats:
+    return RegionStats(
+        region_id=stats.region_id,
+        city_count=stats.city_count,
+        population=stats.population,
+        by_obj_type=_obj_type_stats(stats.by_obj_type),
+    )
+
+
+def _district_stats(stats: DistrictStatsDTO) -> DistrictStats:
+    return DistrictStats(
+        district_id=stats.district_id,
+        region_id=stats.region_id,
+        city_count=stats.city_count,
+        population=stats.population,
+        by_obj_type=_obj_type_stats(stats.by_obj_type),
+    )
+
+
+@stats_router.get('/get_regions_stats')
+@inject
+async def get_regions_stats(
+    interactor: FromDishka[GetRegionsStatsInteractor],
+) -> Sequence[RegionStats]:
+    regions_stats = await interactor()
+    if not regions_stats:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND, detail='Regions not found'
+        )
+
+    return [_region_stats(region_stats) for region_stats in regions_stats]
+
+
+@stats_router.get('/get_region_stats')
+@inject
+async def get_region_stats(
+    interactor: FromDishka[GetRegionStatsInteractor], region_id: uuid.UUID
+) -> RegionStats:
+    region_stats = await interactor(region_id=region_id)
+    if not region_stats:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail='Region not found')
+
+    return _region_stats(region_stats)
+
+
+@stats_router.get('/get_districts_stats')
+@inject
+async def get_districts_stats(
+    interactor: FromDishka[GetDistrictsStatsByRegionIdInteractor],
+    region_id: uuid.UUID,
+) -> Sequence[DistrictStats]:
+    districts_stats = await interactor(region_id=region_id)
+    if not districts_stats:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND, detail='Districts not found'
+        )
+
+    return [_district_stats(district_stats) for district_stats in districts_stats]
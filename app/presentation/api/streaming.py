@@ -0,0 +1,57 @@
+from collections.abc import AsyncIterable, AsyncIterator
+from enum import StrEnum
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+FLUSH_SIZE = 64 * 1024
+
+
+class ExportFormat(StrEnum):
+    NDJSON = 'ndjson'
+    JSON = 'json'
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: 'application/x-ndjson',
+    ExportFormat.JSON: 'application/json',
+}
+
+
+async def iter_ndjson(models: AsyncIterable[BaseModel]) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    async for model in models:
+        buffer += model.model_dump_json().encode()
+        buffer += b'\n'
+        if len(buffer) >= FLUSH_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
+
+
+async def iter_json_array(models: AsyncIterable[BaseModel]) -> AsyncIterator[bytes]:
+    buffer = bytearray(b'[')
+    separator = b''
+    async for model in models:
+        buffer += separator
+        buffer += model.model_dump_json().encode()
+        separator = b','
+        if len(buffer) >= FLUSH_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+
+    buffer += b']'
+    yield bytes(buffer)
+
+
+def stream_models(
+    models: AsyncIterable[BaseModel], export_format: ExportFormat
+) -> StreamingResponse:
+    if export_format is ExportFormat.NDJSON:
+        body = iter_ndjson(models)
+    else:
+        body = iter_json_array(models)
+
+    return StreamingResponse(body, media_type=MEDIA_TYPES[export_format])
@@ -1,4 +1,5 @@
 import uuid
+from collections.abc import AsyncIterator
 
 import grpc
 from dishka import FromDishka
@@ -6,15 +7,33 @@ from dishka.integrations.grpcio import inject
 from google.protobuf.empty_pb2 import Empty
 from grpc.aio import ServicerContext
 
-from app.application.commands.city import CreateCityCommand
+from app.application.commands.city import (
+    MAX_BATCH_SIZE,
+    CreateCitiesBatchCommand,
+    CreateCityCommand,
+)
 from app.application.dto.city import NewCityDTO
-from app.application.errors import EntityNotExistsError
+from app.application.errors import EntityNotExistsError, InvalidCursorError
+from app.application.grouping import MAX_PARENT_IDS
 from app.application.interactors.city import (
     DeleteCityInteractor,
     GetCitiesByDistrictIdInteractor,
+    GetCitiesByDistrictIdsInteractor,
+    GetCitiesByIdsInteractor,
     GetCitiesInteractor,
     GetCityByIdInteractor,
+    SearchCitiesInteractor,
+    StreamCitiesByDistrictIdInteractor,
+    StreamCitiesInteractor,
+)
+from app.application.lookup import MAX_LOOKUP_IDS
+from app.application.pagination import clamp_page_size
+from app.application.search import (
+    MAX_SEARCH_QUERY_LENGTH,
+    SearchMode,
+    clamp_search_limit,
 )
+from app.config import Config
 from app.infrastructure.grpc.city import city_pb2
 from app.infrastructure.grpc.city.city_pb2_grpc import CityServiceServicer
 
@@ -23,11 +42,17 @@ class CityGRPCService(CityServiceServicer):
     @inject
     async def GetCities(
         self,
-        request: Empty,
+        request: city_pb2.PageRequest,
         context: ServicerContext,
         interactor: FromDishka[GetCitiesInteractor],
     ) -> city_pb2.CityList:
-        city_dms = await interactor()
+        try:
+            page = await interactor(
+                limit=clamp_page_size(request.limit), cursor=request.cursor or None
+            )
+        except InvalidCursorError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, e.message)
+
         cities = [
             city_pb2.City(
                 id=str(city_dm.id),
@@ -36,9 +61,9 @@ class CityGRPCService(CityServiceServicer):
                 obj_type=city_dm.obj_type,
                 population=city_dm.population,
             )
-            for city_dm in city_dms
+            for city_dm in page.items
         ]
-        return city_pb2.CityList(cities=cities)
+        return city_pb2.CityList(cities=cities, next_cursor=page.next_cursor or '')
 
     @inject
     async def GetCitiesByDistrictId(
@@ -60,6 +85,116 @@ class CityGRPCService(CityServiceServicer):
         ]
         return city_pb2.CityList(cities=cities)
 
+    @inject
+    async def GetCitiesByDistrictIds(
+        self,
+        request: city_pb2.DistrictIdsRequest,
+        context: ServicerContext,
+        interactor: FromDishka[GetCitiesByDistrictIdsInteractor],
+    ) -> city_pb2.CitiesByDistricts:
+        if len(request.district_ids) > MAX_PARENT_IDS:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f'At most {MAX_PARENT_IDS} districts can be requested at once',
+            )
+
+        grouped = await interactor(
+            district_ids=[
+                uuid.UUID(district_id) for district_id in request.district_ids
+            ]
+        )
+        return city_pb2.CitiesByDistricts(
+            groups=[
+                city_pb2.DistrictCities(
+                    district_id=str(group.parent_id),
+                    cities=[
+                        city_pb2.City(
+                            id=str(city_dm.id),
+                            district_id=str(city_dm.district_id),
+                            name=city_dm.name,
+                            obj_type=city_dm.obj_type,
+                            population=city_dm.population,
+                        )
+                        for city_dm in group.items
+                    ],
+                )
+                for group in grouped.groups
+            ],
+            missing_district_ids=[
+                str(district_id) for district_id in grouped.missing_parent_ids
+            ],
+        )
+
+    @inject
+    async def GetCitiesByIds(
+        self,
+        request: city_pb2.CityIdsRequest,
+        context: ServicerContext,
+        interactor: FromDishka[GetCitiesByIdsInteractor],
+    ) -> city_pb2.CityLookupList:
+        if len(request.city_ids) > MAX_LOOKUP_IDS:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f'At most {MAX_LOOKUP_IDS} cities can be requested at once',
+            )
+
+        city_dms = await interactor(
+            city_ids=[uuid.UUID(city_id) for city_id in request.city_ids]
+        )
+        return city_pb2.CityLookupList(
+            results=[
+                city_pb2.CityLookup(
+                    id=city_id,
+                    city=None
+                    if city_dm is None
+                    else city_pb2.City(
+                        id=str(city_dm.id),
+                        district_id=str(city_dm.district_id),
+                        name=city_dm.name,
+                        obj_type=city_dm.obj_type,
+                        population=city_dm.population,
+                    ),
+                )
+                for city_id, city_dm in zip(request.city_ids, city_dms, strict=True)
+            ]
+        )
+
+    @inject
+    async def SearchCities(
+        self,
+        request: city_pb2.SearchCitiesRequest,
+        context: ServicerContext,
+        interactor: FromDishka[SearchCitiesInteractor],
+    ) -> city_pb2.CityList:
+        if len(request.query) > MAX_SEARCH_QUERY_LENGTH:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f'query must be at most {MAX_SEARCH_QUERY_LENGTH} characters',
+            )
+        # Enums are open in proto3, so a client can send any number.
+        if request.mode not in city_pb2.SearchMode.values():
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f'unknown search mode {request.mode}',
+            )
+
+        city_dms = await interactor(
+            query=request.query,
+            mode=SearchMode[city_pb2.SearchMode.Name(request.mode)],
+            limit=clamp_search_limit(request.limit),
+        )
+        cities = [
+            city_pb2.City(
+                id=str(city_dm.id),
+                district_id=str(city_dm.district_id),
+                name=city_dm.name,
+                obj_type=city_dm.obj_type,
+                population=city_dm.population,
+            )
+            for city_dm in city_dms
+        ]
+        return city_pb2.CityList(cities=cities)
+
     @inject
     async def GetCityById(
         self,
@@ -79,6 +214,44 @@ class CityGRPCService(CityServiceServicer):
             population=city_dm.population,
         )
 
+    @inject
+    async def StreamCities(
+        self,
+        request: Empty,
+        context: ServicerContext,
+        interactor: FromDishka[StreamCitiesInteractor],
+        config: FromDishka[Config],
+    ) -> AsyncIterator[city_pb2.City]:
+        async for city_dm in interactor(chunk_size=config.postgres.stream_chunk_size):
+            yield city_pb2.City(
+                id=str(city_dm.id),
+                district_id=str(city_dm.district_id),
+                name=city_dm.name,
+                obj_type=city_dm.obj_type,
+                population=city_dm.population,
+            )
+
+    @inject
+    async def StreamCitiesByDistrictId(
+        self,
+        request: city_pb2.DistrictIdRequest,
+        context: ServicerContext,
+        interactor: FromDishka[StreamCitiesByDistrictIdInteractor],
+        config: FromDishka[Config],
+    ) -> AsyncIterator[city_pb2.City]:
+        city_dms = interactor(
+            district_id=uuid.UUID(request.district_id),
+            chunk_size=config.postgres.stream_chunk_size,
+        )
+        async for city_dm in city_dms:
+            yield city_pb2.City(
+                id=str(city_dm.id),
+                district_id=str(city_dm.district_id),
+                name=city_dm.name,
+                obj_type=city_dm.obj_type,
+                population=city_dm.population,
+            )
+
     @inject
     async def CreateCity(
         self,
@@ -105,6 +278,48 @@ class CityGRPCService(CityServiceServicer):
                 'District not found. Please check if this district exists',
             )
 
+    @inject
+    async def CreateCities(
+        self,
+        request: city_pb2.NewCityList,
+        context: ServicerContext,
+        interactor: FromDishka[CreateCitiesBatchCommand],
+    ) -> city_pb2.CreatedCityList:
+        if len(request.cities) > MAX_BATCH_SIZE:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f'At most {MAX_BATCH_SIZE} cities can be created at once',
+            )
+
+        try:
+            results = await interactor(
+                [
+                    NewCityDTO(
+                        district_id=uuid.UUID(city.district_id),
+                        name=city.name,
+                        obj_type=city.obj_type,
+                        population=city.population,
+                    )
+                    for city in request.cities
+                ]
+            )
+        except EntityNotExistsError:
+            # A district was deleted after the batch checked it.
+            await context.abort(
+                grpc.StatusCode.NOT_FOUND,
+                'District not found. Please check if this district exists',
+            )
+
+        return city_pb2.CreatedCityList(
+            results=[
+                city_pb2.CreatedCity(
+                    city_id=str(result.city_id) if result.city_id else '',
+                    error=result.error or '',
+                )
+                for result in results
+            ]
+        )
+
     @inject
     async def DeleteCity(
         self,
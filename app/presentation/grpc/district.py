@@ -1,4 +1,5 @@
 import uuid
+from collections.abc import AsyncIterator
 
 import grpc
 from dishka import FromDishka
@@ -8,13 +9,21 @@ from grpc.aio import ServicerContext
 
 from app.application.commands.district import CreateDistrictCommand
 from app.application.dto.district import NewDistrictDTO
-from app.application.errors import EntityNotExistsError
+from app.application.errors import EntityNotExistsError, InvalidCursorError
+from app.application.grouping import MAX_PARENT_IDS
 from app.application.interactors.district import (
     DeleteDistrictInteractor,
     GetDistrictByIdInteractor,
+    GetDistrictsByIdsInteractor,
     GetDistrictsByRegionIdInteractor,
+    GetDistrictsByRegionIdsInteractor,
     GetDistrictsInteractor,
+    StreamDistrictsByRegionIdInteractor,
+    StreamDistrictsInteractor,
 )
+from app.application.lookup import MAX_LOOKUP_IDS
+from app.application.pagination import clamp_page_size
+from app.config import Config
 from app.infrastructure.grpc.district import district_pb2
 from app.infrastructure.grpc.district.district_pb2_grpc import DistrictServiceServicer
 
@@ -23,20 +32,28 @@ class DistrictGRPCService(DistrictServiceServicer):
     @inject
     async def GetDistricts(
         self,
-        request: Empty,
+        request: district_pb2.PageRequest,
         context: ServicerContext,
         interactor: FromDishka[GetDistrictsInteractor],
     ) -> district_pb2.DistrictList:
-        district_dms = await interactor()
+        try:
+            page = await interactor(
+                limit=clamp_page_size(request.limit), cursor=request.cursor or None
+            )
+        except InvalidCursorError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, e.message)
+
         districts = [
             district_pb2.District(
                 id=str(district_dm.id),
                 region_id=str(district_dm.region_id),
                 name=district_dm.name,
             )
-            for district_dm in district_dms
+            for district_dm in page.items
         ]
-        return district_pb2.DistrictList(districts=districts)
+        return district_pb2.DistrictList(
+            districts=districts, next_cursor=page.next_cursor or ''
+        )
 
     @inject
     async def GetDistrictsByRegionId(
@@ -56,6 +73,78 @@ class DistrictGRPCService(DistrictServiceServicer):
         ]
         return district_pb2.DistrictList(districts=districts)
 
+    @inject
+    async def GetDistrictsByRegionIds(
+        self,
+        request: district_pb2.RegionIdsRequest,
+        context: ServicerContext,
+        interactor: FromDishka[GetDistrictsByRegionIdsInteractor],
+    ) -> district_pb2.DistrictsByRegions:
+        if len(request.region_ids) > MAX_PARENT_IDS:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f'At most {MAX_PARENT_IDS} regions can be requested at once',
+            )
+
+        grouped = await interactor(
+            region_ids=[uuid.UUID(region_id) for region_id in request.region_ids]
+        )
+        return district_pb2.DistrictsByRegions(
+            groups=[
+                district_pb2.RegionDistricts(
+                    region_id=str(group.parent_id),
+                    districts=[
+                        district_pb2.District(
+                            id=str(district_dm.id),
+                            region_id=str(district_dm.region_id),
+                            name=district_dm.name,
+                        )
+                        for district_dm in group.items
+                    ],
+                )
+                for group in grouped.groups
+            ],
+            missing_region_ids=[
+                str(region_id) for region_id in grouped.missing_parent_ids
+            ],
+        )
+
+    @inject
+    async def GetDistrictsByIds(
+        self,
+        request: district_pb2.DistrictIdsRequest,
+        context: ServicerContext,
+        interactor: FromDishka[GetDistrictsByIdsInteractor],
+    ) -> district_pb2.DistrictLookupList:
+        if len(request.district_ids) > MAX_LOOKUP_IDS:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f'At most {MAX_LOOKUP_IDS} districts can be requested at once',
+            )
+
+        district_dms = await interactor(
+            district_ids=[
+                uuid.UUID(district_id) for district_id in request.district_ids
+            ]
+        )
+        return district_pb2.DistrictLookupList(
+            results=[
+                district_pb2.DistrictLookup(
+                    id=district_id,
+                    district=None
+                    if district_dm is None
+                    else district_pb2.District(
+                        id=str(district_dm.id),
+                        region_id=str(district_dm.region_id),
+                        name=district_dm.name,
+                    ),
+                )
+                for district_id, district_dm in zip(
+                    request.district_ids, district_dms, strict=True
+                )
+            ]
+        )
+
     @inject
     async def GetDistrictById(
         self,
@@ -73,6 +162,41 @@ class DistrictGRPCService(DistrictServiceServicer):
             name=district_dm.name,
         )
 
+    @inject
+    async def StreamDistricts(
+        self,
+        request: Empty,
+        context: ServicerContext,
+        interactor: FromDishka[StreamDistrictsInteractor],
+        config: FromDishka[Config],
+    ) -> AsyncIterator[district_pb2.District]:
+        district_dms = interactor(chunk_size=config.postgres.stream_chunk_size)
+        async for district_dm in district_dms:
+            yield district_pb2.District(
+                id=str(district_dm.id),
+                region_id=str(district_dm.region_id),
+                name=district_dm.name,
+            )
+
+    @inject
+    async def StreamDistrictsByRegionId(
+        self,
+        request: district_pb2.RegionIdRequest,
+        context: ServicerContext,
+        interactor: FromDishka[StreamDistrictsByRegionIdInteractor],
+        config: FromDishka[Config],
+    ) -> AsyncIterator[district_pb2.District]:
+        district_dms = interactor(
+            region_id=uuid.UUID(request.region_id),
+            chunk_size=config.postgres.stream_chunk_size,
+        )
+        async for district_dm in district_dms:
+            yield district_pb2.District(
+                id=str(district_dm.id),
+                region_id=str(district_dm.region_id),
+                name=district_dm.name,
+            )
+
     @inject
     async def CreateDistrict(
         self,
@@ -7,13 +7,17 @@ from google.protobuf.empty_pb2 import Empty
 from grpc.aio import ServicerContext
 
 from app.application.commands.region import CreateRegionCommand
-from app.application.dto.region import NewRegionDTO
-from app.application.errors import EntityAlreadyExistsError
+from app.application.dto.region import MAX_TREE_DEPTH, NewRegionDTO
+from app.application.errors import EntityAlreadyExistsError, InvalidCursorError
 from app.application.interactors.region import (
     DeleteRegionInteractor,
     GetRegionByIdInteractor,
+    GetRegionsByIdsInteractor,
     GetRegionsInteractor,
+    GetRegionTreeInteractor,
 )
+from app.application.lookup import MAX_LOOKUP_IDS
+from app.application.pagination import clamp_page_size
 from app.infrastructure.grpc.region import region_pb2
 from app.infrastructure.grpc.region.region_pb2_grpc import (
     RegionServiceServicer,
@@ -24,20 +28,62 @@ class RegionGRPCService(RegionServiceServicer):
     @inject
     async def GetRegions(
         self,
-        request: Empty,
+        request: region_pb2.PageRequest,
         context: ServicerContext,
         interactor: FromDishka[GetRegionsInteractor],
     ) -> region_pb2.RegionList:
-        region_dms = await interactor()
+        try:
+            page = await interactor(
+                limit=clamp_page_size(request.limit), cursor=request.cursor or None
+            )
+        except InvalidCursorError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, e.message)
+
         regions = [
             region_pb2.Region(
                 id=str(region_dm.id),
                 name=region_dm.name,
                 capital=region_dm.capital,
             )
-            for region_dm in region_dms
+            for region_dm in page.items
         ]
-        return region_pb2.RegionList(regions=regions)
+        return region_pb2.RegionList(
+            regions=regions, next_cursor=page.next_cursor or ''
+        )
+
+    @inject
+    async def GetRegionsByIds(
+        self,
+        request: region_pb2.RegionIdsRequest,
+        context: ServicerContext,
+        interactor: FromDishka[GetRegionsByIdsInteractor],
+    ) -> region_pb2.RegionLookupList:
+        if len(request.region_ids) > MAX_LOOKUP_IDS:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f'At most {MAX_LOOKUP_IDS} regions can be requested at once',
+            )
+
+        region_dms = await interactor(
+            region_ids=[uuid.UUID(region_id) for region_id in request.region_ids]
+        )
+        return region_pb2.RegionLookupList(
+            results=[
+                region_pb2.RegionLookup(
+                    id=region_id,
+                    region=None
+                    if region_dm is None
+                    else region_pb2.Region(
+                        id=str(region_dm.id),
+                        name=region_dm.name,
+                        capital=region_dm.capital,
+                    ),
+                )
+                for region_id, region_dm in zip(
+                    request.region_ids, region_dms, strict=True
+                )
+            ]
+        )
 
     @inject
     async def GetRegionById(
@@ -56,6 +102,46 @@ class RegionGRPCService(RegionServiceServicer):
             capital=region_dm.capital,
         )
 
+    @inject
+    async def GetRegionTree(
+        self,
+        request: region_pb2.RegionTreeRequest,
+        context: ServicerContext,
+        interactor: FromDishka[GetRegionTreeInteractor],
+    ) -> region_pb2.RegionTree:
+        depth = request.depth if request.HasField('depth') else MAX_TREE_DEPTH
+        if not 0 <= depth <= MAX_TREE_DEPTH:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f'depth must be between 0 and {MAX_TREE_DEPTH}',
+            )
+
+        tree = await interactor(region_id=uuid.UUID(request.region_id), depth=depth)
+        if not tree:
+            await context.abort(grpc.StatusCode.NOT_FOUND, 'Region not found')
+
+        return region_pb2.RegionTree(
+            id=str(tree.id),
+            name=tree.name,
+            capital=tree.capital,
+            districts=[
+                region_pb2.TreeDistrict(
+                    id=str(district.id),
+                    name=district.name,
+                    cities=[
+                        region_pb2.TreeCity(
+                            id=str(city_dm.id),
+                            name=city_dm.name,
+                            obj_type=city_dm.obj_type,
+                            population=city_dm.population,
+                        )
+                        for city_dm in district.cities or ()
+                    ],
+                )
+                for district in tree.districts or ()
+            ],
+        )
+
     @inject
     async def CreateRegion(
         self,
@@ -0,0 +1,93 @@
+import uuid
+
+import grpc
+from dishka import FromDishka
+from dishka.integrations.grpcio import inject
+from google.protobuf.empty_pb2 import Empty
+from grpc.aio import ServicerContext
+
+from app.application.dto.stats import (
+    DistrictStatsDTO,
+    ObjTypeStatsDTO,
+    RegionStatsDTO,
+)
+from app.application.interactors.stats import (
+    GetDistrictsStatsByRegionIdInteractor,
+    GetRegionsStatsInteractor,
+    GetRegionStatsInteractor,
+)
+from app.infrastructure.grpc.stats import stats_pb2
+from app.infrastructure.grpc.stats.stats_pb2_grpc import StatsServiceServicer
+
+
+def _obj_type_stats(stats: list[ObjTypeStatsDTO]) -> list[stats_pb2.ObjTypeStats]:
+    return [
+        stats_pb2.ObjTypeStats(
+            obj_type=item.obj_type,
+            city_count=item.city_count,
+            population=item.population,
+        )
+        for item in stats
+    ]
+
+
+def _region_stats(stats: RegionStatsDTO) -> stats_pb2.RegionStats:
+    return stats_pb2.RegionStats(
+        region_id=str(stats.region_id),
+        city_count=stats.city_count,
+        population=stats.population,
+        by_obj_type=_obj_type_stats(stats.by_obj_type),
+    )
+
+
+def _district_stats(stats: DistrictStatsDTO) -> stats_pb2.DistrictStats:
+    return stats_pb2.DistrictStats(
+        district_id=str(stats.district_id),
+        region_id=str(stats.region_id),
+        city_count=stats.city_count,
+        population=stats.population,
+        by_obj_type=_obj_type_stats(stats.by_obj_type),
+    )
+
+
+class StatsGRPCService(StatsServiceServicer):
+    @inject
+    async def GetRegionsStats(
+        self,
+        request: Empty,
+        context: ServicerContext,
+        interactor: FromDishka[GetRegionsStatsInteractor],
+    ) -> stats_pb2.RegionStatsList:
+        regions_stats = await interactor()
+
+        return stats_pb2.RegionStatsList(
+            regions=[_region_stats(region_stats) for region_stats in regions_stats]
+        )
+
+    @inject
+    async def GetRegionStats(
+        self,
+        request: stats_pb2.RegionIdRequest,
+        context: ServicerContext,
+        interactor: FromDishka[GetRegionStatsInteractor],
+    ) -> stats_pb2.RegionStats:
+        region_stats = await interactor(region_id=uuid.UUID(request.region_id))
+        if not region_stats:
+            await context.abort(grpc.StatusCode.NOT_FOUND, 'Region not found')
+
+        return _region_stats(region_stats)
+
+    @inject
+    async def GetDistrictsStats(
+        self,
+        request: stats_pb2.RegionIdRequest,
+        context: ServicerContext,
+        interactor: FromDishka[GetDistrictsStatsByRegionIdInteractor],
+    ) -> stats_pb2.DistrictStatsList:
+        districts_stats = await interactor(region_id=uuid.UUID(request.region_id))
+
+        return stats_pb2.DistrictStatsList(
+            districts=[
+                _district_stats(district_stats) for district_stats in districts_stats
+            ]
+        )
@@ -9,3 +9,23 @@ class City(BaseModel):
     name: str
     obj_type: str
     population: int
+
+
+class CityLookup(BaseModel):
+    id: UUID
+    city: City | None
+
+
+class DistrictCities(BaseModel):
+    district_id: UUID
+    cities: list[City]
+
+
+class CitiesByDistricts(BaseModel):
+    groups: list[DistrictCities]
+    missing_district_ids: list[UUID]
+
+
+class CreatedCity(BaseModel):
+    city_id: UUID | None
+    error: str | None
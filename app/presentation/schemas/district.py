@@ -7,3 +7,18 @@ class District(BaseModel):
     id: UUID
     region_id: UUID
     name: str
+
+
+class DistrictLookup(BaseModel):
+    id: UUID
+    district: District | None
+
+
+class RegionDistricts(BaseModel):
+    region_id: UUID
+    districts: list[District]
+
+
+class DistrictsByRegions(BaseModel):
+    groups: list[RegionDistricts]
+    missing_region_ids: list[UUID]
@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+
+
+class HistogramBucket(BaseModel):
+    le: str
+    count: int
+
+
+class CheckoutWait(BaseModel):
+    count: int
+    sum_seconds: float
+    buckets: list[HistogramBucket]
+
+
+class PoolStats(BaseModel):
+    size: int
+    checked_out: int
+    overflow: int
+    waiters: int
+    checkouts: int
+    connects: int
+    invalidations: int
+    checkout_wait: CheckoutWait
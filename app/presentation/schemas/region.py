@@ -2,6 +2,8 @@ import uuid
 
 from pydantic import BaseModel
 
+from app.presentation.schemas.city import City
+
 
 class Region(BaseModel):
     id: uuid.UUID
@@ -9,6 +11,24 @@ class Region(BaseModel):
     capital: str
 
 
+class RegionLookup(BaseModel):
+    id: uuid.UUID
+    region: Region | None
+
+
+class DistrictTree(BaseModel):
+    id: uuid.UUID
+    name: str
+    cities: list[City] | None = None
+
+
+class RegionTree(BaseModel):
+    id: uuid.UUID
+    name: str
+    capital: str
+    districts: list[DistrictTree] | None = None
+
+
 class CreateRegion(BaseModel):
     name: str
     capital: str
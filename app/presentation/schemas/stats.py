@@ -0,0 +1,24 @@
+import uuid
+
+from pydantic import BaseModel
+
+
+class ObjTypeStats(BaseModel):
+    obj_type: str | None
+    city_count: int
+    population: int
+
+
+class RegionStats(BaseModel):
+    region_id: uuid.UUID
+    city_count: int
+    population: int
+    by_obj_type: list[ObjTypeStats]
+
+
+class DistrictStats(BaseModel):
+    district_id: uuid.UUID
+    region_id: uuid.UUID
+    city_count: int
+    population: int
+    by_obj_type: list[ObjTypeStats]
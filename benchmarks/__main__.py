@@ -0,0 +1,163 @@
+"""Benchmark the gateways, interactors, HTTP routes and gRPC services.
+
+The schema of the benchmark database is dropped and recreated on every run
+and seeded with deterministic rows, so never point it at real data. The
+database is created when it does not exist yet.
+
+Usage: python -m benchmarks [--layers gateway http] [--filter City]
+                            [--regions 20] [--districts-per-region 10]
+                            [--cities-per-district 50] [--iterations 200]
+                            [--output results.json]
+"""
+
+import argparse
+import asyncio
+from collections.abc import Sequence
+from contextlib import AsyncExitStack
+from datetime import UTC, datetime
+from os import environ as env
+from pathlib import Path
+
+from dishka import make_async_container
+from dishka.integrations.fastapi import FastapiProvider
+from dishka.integrations.grpcio import GrpcioProvider
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import Config, PostgresConfig
+from app.infrastructure.db.main import new_session_maker
+from app.ioc import AppProvider
+from benchmarks.dataset import Volumes, seed
+from benchmarks.gateways import gateway_benchmarks
+from benchmarks.grpc_api import grpc_benchmarks, grpc_stubs
+from benchmarks.harness import (
+    Benchmark,
+    BenchmarkResult,
+    format_header,
+    format_result,
+    run_benchmark,
+    save_results,
+)
+from benchmarks.http_api import http_benchmarks, http_client
+from benchmarks.interactors import interactor_benchmarks
+from benchmarks.serialization import serialization_benchmarks
+from benchmarks.statements import statement_benchmarks
+
+LAYERS = ('gateway', 'interactor', 'http', 'grpc', 'serialization', 'statements')
+RESULTS_DIR = Path(__file__).parent / 'results'
+
+
+def database_uri(config: PostgresConfig, database: str) -> str:
+    return f'postgresql+psycopg://{config.user}:{config.password}@{config.host}:{config.port}/{database}'
+
+
+async def ensure_database(config: PostgresConfig) -> None:
+    engine = create_async_engine(
+        database_uri(config, 'postgres'), isolation_level='AUTOCOMMIT'
+    )
+    async with engine.connect() as conn:
+        exists = await conn.scalar(
+            text('SELECT 1 FROM pg_database WHERE datname = :name'),
+            {'name': config.database},
+        )
+        if not exists:
+            await conn.execute(
+                text(
+                    f'CREATE DATABASE "{config.database}" '
+                    "ENCODING 'UTF8' TEMPLATE template0"
+                )
+            )
+    await engine.dispose()
+
+
+async def run(args: argparse.Namespace) -> Sequence[BenchmarkResult]:
+    config = Config(postgres=PostgresConfig(**{**env, 'POSTGRES_DB': args.database}))
+    chunk_size = config.postgres.stream_chunk_size
+    await ensure_database(config.postgres)
+
+    session_maker = new_session_maker(config.postgres)
+    engine = session_maker.kw['bind']
+    volumes = Volumes(
+        regions=args.regions,
+        districts_per_region=args.districts_per_region,
+        cities_per_district=args.cities_per_district,
+    )
+    # Every layer runs each delete benchmark once per iteration.
+    disposable = len(args.layers) * (args.iterations + args.warmup)
+    print(
+        f'seeding {volumes.regions} regions, {volumes.districts} districts, '
+        f'{volumes.cities} cities into {args.database}'
+    )
+    dataset = await seed(engine, volumes, disposable)
+
+    async with AsyncExitStack() as stack:
+        benchmarks: list[Benchmark] = []
+        if 'gateway' in args.layers:
+            benchmarks += gateway_benchmarks(session_maker, dataset, chunk_size)
+        if 'interactor' in args.layers:
+            container = make_async_container(AppProvider(), context={Config: config})
+            stack.push_async_callback(container.close)
+            benchmarks += interactor_benchmarks(container, dataset, chunk_size)
+        if 'http' in args.layers:
+            container = make_async_container(
+                AppProvider(), FastapiProvider(), context={Config: config}
+            )
+            stack.push_async_callback(container.close)
+            client = await stack.enter_async_context(http_client(container))
+            benchmarks += http_benchmarks(client, dataset)
+        if 'grpc' in args.layers:
+            container = make_async_container(
+                AppProvider(), GrpcioProvider(), context={Config: config}
+            )
+            stack.push_async_callback(container.close)
+            stubs = await stack.enter_async_context(grpc_stubs(container))
+            benchmarks += grpc_benchmarks(stubs, dataset)
+        if 'serialization' in args.layers:
+            benchmarks += serialization_benchmarks()
+        if 'statements' in args.layers:
+            unprepared = new_session_maker(
+                config.postgres.model_copy(update={'prepare_threshold': -1})
+            )
+            stack.push_async_callback(unprepared.kw['bind'].dispose)
+            benchmarks += statement_benchmarks(session_maker, unprepared, dataset)
+
+        print(format_header())
+        results = []
+        for benchmark in benchmarks:
+            if args.filter and args.filter not in f'{benchmark.group}.{benchmark.name}':
+                continue
+            result = await run_benchmark(benchmark, args.iterations, args.warmup)
+            print(format_result(result))
+            results.append(result)
+
+    await engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--layers', nargs='+', choices=LAYERS, default=list(LAYERS))
+    parser.add_argument('--filter', help='only run benchmarks containing this text')
+    parser.add_argument('--regions', type=int, default=20)
+    parser.add_argument('--districts-per-region', type=int, default=10)
+    parser.add_argument('--cities-per-district', type=int, default=50)
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument(
+        '--database', default=env.get('BENCHMARK_DB', 'city_app_benchmark')
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=RESULTS_DIR / f'{datetime.now(UTC):%Y%m%dT%H%M%SZ}.json',
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    parameters = {name: value for name, value in vars(args).items() if name != 'output'}
+    save_results(args.output, results, parameters)
+    print(f'results saved to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
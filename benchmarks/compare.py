@@ -0,0 +1,54 @@
+"""Compare two saved benchmark runs.
+
+Usage: python -m benchmarks.compare BASELINE.json CANDIDATE.json [--threshold 5]
+"""
+
+import argparse
+from pathlib import Path
+
+from benchmarks.harness import load_results
+
+
+def change(baseline: float, candidate: float) -> float:
+    return (candidate - baseline) / baseline * 100 if baseline else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('baseline', type=Path)
+    parser.add_argument('candidate', type=Path)
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=5.0,
+        help='mark p50 changes larger than this many percent',
+    )
+    args = parser.parse_args()
+
+    baseline = load_results(args.baseline)
+    candidate = load_results(args.candidate)
+
+    print(f'{"benchmark":<56} {"p50 ms":>18} {"p95":>8} {"p99":>8} {"ops/sec":>8}')
+    for key in sorted(baseline.keys() & candidate.keys()):
+        old, new = baseline[key], candidate[key]
+        p50 = change(old.p50_ms, new.p50_ms)
+        marker = ''
+        if p50 > args.threshold:
+            marker = ' slower'
+        elif p50 < -args.threshold:
+            marker = ' faster'
+        print(
+            f'{key:<56} {old.p50_ms:8.3f}->{new.p50_ms:8.3f} '
+            f'{change(old.p95_ms, new.p95_ms):+7.1f}% '
+            f'{change(old.p99_ms, new.p99_ms):+7.1f}% '
+            f'{change(old.ops_per_sec, new.ops_per_sec):+7.1f}%{marker}'
+        )
+
+    for key in sorted(baseline.keys() - candidate.keys()):
+        print(f'{key:<56} only in baseline')
+    for key in sorted(candidate.keys() - baseline.keys()):
+        print(f'{key:<56} only in candidate')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+import hashlib
+import itertools
+import random
+import uuid
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.db.models import BaseModel
+from app.infrastructure.db.models.stats import STATS_VIEWS
+
+# Ids are derived from md5 of a label and a counter, so two runs with the same
+# volumes benchmark exactly the same rows.
+SEED_REGIONS = text(
+    'INSERT INTO region (id, name, capital, is_deleted) '
+    "SELECT md5('region-' || i)::uuid, 'region ' || i, 'capital ' || i, false "
+    'FROM generate_series(1, :regions) AS i'
+)
+SEED_DISTRICTS = text(
+    'INSERT INTO district (id, region_id, name, is_deleted) '
+    "SELECT md5('district-' || r || '-' || i)::uuid, "
+    "md5('region-' || r)::uuid, 'district ' || r || '-' || i, false "
+    'FROM generate_series(1, :regions) AS r, generate_series(1, :districts) AS i'
+)
+SEED_CITIES = text(
+    'INSERT INTO city (id, district_id, name, obj_type, population, is_deleted) '
+    "SELECT md5('city-' || r || '-' || d || '-' || i)::uuid, "
+    "md5('district-' || r || '-' || d)::uuid, "
+    "'city ' || r || '-' || d || '-' || i, 'city', i * 100, false "
+    'FROM generate_series(1, :regions) AS r, generate_series(1, :districts) AS d, '
+    'generate_series(1, :cities) AS i'
+)
+# Rows without children that the delete benchmarks consume one by one, so
+# soft deletes never touch the rows the read benchmarks look up.
+SEED_DISPOSABLE = (
+    text(
+        'INSERT INTO region (id, name, capital, is_deleted) '
+        "SELECT md5('disposable-region-' || i)::uuid, 'disposable ' || i, "
+        "'capital', false FROM generate_series(1, :count) AS i"
+    ),
+    text(
+        'INSERT INTO district (id, region_id, name, is_deleted) '
+        "SELECT md5('disposable-district-' || i)::uuid, md5('region-1')::uuid, "
+        "'disposable ' || i, false FROM generate_series(1, :count) AS i"
+    ),
+    text(
+        'INSERT INTO city (id, district_id, name, obj_type, population, is_deleted) '
+        "SELECT md5('disposable-city-' || i)::uuid, md5('district-1-1')::uuid, "
+        "'disposable ' || i, 'city', 0, false FROM generate_series(1, :count) AS i"
+    ),
+)
+
+# Indexes that only migrations create, see the City model.
+MIGRATION_INDEXES = (
+    text('CREATE EXTENSION IF NOT EXISTS pg_trgm'),
+    text(
+        'CREATE INDEX ix_city_name_trgm ON city USING gin (name gin_trgm_ops) '
+        'WHERE is_deleted = false'
+    ),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Volumes:
+    regions: int
+    districts_per_region: int
+    cities_per_district: int
+
+    @property
+    def districts(self) -> int:
+        return self.regions * self.districts_per_region
+
+    @property
+    def cities(self) -> int:
+        return self.districts * self.cities_per_district
+
+
+@dataclass(slots=True)
+class Dataset:
+    volumes: Volumes
+    region_ids: Sequence[uuid.UUID]
+    district_ids: Sequence[uuid.UUID]
+    city_ids: Sequence[uuid.UUID]
+    disposable_region_ids: Iterator[uuid.UUID]
+    disposable_district_ids: Iterator[uuid.UUID]
+    disposable_city_ids: Iterator[uuid.UUID]
+    rng: random.Random = field(default_factory=lambda: random.Random(0))
+
+    def region_id(self) -> uuid.UUID:
+        return self.rng.choice(self.region_ids)
+
+    def district_id(self) -> uuid.UUID:
+        return self.rng.choice(self.district_ids)
+
+    def city_id(self) -> uuid.UUID:
+        return self.rng.choice(self.city_ids)
+
+    def city_with_district(self) -> tuple[uuid.UUID, uuid.UUID]:
+        # Cities are generated district by district, see SEED_CITIES.
+        index = self.rng.randrange(len(self.city_ids))
+        district_index = index // self.volumes.cities_per_district
+        return self.city_ids[index], self.district_ids[district_index]
+
+    def city_name_prefix(self) -> str:
+        # Matches the cities of one district, see SEED_CITIES.
+        region = self.rng.randint(1, self.volumes.regions)
+        district = self.rng.randint(1, self.volumes.districts_per_region)
+        return f'city {region}-{district}-'
+
+
+def _seeded_id(label: str) -> uuid.UUID:
+    return uuid.UUID(bytes=hashlib.md5(label.encode()).digest())
+
+
+async def seed(engine: AsyncEngine, volumes: Volumes, disposable: int) -> Dataset:
+    """Recreate the schema and fill it with deterministic rows."""
+    async with engine.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.drop_all)
+        await conn.run_sync(BaseModel.metadata.create_all)
+
+        parameters = {
+            'regions': volumes.regions,
+            'districts': volumes.districts_per_region,
+            'cities': volumes.cities_per_district,
+            'count': disposable,
+        }
+        for statement in (SEED_REGIONS, SEED_DISTRICTS, SEED_CITIES, *SEED_DISPOSABLE):
+            await conn.execute(statement, parameters)
+        for view in STATS_VIEWS:
+            await conn.execute(text(f'REFRESH MATERIALIZED VIEW {view}'))
+
+    try:
+        async with engine.begin() as conn:
+            for statement in MIGRATION_INDEXES:
+                await conn.execute(statement)
+    except DBAPIError:
+        print('pg_trgm is not available, city name search runs without its index')
+
+    # Fresh statistics and visibility maps, so the planner sees what it would
+    # see on a long-running database.
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level='AUTOCOMMIT')
+        await conn.execute(
+            text(f'VACUUM ANALYZE region, district, city, {", ".join(STATS_VIEWS)}')
+        )
+
+    regions = range(1, volumes.regions + 1)
+    districts = range(1, volumes.districts_per_region + 1)
+    cities = range(1, volumes.cities_per_district + 1)
+    return Dataset(
+        volumes=volumes,
+        region_ids=[_seeded_id(f'region-{r}') for r in regions],
+        district_ids=[
+            _seeded_id(f'district-{r}-{d}')
+            for r, d in itertools.product(regions, districts)
+        ],
+        city_ids=[
+            _seeded_id(f'city-{r}-{d}-{i}')
+            for r, d, i in itertools.product(regions, districts, cities)
+        ],
+        disposable_region_ids=(
+            _seeded_id(f'disposable-region-{i}') for i in range(1, disposable + 1)
+        ),
+        disposable_district_ids=(
+            _seeded_id(f'disposable-district-{i}') for i in range(1, disposable + 1)
+        ),
+        disposable_city_ids=(
+            _seeded_id(f'disposable-city-{i}') for i in range(1, disposable + 1)
+        ),
+    )
@@ -0,0 +1,333 @@
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from functools import partial
+from typing import Any, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.dto.region import MAX_TREE_DEPTH
+from app.application.pagination import DEFAULT_PAGE_SIZE
+from app.application.search import DEFAULT_SEARCH_LIMIT, SearchMode
+from app.domain.entities.city import CityDM
+from app.domain.entities.district import DistrictDM
+from app.domain.entities.region import RegionDM
+from app.infrastructure.gateway.city import CityGateway
+from app.infrastructure.gateway.district import DistrictGateway
+from app.infrastructure.gateway.region import RegionGateway
+from app.infrastructure.gateway.stats import PopulationStatsGateway
+from benchmarks.dataset import Dataset
+from benchmarks.harness import Benchmark
+
+GROUP = 'gateway'
+BATCH_SIZE = 100
+# Parents per multi-parent lookup, e.g. a page of districts whose cities are needed.
+PARENT_BATCH_SIZE = 10
+
+G = TypeVar('G')
+
+
+async def drain(rows: AsyncIterator[Any]) -> None:
+    async for _ in rows:
+        pass
+
+
+def new_city(district_id: uuid.UUID) -> CityDM:
+    return CityDM(
+        id=uuid.uuid4(),
+        district_id=district_id,
+        name='benchmark city',
+        obj_type='city',
+        population=1000,
+    )
+
+
+def _with_gateway(
+    session_maker: async_sessionmaker[AsyncSession],
+    gateway_type: Callable[[AsyncSession], G],
+    action: Callable[[G], Awaitable[Any]],
+    commit: bool = False,
+) -> Callable[[], Awaitable[None]]:
+    # One session per call, as one request would get. Writes are committed
+    # by the command, so their benchmarks commit too.
+    async def call() -> None:
+        async with session_maker() as session:
+            await action(gateway_type(session))
+            if commit:
+                await session.commit()
+
+    return call
+
+
+def gateway_benchmarks(
+    session_maker: async_sessionmaker[AsyncSession],
+    dataset: Dataset,
+    chunk_size: int,
+) -> list[Benchmark]:
+    city = partial(_with_gateway, session_maker, CityGateway)
+    district = partial(_with_gateway, session_maker, DistrictGateway)
+    region = partial(_with_gateway, session_maker, RegionGateway)
+    stats = partial(_with_gateway, session_maker, PopulationStatsGateway)
+    city_write = partial(city, commit=True)
+    district_write = partial(district, commit=True)
+    region_write = partial(region, commit=True)
+
+    def updated_city() -> CityDM:
+        city_id, district_id = dataset.city_with_district()
+        return CityDM(
+            id=city_id,
+            district_id=district_id,
+            name='benchmark city',
+            obj_type='city',
+            population=1000,
+        )
+
+    def district_ids() -> list[uuid.UUID]:
+        return [dataset.district_id() for _ in range(PARENT_BATCH_SIZE)]
+
+    def region_ids() -> list[uuid.UUID]:
+        return [dataset.region_id() for _ in range(PARENT_BATCH_SIZE)]
+
+    return [
+        Benchmark(
+            GROUP,
+            'CityGateway.get_cities',
+            city(lambda g: g.get_cities(limit=DEFAULT_PAGE_SIZE)),
+        ),
+        Benchmark(
+            GROUP,
+            'CityGateway.get_cities.after_id',
+            city(
+                lambda g: g.get_cities(
+                    limit=DEFAULT_PAGE_SIZE, after_id=dataset.city_id()
+                )
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'CityGateway.get_cities_by_district_uuid',
+            city(lambda g: g.get_cities_by_district_uuid(dataset.district_id())),
+        ),
+        Benchmark(
+            GROUP,
+            'CityGateway.get_cities_by_district_uuids',
+            city(lambda g: g.get_cities_by_district_uuids(district_ids())),
+        ),
+        Benchmark(
+            GROUP,
+            'CityGateway.get_by_uuid',
+            city(lambda g: g.get_by_uuid(dataset.city_id())),
+        ),
+        Benchmark(
+            GROUP,
+            'CityGateway.get_by_uuids',
+            city(
+                lambda g: g.get_by_uuids([dataset.city_id() for _ in range(BATCH_SIZE)])
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'CityGateway.search_by_name.prefix',
+            city(
+                lambda g: g.search_by_name(
+                    dataset.city_name_prefix(), SearchMode.PREFIX, DEFAULT_SEARCH_LIMIT
+                )
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'CityGateway.search_by_name.substring',
+            city(
+                lambda g: g.search_by_name(
+                    dataset.city_name_prefix()[5:],
+                    SearchMode.SUBSTRING,
+                    DEFAULT_SEARCH_LIMIT,
+                )
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'CityGateway.stream_cities',
+            city(lambda g: drain(g.stream_cities(chunk_size=chunk_size))),
+            heavy=True,
+        ),
+        Benchmark(
+            GROUP,
+            'CityGateway.stream_cities_by_district_uuid',
+            city(
+                lambda g: drain(
+                    g.stream_cities_by_district_uuid(
+                        dataset.district_id(), chunk_size=chunk_size
+                    )
+                )
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'CityGateway.save',
+            city_write(lambda g: g.save(new_city(dataset.district_id()))),
+        ),
+        Benchmark(
+            GROUP,
+            'CityGateway.save_many',
+            city_write(
+                lambda g: g.save_many(
+                    [new_city(dataset.district_id()) for _ in range(BATCH_SIZE)]
+                )
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'CityGateway.update_by_uuid',
+            city_write(lambda g: g.update_by_uuid(updated_city())),
+        ),
+        Benchmark(
+            GROUP,
+            'CityGateway.delete_by_uuid',
+            city_write(lambda g: g.delete_by_uuid(next(dataset.disposable_city_ids))),
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictGateway.get_districts',
+            district(lambda g: g.get_districts(limit=DEFAULT_PAGE_SIZE)),
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictGateway.get_districts_by_region_uuid',
+            district(lambda g: g.get_districts_by_region_uuid(dataset.region_id())),
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictGateway.get_districts_by_region_uuids',
+            district(lambda g: g.get_districts_by_region_uuids(region_ids())),
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictGateway.get_by_uuid',
+            district(lambda g: g.get_by_uuid(dataset.district_id())),
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictGateway.get_by_uuids',
+            district(
+                lambda g: g.get_by_uuids(
+                    [dataset.district_id() for _ in range(BATCH_SIZE)]
+                )
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictGateway.get_existing_uuids',
+            district(
+                lambda g: g.get_existing_uuids(
+                    [dataset.district_id() for _ in range(BATCH_SIZE)]
+                )
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictGateway.stream_districts',
+            district(lambda g: drain(g.stream_districts(chunk_size=chunk_size))),
+            heavy=True,
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictGateway.stream_districts_by_region_uuid',
+            district(
+                lambda g: drain(
+                    g.stream_districts_by_region_uuid(
+                        dataset.region_id(), chunk_size=chunk_size
+                    )
+                )
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictGateway.save',
+            district_write(
+                lambda g: g.save(
+                    DistrictDM(
+                        id=uuid.uuid4(),
+                        region_id=dataset.region_id(),
+                        name='benchmark district',
+                    )
+                )
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictGateway.delete_by_uuid',
+            district_write(
+                lambda g: g.delete_by_uuid(next(dataset.disposable_district_ids))
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'RegionGateway.get_regions',
+            region(lambda g: g.get_regions(limit=DEFAULT_PAGE_SIZE)),
+        ),
+        Benchmark(
+            GROUP,
+            'RegionGateway.get_by_uuid',
+            region(lambda g: g.get_by_uuid(dataset.region_id())),
+        ),
+        Benchmark(
+            GROUP,
+            'RegionGateway.get_by_uuids',
+            region(
+                lambda g: g.get_by_uuids(
+                    [dataset.region_id() for _ in range(BATCH_SIZE)]
+                )
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'RegionGateway.get_tree',
+            region(lambda g: g.get_tree(dataset.region_id(), depth=MAX_TREE_DEPTH)),
+        ),
+        Benchmark(
+            GROUP,
+            'RegionGateway.exist_with_name',
+            region(lambda g: g.exist_with_name('region 1')),
+        ),
+        Benchmark(
+            GROUP,
+            'RegionGateway.save',
+            region_write(
+                lambda g: g.save(
+                    RegionDM(
+                        id=uuid.uuid4(),
+                        name=f'benchmark {uuid.uuid4()}',
+                        capital='capital',
+                    )
+                )
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'RegionGateway.delete_by_uuid',
+            region_write(
+                lambda g: g.delete_by_uuid(next(dataset.disposable_region_ids))
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'PopulationStatsGateway.get_regions_stats',
+            stats(lambda g: g.get_regions_stats()),
+        ),
+        Benchmark(
+            GROUP,
+            'PopulationStatsGateway.get_region_stats',
+            stats(lambda g: g.get_region_stats(dataset.region_id())),
+        ),
+        Benchmark(
+            GROUP,
+            'PopulationStatsGateway.get_districts_stats_by_region_uuid',
+            stats(lambda g: g.get_districts_stats_by_region_uuid(dataset.region_id())),
+        ),
+        Benchmark(
+            GROUP,
+            'PopulationStatsGateway.refresh',
+            stats(lambda g: g.refresh()),
+            heavy=True,
+        ),
+    ]
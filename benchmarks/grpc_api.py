@@ -0,0 +1,321 @@
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import grpc
+from dishka import AsyncContainer
+from dishka.integrations.grpcio import DishkaAioInterceptor
+from google.protobuf.empty_pb2 import Empty
+
+from app.infrastructure.grpc.city import city_pb2, city_pb2_grpc
+from app.infrastructure.grpc.district import district_pb2, district_pb2_grpc
+from app.infrastructure.grpc.region import region_pb2, region_pb2_grpc
+from app.infrastructure.grpc.stats import stats_pb2, stats_pb2_grpc
+from app.presentation.grpc.city import CityGRPCService
+from app.presentation.grpc.district import DistrictGRPCService
+from app.presentation.grpc.region import RegionGRPCService
+from app.presentation.grpc.stats import StatsGRPCService
+from benchmarks.dataset import Dataset
+from benchmarks.gateways import BATCH_SIZE, PARENT_BATCH_SIZE
+from benchmarks.harness import Benchmark
+
+GROUP = 'grpc'
+
+
+@dataclass(frozen=True, slots=True)
+class Stubs:
+    city: city_pb2_grpc.CityServiceStub
+    district: district_pb2_grpc.DistrictServiceStub
+    region: region_pb2_grpc.RegionServiceStub
+    stats: stats_pb2_grpc.StatsServiceStub
+
+
+@asynccontextmanager
+async def grpc_stubs(container: AsyncContainer) -> AsyncIterator[Stubs]:
+    # The server and the channel share the event loop and talk over loopback,
+    # so the numbers include protobuf and HTTP/2 framing but no real network.
+    server = grpc.aio.server(
+        ThreadPoolExecutor(max_workers=10),
+        interceptors=[DishkaAioInterceptor(container)],
+    )
+    region_pb2_grpc.add_RegionServiceServicer_to_server(RegionGRPCService(), server)
+    district_pb2_grpc.add_DistrictServiceServicer_to_server(
+        DistrictGRPCService(), server
+    )
+    city_pb2_grpc.add_CityServiceServicer_to_server(CityGRPCService(), server)
+    stats_pb2_grpc.add_StatsServiceServicer_to_server(StatsGRPCService(), server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    await server.start()
+
+    try:
+        async with grpc.aio.insecure_channel(f'127.0.0.1:{port}') as channel:
+            yield Stubs(
+                city=city_pb2_grpc.CityServiceStub(channel),
+                district=district_pb2_grpc.DistrictServiceStub(channel),
+                region=region_pb2_grpc.RegionServiceStub(channel),
+                stats=stats_pb2_grpc.StatsServiceStub(channel),
+            )
+    finally:
+        await server.stop(None)
+
+
+def _unary(
+    method: Callable[[Any], Awaitable[Any]], request: Callable[[], Any]
+) -> Callable[[], Awaitable[None]]:
+    async def call() -> None:
+        await method(request())
+
+    return call
+
+
+def _stream(
+    method: Callable[[Any], AsyncIterator[Any]], request: Callable[[], Any]
+) -> Callable[[], Awaitable[None]]:
+    async def call() -> None:
+        async for _ in method(request()):
+            pass
+
+    return call
+
+
+def new_city(dataset: Dataset) -> city_pb2.NewCityDTO:
+    return city_pb2.NewCityDTO(
+        district_id=str(dataset.district_id()),
+        name='benchmark city',
+        obj_type='city',
+        population=1000,
+    )
+
+
+def grpc_benchmarks(stubs: Stubs, dataset: Dataset) -> list[Benchmark]:
+    city, district, region = stubs.city, stubs.district, stubs.region
+    stats = stubs.stats
+
+    return [
+        Benchmark(
+            GROUP,
+            'CityService.GetCities',
+            _unary(city.GetCities, city_pb2.PageRequest),
+        ),
+        Benchmark(
+            GROUP,
+            'CityService.GetCitiesByDistrictId',
+            _unary(
+                city.GetCitiesByDistrictId,
+                lambda: city_pb2.DistrictIdRequest(
+                    district_id=str(dataset.district_id())
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'CityService.GetCitiesByDistrictIds',
+            _unary(
+                city.GetCitiesByDistrictIds,
+                lambda: city_pb2.DistrictIdsRequest(
+                    district_ids=[
+                        str(dataset.district_id()) for _ in range(PARENT_BATCH_SIZE)
+                    ]
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'CityService.GetCityById',
+            _unary(
+                city.GetCityById,
+                lambda: city_pb2.CityIdRequest(city_id=str(dataset.city_id())),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'CityService.GetCitiesByIds',
+            _unary(
+                city.GetCitiesByIds,
+                lambda: city_pb2.CityIdsRequest(
+                    city_ids=[str(dataset.city_id()) for _ in range(BATCH_SIZE)]
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'CityService.StreamCities',
+            _stream(city.StreamCities, Empty),
+            heavy=True,
+        ),
+        Benchmark(
+            GROUP,
+            'CityService.StreamCitiesByDistrictId',
+            _stream(
+                city.StreamCitiesByDistrictId,
+                lambda: city_pb2.DistrictIdRequest(
+                    district_id=str(dataset.district_id())
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'CityService.CreateCity',
+            _unary(city.CreateCity, lambda: new_city(dataset)),
+        ),
+        Benchmark(
+            GROUP,
+            'CityService.CreateCities',
+            _unary(
+                city.CreateCities,
+                lambda: city_pb2.NewCityList(
+                    cities=[new_city(dataset) for _ in range(BATCH_SIZE)]
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'CityService.DeleteCity',
+            _unary(
+                city.DeleteCity,
+                lambda: city_pb2.CityIdRequest(
+                    city_id=str(next(dataset.disposable_city_ids))
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictService.GetDistricts',
+            _unary(district.GetDistricts, district_pb2.PageRequest),
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictService.GetDistrictsByRegionId',
+            _unary(
+                district.GetDistrictsByRegionId,
+                lambda: district_pb2.RegionIdRequest(
+                    region_id=str(dataset.region_id())
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictService.GetDistrictsByRegionIds',
+            _unary(
+                district.GetDistrictsByRegionIds,
+                lambda: district_pb2.RegionIdsRequest(
+                    region_ids=[
+                        str(dataset.region_id()) for _ in range(PARENT_BATCH_SIZE)
+                    ]
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictService.GetDistrictById',
+            _unary(
+                district.GetDistrictById,
+                lambda: district_pb2.DistrictIdRequest(
+                    district_id=str(dataset.district_id())
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictService.StreamDistricts',
+            _stream(district.StreamDistricts, Empty),
+            heavy=True,
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictService.StreamDistrictsByRegionId',
+            _stream(
+                district.StreamDistrictsByRegionId,
+                lambda: district_pb2.RegionIdRequest(
+                    region_id=str(dataset.region_id())
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictService.CreateDistrict',
+            _unary(
+                district.CreateDistrict,
+                lambda: district_pb2.NewDistrictDTO(
+                    region_id=str(dataset.region_id()), name='benchmark district'
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'DistrictService.DeleteDistrict',
+            _unary(
+                district.DeleteDistrict,
+                lambda: district_pb2.DistrictIdRequest(
+                    district_id=str(next(dataset.disposable_district_ids))
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'RegionService.GetRegions',
+            _unary(region.GetRegions, region_pb2.PageRequest),
+        ),
+        Benchmark(
+            GROUP,
+            'RegionService.GetRegionById',
+            _unary(
+                region.GetRegionById,
+                lambda: region_pb2.RegionIdRequest(region_id=str(dataset.region_id())),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'RegionService.GetRegionTree',
+            _unary(
+                region.GetRegionTree,
+                lambda: region_pb2.RegionTreeRequest(
+                    region_id=str(dataset.region_id())
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'RegionService.CreateRegion',
+            _unary(
+                region.CreateRegion,
+                lambda: region_pb2.NewRegionDTO(
+                    name=f'benchmark {uuid.uuid4()}', capital='capital'
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'RegionService.DeleteRegion',
+            _unary(
+                region.DeleteRegion,
+                lambda: region_pb2.RegionIdRequest(
+                    region_id=str(next(dataset.disposable_region_ids))
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'StatsService.GetRegionsStats',
+            _unary(stats.GetRegionsStats, Empty),
+        ),
+        Benchmark(
+            GROUP,
+            'StatsService.GetRegionStats',
+            _unary(
+                stats.GetRegionStats,
+                lambda: stats_pb2.RegionIdRequest(region_id=str(dataset.region_id())),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'StatsService.GetDistrictsStats',
+            _unary(
+                stats.GetDistrictsStats,
+                lambda: stats_pb2.RegionIdRequest(region_id=str(dataset.region_id())),
+            ),
+        ),
+    ]
@@ -0,0 +1,119 @@
+import json
+import math
+import platform
+import subprocess
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+HEAVY_DIVISOR = 10
+
+
+@dataclass(frozen=True, slots=True)
+class Benchmark:
+    group: str
+    name: str
+    call: Callable[[], Awaitable[Any]]
+    # Heavy operations such as full-table streams run fewer iterations.
+    heavy: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    group: str
+    name: str
+    iterations: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    ops_per_sec: float
+
+    @property
+    def key(self) -> str:
+        return f'{self.group}.{self.name}'
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    # Nearest-rank percentile, so every reported value was actually observed.
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+async def run_benchmark(
+    benchmark: Benchmark, iterations: int, warmup: int
+) -> BenchmarkResult:
+    if benchmark.heavy:
+        iterations = max(iterations // HEAVY_DIVISOR, 1)
+        warmup = min(warmup, 1)
+
+    for _ in range(warmup):
+        await benchmark.call()
+
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await benchmark.call()
+        timings.append(time.perf_counter() - started)
+
+    timings.sort()
+    total = sum(timings)
+    return BenchmarkResult(
+        group=benchmark.group,
+        name=benchmark.name,
+        iterations=iterations,
+        mean_ms=total / iterations * 1000,
+        p50_ms=percentile(timings, 0.50) * 1000,
+        p95_ms=percentile(timings, 0.95) * 1000,
+        p99_ms=percentile(timings, 0.99) * 1000,
+        ops_per_sec=iterations / total if total else math.inf,
+    )
+
+
+def format_result(result: BenchmarkResult) -> str:
+    return (
+        f'{result.key:<56} {result.p50_ms:9.3f} {result.p95_ms:9.3f} '
+        f'{result.p99_ms:9.3f} {result.ops_per_sec:10.1f}'
+    )
+
+
+def format_header() -> str:
+    return (
+        f'{"benchmark":<56} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} {"ops/sec":>10}'
+    )
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(
+    path: Path, results: Sequence[BenchmarkResult], parameters: dict[str, Any]
+) -> None:
+    document = {
+        'created_at': datetime.now(UTC).isoformat(),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parameters': parameters,
+        'results': [asdict(result) for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2) + '\n')
+
+
+def load_results(path: Path) -> dict[str, BenchmarkResult]:
+    document = json.loads(path.read_text())
+    results = (BenchmarkResult(**result) for result in document['results'])
+    return {result.key: result for result in results}
@@ -0,0 +1,294 @@
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from http import HTTPStatus
+from typing import Any
+
+from dishka import AsyncContainer
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.presentation.api.city import city_router
+from app.presentation.api.district import district_router
+from app.presentation.api.region import region_router
+from app.presentation.api.stats import stats_router
+from benchmarks.dataset import Dataset
+from benchmarks.gateways import BATCH_SIZE, PARENT_BATCH_SIZE
+from benchmarks.harness import Benchmark
+
+GROUP = 'http'
+
+
+@asynccontextmanager
+async def http_client(container: AsyncContainer) -> AsyncIterator[AsyncClient]:
+    # The ASGI app is called in-process, so the numbers include routing,
+    # validation and serialization but no socket or server overhead.
+    app = FastAPI()
+    app.include_router(region_router)
+    app.include_router(district_router)
+    app.include_router(city_router)
+    app.include_router(stats_router)
+    setup_dishka(container=container, app=app)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url='http://benchmark'
+    ) as client:
+        yield client
+
+
+def _request(
+    client: AsyncClient,
+    method: str,
+    url: Callable[[], str],
+    body: Callable[[], Any] | None = None,
+) -> Callable[[], Awaitable[None]]:
+    async def call() -> None:
+        response = await client.request(
+            method, url(), json=body() if body is not None else None
+        )
+        response.raise_for_status()
+
+    return call
+
+
+def _revalidate(client: AsyncClient, url: str) -> Callable[[], Awaitable[None]]:
+    # A poller that sends back the ETag it got last; once the first call has
+    # stored it, every call is answered 304 while nothing is written.
+    etag = None
+
+    async def call() -> None:
+        nonlocal etag
+        headers = {'If-None-Match': etag} if etag else None
+        response = await client.get(url, headers=headers)
+        if response.status_code != HTTPStatus.NOT_MODIFIED:
+            response.raise_for_status()
+        etag = response.headers.get('ETag')
+
+    return call
+
+
+def new_city(dataset: Dataset) -> dict[str, Any]:
+    return {
+        'district_id': str(dataset.district_id()),
+        'name': 'benchmark city',
+        'obj_type': 'city',
+        'population': 1000,
+    }
+
+
+def http_benchmarks(client: AsyncClient, dataset: Dataset) -> list[Benchmark]:
+    def get(path: Callable[[], str]) -> Callable[[], Awaitable[None]]:
+        return _request(client, 'GET', path)
+
+    def updated_city() -> dict[str, Any]:
+        city_id, district_id = dataset.city_with_district()
+        return {
+            'city_id': str(city_id),
+            'district_id': str(district_id),
+            'name': 'benchmark city',
+            'obj_type': 'city',
+            'population': 1000,
+        }
+
+    return [
+        Benchmark(GROUP, 'GET /cities/get_cities', get(lambda: '/cities/get_cities')),
+        Benchmark(
+            GROUP,
+            'GET /cities/get_cities.not_modified',
+            _revalidate(client, '/cities/get_cities'),
+        ),
+        Benchmark(
+            GROUP,
+            'GET /cities/get_cities_by_district',
+            get(
+                lambda: '/cities/get_cities_by_district'
+                f'?district_id={dataset.district_id()}'
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'POST /cities/get_cities_by_districts',
+            _request(
+                client,
+                'POST',
+                lambda: '/cities/get_cities_by_districts',
+                lambda: [str(dataset.district_id()) for _ in range(PARENT_BATCH_SIZE)],
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'GET /cities/get_city_by_id',
+            get(lambda: f'/cities/get_city_by_id?city_id={dataset.city_id()}'),
+        ),
+        Benchmark(
+            GROUP,
+            'GET /cities/get_city_by_id.not_modified',
+            _revalidate(client, f'/cities/get_city_by_id?city_id={dataset.city_id()}'),
+        ),
+        Benchmark(
+            GROUP,
+            'POST /cities/get_cities_by_ids',
+            _request(
+                client,
+                'POST',
+                lambda: '/cities/get_cities_by_ids',
+                lambda: [str(dataset.city_id()) for _ in range(BATCH_SIZE)],
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'GET /cities/search_cities',
+            get(
+                lambda: '/cities/search_cities'
+                f'?query={dataset.city_name_prefix()}&mode=prefix'
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'GET /cities/export_cities',
+            get(lambda: '/cities/export_cities'),
+            heavy=True,
+        ),
+        Benchmark(
+            GROUP,
+            'POST /cities/create_city',
+            _request(
+                client, 'POST', lambda: '/cities/create_city', lambda: new_city(dataset)
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'POST /cities/create_cities',
+            _request(
+                client,
+                'POST',
+                lambda: '/cities/create_cities',
+                lambda: [new_city(dataset) for _ in range(BATCH_SIZE)],
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'PUT /cities/update_city',
+            _request(client, 'PUT', lambda: '/cities/update_city', updated_city),
+        ),
+        Benchmark(
+            GROUP,
+            'DELETE /cities/delete_city',
+            _request(
+                client,
+                'DELETE',
+                lambda: f'/cities/delete_city?city_id={next(dataset.disposable_city_ids)}',
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'GET /districts/get_districts',
+            get(lambda: '/districts/get_districts'),
+        ),
+        Benchmark(
+            GROUP,
+            'GET /districts/get_districts.not_modified',
+            _revalidate(client, '/districts/get_districts'),
+        ),
+        Benchmark(
+            GROUP,
+            'GET /districts/get_districts_by_region',
+            get(
+                lambda: '/districts/get_districts_by_region'
+                f'?region_id={dataset.region_id()}'
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'POST /districts/get_districts_by_regions',
+            _request(
+                client,
+                'POST',
+                lambda: '/districts/get_districts_by_regions',
+                lambda: [str(dataset.region_id()) for _ in range(PARENT_BATCH_SIZE)],
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'GET /districts/get_district_by_id',
+            get(
+                lambda: '/districts/get_district_by_id'
+                f'?district_id={dataset.district_id()}'
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'POST /districts/create_district',
+            _request(
+                client,
+                'POST',
+                lambda: '/districts/create_district',
+                lambda: {
+                    'region_id': str(dataset.region_id()),
+                    'name': 'benchmark district',
+                },
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'DELETE /districts/delete_district',
+            _request(
+                client,
+                'DELETE',
+                lambda: '/districts/delete_district'
+                f'?district_id={next(dataset.disposable_district_ids)}',
+            ),
+        ),
+        Benchmark(GROUP, 'GET /region/get_regions', get(lambda: '/region/get_regions')),
+        Benchmark(
+            GROUP,
+            'GET /region/get_regions.not_modified',
+            _revalidate(client, '/region/get_regions'),
+        ),
+        Benchmark(
+            GROUP,
+            'GET /region/get_by_id',
+            get(lambda: f'/region/get_by_id?region_id={dataset.region_id()}'),
+        ),
+        Benchmark(
+            GROUP,
+            'GET /region/get_region_tree',
+            get(lambda: f'/region/get_region_tree?region_id={dataset.region_id()}'),
+        ),
+        Benchmark(
+            GROUP,
+            'POST /region/create_region',
+            _request(
+                client,
+                'POST',
+                lambda: '/region/create_region',
+                lambda: {'name': f'benchmark {uuid.uuid4()}', 'capital': 'capital'},
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'DELETE /region/delete_region',
+            _request(
+                client,
+                'DELETE',
+                lambda: '/region/delete_region'
+                f'?region_id={next(dataset.disposable_region_ids)}',
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'GET /stats/get_regions_stats',
+            get(lambda: '/stats/get_regions_stats'),
+        ),
+        Benchmark(
+            GROUP,
+            'GET /stats/get_region_stats',
+            get(lambda: f'/stats/get_region_stats?region_id={dataset.region_id()}'),
+        ),
+        Benchmark(
+            GROUP,
+            'GET /stats/get_districts_stats',
+            get(lambda: f'/stats/get_districts_stats?region_id={dataset.region_id()}'),
+        ),
+    ]
@@ -0,0 +1,266 @@
+import uuid
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any, TypeVar
+
+from dishka import AsyncContainer
+
+from app.application.commands.city import (
+    CreateCitiesBatchCommand,
+    CreateCityCommand,
+    UpdateCityCommand,
+)
+from app.application.commands.district import CreateDistrictCommand
+from app.application.commands.region import CreateRegionCommand
+from app.application.dto.city import NewCityDTO, UpdatedCityDTO
+from app.application.dto.district import NewDistrictDTO
+from app.application.dto.region import NewRegionDTO
+from app.application.interactors.city import (
+    DeleteCityInteractor,
+    GetCitiesByDistrictIdInteractor,
+    GetCitiesByDistrictIdsInteractor,
+    GetCitiesByIdsInteractor,
+    GetCitiesInteractor,
+    GetCityByIdInteractor,
+    StreamCitiesByDistrictIdInteractor,
+    StreamCitiesInteractor,
+)
+from app.application.interactors.district import (
+    DeleteDistrictInteractor,
+    GetDistrictByIdInteractor,
+    GetDistrictsByRegionIdInteractor,
+    GetDistrictsByRegionIdsInteractor,
+    GetDistrictsInteractor,
+    StreamDistrictsByRegionIdInteractor,
+    StreamDistrictsInteractor,
+)
+from app.application.interactors.region import (
+    DeleteRegionInteractor,
+    GetRegionByIdInteractor,
+    GetRegionsInteractor,
+    GetRegionTreeInteractor,
+)
+from app.application.interactors.stats import (
+    GetDistrictsStatsByRegionIdInteractor,
+    GetRegionsStatsInteractor,
+    GetRegionStatsInteractor,
+)
+from benchmarks.dataset import Dataset
+from benchmarks.gateways import BATCH_SIZE, PARENT_BATCH_SIZE, drain
+from benchmarks.harness import Benchmark
+
+GROUP = 'interactor'
+
+T = TypeVar('T')
+
+
+def _with_interactor(
+    container: AsyncContainer,
+    interactor_type: type[T],
+    action: Callable[[T], Awaitable[Any]],
+) -> Callable[[], Awaitable[None]]:
+    # Resolved in a request scope of the application container, so the
+    # cached gateways and the session lifecycle match the served code path.
+    async def call() -> None:
+        async with container() as request_container:
+            await action(await request_container.get(interactor_type))
+
+    return call
+
+
+def new_city(dataset: Dataset) -> NewCityDTO:
+    return NewCityDTO(
+        district_id=dataset.district_id(),
+        name='benchmark city',
+        obj_type='city',
+        population=1000,
+    )
+
+
+def interactor_benchmarks(
+    container: AsyncContainer, dataset: Dataset, chunk_size: int
+) -> list[Benchmark]:
+    run = partial(_with_interactor, container)
+
+    def updated_city() -> UpdatedCityDTO:
+        city_id, district_id = dataset.city_with_district()
+        return UpdatedCityDTO(
+            city_id=city_id,
+            district_id=district_id,
+            name='benchmark city',
+            obj_type='city',
+            population=1000,
+        )
+
+    return [
+        Benchmark(
+            GROUP, 'GetCitiesInteractor', run(GetCitiesInteractor, lambda i: i())
+        ),
+        Benchmark(
+            GROUP,
+            'GetCitiesByDistrictIdInteractor',
+            run(GetCitiesByDistrictIdInteractor, lambda i: i(dataset.district_id())),
+        ),
+        Benchmark(
+            GROUP,
+            'GetCitiesByDistrictIdsInteractor',
+            run(
+                GetCitiesByDistrictIdsInteractor,
+                lambda i: i([dataset.district_id() for _ in range(PARENT_BATCH_SIZE)]),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'GetCityByIdInteractor',
+            run(GetCityByIdInteractor, lambda i: i(dataset.city_id())),
+        ),
+        Benchmark(
+            GROUP,
+            'GetCitiesByIdsInteractor',
+            run(
+                GetCitiesByIdsInteractor,
+                lambda i: i([dataset.city_id() for _ in range(BATCH_SIZE)]),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'StreamCitiesInteractor',
+            run(StreamCitiesInteractor, lambda i: drain(i(chunk_size))),
+            heavy=True,
+        ),
+        Benchmark(
+            GROUP,
+            'StreamCitiesByDistrictIdInteractor',
+            run(
+                StreamCitiesByDistrictIdInteractor,
+                lambda i: drain(i(dataset.district_id(), chunk_size)),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'CreateCityCommand',
+            run(CreateCityCommand, lambda i: i(new_city(dataset))),
+        ),
+        Benchmark(
+            GROUP,
+            'CreateCitiesBatchCommand',
+            run(
+                CreateCitiesBatchCommand,
+                lambda i: i([new_city(dataset) for _ in range(BATCH_SIZE)]),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'UpdateCityCommand',
+            run(UpdateCityCommand, lambda i: i(updated_city())),
+        ),
+        Benchmark(
+            GROUP,
+            'DeleteCityInteractor',
+            run(DeleteCityInteractor, lambda i: i(next(dataset.disposable_city_ids))),
+        ),
+        Benchmark(
+            GROUP, 'GetDistrictsInteractor', run(GetDistrictsInteractor, lambda i: i())
+        ),
+        Benchmark(
+            GROUP,
+            'GetDistrictsByRegionIdInteractor',
+            run(GetDistrictsByRegionIdInteractor, lambda i: i(dataset.region_id())),
+        ),
+        Benchmark(
+            GROUP,
+            'GetDistrictsByRegionIdsInteractor',
+            run(
+                GetDistrictsByRegionIdsInteractor,
+                lambda i: i([dataset.region_id() for _ in range(PARENT_BATCH_SIZE)]),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'GetDistrictByIdInteractor',
+            run(GetDistrictByIdInteractor, lambda i: i(dataset.district_id())),
+        ),
+        Benchmark(
+            GROUP,
+            'StreamDistrictsInteractor',
+            run(StreamDistrictsInteractor, lambda i: drain(i(chunk_size))),
+            heavy=True,
+        ),
+        Benchmark(
+            GROUP,
+            'StreamDistrictsByRegionIdInteractor',
+            run(
+                StreamDistrictsByRegionIdInteractor,
+                lambda i: drain(i(dataset.region_id(), chunk_size)),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'CreateDistrictCommand',
+            run(
+                CreateDistrictCommand,
+                lambda i: i(
+                    NewDistrictDTO(
+                        region_id=dataset.region_id(), name='benchmark district'
+                    )
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'DeleteDistrictInteractor',
+            run(
+                DeleteDistrictInteractor,
+                lambda i: i(next(dataset.disposable_district_ids)),
+            ),
+        ),
+        Benchmark(
+            GROUP, 'GetRegionsInteractor', run(GetRegionsInteractor, lambda i: i())
+        ),
+        Benchmark(
+            GROUP,
+            'GetRegionByIdInteractor',
+            run(GetRegionByIdInteractor, lambda i: i(dataset.region_id())),
+        ),
+        Benchmark(
+            GROUP,
+            'GetRegionTreeInteractor',
+            run(GetRegionTreeInteractor, lambda i: i(dataset.region_id())),
+        ),
+        Benchmark(
+            GROUP,
+            'CreateRegionCommand',
+            run(
+                CreateRegionCommand,
+                lambda i: i(
+                    NewRegionDTO(name=f'benchmark {uuid.uuid4()}', capital='capital')
+                ),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'DeleteRegionInteractor',
+            run(
+                DeleteRegionInteractor,
+                lambda i: i(next(dataset.disposable_region_ids)),
+            ),
+        ),
+        Benchmark(
+            GROUP,
+            'GetRegionsStatsInteractor',
+            run(GetRegionsStatsInteractor, lambda i: i()),
+        ),
+        Benchmark(
+            GROUP,
+            'GetRegionStatsInteractor',
+            run(GetRegionStatsInteractor, lambda i: i(dataset.region_id())),
+        ),
+        Benchmark(
+            GROUP,
+            'GetDistrictsStatsByRegionIdInteractor',
+            run(
+                GetDistrictsStatsByRegionIdInteractor,
+                lambda i: i(dataset.region_id()),
+            ),
+        ),
+    ]
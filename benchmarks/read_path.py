@@ -0,0 +1,119 @@
+"""Compare the per-row cost of the ORM and Core read paths of get_cities.
+
+The rows are inserted inside a transaction that is rolled back at the end,
+so the benchmark can run against the dev database.
+
+Usage: python -m benchmarks.read_path [--rows 100000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Sequence
+
+from sqlalchemy import and_, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import Config
+from app.domain.entities.city import CityDM
+from app.infrastructure.db.main import new_session_maker
+from app.infrastructure.db.models import City, District, Region
+from app.infrastructure.gateway.city import CityGateway
+
+
+async def seed(session: AsyncSession, rows: int) -> None:
+    region_id = uuid.uuid4()
+    district_id = uuid.uuid4()
+    await session.execute(
+        insert(Region).values(id=region_id, name='benchmark', capital='benchmark')
+    )
+    await session.execute(
+        insert(District).values(id=district_id, region_id=region_id, name='benchmark')
+    )
+    await session.execute(
+        text(
+            'INSERT INTO city (id, district_id, name, obj_type, population, is_deleted) '
+            "SELECT gen_random_uuid(), :district_id, 'city ' || i, 'city', i, false "
+            'FROM generate_series(1, :rows) AS i'
+        ),
+        {'district_id': district_id, 'rows': rows},
+    )
+
+
+async def orm_get_cities(session: AsyncSession, limit: int) -> Sequence[CityDM]:
+    # The previous implementation: full ORM entities copied into CityDM.
+    query = (
+        select(City)
+        .where(and_(City.is_deleted == False))
+        .order_by(City.id)
+        .limit(limit)
+    )
+    result = await session.execute(query)
+
+    return [
+        CityDM(
+            id=row.id,
+            district_id=row.district_id,
+            name=row.name,
+            obj_type=row.obj_type,
+            population=row.population,
+        )
+        for row in result.scalars()
+    ]
+
+
+async def core_get_cities(session: AsyncSession, limit: int) -> Sequence[CityDM]:
+    return await CityGateway(session).get_cities(limit=limit)
+
+
+async def measure(
+    session: AsyncSession,
+    read: Callable[[AsyncSession, int], Awaitable[Sequence[CityDM]]],
+    rows: int,
+    repeat: int,
+) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        session.expunge_all()
+        started = time.perf_counter()
+        cities = await read(session, rows)
+        elapsed = time.perf_counter() - started
+        assert len(cities) == rows
+        best = min(best, elapsed)
+
+    return best
+
+
+async def main(rows: int, repeat: int) -> None:
+    session_maker = new_session_maker(Config().postgres)
+
+    async with session_maker() as session:
+        await seed(session, rows)
+
+        # Warm up the statement caches and the database buffers.
+        await core_get_cities(session, rows)
+        await orm_get_cities(session, rows)
+
+        results = {
+            'orm': await measure(session, orm_get_cities, rows, repeat),
+            'core': await measure(session, core_get_cities, rows, repeat),
+        }
+        await session.rollback()
+
+    await session_maker.kw['bind'].dispose()
+
+    for name, elapsed in results.items():
+        print(
+            f'{name:<5} {rows} rows in {elapsed * 1000:8.1f} ms, '
+            f'{elapsed / rows * 1_000_000:6.2f} us/row'
+        )
+    print(f'speedup: {results["orm"] / results["core"]:.2f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
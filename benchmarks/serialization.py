@@ -0,0 +1,82 @@
+import uuid
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from app.domain.entities.city import CityDM
+from app.domain.entities.district import DistrictDM
+from app.domain.entities.region import RegionDM
+from app.presentation.api.encoding import (
+    CITIES_ENCODER,
+    DISTRICTS_ENCODER,
+    REGIONS_ENCODER,
+)
+from app.presentation.schemas.city import City
+from app.presentation.schemas.district import District
+from app.presentation.schemas.region import Region
+from benchmarks.harness import Benchmark
+
+GROUP = 'serialization'
+ROWS = 10_000
+
+
+def _schema_path(
+    schema: type[BaseModel], rows: Sequence[Any]
+) -> Callable[[], Awaitable[None]]:
+    # What a route returning list[Schema] costs: a model per row, then
+    # FastAPI validates the declared Sequence[Schema] return type, dumps it
+    # to JSON-compatible objects and JSONResponse encodes those.
+    response_type = TypeAdapter(Sequence[schema])
+
+    async def call() -> None:
+        models = [schema.model_validate(row, from_attributes=True) for row in rows]
+        content = response_type.dump_python(
+            response_type.validate_python(models), mode='json'
+        )
+        JSONResponse(content)
+
+    return call
+
+
+def _encoder_path(
+    encoder: TypeAdapter, rows: Sequence[Any]
+) -> Callable[[], Awaitable[None]]:
+    async def call() -> None:
+        encoder.dump_json(rows)
+
+    return call
+
+
+def serialization_benchmarks() -> list[Benchmark]:
+    # Rows are built in memory, so only the encoding is measured.
+    cities = [
+        CityDM(
+            id=uuid.uuid4(),
+            district_id=uuid.uuid4(),
+            name=f'city {i}',
+            obj_type='city',
+            population=i,
+        )
+        for i in range(ROWS)
+    ]
+    districts = [
+        DistrictDM(id=uuid.uuid4(), region_id=uuid.uuid4(), name=f'district {i}')
+        for i in range(ROWS)
+    ]
+    regions = [
+        RegionDM(id=uuid.uuid4(), name=f'region {i}', capital=f'capital {i}')
+        for i in range(ROWS)
+    ]
+
+    return [
+        Benchmark(GROUP, 'cities.schema', _schema_path(City, cities)),
+        Benchmark(GROUP, 'cities.encoder', _encoder_path(CITIES_ENCODER, cities)),
+        Benchmark(GROUP, 'districts.schema', _schema_path(District, districts)),
+        Benchmark(
+            GROUP, 'districts.encoder', _encoder_path(DISTRICTS_ENCODER, districts)
+        ),
+        Benchmark(GROUP, 'regions.schema', _schema_path(Region, regions)),
+        Benchmark(GROUP, 'regions.encoder', _encoder_path(REGIONS_ENCODER, regions)),
+    ]
@@ -3,5 +3,5 @@ import asyncio
 from app.main import main
 
 if __name__ == '__main__':
-    # HTTP OR GRPC
+    # HTTP, GRPC OR ALL
     asyncio.run(main('HTTP'))
@@ -0,0 +1,100 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.cache.invalidation import invalidate_on_commit
+from app.infrastructure.cache.lru import CacheStats, LRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> LRUCache[str, int]:
+    return LRUCache(max_size=2, ttl=10, clock=clock)
+
+
+def test_get_set(cache: LRUCache[str, int]) -> None:
+    assert cache.get('a') is None
+    cache.set('a', 1)
+
+    assert cache.get('a') == 1
+    assert cache.stats == CacheStats(hits=1, misses=1)
+
+
+def test_get_many(cache: LRUCache[str, int]) -> None:
+    cache.set('a', 1)
+
+    assert cache.get_many(['a', 'b']) == ({'a': 1}, ['b'])
+    assert cache.stats == CacheStats(hits=1, misses=1)
+
+
+def test_evicts_least_recently_used(cache: LRUCache[str, int]) -> None:
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+
+
+def test_expires_after_ttl(cache: LRUCache[str, int], clock: FakeClock) -> None:
+    cache.set('a', 1)
+    clock.now = 9.9
+    assert cache.get('a') == 1
+
+    clock.now = 10
+    assert cache.get('a') is None
+    assert len(cache) == 0
+    assert cache.stats.expirations == 1
+
+
+def test_invalidate(cache: LRUCache[str, int]) -> None:
+    cache.set('a', 1)
+    cache.invalidate('a')
+    cache.invalidate('missing')
+
+    assert cache.get('a') is None
+    assert cache.stats.invalidations == 1
+
+
+def test_zero_size_disables_cache(clock: FakeClock) -> None:
+    cache = LRUCache(max_size=0, ttl=10, clock=clock)
+    cache.set('a', 1)
+
+    assert cache.get('a') is None
+    assert cache.stats.evictions == 0
+
+
+async def test_invalidate_on_commit(
+    cache: LRUCache[str, int], session_maker: async_sessionmaker[AsyncSession]
+) -> None:
+    async with session_maker() as session:
+        cache.set('a', 1)
+        invalidate_on_commit(session, cache, 'a')
+        assert cache.get('a') is None
+
+        # Another request reloads the row before the write is committed.
+        cache.set('a', 1)
+        await session.commit()
+
+        assert cache.get('a') is None
+        assert cache.stats.invalidations == 2
+
+        cache.set('a', 2)
+        await session.commit()
+
+        assert cache.get('a') == 2
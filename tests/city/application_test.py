@@ -1,17 +1,26 @@
 import uuid
-from unittest.mock import AsyncMock, MagicMock, create_autospec
+from unittest.mock import MagicMock, create_autospec
 
 import pytest
 from faker import Faker
 
-from app.application.commands.city import CreateCityCommand, UpdateCityCommand
-from app.application.dto.city import NewCityDTO, UpdatedCityDTO
-from app.application.errors import EntityNotExistsError
+from app.application.commands.city import (
+    CreateCitiesBatchCommand,
+    CreateCityCommand,
+    UpdateCityCommand,
+)
+from app.application.dto.city import CreatedCityDTO, NewCityDTO, UpdatedCityDTO
+from app.application.errors import EntityNotExistsError, InvalidCursorError
+from app.application.grouping import Group, Grouped
 from app.application.interactors.city import (
     DeleteCityInteractor,
     GetCitiesByDistrictIdInteractor,
+    GetCitiesByDistrictIdsInteractor,
+    GetCitiesByIdsInteractor,
     GetCitiesInteractor,
     GetCityByIdInteractor,
+    SearchCitiesInteractor,
+    StreamCitiesInteractor,
 )
 from app.application.interface.city.city import (
     CityDeleter,
@@ -19,7 +28,12 @@ from app.application.interface.city.city import (
     CitySaver,
     CityUpdater,
 )
-from app.application.interface.district.district import DistrictReader
+from app.application.interface.stats.stats import PopulationStatsRefresher
+from app.application.interface.transaction import TransactionManager
+from app.application.interface.version.version import VersionBumper
+from app.application.pagination import Page, decode_cursor
+from app.application.search import SearchMode
+from app.application.versions import CITIES, district_cities
 from app.domain.entities.city import CityDM
 
 
@@ -30,9 +44,59 @@ def get_cities_interactor() -> GetCitiesInteractor:
 
 
 async def test_get_cities(get_cities_interactor: GetCitiesInteractor) -> None:
-    result = await get_cities_interactor()
-    get_cities_interactor._city_gateway.get_cities.assert_awaited_once_with()
-    assert result == get_cities_interactor._city_gateway.get_cities.return_value
+    get_cities_interactor._city_gateway.get_cities.return_value = []
+
+    result = await get_cities_interactor(limit=10)
+    get_cities_interactor._city_gateway.get_cities.assert_awaited_once_with(
+        limit=11, after_id=None
+    )
+    assert result == Page(items=[], next_cursor=None)
+
+
+async def test_get_cities_next_page(
+    get_cities_interactor: GetCitiesInteractor, faker: Faker
+) -> None:
+    city_dms = [
+        CityDM(
+            id=uuid.uuid4(),
+            district_id=uuid.uuid4(),
+            name=faker.pystr(),
+            obj_type=faker.pystr(),
+            population=faker.pyint(),
+        )
+        for _ in range(3)
+    ]
+    get_cities_interactor._city_gateway.get_cities.return_value = city_dms
+
+    result = await get_cities_interactor(limit=2)
+    assert result.items == city_dms[:2]
+    assert decode_cursor(result.next_cursor) == city_dms[1].id
+
+    await get_cities_interactor(limit=2, cursor=result.next_cursor)
+    get_cities_interactor._city_gateway.get_cities.assert_awaited_with(
+        limit=3, after_id=city_dms[1].id
+    )
+
+
+async def test_get_cities_invalid_cursor(
+    get_cities_interactor: GetCitiesInteractor,
+) -> None:
+    with pytest.raises(InvalidCursorError):
+        await get_cities_interactor(cursor='not-a-cursor')
+
+    get_cities_interactor._city_gateway.get_cities.assert_not_awaited()
+
+
+@pytest.fixture
+def stream_cities() -> StreamCitiesInteractor:
+    city_gateway = create_autospec(CityReader)
+    return StreamCitiesInteractor(city_gateway)
+
+
+async def test_stream_cities(stream_cities: StreamCitiesInteractor) -> None:
+    result = stream_cities(chunk_size=500)
+    stream_cities._city_gateway.stream_cities.assert_called_once_with(chunk_size=500)
+    assert result == stream_cities._city_gateway.stream_cities.return_value
 
 
 @pytest.fixture
@@ -55,6 +119,82 @@ async def test_get_cities_by_district_id(
     )
 
 
+async def test_get_cities_by_district_ids() -> None:
+    interactor = GetCitiesByDistrictIdsInteractor(create_autospec(CityReader))
+    found_id, empty_id, missing_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    city = CityDM(
+        id=uuid.uuid4(),
+        district_id=found_id,
+        name='city',
+        obj_type='city',
+        population=1,
+    )
+    interactor._city_gateway.get_cities_by_district_uuids.return_value = {
+        found_id: [city],
+        empty_id: [],
+    }
+
+    result = await interactor([missing_id, found_id, empty_id, found_id])
+
+    interactor._city_gateway.get_cities_by_district_uuids.assert_awaited_once_with(
+        [missing_id, found_id, empty_id]
+    )
+    assert result == Grouped(
+        groups=[
+            Group(parent_id=found_id, items=[city]),
+            Group(parent_id=empty_id, items=[]),
+        ],
+        missing_parent_ids=[missing_id],
+    )
+
+
+async def test_get_cities_by_no_district_ids() -> None:
+    interactor = GetCitiesByDistrictIdsInteractor(create_autospec(CityReader))
+
+    result = await interactor([])
+
+    interactor._city_gateway.get_cities_by_district_uuids.assert_not_awaited()
+    assert result == Grouped(groups=[], missing_parent_ids=[])
+
+
+async def test_get_cities_by_ids() -> None:
+    interactor = GetCitiesByIdsInteractor(create_autospec(CityReader))
+    found_id, missing_id = uuid.uuid4(), uuid.uuid4()
+    city = CityDM(
+        id=found_id,
+        district_id=uuid.uuid4(),
+        name='city',
+        obj_type='city',
+        population=1,
+    )
+    interactor._city_gateway.get_by_uuids.return_value = {found_id: city}
+
+    result = await interactor([found_id, missing_id, found_id])
+
+    interactor._city_gateway.get_by_uuids.assert_awaited_once_with(
+        [found_id, missing_id]
+    )
+    assert result == [city, None, city]
+
+
+async def test_search_cities() -> None:
+    interactor = SearchCitiesInteractor(create_autospec(CityReader))
+
+    result = await interactor('  Mos ', mode=SearchMode.PREFIX, limit=5)
+
+    interactor._city_gateway.search_by_name.assert_awaited_once_with(
+        'Mos', SearchMode.PREFIX, 5
+    )
+    assert result == interactor._city_gateway.search_by_name.return_value
+
+
+async def test_search_cities_blank_query() -> None:
+    interactor = SearchCitiesInteractor(create_autospec(CityReader))
+
+    assert await interactor('   ') == []
+    interactor._city_gateway.search_by_name.assert_not_awaited()
+
+
 @pytest.fixture
 def get_city_by_uuid() -> GetCityByIdInteractor:
     city_gateway = create_autospec(CityReader)
@@ -73,9 +213,14 @@ async def test_get_city_by_uuid(
 @pytest.fixture
 def create_city(faker: Faker) -> CreateCityCommand:
     city_gateway = create_autospec(CitySaver)
-    district_gateway = create_autospec(DistrictReader)
     uuid_generator = MagicMock()
-    return CreateCityCommand(city_gateway, district_gateway, uuid_generator)
+    return CreateCityCommand(
+        city_gateway,
+        uuid_generator,
+        create_autospec(PopulationStatsRefresher),
+        create_autospec(VersionBumper),
+        create_autospec(TransactionManager),
+    )
 
 
 async def test_create_city_success(
@@ -91,7 +236,6 @@ async def test_create_city_success(
     )
 
     create_city._uuid_generator.return_value = city_id
-    create_city._district_gateway.get_by_uuid = AsyncMock(return_value=MagicMock())
 
     result = await create_city(dto)
 
@@ -103,8 +247,12 @@ async def test_create_city_success(
         population=dto.population,
     )
     create_city._city_gateway.save.assert_awaited_once_with(expected_city)
-    create_city._district_gateway.get_by_uuid.assert_awaited_once_with(district_id)
     create_city._uuid_generator.assert_called_once()
+    create_city._version_gateway.bump.assert_awaited_once_with(
+        [CITIES, district_cities(district_id)]
+    )
+    create_city._transaction_manager.commit.assert_awaited_once_with()
+    create_city._stats_refresher.request_refresh.assert_called_once_with()
 
     assert result == city_id
 
@@ -119,51 +267,177 @@ async def test_create_city_district_not_exists(
         population=faker.pyint(),
     )
 
-    create_city._district_gateway.get_by_uuid = AsyncMock(return_value=None)
+    create_city._city_gateway.save.side_effect = EntityNotExistsError(
+        'District does not exist'
+    )
 
     with pytest.raises(EntityNotExistsError):
         await create_city(dto)
 
-    create_city._city_gateway.save.assert_not_awaited()
-    create_city._uuid_generator.assert_not_called()
+    create_city._city_gateway.save.assert_awaited_once()
+    create_city._version_gateway.bump.assert_not_awaited()
+    create_city._transaction_manager.commit.assert_not_awaited()
+    create_city._stats_refresher.request_refresh.assert_not_called()
+
+
+@pytest.fixture
+def create_cities_batch() -> CreateCitiesBatchCommand:
+    city_gateway = create_autospec(CitySaver)
+    uuid_generator = MagicMock()
+    return CreateCitiesBatchCommand(
+        city_gateway,
+        uuid_generator,
+        create_autospec(PopulationStatsRefresher),
+        create_autospec(VersionBumper),
+        create_autospec(TransactionManager),
+    )
+
+
+async def test_create_cities_batch(
+    create_cities_batch: CreateCitiesBatchCommand, faker: Faker
+) -> None:
+    district_id = uuid.uuid4()
+    missing_district_id = uuid.uuid4()
+    city_ids = [uuid.uuid4(), uuid.uuid4(), uuid.uuid4()]
+    dtos = [
+        NewCityDTO(
+            district_id=district,
+            name=faker.pystr(),
+            obj_type=faker.pystr(),
+            population=faker.pyint(),
+        )
+        for district in (district_id, missing_district_id, district_id)
+    ]
+
+    create_cities_batch._uuid_generator.side_effect = city_ids
+    # The insert skips the city whose district does not exist.
+    create_cities_batch._city_gateway.save_many.return_value = {
+        city_ids[0],
+        city_ids[2],
+    }
+
+    result = await create_cities_batch(dtos)
+
+    assert result == [
+        CreatedCityDTO(city_id=city_ids[0]),
+        CreatedCityDTO(error='District not found'),
+        CreatedCityDTO(city_id=city_ids[2]),
+    ]
+    create_cities_batch._city_gateway.save_many.assert_awaited_once_with(
+        [
+            CityDM(
+                id=city_id,
+                district_id=dto.district_id,
+                name=dto.name,
+                obj_type=dto.obj_type,
+                population=dto.population,
+            )
+            for city_id, dto in zip(city_ids, dtos, strict=True)
+        ]
+    )
+    create_cities_batch._version_gateway.bump.assert_awaited_once_with(
+        [CITIES, district_cities(district_id), district_cities(district_id)]
+    )
+    create_cities_batch._transaction_manager.commit.assert_awaited_once_with()
+    create_cities_batch._stats_refresher.request_refresh.assert_called_once_with()
+
+
+async def test_create_cities_batch_nothing_saved(
+    create_cities_batch: CreateCitiesBatchCommand, faker: Faker
+) -> None:
+    create_cities_batch._uuid_generator.return_value = uuid.uuid4()
+    create_cities_batch._city_gateway.save_many.return_value = set()
+
+    result = await create_cities_batch(
+        [
+            NewCityDTO(
+                district_id=uuid.uuid4(),
+                name=faker.pystr(),
+                obj_type=faker.pystr(),
+                population=faker.pyint(),
+            )
+        ]
+    )
+
+    assert result == [CreatedCityDTO(error='District not found')]
+    create_cities_batch._version_gateway.bump.assert_not_awaited()
+    create_cities_batch._transaction_manager.commit.assert_not_awaited()
+
+
+async def test_create_cities_batch_empty(
+    create_cities_batch: CreateCitiesBatchCommand,
+) -> None:
+    assert await create_cities_batch([]) == []
+    create_cities_batch._city_gateway.save_many.assert_not_awaited()
+    create_cities_batch._version_gateway.bump.assert_not_awaited()
+    create_cities_batch._transaction_manager.commit.assert_not_awaited()
+    create_cities_batch._stats_refresher.request_refresh.assert_not_called()
 
 
 @pytest.fixture
 def delete_city() -> DeleteCityInteractor:
     city_gateway = create_autospec(CityDeleter)
-    return DeleteCityInteractor(city_gateway)
+    return DeleteCityInteractor(
+        city_gateway,
+        create_autospec(PopulationStatsRefresher),
+        create_autospec(VersionBumper),
+        create_autospec(TransactionManager),
+    )
 
 
-@pytest.mark.parametrize('city_id', [uuid.uuid4(), uuid.uuid4()])
-async def test_delete_city(delete_city: DeleteCityInteractor, city_id: uuid.UUID):
-    result = await delete_city(city_id=city_id)
-    delete_city._city_gateway.delete_by_uuid.assert_awaited_once_with(city_id=city_id)
+async def test_delete_city(delete_city: DeleteCityInteractor, faker: Faker):
+    city = CityDM(
+        id=uuid.uuid4(),
+        district_id=uuid.uuid4(),
+        name=faker.pystr(),
+        obj_type=faker.pystr(),
+        population=faker.pyint(),
+    )
+    delete_city._city_gateway.delete_by_uuid.return_value = city.district_id
+
+    result = await delete_city(city_id=city.id)
+    delete_city._city_gateway.delete_by_uuid.assert_awaited_once_with(city_id=city.id)
+    delete_city._version_gateway.bump.assert_awaited_once_with(
+        [CITIES, district_cities(city.district_id)]
+    )
+    delete_city._transaction_manager.commit.assert_awaited_once_with()
+    delete_city._stats_refresher.request_refresh.assert_called_once_with()
     assert result is None
 
 
+async def test_delete_missing_city(delete_city: DeleteCityInteractor):
+    delete_city._city_gateway.delete_by_uuid.return_value = None
+
+    await delete_city(city_id=uuid.uuid4())
+
+    delete_city._version_gateway.bump.assert_not_awaited()
+    delete_city._transaction_manager.commit.assert_not_awaited()
+    delete_city._stats_refresher.request_refresh.assert_called_once_with()
+
+
 @pytest.fixture
 def update_city(faker: Faker) -> UpdateCityCommand:
-    city_read_gateway = create_autospec(CityReader)
-    city_update_gateway = create_autospec(CityUpdater)
-    district_gateway = create_autospec(DistrictReader)
-    return UpdateCityCommand(city_read_gateway, city_update_gateway, district_gateway)
+    city_gateway = create_autospec(CityUpdater)
+    return UpdateCityCommand(
+        city_gateway,
+        create_autospec(PopulationStatsRefresher),
+        create_autospec(VersionBumper),
+        create_autospec(TransactionManager),
+    )
 
 
 async def test_update_city_success(
     update_city: UpdateCityCommand, faker: Faker
 ) -> None:
     city_id = uuid.uuid4()
-    district_id = uuid.uuid4()
     dto = UpdatedCityDTO(
         city_id=city_id,
-        district_id=district_id,
+        district_id=uuid.uuid4(),
         name=faker.pystr(),
         obj_type=faker.pystr(),
         population=faker.pyint(),
     )
-
-    update_city._district_gateway.get_by_uuid = AsyncMock(return_value=MagicMock())
-    update_city._city_read_gateway.get_by_uuid = AsyncMock(return_value=MagicMock())
+    update_city._city_gateway.update_by_uuid.return_value = dto.district_id
 
     result = await update_city(dto)
 
@@ -174,18 +448,20 @@ async def test_update_city_success(
         obj_type=dto.obj_type,
         population=dto.population,
     )
-    update_city._city_update_gateway.update_by_uuid.assert_awaited_once_with(
-        expected_city
+    update_city._city_gateway.update_by_uuid.assert_awaited_once_with(expected_city)
+    update_city._version_gateway.bump.assert_awaited_once_with(
+        [CITIES, district_cities(dto.district_id)]
     )
-    update_city._district_gateway.get_by_uuid.assert_awaited_once_with(district_id)
-    update_city._city_read_gateway.get_by_uuid.assert_awaited_once_with(city_id)
+    update_city._transaction_manager.commit.assert_awaited_once_with()
+    update_city._stats_refresher.request_refresh.assert_called_once_with()
 
     assert result == city_id
 
 
-async def test_update_city_district_not_exists(
+async def test_update_city_moves_district(
     update_city: UpdateCityCommand, faker: Faker
 ) -> None:
+    previous_district_id = uuid.uuid4()
     dto = UpdatedCityDTO(
         city_id=uuid.uuid4(),
         district_id=uuid.uuid4(),
@@ -193,13 +469,18 @@ async def test_update_city_district_not_exists(
         obj_type=faker.pystr(),
         population=faker.pyint(),
     )
+    update_city._city_gateway.update_by_uuid.return_value = previous_district_id
 
-    update_city._district_gateway.get_by_uuid = AsyncMock(return_value=None)
-
-    with pytest.raises(EntityNotExistsError, match='District does not exist'):
-        await update_city(dto)
+    await update_city(dto)
 
-    update_city._city_update_gateway.update_by_uuid.assert_not_awaited()
+    update_city._version_gateway.bump.assert_awaited_once_with(
+        [
+            CITIES,
+            district_cities(dto.district_id),
+            district_cities(previous_district_id),
+        ]
+    )
+    update_city._transaction_manager.commit.assert_awaited_once_with()
 
 
 async def test_update_city_not_exists(
@@ -213,10 +494,12 @@ async def test_update_city_not_exists(
         population=faker.pyint(),
     )
 
-    update_city._district_gateway.get_by_uuid = AsyncMock(return_value=MagicMock())
-    update_city._city_read_gateway.get_by_uuid = AsyncMock(return_value=None)
+    update_city._city_gateway.update_by_uuid.side_effect = EntityNotExistsError(
+        'City does not exist'
+    )
 
     with pytest.raises(EntityNotExistsError, match='City does not exist'):
         await update_city(dto)
 
-    update_city._city_update_gateway.update_by_uuid.assert_not_awaited()
+    update_city._version_gateway.bump.assert_not_awaited()
+    update_city._transaction_manager.commit.assert_not_awaited()
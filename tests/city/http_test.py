@@ -1,3 +1,4 @@
+import json
 import uuid
 from collections.abc import AsyncIterator
 
@@ -7,13 +8,17 @@ from dishka.integrations import fastapi as fastapi_integration
 from faker import Faker
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import insert
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.dto.city import NewCityDTO, UpdatedCityDTO
+from app.application.lookup import MAX_LOOKUP_IDS
+from app.domain.entities.city import CityDM
 from app.infrastructure.db.models import City as CityModel
 from app.infrastructure.db.models import District, Region
 from app.presentation.api.city import city_router
+from app.presentation.api.encoding import CITIES_ENCODER
+from app.presentation.schemas.city import City
 
 
 @pytest.fixture
@@ -33,6 +38,19 @@ async def http_client(http_app: FastAPI) -> AsyncIterator[AsyncClient]:
         yield client
 
 
+@pytest.fixture
+async def district_id(session: AsyncSession, faker: Faker) -> uuid.UUID:
+    region_id = uuid.uuid4()
+    district_id = uuid.uuid4()
+    await session.execute(
+        insert(Region).values(id=region_id, name=faker.pystr(), capital=faker.pystr())
+    )
+    await session.execute(
+        insert(District).values(id=district_id, region_id=region_id, name=faker.pystr())
+    )
+    return district_id
+
+
 async def test_get_cities(
     session: AsyncSession,
     http_client: AsyncClient,
@@ -81,6 +99,82 @@ async def test_get_cities(
     assert result.json()[0]['population'] == population
 
 
+async def test_get_cities_pagination(
+    session: AsyncSession,
+    http_client: AsyncClient,
+    district_id: uuid.UUID,
+    faker: Faker,
+) -> None:
+    city_ids = sorted(str(uuid.uuid4()) for _ in range(3))
+    for city_id in city_ids:
+        await session.execute(
+            insert(CityModel).values(
+                id=city_id,
+                district_id=district_id,
+                name=faker.pystr(),
+                obj_type=faker.pystr(),
+                population=faker.pyint(),
+            )
+        )
+    await session.commit()
+
+    first_page = await http_client.get('/cities/get_cities?limit=2')
+    assert first_page.status_code == 200
+    assert [city['id'] for city in first_page.json()] == city_ids[:2]
+
+    cursor = first_page.headers['X-Next-Cursor']
+    second_page = await http_client.get(f'/cities/get_cities?limit=2&cursor={cursor}')
+    assert second_page.status_code == 200
+    assert [city['id'] for city in second_page.json()] == city_ids[2:]
+    assert 'X-Next-Cursor' not in second_page.headers
+
+
+async def test_get_cities_invalid_cursor(
+    http_client: AsyncClient,
+) -> None:
+    result = await http_client.get('/cities/get_cities?cursor=not-a-cursor')
+    assert result.status_code == 400
+    assert result.json()['detail'] == 'Invalid pagination cursor'
+
+
+async def test_export_cities(
+    session: AsyncSession,
+    http_client: AsyncClient,
+    district_id: uuid.UUID,
+    faker: Faker,
+) -> None:
+    city_ids = sorted(str(uuid.uuid4()) for _ in range(3))
+    for city_id in city_ids:
+        await session.execute(
+            insert(CityModel).values(
+                id=city_id,
+                district_id=district_id,
+                name=faker.pystr(),
+                obj_type=faker.pystr(),
+                population=faker.pyint(),
+            )
+        )
+    await session.commit()
+
+    ndjson = await http_client.get('/cities/export_cities')
+    assert ndjson.status_code == 200
+    assert ndjson.headers['content-type'] == 'application/x-ndjson'
+    lines = ndjson.text.splitlines()
+    assert sorted(json.loads(line)['id'] for line in lines) == city_ids
+
+    json_array = await http_client.get('/cities/export_cities?format=json')
+    assert json_array.status_code == 200
+    assert sorted(city['id'] for city in json_array.json()) == city_ids
+
+
+async def test_export_empty_cities(
+    http_client: AsyncClient,
+) -> None:
+    result = await http_client.get('/cities/export_cities?format=json')
+    assert result.status_code == 200
+    assert result.json() == []
+
+
 async def test_empty_get_cities(
     http_client: AsyncClient,
 ) -> None:
@@ -150,6 +244,37 @@ async def test_get_empty_cities_by_district_id(
     assert result.json()['detail'] == 'Cities not found for this district'
 
 
+async def test_get_cities_by_district_ids(
+    session: AsyncSession,
+    http_client: AsyncClient,
+    district_id: uuid.UUID,
+    faker: Faker,
+) -> None:
+    city_id = uuid.uuid4()
+    await session.execute(
+        insert(CityModel).values(
+            id=city_id,
+            district_id=district_id,
+            name=faker.pystr(),
+            obj_type='city',
+            population=faker.pyint(),
+        )
+    )
+    await session.commit()
+    missing_id = uuid.uuid4()
+
+    result = await http_client.post(
+        '/cities/get_cities_by_districts',
+        json=[str(missing_id), str(district_id)],
+    )
+    assert result.status_code == 200
+
+    body = result.json()
+    assert [group['district_id'] for group in body['groups']] == [str(district_id)]
+    assert body['groups'][0]['cities'][0]['id'] == str(city_id)
+    assert body['missing_district_ids'] == [str(missing_id)]
+
+
 async def test_get_city_by_id(
     session: AsyncSession,
     http_client: AsyncClient,
@@ -197,6 +322,77 @@ async def test_get_city_by_id(
     assert result.json()['population'] == population
 
 
+async def test_get_cities_by_ids(
+    session: AsyncSession,
+    http_client: AsyncClient,
+    district_id: uuid.UUID,
+    faker: Faker,
+) -> None:
+    city_id = uuid.uuid4()
+    await session.execute(
+        insert(CityModel).values(
+            id=city_id,
+            district_id=district_id,
+            name=faker.pystr(),
+            obj_type='city',
+            population=faker.pyint(),
+        )
+    )
+    await session.commit()
+    missing_id = uuid.uuid4()
+
+    result = await http_client.post(
+        '/cities/get_cities_by_ids', json=[str(missing_id), str(city_id)]
+    )
+    assert result.status_code == 200
+
+    assert result.json()[0] == {'id': str(missing_id), 'city': None}
+    assert result.json()[1]['id'] == str(city_id)
+    assert result.json()[1]['city']['district_id'] == str(district_id)
+
+
+async def test_get_cities_by_too_many_ids(http_client: AsyncClient) -> None:
+    result = await http_client.post(
+        '/cities/get_cities_by_ids',
+        json=[str(uuid.uuid4()) for _ in range(MAX_LOOKUP_IDS + 1)],
+    )
+    assert result.status_code == 422
+
+
+async def test_search_cities(
+    session: AsyncSession,
+    http_client: AsyncClient,
+    district_id: uuid.UUID,
+) -> None:
+    await session.execute(
+        insert(CityModel),
+        [
+            {
+                'id': uuid.uuid4(),
+                'district_id': district_id,
+                'name': name,
+                'obj_type': 'city',
+                'population': 1,
+            }
+            for name in ['Novosibirsk', 'Novgorod', 'Tver']
+        ],
+    )
+    await session.commit()
+
+    result = await http_client.get('/cities/search_cities?query=nov&mode=prefix')
+    assert result.status_code == 200
+    assert [city['name'] for city in result.json()] == ['Novgorod', 'Novosibirsk']
+
+    result = await http_client.get('/cities/search_cities?query=nov&limit=1')
+    assert [city['name'] for city in result.json()] == ['Novgorod']
+
+    result = await http_client.get('/cities/search_cities?query=omsk')
+    assert result.status_code == 404
+
+    result = await http_client.get('/cities/search_cities?query=')
+    assert result.status_code == 422
+
+
 async def test_get_empty_city_by_id(
     http_client: AsyncClient,
 ) -> None:
@@ -206,6 +402,117 @@ async def test_get_empty_city_by_id(
     assert result.json()['detail'] == 'City not found'
 
 
+async def test_get_cities_not_modified(
+    http_client: AsyncClient, district_id: uuid.UUID
+) -> None:
+    new_city = {
+        'district_id': str(district_id),
+        'name': 'city',
+        'obj_type': 'city',
+        'population': 100,
+    }
+    await http_client.post('/cities/create_city', json=new_city)
+
+    result = await http_client.get('/cities/get_cities')
+    assert result.status_code == 200
+    etag = result.headers['ETag']
+    assert result.headers['Cache-Control'] == 'max-age=0'
+
+    result = await http_client.get(
+        '/cities/get_cities', headers={'If-None-Match': etag}
+    )
+    assert result.status_code == 304
+    assert result.headers['ETag'] == etag
+    assert result.content == b''
+
+    await http_client.post('/cities/create_city', json=new_city)
+
+    result = await http_client.get(
+        '/cities/get_cities', headers={'If-None-Match': etag}
+    )
+    assert result.status_code == 200
+    assert result.headers['ETag'] != etag
+    assert len(result.json()) == 2
+
+
+async def test_get_cities_by_district_not_modified(
+    session: AsyncSession, http_client: AsyncClient, district_id: uuid.UUID
+) -> None:
+    other_district_id = uuid.uuid4()
+    await session.execute(
+        insert(District).values(
+            id=other_district_id,
+            region_id=select(District.region_id)
+            .where(District.id == district_id)
+            .scalar_subquery(),
+            name='other district',
+        )
+    )
+    created = await http_client.post(
+        '/cities/create_city',
+        json={
+            'district_id': str(district_id),
+            'name': 'city',
+            'obj_type': 'city',
+            'population': 100,
+        },
+    )
+    url = f'/cities/get_cities_by_district?district_id={district_id}'
+    etag = (await http_client.get(url)).headers['ETag']
+
+    await http_client.put(
+        '/cities/update_city',
+        json={
+            'city_id': created.json(),
+            'district_id': str(other_district_id),
+            'name': 'city',
+            'obj_type': 'city',
+            'population': 100,
+        },
+    )
+
+    # The city left the district, so its list changed.
+    result = await http_client.get(url, headers={'If-None-Match': etag})
+    assert result.status_code == 404
+
+
+async def test_get_city_by_id_not_modified(
+    http_client: AsyncClient, district_id: uuid.UUID
+) -> None:
+    created = await http_client.post(
+        '/cities/create_city',
+        json={
+            'district_id': str(district_id),
+            'name': 'city',
+            'obj_type': 'city',
+            'population': 100,
+        },
+    )
+    url = f'/cities/get_city_by_id?city_id={created.json()}'
+
+    result = await http_client.get(url)
+    assert result.status_code == 200
+    etag = result.headers['ETag']
+
+    result = await http_client.get(url, headers={'If-None-Match': f'"x", {etag}'})
+    assert result.status_code == 304
+
+    await http_client.put(
+        '/cities/update_city',
+        json={
+            'city_id': created.json(),
+            'district_id': str(district_id),
+            'name': 'renamed city',
+            'obj_type': 'city',
+            'population': 100,
+        },
+    )
+
+    result = await http_client.get(url, headers={'If-None-Match': etag})
+    assert result.status_code == 200
+    assert result.json()['name'] == 'renamed city'
+
+
 async def test_create_city(
     session: AsyncSession,
     http_client: AsyncClient,
@@ -262,6 +569,64 @@ async def test_create_city(
     assert result_obj.json()['population'] == population
 
 
+async def test_create_cities(
+    session: AsyncSession,
+    http_client: AsyncClient,
+    district_id: uuid.UUID,
+    faker: Faker,
+) -> None:
+    payload = [
+        {
+            'district_id': str(district),
+            'name': faker.pystr(),
+            'obj_type': faker.pystr(),
+            'population': faker.pyint(),
+        }
+        for district in (district_id, uuid.uuid4())
+    ]
+
+    result = await http_client.post('/cities/create_cities', json=payload)
+
+    assert result.status_code == 200
+    created, failed = result.json()
+    assert failed == {'city_id': None, 'error': 'District not found'}
+    assert created['error'] is None
+
+    result_obj = await http_client.get(
+        f'/cities/get_city_by_id?city_id={created["city_id"]}'
+    )
+    assert result_obj.status_code == 200
+    assert result_obj.json()['name'] == payload[0]['name']
+
+
+async def test_create_cities_in_deleted_district(
+    session: AsyncSession,
+    http_client: AsyncClient,
+    district_id: uuid.UUID,
+    faker: Faker,
+) -> None:
+    await session.execute(
+        update(District).where(District.id == district_id).values(is_deleted=True)
+    )
+    payload = [
+        {
+            'district_id': str(district_id),
+            'name': faker.pystr(),
+            'obj_type': faker.pystr(),
+            'population': faker.pyint(),
+        }
+    ]
+
+    result = await http_client.post('/cities/create_cities', json=payload)
+
+    assert result.status_code == 200
+    assert result.json() == [{'city_id': None, 'error': 'District not found'}]
+    rows = await session.execute(
+        select(CityModel).where(CityModel.district_id == district_id)
+    )
+    assert rows.first() is None
+
+
 async def test_create_city_with_nonexistent_district(
     http_client: AsyncClient,
     faker: Faker,
@@ -456,3 +821,18 @@ async def test_update_nonexistent_city(
 
     assert result.status_code == 404
     assert result.json()['detail'] == 'City does not exist'
+
+
+def test_encoder_matches_schema(faker: Faker) -> None:
+    city_dm = CityDM(
+        id=uuid.uuid4(),
+        district_id=uuid.uuid4(),
+        name=faker.pystr(),
+        obj_type=faker.pystr(),
+        population=faker.pyint(),
+    )
+
+    # The fast path must send what the declared response model would.
+    assert json.loads(CITIES_ENCODER.dump_json([city_dm])) == [
+        json.loads(City.model_validate(city_dm, from_attributes=True).model_dump_json())
+    ]
@@ -1,9 +1,17 @@
+import asyncio
+import uuid
+
 import pytest
 from faker import Faker
-from sqlalchemy import insert, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, insert, select, text, update
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.application.errors import EntityNotExistsError
+from app.application.search import SearchMode
 from app.domain.entities.city import CityDM
+from app.infrastructure.cache.city import CachedCityGateway, CityCache
+from app.infrastructure.db.errors import is_foreign_key_violation
 from app.infrastructure.db.models import City, District, Region
 from app.infrastructure.gateway.city import CityGateway
 
@@ -15,10 +23,29 @@ async def city_gateway(session: AsyncSession) -> CityGateway:
     return CityGateway(session=session)
 
 
+async def insert_district(session: AsyncSession, faker: Faker) -> str:
+    region_id = faker.uuid4()
+    district_id = faker.uuid4()
+    await session.execute(
+        insert(Region).values(id=region_id, name=faker.pystr(), capital=faker.pystr())
+    )
+    await session.execute(
+        insert(District).values(id=district_id, region_id=region_id, name=faker.pystr())
+    )
+    return district_id
+
+
+@pytest.fixture
+async def district_id(session: AsyncSession, faker: Faker) -> str:
+    return await insert_district(session, faker)
+
+
 async def test_create_city(
-    session: AsyncSession, city_gateway: CityGateway, faker: Faker
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
 ) -> None:
-    district_id = faker.uuid4()
     city_id = faker.uuid4()
     name = faker.pystr()
     obj_type = faker.pystr()
@@ -45,11 +72,14 @@ async def test_create_city(
 
 
 async def test_save_city(
-    session: AsyncSession, city_gateway: CityGateway, faker: Faker
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
 ) -> None:
     city = CityDM(
         id=faker.uuid4(),
-        district_id=faker.uuid4(),
+        district_id=district_id,
         name=faker.pystr(),
         obj_type=faker.pystr(),
         population=faker.pyint(),
@@ -65,10 +95,10 @@ async def test_save_city(
     assert result.population == city.population
 
 
-async def test_create_few_cities(
+async def test_save_city_district_not_exists(
     session: AsyncSession, city_gateway: CityGateway, faker: Faker
 ) -> None:
-    city_first = CityDM(
+    city = CityDM(
         id=faker.uuid4(),
         district_id=faker.uuid4(),
         name=faker.pystr(),
@@ -76,9 +106,29 @@ async def test_create_few_cities(
         population=faker.pyint(),
     )
 
+    with pytest.raises(EntityNotExistsError):
+        await city_gateway.save(city)
+
+    assert await city_gateway.get_by_uuid(city.id) is None
+
+
+async def test_create_few_cities(
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
+) -> None:
+    city_first = CityDM(
+        id=faker.uuid4(),
+        district_id=district_id,
+        name=faker.pystr(),
+        obj_type=faker.pystr(),
+        population=faker.pyint(),
+    )
+
     city_second = CityDM(
         id=faker.uuid4(),
-        district_id=faker.uuid4(),
+        district_id=district_id,
         name=faker.pystr(),
         obj_type=faker.pystr(),
         population=faker.pyint(),
@@ -86,11 +136,61 @@ async def test_create_few_cities(
 
     await city_gateway.save(city_first)
     await city_gateway.save(city_second)
-    result = await city_gateway.get_cities()
+    result = await city_gateway.get_cities(limit=10)
 
     assert len(result) == 2
-    assert str(result[0].id) == city_first.id
-    assert str(result[1].id) == city_second.id
+    assert [str(city.id) for city in result] == sorted([city_first.id, city_second.id])
+
+
+async def test_get_cities_keyset(
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
+) -> None:
+    cities = [
+        CityDM(
+            id=faker.uuid4(),
+            district_id=district_id,
+            name=faker.pystr(),
+            obj_type=faker.pystr(),
+            population=faker.pyint(),
+        )
+        for _ in range(5)
+    ]
+    for city in cities:
+        await city_gateway.save(city)
+    expected_ids = sorted(city.id for city in cities)
+
+    first_page = await city_gateway.get_cities(limit=3)
+    second_page = await city_gateway.get_cities(limit=3, after_id=first_page[-1].id)
+
+    assert [str(city.id) for city in first_page] == expected_ids[:3]
+    assert [str(city.id) for city in second_page] == expected_ids[3:]
+
+
+async def test_stream_cities(
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
+) -> None:
+    cities = [
+        CityDM(
+            id=faker.uuid4(),
+            district_id=district_id,
+            name=faker.pystr(),
+            obj_type=faker.pystr(),
+            population=faker.pyint(),
+        )
+        for _ in range(5)
+    ]
+    for city in cities:
+        await city_gateway.save(city)
+
+    result = [city async for city in city_gateway.stream_cities(chunk_size=2)]
+
+    assert sorted(str(city.id) for city in result) == sorted(city.id for city in cities)
 
 
 async def test_get_cities_by_district_id(
@@ -139,11 +239,55 @@ async def test_get_cities_by_district_id(
     assert result[0].population == population
 
 
-async def test_delete_city(
+async def test_get_cities_by_district_ids(
     session: AsyncSession, city_gateway: CityGateway, faker: Faker
+) -> None:
+    district_id = await insert_district(session, faker)
+    empty_district_id = await insert_district(session, faker)
+    deleted_district_id = await insert_district(session, faker)
+    await session.execute(
+        update(District)
+        .where(District.id == deleted_district_id)
+        .values(is_deleted=True)
+    )
+    cities = sorted(
+        (
+            CityDM(
+                id=uuid.uuid4(),
+                district_id=uuid.UUID(district_id),
+                name=faker.pystr(),
+                obj_type='city',
+                population=faker.pyint(),
+            )
+            for _ in range(3)
+        ),
+        key=lambda city: city.id,
+    )
+    await city_gateway.save_many(cities)
+    await city_gateway.delete_by_uuid(cities[-1].id)
+
+    result = await city_gateway.get_cities_by_district_uuids(
+        [
+            uuid.UUID(district_id),
+            uuid.UUID(empty_district_id),
+            uuid.UUID(deleted_district_id),
+            uuid.uuid4(),
+        ]
+    )
+
+    assert result == {
+        uuid.UUID(district_id): cities[:2],
+        uuid.UUID(empty_district_id): [],
+    }
+
+
+async def test_delete_city(
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
 ) -> None:
     city_id = faker.uuid4()
-    district_id = faker.uuid4()
     name = faker.pystr()
     obj_type = faker.pystr()
     population = faker.pyint()
@@ -159,7 +303,9 @@ async def test_delete_city(
     await session.execute(stmt)
     await session.commit()
 
-    await city_gateway.delete_by_uuid(city_id)
+    deleted_from = await city_gateway.delete_by_uuid(city_id)
+    assert str(deleted_from) == district_id
+    assert await city_gateway.delete_by_uuid(city_id) is None
 
     result = await city_gateway.get_by_uuid(city_id)
     assert result is None
@@ -171,10 +317,12 @@ async def test_delete_city(
 
 
 async def test_update_city(
-    session: AsyncSession, city_gateway: CityGateway, faker: Faker
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
 ) -> None:
     city_id = faker.uuid4()
-    district_id = faker.uuid4()
     old_name = faker.pystr()
     old_obj_type = faker.pystr()
     old_population = faker.pyint()
@@ -202,10 +350,429 @@ async def test_update_city(
         population=new_population,
     )
 
-    await city_gateway.update_by_uuid(updated_city)
+    previous_district_id = await city_gateway.update_by_uuid(updated_city)
     result = await city_gateway.get_by_uuid(city_id)
 
+    assert str(previous_district_id) == district_id
+
     assert str(result.id) == city_id
     assert result.name == new_name
     assert result.obj_type == new_obj_type
     assert result.population == new_population
+
+
+async def test_update_city_returns_previous_district(
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
+) -> None:
+    other_district_id = await insert_district(session, faker)
+    city = CityDM(
+        id=faker.uuid4(),
+        district_id=district_id,
+        name=faker.pystr(),
+        obj_type=faker.pystr(),
+        population=faker.pyint(),
+    )
+    await city_gateway.save(city)
+
+    moved_city = CityDM(
+        id=city.id,
+        district_id=other_district_id,
+        name=city.name,
+        obj_type=city.obj_type,
+        population=city.population,
+    )
+    previous_district_id = await city_gateway.update_by_uuid(moved_city)
+
+    assert str(previous_district_id) == district_id
+
+
+async def test_update_city_district_not_exists(
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
+) -> None:
+    city = CityDM(
+        id=faker.uuid4(),
+        district_id=district_id,
+        name=faker.pystr(),
+        obj_type=faker.pystr(),
+        population=faker.pyint(),
+    )
+    await city_gateway.save(city)
+
+    moved_city = CityDM(
+        id=city.id,
+        district_id=faker.uuid4(),
+        name=city.name,
+        obj_type=city.obj_type,
+        population=city.population,
+    )
+
+    with pytest.raises(EntityNotExistsError, match='District does not exist'):
+        await city_gateway.update_by_uuid(moved_city)
+
+    result = await city_gateway.get_by_uuid(city.id)
+    assert str(result.district_id) == district_id
+
+
+async def test_update_deleted_city(
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
+) -> None:
+    city = CityDM(
+        id=faker.uuid4(),
+        district_id=district_id,
+        name=faker.pystr(),
+        obj_type=faker.pystr(),
+        population=faker.pyint(),
+    )
+    await city_gateway.save(city)
+    await city_gateway.delete_by_uuid(city.id)
+
+    with pytest.raises(EntityNotExistsError, match='City does not exist'):
+        await city_gateway.update_by_uuid(city)
+
+
+async def test_stream_cities_by_district_id(
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
+) -> None:
+    city = CityDM(
+        id=faker.uuid4(),
+        district_id=district_id,
+        name=faker.pystr(),
+        obj_type=faker.pystr(),
+        population=faker.pyint(),
+    )
+    other_city = CityDM(
+        id=faker.uuid4(),
+        district_id=await insert_district(session, faker),
+        name=faker.pystr(),
+        obj_type=faker.pystr(),
+        population=faker.pyint(),
+    )
+    await city_gateway.save(city)
+    await city_gateway.save(other_city)
+
+    result = [
+        city
+        async for city in city_gateway.stream_cities_by_district_uuid(
+            district_id, chunk_size=1
+        )
+    ]
+
+    assert len(result) == 1
+    assert str(result[0].id) == city.id
+
+
+async def test_get_by_uuids(
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
+) -> None:
+    cities = [
+        CityDM(
+            id=uuid.uuid4(),
+            district_id=uuid.UUID(district_id),
+            name=faker.pystr(),
+            obj_type=faker.pystr(),
+            population=faker.pyint(),
+        )
+        for _ in range(3)
+    ]
+    await city_gateway.save_many(cities)
+    await city_gateway.delete_by_uuid(cities[2].id)
+
+    result = await city_gateway.get_by_uuids(
+        [cities[0].id, cities[1].id, cities[2].id, uuid.uuid4()]
+    )
+
+    assert result == {cities[0].id: cities[0], cities[1].id: cities[1]}
+
+
+async def test_cached_get_by_uuids(
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
+) -> None:
+    cache = CityCache(max_size=10, ttl=60)
+    cached_gateway = CachedCityGateway(city_gateway, cache, session)
+    cities = [
+        CityDM(
+            id=uuid.uuid4(),
+            district_id=uuid.UUID(district_id),
+            name=faker.pystr(),
+            obj_type=faker.pystr(),
+            population=faker.pyint(),
+        )
+        for _ in range(2)
+    ]
+    await city_gateway.save_many(cities)
+    await cached_gateway.get_by_uuid(cities[0].id)
+    missing_id = uuid.uuid4()
+
+    result = await cached_gateway.get_by_uuids([cities[0].id, cities[1].id, missing_id])
+
+    assert result == {city.id: city for city in cities}
+    assert cache.get(cities[1].id) == cities[1]
+    assert cache.get(missing_id) is None
+
+
+async def test_cached_get_by_uuid(
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
+) -> None:
+    cache = CityCache(max_size=10, ttl=60)
+    cached_gateway = CachedCityGateway(city_gateway, cache, session)
+    city = CityDM(
+        id=uuid.uuid4(),
+        district_id=uuid.UUID(district_id),
+        name=faker.pystr(),
+        obj_type=faker.pystr(),
+        population=faker.pyint(),
+    )
+    await city_gateway.save(city)
+
+    first = await cached_gateway.get_by_uuid(city.id)
+    second = await cached_gateway.get_by_uuid(city.id)
+
+    assert first == second == city
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 1
+
+    await cached_gateway.delete_by_uuid(city.id)
+
+    assert await cached_gateway.get_by_uuid(city.id) is None
+    assert cache.stats.invalidations == 1
+
+
+async def test_cached_update_invalidates(
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
+) -> None:
+    cached_gateway = CachedCityGateway(
+        city_gateway, CityCache(max_size=10, ttl=60), session
+    )
+    city = CityDM(
+        id=uuid.uuid4(),
+        district_id=uuid.UUID(district_id),
+        name=faker.pystr(),
+        obj_type=faker.pystr(),
+        population=faker.pyint(),
+    )
+    await city_gateway.save(city)
+    await cached_gateway.get_by_uuid(city.id)
+
+    updated_city = CityDM(
+        id=city.id,
+        district_id=city.district_id,
+        name=faker.pystr(),
+        obj_type=city.obj_type,
+        population=city.population,
+    )
+    await cached_gateway.update_by_uuid(updated_city)
+
+    assert await cached_gateway.get_by_uuid(city.id) == updated_city
+
+
+async def test_save_many_cities(
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
+) -> None:
+    cities = [
+        CityDM(
+            id=uuid.uuid4(),
+            district_id=uuid.UUID(district_id),
+            name=faker.pystr(),
+            obj_type=faker.pystr(),
+            population=faker.pyint(),
+        )
+        for _ in range(3)
+    ]
+
+    saved_ids = await city_gateway.save_many(cities)
+
+    assert saved_ids == {city.id for city in cities}
+    for city in cities:
+        assert await city_gateway.get_by_uuid(city.id) == city
+
+
+async def test_save_duplicate_cities(
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
+) -> None:
+    city = CityDM(
+        id=uuid.uuid4(),
+        district_id=uuid.UUID(district_id),
+        name=faker.pystr(),
+        obj_type=faker.pystr(),
+        population=faker.pyint(),
+    )
+    await city_gateway.save(city)
+
+    # Only a missing district is reported as one.
+    with pytest.raises(IntegrityError):
+        await city_gateway.save_many([city])
+
+
+async def test_foreign_key_violation(session: AsyncSession, faker: Faker) -> None:
+    with pytest.raises(IntegrityError) as error:
+        await session.execute(
+            insert(City).values(
+                id=uuid.uuid4(),
+                district_id=uuid.uuid4(),
+                name=faker.pystr(),
+                obj_type=faker.pystr(),
+                population=faker.pyint(),
+            )
+        )
+
+    assert is_foreign_key_violation(error.value)
+
+
+async def test_save_many_skips_deleted_districts(
+    session: AsyncSession,
+    city_gateway: CityGateway,
+    district_id: str,
+    faker: Faker,
+) -> None:
+    deleted_district_id = await insert_district(session, faker)
+    await session.execute(
+        update(District)
+        .where(District.id == deleted_district_id)
+        .values(is_deleted=True)
+    )
+    cities = [
+        CityDM(
+            id=uuid.uuid4(),
+            district_id=uuid.UUID(district),
+            name=faker.pystr(),
+            obj_type=faker.pystr(),
+            population=faker.pyint(),
+        )
+        for district in (district_id, deleted_district_id, faker.uuid4())
+    ]
+
+    saved_ids = await city_gateway.save_many(cities)
+
+    assert saved_ids == {cities[0].id}
+    assert await city_gateway.get_by_uuid(cities[1].id) is None
+
+
+async def test_save_many_waits_for_a_concurrent_district_delete(
+    session_maker: async_sessionmaker[AsyncSession], faker: Faker
+) -> None:
+    async with session_maker() as setup:
+        district_id = await insert_district(setup, faker)
+        await setup.commit()
+
+    city = CityDM(
+        id=uuid.uuid4(),
+        district_id=uuid.UUID(district_id),
+        name=faker.pystr(),
+        obj_type=faker.pystr(),
+        population=faker.pyint(),
+    )
+    try:
+        async with session_maker() as deleting, session_maker() as saving:
+            # The delete holds the district row until it commits, so the
+            # insert has to wait and then sees the district as deleted.
+            await deleting.execute(
+                update(District)
+                .where(District.id == district_id)
+                .values(is_deleted=True)
+            )
+            save = asyncio.create_task(CityGateway(saving).save_many([city]))
+            await asyncio.sleep(0.2)
+            assert not save.done()
+
+            await deleting.commit()
+            assert await save == set()
+            await saving.commit()
+    finally:
+        async with session_maker() as cleanup:
+            region_id = await cleanup.scalar(
+                select(District.region_id).where(District.id == district_id)
+            )
+            await cleanup.execute(delete(City).where(City.id == city.id))
+            await cleanup.execute(delete(District).where(District.id == district_id))
+            await cleanup.execute(delete(Region).where(Region.id == region_id))
+            await cleanup.commit()
+
+
+async def insert_named_cities(
+    city_gateway: CityGateway, district_id: str, names: list[str]
+) -> None:
+    await city_gateway.save_many(
+        [
+            CityDM(
+                id=uuid.uuid4(),
+                district_id=uuid.UUID(district_id),
+                name=name,
+                obj_type='city',
+                population=1,
+            )
+            for name in names
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    ('mode', 'query', 'expected'),
+    [
+        (SearchMode.PREFIX, 'mos', ['Mosk', 'Moscow']),
+        (SearchMode.SUBSTRING, 'os', ['Mosk', 'Moscow', 'Kostroma']),
+        (SearchMode.SUBSTRING, '100%', ['100% City']),
+    ],
+)
+async def test_search_by_name(
+    city_gateway: CityGateway,
+    district_id: str,
+    mode: SearchMode,
+    query: str,
+    expected: list[str],
+) -> None:
+    await insert_named_cities(
+        city_gateway, district_id, ['Moscow', 'Mosk', 'Kostroma', '100% City', '1000']
+    )
+
+    result = await city_gateway.search_by_name(query, mode, limit=10)
+
+    assert [city.name for city in result] == expected
+
+
+@pytest.fixture
+async def pg_trgm(session: AsyncSession) -> None:
+    try:
+        async with session.begin_nested():
+            await session.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+    except DBAPIError:
+        pytest.skip('pg_trgm is not available on the test server')
+
+
+async def test_search_by_name_similar(
+    pg_trgm: None, city_gateway: CityGateway, district_id: str
+) -> None:
+    await insert_named_cities(city_gateway, district_id, ['Moscow', 'Kostroma'])
+
+    result = await city_gateway.search_by_name('Moskow', SearchMode.SIMILAR, limit=10)
+
+    assert [city.name for city in result] == ['Moscow']
@@ -72,5 +72,9 @@ def test_config(postgres_config: PostgresConfig) -> Config:
 
 
 @pytest.fixture
-def container(mock_provider: Provider, test_config) -> AsyncContainer:
-    return make_async_container(mock_provider, context={Config: test_config})
+async def container(
+    mock_provider: Provider, test_config
+) -> AsyncGenerator[AsyncContainer, Any]:
+    container = make_async_container(mock_provider, context={Config: test_config})
+    yield container
+    await container.close()
@@ -1,5 +1,5 @@
 import uuid
-from unittest.mock import AsyncMock, MagicMock, create_autospec
+from unittest.mock import MagicMock, create_autospec
 
 import pytest
 from faker import Faker
@@ -7,10 +7,12 @@ from faker import Faker
 from app.application.commands.district import CreateDistrictCommand
 from app.application.dto.district import NewDistrictDTO
 from app.application.errors import EntityNotExistsError
+from app.application.grouping import Group, Grouped
 from app.application.interactors.district import (
     DeleteDistrictInteractor,
     GetDistrictByIdInteractor,
     GetDistrictsByRegionIdInteractor,
+    GetDistrictsByRegionIdsInteractor,
     GetDistrictsInteractor,
 )
 from app.application.interface.district.district import (
@@ -18,7 +20,11 @@ from app.application.interface.district.district import (
     DistrictReader,
     DistrictSaver,
 )
-from app.application.interface.region.region import RegionReader
+from app.application.interface.stats.stats import PopulationStatsRefresher
+from app.application.interface.transaction import TransactionManager
+from app.application.interface.version.version import VersionBumper
+from app.application.pagination import Page
+from app.application.versions import DISTRICTS, region_districts
 from app.domain.entities.district import DistrictDM
 
 
@@ -29,11 +35,13 @@ def get_districts_interactor() -> GetDistrictsInteractor:
 
 
 async def test_get_districts(get_districts_interactor: GetDistrictsInteractor) -> None:
-    result = await get_districts_interactor()
-    get_districts_interactor._district_gateway.get_districts.assert_awaited_once_with()
-    assert (
-        result == get_districts_interactor._district_gateway.get_districts.return_value
+    get_districts_interactor._district_gateway.get_districts.return_value = []
+
+    result = await get_districts_interactor(limit=10)
+    get_districts_interactor._district_gateway.get_districts.assert_awaited_once_with(
+        limit=11, after_id=None
     )
+    assert result == Page(items=[], next_cursor=None)
 
 
 @pytest.fixture
@@ -56,6 +64,22 @@ async def test_get_district_by_region_id(
     )
 
 
+async def test_get_districts_by_region_ids() -> None:
+    interactor = GetDistrictsByRegionIdsInteractor(create_autospec(DistrictReader))
+    found_id, missing_id = uuid.uuid4(), uuid.uuid4()
+    district = DistrictDM(id=uuid.uuid4(), region_id=found_id, name='district')
+    interactor._district_gateway.get_districts_by_region_uuids.return_value = {
+        found_id: [district]
+    }
+
+    result = await interactor([found_id, missing_id])
+
+    assert result == Grouped(
+        groups=[Group(parent_id=found_id, items=[district])],
+        missing_parent_ids=[missing_id],
+    )
+
+
 @pytest.fixture
 def get_district_by_uuid() -> GetDistrictByIdInteractor:
     district_gateway = create_autospec(DistrictReader)
@@ -76,9 +100,13 @@ async def test_get_district_by_uuid(
 @pytest.fixture
 def create_district(faker: Faker) -> CreateDistrictCommand:
     district_gateway = create_autospec(DistrictSaver)
-    region_gateway = create_autospec(RegionReader)
     uuid_generator = MagicMock(return_value=faker.uuid4())
-    return CreateDistrictCommand(district_gateway, region_gateway, uuid_generator)
+    return CreateDistrictCommand(
+        district_gateway,
+        uuid_generator,
+        create_autospec(VersionBumper),
+        create_autospec(TransactionManager),
+    )
 
 
 async def test_create_district_success(
@@ -87,13 +115,14 @@ async def test_create_district_success(
     region_id = create_district._uuid_generator()
     dto = NewDistrictDTO(name=f'test_district_{uuid.uuid4()}', region_id=region_id)
 
-    create_district._region_gateway.get_by_uuid = AsyncMock(return_value=MagicMock())
-
     result = await create_district(dto)
 
     expected_district = DistrictDM(id=result, region_id=dto.region_id, name=dto.name)
     create_district._district_gateway.save.assert_awaited_once_with(expected_district)
-    create_district._region_gateway.get_by_uuid.assert_awaited_once_with(region_id)
+    create_district._version_gateway.bump.assert_awaited_once_with(
+        [DISTRICTS, region_districts(dto.region_id)]
+    )
+    create_district._transaction_manager.commit.assert_awaited_once_with()
 
     assert isinstance(result, str)
     assert result == region_id
@@ -104,26 +133,38 @@ async def test_create_district_region_not_exists(
 ) -> None:
     dto = NewDistrictDTO(name=f'test_district_{uuid.uuid4()}', region_id=uuid.uuid4())
 
-    create_district._region_gateway.get_by_uuid = AsyncMock(return_value=None)
+    create_district._district_gateway.save.side_effect = EntityNotExistsError(
+        'Region does not exist'
+    )
 
     with pytest.raises(EntityNotExistsError):
         await create_district(dto)
 
-    create_district._district_gateway.save.assert_not_awaited()
+    create_district._district_gateway.save.assert_awaited_once()
 
 
 @pytest.fixture
 def delete_district() -> DeleteDistrictInteractor:
     district_gateway = create_autospec(DistrictDeleter)
-    return DeleteDistrictInteractor(district_gateway)
+    return DeleteDistrictInteractor(
+        district_gateway,
+        create_autospec(PopulationStatsRefresher),
+        create_autospec(VersionBumper),
+        create_autospec(TransactionManager),
+    )
 
 
-@pytest.mark.parametrize('district_id', [uuid.uuid4(), uuid.uuid4()])
-async def test_delete_district(
-    delete_district: DeleteDistrictInteractor, district_id: uuid.UUID
-):
-    result = await delete_district(district_id=district_id)
+async def test_delete_district(delete_district: DeleteDistrictInteractor):
+    district = DistrictDM(id=uuid.uuid4(), region_id=uuid.uuid4(), name='district')
+    delete_district._district_gateway.delete_by_uuid.return_value = district.region_id
+
+    result = await delete_district(district_id=district.id)
     delete_district._district_gateway.delete_by_uuid.assert_awaited_once_with(
-        district_id=district_id
+        district_id=district.id
+    )
+    delete_district._version_gateway.bump.assert_awaited_once_with(
+        [DISTRICTS, region_districts(district.region_id)]
     )
+    delete_district._transaction_manager.commit.assert_awaited_once_with()
+    delete_district._stats_refresher.request_refresh.assert_called_once_with()
     assert result is None
@@ -1,3 +1,4 @@
+import json
 import uuid
 from collections.abc import AsyncIterator
 
@@ -11,9 +12,12 @@ from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.dto.district import NewDistrictDTO
+from app.domain.entities.district import DistrictDM
 from app.infrastructure.db.models import District as DistrictModel
 from app.infrastructure.db.models import Region
 from app.presentation.api.district import district_router
+from app.presentation.api.encoding import DISTRICTS_ENCODER
+from app.presentation.schemas.district import District
 
 
 @pytest.fixture
@@ -42,6 +46,13 @@ async def test_get_districts(
     region_id = uuid.uuid4()
     name = faker.pystr()
 
+    await session.execute(
+        insert(Region).values(
+            id=region_id,
+            name=faker.pystr(),
+            capital=faker.pystr(),
+        )
+    )
     stmt = insert(DistrictModel).values(
         id=district_id,
         region_id=region_id,
@@ -77,6 +88,13 @@ async def test_get_districts_by_region_id(
     district_id = uuid.uuid4()
     name = faker.pystr()
 
+    await session.execute(
+        insert(Region).values(
+            id=region_id,
+            name=faker.pystr(),
+            capital=faker.pystr(),
+        )
+    )
     stmt = insert(DistrictModel).values(
         id=district_id,
         region_id=region_id,
@@ -108,6 +126,65 @@ async def test_get_empty_districts_by_region_id(
     assert result.json()['detail'] == 'District not found'
 
 
+async def test_get_districts_by_region_ids(
+    session: AsyncSession, http_client: AsyncClient, faker: Faker
+) -> None:
+    region_id = uuid.uuid4()
+    district_id = uuid.uuid4()
+    await session.execute(
+        insert(Region).values(id=region_id, name=faker.pystr(), capital=faker.pystr())
+    )
+    await session.execute(
+        insert(DistrictModel).values(
+            id=district_id, region_id=region_id, name=faker.pystr()
+        )
+    )
+    await session.commit()
+    missing_id = uuid.uuid4()
+
+    result = await http_client.post(
+        '/districts/get_districts_by_regions',
+        json=[str(region_id), str(missing_id)],
+    )
+    assert result.status_code == 200
+
+    body = result.json()
+    assert body['groups'][0]['region_id'] == str(region_id)
+    assert body['groups'][0]['districts'][0]['id'] == str(district_id)
+    assert body['missing_region_ids'] == [str(missing_id)]
+
+
+async def test_get_districts_by_region_id_not_modified(
+    session: AsyncSession, http_client: AsyncClient, faker: Faker
+) -> None:
+    region_id = uuid.uuid4()
+    other_region_id = uuid.uuid4()
+    for id_ in (region_id, other_region_id):
+        await session.execute(
+            insert(Region).values(id=id_, name=faker.pystr(), capital=faker.pystr())
+        )
+    await http_client.post(
+        '/districts/create_district',
+        json={'region_id': str(region_id), 'name': 'district'},
+    )
+    url = f'/districts/get_districts_by_region?region_id={region_id}'
+    etag = (await http_client.get(url)).headers['ETag']
+
+    # A write to another region leaves this list, and its ETag, alone.
+    await http_client.post(
+        '/districts/create_district',
+        json={'region_id': str(other_region_id), 'name': 'district'},
+    )
+    result = await http_client.get(url, headers={'If-None-Match': etag})
+    assert result.status_code == 304
+
+    result = await http_client.get(
+        '/districts/get_districts', headers={'If-None-Match': etag}
+    )
+    assert result.status_code == 200
+    assert len(result.json()) == 2
+
+
 async def test_get_district_by_id(
     session: AsyncSession,
     http_client: AsyncClient,
@@ -117,6 +194,13 @@ async def test_get_district_by_id(
     region_id = uuid.uuid4()
     name = faker.pystr()
 
+    await session.execute(
+        insert(Region).values(
+            id=region_id,
+            name=faker.pystr(),
+            capital=faker.pystr(),
+        )
+    )
     stmt = insert(DistrictModel).values(
         id=district_id,
         region_id=region_id,
@@ -219,6 +303,13 @@ async def test_delete_district(
     region_id = uuid.uuid4()
     name = faker.pystr()
 
+    await session.execute(
+        insert(Region).values(
+            id=region_id,
+            name=faker.pystr(),
+            capital=faker.pystr(),
+        )
+    )
     stmt = insert(DistrictModel).values(
         id=district_id,
         region_id=region_id,
@@ -238,3 +329,16 @@ async def test_delete_district(
     assert result_del.status_code == 200
     assert result_get.status_code == 404
     assert result_get.json()['detail'] == 'District not found'
+
+
+def test_encoder_matches_schema(faker: Faker) -> None:
+    district_dm = DistrictDM(
+        id=uuid.uuid4(), region_id=uuid.uuid4(), name=faker.pystr()
+    )
+
+    # The fast path must send what the declared response model would.
+    assert json.loads(DISTRICTS_ENCODER.dump_json([district_dm])) == [
+        json.loads(
+            District.model_validate(district_dm, from_attributes=True).model_dump_json()
+        )
+    ]
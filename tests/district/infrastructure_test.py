@@ -1,8 +1,12 @@
+import uuid
+
 import pytest
 from faker import Faker
 from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.errors import EntityNotExistsError
 from app.domain.entities.district import DistrictDM
 from app.infrastructure.db.models import District, Region
 from app.infrastructure.gateway.district import DistrictGateway
@@ -21,10 +25,23 @@ async def region_gateway(session: AsyncSession) -> RegionGateway:
     return RegionGateway(session=session)
 
 
+@pytest.fixture
+async def region_id(session: AsyncSession, faker: Faker) -> str:
+    region_id = faker.uuid4()
+    stmt = insert(Region).values(
+        id=region_id, name=faker.pystr(), capital=faker.pystr()
+    )
+    await session.execute(stmt)
+    return region_id
+
+
 async def test_create_district(
-    session: AsyncSession, district_gateway: DistrictGateway, faker: Faker
+    session: AsyncSession,
+    district_gateway: DistrictGateway,
+    region_id: str,
+    faker: Faker,
 ) -> None:
-    rg_uuid = faker.uuid4()
+    rg_uuid = region_id
 
     ds_uuid = faker.uuid4()
     ds_name = faker.pystr()
@@ -40,11 +57,14 @@ async def test_create_district(
 
 
 async def test_save_district(
-    session: AsyncSession, district_gateway: DistrictGateway, faker: Faker
+    session: AsyncSession,
+    district_gateway: DistrictGateway,
+    region_id: str,
+    faker: Faker,
 ) -> None:
     district = DistrictDM(
         id=faker.uuid4(),
-        region_id=faker.uuid4(),
+        region_id=region_id,
         name=faker.pystr(),
     )
 
@@ -56,28 +76,71 @@ async def test_save_district(
     assert result.name == district.name
 
 
-async def test_create_few_districts(
+async def test_save_duplicate_district(
+    session: AsyncSession,
+    district_gateway: DistrictGateway,
+    region_id: str,
+    faker: Faker,
+) -> None:
+    district = DistrictDM(id=faker.uuid4(), region_id=region_id, name=faker.pystr())
+    await district_gateway.save(district)
+
+    # Only a missing region is reported as one.
+    with pytest.raises(IntegrityError):
+        await district_gateway.save(district)
+
+
+async def test_save_district_region_not_exists(
     session: AsyncSession, district_gateway: DistrictGateway, faker: Faker
+) -> None:
+    district = DistrictDM(id=faker.uuid4(), region_id=faker.uuid4(), name=faker.pystr())
+
+    with pytest.raises(EntityNotExistsError):
+        await district_gateway.save(district)
+
+
+async def test_save_district_region_deleted(
+    session: AsyncSession,
+    district_gateway: DistrictGateway,
+    region_gateway: RegionGateway,
+    region_id: str,
+    faker: Faker,
+) -> None:
+    await region_gateway.delete_by_uuid(region_id)
+    district = DistrictDM(id=faker.uuid4(), region_id=region_id, name=faker.pystr())
+
+    with pytest.raises(EntityNotExistsError):
+        await district_gateway.save(district)
+
+    assert await district_gateway.get_by_uuid(district.id) is None
+
+
+async def test_create_few_districts(
+    session: AsyncSession,
+    district_gateway: DistrictGateway,
+    region_id: str,
+    faker: Faker,
 ) -> None:
     district_first = DistrictDM(
         id=faker.uuid4(),
-        region_id=faker.uuid4(),
+        region_id=region_id,
         name=faker.pystr(),
     )
 
     district_second = DistrictDM(
         id=faker.uuid4(),
-        region_id=faker.uuid4(),
+        region_id=region_id,
         name=faker.pystr(),
     )
 
     await district_gateway.save(district_first)
     await district_gateway.save(district_second)
-    result = await district_gateway.get_districts()
+    result = await district_gateway.get_districts(limit=10)
 
     assert len(result) == 2
-    assert str(result[0].id) == district_first.id
-    assert str(result[1].id) == district_second.id
+    assert [str(district.id) for district in result] == sorted(
+        [district_first.id, district_second.id]
+    )
 
 
 async def test_get_districts_by_region_id(
@@ -106,22 +169,120 @@ async def test_get_districts_by_region_id(
 
 
 async def test_delete_district(
-    session: AsyncSession, district_gateway: DistrictGateway, faker: Faker
+    session: AsyncSession,
+    district_gateway: DistrictGateway,
+    region_id: str,
+    faker: Faker,
 ) -> None:
     uuid = faker.uuid4()
-    rg_uuid = faker.uuid4()
+    rg_uuid = region_id
     name = faker.pystr()
 
     stmt = insert(District).values(id=uuid, region_id=rg_uuid, name=name)
 
     await session.execute(stmt)
 
-    await district_gateway.delete_by_uuid(uuid)
+    deleted_from = await district_gateway.delete_by_uuid(uuid)
     result = await district_gateway.get_by_uuid(uuid)
 
+    assert str(deleted_from) == rg_uuid
+    assert await district_gateway.delete_by_uuid(uuid) is None
+
     query = select(District).where(District.id == uuid)
     row = (await session.execute(query)).scalar_one_or_none()
 
     assert result is None
     assert row is not None
     assert row.is_deleted is True
+
+
+async def test_stream_districts_by_region_id(
+    session: AsyncSession,
+    district_gateway: DistrictGateway,
+    region_id: str,
+    faker: Faker,
+) -> None:
+    districts = [
+        DistrictDM(id=faker.uuid4(), region_id=region_id, name=faker.pystr())
+        for _ in range(3)
+    ]
+    for district in districts:
+        await district_gateway.save(district)
+
+    result = [
+        district
+        async for district in district_gateway.stream_districts_by_region_uuid(
+            region_id, chunk_size=2
+        )
+    ]
+
+    assert sorted(str(district.id) for district in result) == sorted(
+        district.id for district in districts
+    )
+
+
+async def test_get_existing_uuids(
+    session: AsyncSession,
+    district_gateway: DistrictGateway,
+    region_id: str,
+    faker: Faker,
+) -> None:
+    district = DistrictDM(id=uuid.uuid4(), region_id=region_id, name=faker.pystr())
+    deleted_district = DistrictDM(
+        id=uuid.uuid4(), region_id=region_id, name=faker.pystr()
+    )
+    await district_gateway.save(district)
+    await district_gateway.save(deleted_district)
+    await district_gateway.delete_by_uuid(deleted_district.id)
+
+    result = await district_gateway.get_existing_uuids(
+        [district.id, deleted_district.id, uuid.uuid4()]
+    )
+
+    assert result == {district.id}
+
+
+async def test_get_districts_by_region_ids(
+    session: AsyncSession,
+    district_gateway: DistrictGateway,
+    region_id: str,
+    faker: Faker,
+) -> None:
+    empty_region_id = uuid.uuid4()
+    await session.execute(
+        insert(Region).values(
+            id=empty_region_id, name=faker.pystr(), capital=faker.pystr()
+        )
+    )
+    district = DistrictDM(
+        id=uuid.uuid4(), region_id=uuid.UUID(region_id), name=faker.pystr()
+    )
+    deleted_district = DistrictDM(
+        id=uuid.uuid4(), region_id=uuid.UUID(region_id), name=faker.pystr()
+    )
+    await district_gateway.save(district)
+    await district_gateway.save(deleted_district)
+    await district_gateway.delete_by_uuid(deleted_district.id)
+    missing_region_id = uuid.uuid4()
+
+    result = await district_gateway.get_districts_by_region_uuids(
+        [uuid.UUID(region_id), empty_region_id, missing_region_id]
+    )
+
+    assert result == {uuid.UUID(region_id): [district], empty_region_id: []}
+
+
+async def test_get_by_uuids(
+    session: AsyncSession,
+    district_gateway: DistrictGateway,
+    region_id: str,
+    faker: Faker,
+) -> None:
+    district = DistrictDM(
+        id=uuid.uuid4(), region_id=uuid.UUID(region_id), name=faker.pystr()
+    )
+    await district_gateway.save(district)
+
+    result = await district_gateway.get_by_uuids([district.id, uuid.uuid4()])
+
+    assert result == {district.id: district}
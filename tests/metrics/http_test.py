@@ -0,0 +1,52 @@
+import uuid
+from collections.abc import AsyncIterator
+from http import HTTPStatus
+
+import pytest
+from dishka import AsyncContainer
+from dishka.integrations import fastapi as fastapi_integration
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.infrastructure.metrics.http import MetricsMiddleware
+from app.infrastructure.metrics.registry import CONTENT_TYPE
+from app.presentation.api.city import city_router
+from app.presentation.api.metrics import metrics_router
+
+
+@pytest.fixture
+async def http_app(container: AsyncContainer) -> FastAPI:
+    app = FastAPI()
+    app.include_router(city_router)
+    app.include_router(metrics_router)
+    app.add_middleware(MetricsMiddleware, container=container)
+
+    fastapi_integration.setup_dishka(container, app)
+    return app
+
+
+@pytest.fixture
+async def http_client(http_app: FastAPI) -> AsyncIterator[AsyncClient]:
+    async with AsyncClient(
+        transport=ASGITransport(app=http_app), base_url='http://test'
+    ) as client:
+        yield client
+
+
+async def test_metrics(http_client: AsyncClient) -> None:
+    await http_client.get(f'/cities/get_city_by_id?city_id={uuid.uuid4()}')
+    await http_client.get('/no/such/path')
+
+    response = await http_client.get('/metrics')
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'] == CONTENT_TYPE
+    lines = response.text.splitlines()
+    assert (
+        'http_request_duration_seconds_count'
+        '{method="GET",route="/cities/get_city_by_id"} 1'
+    ) in lines
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="unmatched"} 1'
+    ) in lines
+    assert 'cache_misses_total{cache="city"} 1' in lines
@@ -0,0 +1,121 @@
+import math
+import uuid
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import PostgresConfig
+from app.infrastructure.cache.lru import LRUCache
+from app.infrastructure.db.main import new_session_maker
+from app.infrastructure.db.pool import PoolMetrics
+from app.infrastructure.gateway.city import CityGateway
+from app.infrastructure.metrics.histogram import Histogram
+from app.infrastructure.metrics.latency import LatencyMetric
+from app.infrastructure.metrics.queries import UNKNOWN_ORIGIN
+from app.infrastructure.metrics.registry import MetricsRegistry
+
+
+@pytest.fixture
+def query_metrics() -> LatencyMetric:
+    return LatencyMetric('db_query', 'Queries.', ('gateway_method',))
+
+
+@pytest.fixture
+async def metered_session(
+    postgres_config: PostgresConfig, query_metrics: LatencyMetric
+) -> AsyncIterator[AsyncSession]:
+    session_maker = new_session_maker(postgres_config, query_metrics=query_metrics)
+    async with session_maker() as session:
+        yield session
+    await session_maker.kw['bind'].dispose()
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    histogram = Histogram(buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [(0.1, 2), (1.0, 3), (math.inf, 4)]
+    assert histogram.count == 4
+    assert histogram.sum == 2.65
+
+
+async def test_queries_are_timed_per_gateway_method(
+    metered_session: AsyncSession, query_metrics: LatencyMetric
+) -> None:
+    gateway = CityGateway(metered_session)
+
+    await gateway.get_by_uuid(uuid.uuid4())
+    async for _ in gateway.stream_cities(chunk_size=10):
+        pass
+    await metered_session.execute(text('SELECT 1'))
+
+    assert query_metrics.histograms.keys() == {
+        ('CityGateway.get_by_uuid',),
+        ('CityGateway.stream_cities',),
+        (UNKNOWN_ORIGIN,),
+    }
+    assert query_metrics.histograms[('CityGateway.get_by_uuid',)].count == 1
+
+
+async def test_failed_queries_are_counted(
+    metered_session: AsyncSession, query_metrics: LatencyMetric
+) -> None:
+    with pytest.raises(ProgrammingError):
+        await metered_session.execute(text('SELECT * FROM missing_table'))
+
+    assert query_metrics.errors == {(UNKNOWN_ORIGIN,): 1}
+
+
+def test_render() -> None:
+    registry = MetricsRegistry(PoolMetrics(), {})
+    registry.http.observe(('GET', '/cities/get_cities'), 0.003)
+    registry.http.error(('GET', '/cities/get_cities'))
+    registry.grpc.observe(('/city.CityService/GetCityById',), 0.002)
+
+    lines = registry.render().splitlines()
+
+    assert '# TYPE http_request_duration_seconds histogram' in lines
+    assert (
+        'http_request_duration_seconds_bucket'
+        '{method="GET",route="/cities/get_cities",le="0.005"} 1'
+    ) in lines
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/cities/get_cities"} 1'
+    ) in lines
+    assert (
+        'http_request_errors_total{method="GET",route="/cities/get_cities"} 1'
+    ) in lines
+    assert (
+        'grpc_request_duration_seconds_bucket'
+        '{method="/city.CityService/GetCityById",le="+Inf"} 1'
+    ) in lines
+    assert 'db_pool_checked_out 0' in lines
+    assert 'db_pool_checkout_wait_seconds_count 0' in lines
+
+
+def test_render_caches() -> None:
+    city_cache = LRUCache(max_size=1, ttl=60)
+    registry = MetricsRegistry(
+        PoolMetrics(), {'city': city_cache, 'region': LRUCache(max_size=1, ttl=60)}
+    )
+    city_cache.get('a')
+    city_cache.set('a', 1)
+    city_cache.get('a')
+    city_cache.set('b', 2)
+    city_cache.set('c', 3)
+    city_cache.invalidate('c')
+
+    lines = registry.render().splitlines()
+
+    assert '# TYPE cache_hits_total counter' in lines
+    assert 'cache_entries{cache="city"} 0' in lines
+    assert 'cache_hits_total{cache="city"} 1' in lines
+    assert 'cache_misses_total{cache="city"} 1' in lines
+    assert 'cache_evictions_total{cache="city"} 2' in lines
+    assert 'cache_invalidations_total{cache="city"} 1' in lines
+    assert 'cache_hits_total{cache="region"} 0' in lines
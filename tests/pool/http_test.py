@@ -0,0 +1,46 @@
+from collections.abc import AsyncIterator
+from http import HTTPStatus
+
+import pytest
+from dishka import AsyncContainer
+from dishka.integrations import fastapi as fastapi_integration
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.presentation.api.pool import pool_router
+
+
+@pytest.fixture
+async def http_app(container: AsyncContainer) -> FastAPI:
+    app = FastAPI()
+    app.include_router(pool_router)
+
+    fastapi_integration.setup_dishka(container, app)
+    return app
+
+
+@pytest.fixture
+async def http_client(http_app: FastAPI) -> AsyncIterator[AsyncClient]:
+    async with AsyncClient(
+        transport=ASGITransport(app=http_app), base_url='http://test'
+    ) as client:
+        yield client
+
+
+async def test_get_pool_stats(
+    container: AsyncContainer, http_client: AsyncClient
+) -> None:
+    session_maker = await container.get(async_sessionmaker[AsyncSession])
+    async with session_maker() as session:
+        await session.execute(text('SELECT 1'))
+
+    response = await http_client.get('/pool/get_pool_stats')
+
+    assert response.status_code == HTTPStatus.OK
+    stats = response.json()
+    assert stats['checked_out'] == 0
+    assert stats['checkouts'] == 1
+    assert stats['checkout_wait']['count'] == 1
+    assert stats['checkout_wait']['buckets'][-1] == {'le': '+Inf', 'count': 1}
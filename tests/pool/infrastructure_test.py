@@ -0,0 +1,83 @@
+import asyncio
+import uuid
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.config import PostgresConfig
+from app.infrastructure.db.main import new_session_maker
+from app.infrastructure.db.pool import PoolMetrics, PoolStats
+from app.infrastructure.gateway.city import CityGateway
+
+
+@pytest.fixture
+def pool_metrics() -> PoolMetrics:
+    return PoolMetrics()
+
+
+@pytest.fixture
+async def engine(
+    postgres_config: PostgresConfig, pool_metrics: PoolMetrics
+) -> AsyncIterator[AsyncEngine]:
+    config = postgres_config.model_copy(
+        update={'pool_size': 1, 'max_overflow': 0, 'statement_timeout_ms': 100}
+    )
+    engine = new_session_maker(config, pool_metrics).kw['bind']
+    yield engine
+    await engine.dispose()
+
+
+async def test_pool_stats(engine: AsyncEngine, pool_metrics: PoolMetrics) -> None:
+    async with engine.connect():
+        waiting = asyncio.create_task(engine.connect().start())
+        await asyncio.sleep(0.1)
+        busy = pool_metrics.stats()
+
+    connection = await waiting
+    await connection.close()
+
+    assert busy == PoolStats(
+        size=1,
+        checked_out=1,
+        overflow=0,
+        waiters=1,
+        checkouts=1,
+        connects=1,
+        invalidations=0,
+    )
+    assert pool_metrics.stats().waiters == 0
+    assert pool_metrics.stats().checkouts == 2
+    assert pool_metrics.checkout_wait.count == 2
+    assert pool_metrics.checkout_wait.sum >= 0.1
+
+
+async def test_statement_timeout(engine: AsyncEngine) -> None:
+    async with engine.connect() as connection:
+        with pytest.raises(OperationalError, match='statement timeout'):
+            await connection.execute(text('SELECT pg_sleep(1)'))
+
+
+@pytest.mark.parametrize(('threshold', 'prepared'), [(0, 1), (-1, 0)])
+async def test_prepare_threshold(
+    session_maker: async_sessionmaker[AsyncSession],
+    postgres_config: PostgresConfig,
+    threshold: int,
+    prepared: int,
+) -> None:
+    config = postgres_config.model_copy(update={'prepare_threshold': threshold})
+    prepared_session_maker = new_session_maker(config)
+
+    async with prepared_session_maker() as session:
+        await CityGateway(session).get_by_uuid(uuid.uuid4())
+        count = await session.scalar(
+            text(
+                'SELECT count(*) FROM pg_prepared_statements '
+                "WHERE statement LIKE 'SELECT city.id%'"
+            )
+        )
+
+    assert count == prepared
+    await prepared_session_maker.kw['bind'].dispose()
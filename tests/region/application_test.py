@@ -11,12 +11,18 @@ from app.application.interactors.region import (
     DeleteRegionInteractor,
     GetRegionByIdInteractor,
     GetRegionsInteractor,
+    GetRegionTreeInteractor,
 )
 from app.application.interface.region.region import (
     RegionDeleter,
     RegionReader,
     RegionSaver,
 )
+from app.application.interface.stats.stats import PopulationStatsRefresher
+from app.application.interface.transaction import TransactionManager
+from app.application.interface.version.version import VersionBumper
+from app.application.pagination import Page
+from app.application.versions import REGIONS
 from app.domain.entities.region import RegionDM
 
 pytestmark = pytest.mark.asyncio
@@ -29,9 +35,13 @@ def get_regions_interactor() -> GetRegionsInteractor:
 
 
 async def test_get_regions(get_regions_interactor: GetRegionsInteractor) -> None:
-    result = await get_regions_interactor()
-    get_regions_interactor._region_gateway.get_regions.assert_awaited_once_with()
-    assert result == get_regions_interactor._region_gateway.get_regions.return_value
+    get_regions_interactor._region_gateway.get_regions.return_value = []
+
+    result = await get_regions_interactor(limit=10)
+    get_regions_interactor._region_gateway.get_regions.assert_awaited_once_with(
+        limit=11, after_id=None
+    )
+    assert result == Page(items=[], next_cursor=None)
 
 
 @pytest.fixture
@@ -51,11 +61,26 @@ async def test_get_region_by_uuid(
     assert result == get_region_by_uuid._region_gateway.get_by_uuid.return_value
 
 
+@pytest.mark.parametrize('depth', [0, 1, 2])
+async def test_get_region_tree(depth: int) -> None:
+    interactor = GetRegionTreeInteractor(create_autospec(RegionReader))
+    region_id = uuid.uuid4()
+
+    result = await interactor(region_id=region_id, depth=depth)
+    interactor._region_gateway.get_tree.assert_awaited_once_with(region_id, depth)
+    assert result == interactor._region_gateway.get_tree.return_value
+
+
 @pytest.fixture
 def create_region(faker: Faker) -> CreateRegionCommand:
     region_gateway = create_autospec(RegionSaver)
     uuid_generator = MagicMock(return_value=faker.uuid4())
-    return CreateRegionCommand(region_gateway, uuid_generator)
+    return CreateRegionCommand(
+        region_gateway,
+        uuid_generator,
+        create_autospec(VersionBumper),
+        create_autospec(TransactionManager),
+    )
 
 
 async def test_create_region(create_region: CreateRegionCommand, faker: Faker) -> None:
@@ -95,7 +120,12 @@ async def test_create_same_regions(
 @pytest.fixture
 def delete_region() -> DeleteRegionInteractor:
     region_gateway = create_autospec(RegionDeleter)
-    return DeleteRegionInteractor(region_gateway)
+    return DeleteRegionInteractor(
+        region_gateway,
+        create_autospec(PopulationStatsRefresher),
+        create_autospec(VersionBumper),
+        create_autospec(TransactionManager),
+    )
 
 
 @pytest.mark.parametrize('region_id', [uuid.uuid4(), uuid.uuid4()])
@@ -106,4 +136,7 @@ async def test_delete_region(
     delete_region._region_gateway.delete_by_uuid.assert_awaited_once_with(
         region_id=region_id
     )
+    delete_region._version_gateway.bump.assert_awaited_once_with([REGIONS])
+    delete_region._transaction_manager.commit.assert_awaited_once_with()
+    delete_region._stats_refresher.request_refresh.assert_called_once_with()
     assert result is None
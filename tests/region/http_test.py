@@ -1,3 +1,4 @@
+import json
 import uuid
 from collections.abc import AsyncIterator
 
@@ -11,8 +12,11 @@ from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.dto.region import NewRegionDTO
-from app.infrastructure.db.models import Region
+from app.domain.entities.region import RegionDM
+from app.infrastructure.db.models import City, District, Region
+from app.presentation.api.encoding import REGIONS_ENCODER
 from app.presentation.api.region import region_router
+from app.presentation.schemas.region import Region as RegionSchema
 
 
 @pytest.fixture
@@ -63,6 +67,25 @@ async def test_empty_get_regions(
     assert result.json()['detail'] == 'Regions not found'
 
 
+async def test_get_regions_not_modified(http_client: AsyncClient) -> None:
+    created = await http_client.post(
+        '/region/create_region', json={'name': 'region', 'capital': 'capital'}
+    )
+    etag = (await http_client.get('/region/get_regions')).headers['ETag']
+
+    result = await http_client.get(
+        '/region/get_regions', headers={'If-None-Match': etag}
+    )
+    assert result.status_code == 304
+
+    await http_client.delete(f'/region/delete_region?region_id={created.json()}')
+
+    result = await http_client.get(
+        '/region/get_regions', headers={'If-None-Match': etag}
+    )
+    assert result.status_code == 404
+
+
 async def test_get_region_by_id(
     session: AsyncSession, http_client: AsyncClient, faker: Faker
 ) -> None:
@@ -91,6 +114,53 @@ async def test_get_empty_region_by_id(
     assert result.json()['detail'] == 'Region not found'
 
 
+async def test_get_region_tree(
+    session: AsyncSession, http_client: AsyncClient, faker: Faker
+) -> None:
+    region_id = faker.uuid4()
+    district_id = faker.uuid4()
+    city_id = faker.uuid4()
+    await session.execute(
+        insert(Region).values(id=region_id, name=faker.pystr(), capital=faker.pystr())
+    )
+    await session.execute(
+        insert(District).values(id=district_id, region_id=region_id, name='district')
+    )
+    await session.execute(
+        insert(City).values(
+            id=city_id,
+            district_id=district_id,
+            name='city',
+            obj_type='city',
+            population=100,
+        )
+    )
+    await session.commit()
+
+    result = await http_client.get(f'/region/get_region_tree?region_id={region_id}')
+    assert result.status_code == 200
+    assert result.json()['id'] == region_id
+    assert result.json()['districts'][0]['id'] == district_id
+    assert result.json()['districts'][0]['cities'][0]['id'] == city_id
+
+    result = await http_client.get(
+        f'/region/get_region_tree?region_id={region_id}&depth=1'
+    )
+    assert result.status_code == 200
+    assert result.json()['districts'][0]['cities'] is None
+
+    result = await http_client.get(
+        f'/region/get_region_tree?region_id={region_id}&depth=3'
+    )
+    assert result.status_code == 422
+
+
+async def test_get_empty_region_tree(http_client: AsyncClient) -> None:
+    result = await http_client.get(f'/region/get_region_tree?region_id={uuid.uuid4()}')
+    assert result.status_code == 404
+    assert result.json()['detail'] == 'Region not found'
+
+
 async def test_create_region(
     session: AsyncSession, http_client: AsyncClient, faker: Faker
 ) -> None:
@@ -160,3 +230,16 @@ async def test_delete_region(
 
     assert result_get.status_code == 404
     assert result_get.json()['detail'] == 'Region not found'
+
+
+def test_encoder_matches_schema(faker: Faker) -> None:
+    region_dm = RegionDM(id=uuid.uuid4(), name=faker.pystr(), capital=faker.pystr())
+
+    # The fast path must send what the declared response model would.
+    assert json.loads(REGIONS_ENCODER.dump_json([region_dm])) == [
+        json.loads(
+            RegionSchema.model_validate(
+                region_dm, from_attributes=True
+            ).model_dump_json()
+        )
+    ]
@@ -1,10 +1,12 @@
+import uuid
+
 import pytest
 from faker import Faker
 from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.region import RegionDM
-from app.infrastructure.db.models import Region
+from app.infrastructure.db.models import City, District, Region
 from app.infrastructure.gateway.region import RegionGateway
 
 pytestmark = pytest.mark.asyncio
@@ -64,11 +66,12 @@ async def test_create_few_regions(
     )
     await region_gateway.save(region_first)
     await region_gateway.save(region_second)
-    result = await region_gateway.get_regions()
+    result = await region_gateway.get_regions(limit=10)
 
     assert len(result) == 2
-    assert str(result[0].id) == region_first.id
-    assert str(result[1].id) == region_second.id
+    assert [str(region.id) for region in result] == sorted(
+        [region_first.id, region_second.id]
+    )
 
 
 async def test_exist_with_name(
@@ -106,3 +109,110 @@ async def test_delete_region(
     assert result is None
     assert row is not None
     assert row.is_deleted is True
+
+
+async def test_get_region_tree(
+    session: AsyncSession, region_gateway: RegionGateway, faker: Faker
+) -> None:
+    region_id = faker.uuid4()
+    await session.execute(
+        insert(Region).values(id=region_id, name=faker.pystr(), capital=faker.pystr())
+    )
+    district_ids = sorted(faker.uuid4() for _ in range(2))
+    deleted_district_id = faker.uuid4()
+    await session.execute(
+        insert(District),
+        [
+            {'id': district_ids[0], 'region_id': region_id, 'name': faker.pystr()},
+            {'id': district_ids[1], 'region_id': region_id, 'name': faker.pystr()},
+            {
+                'id': deleted_district_id,
+                'region_id': region_id,
+                'name': faker.pystr(),
+                'is_deleted': True,
+            },
+        ],
+    )
+    city_ids = sorted(faker.uuid4() for _ in range(2))
+    await session.execute(
+        insert(City),
+        [
+            {
+                'id': city_id,
+                'district_id': district_ids[0],
+                'name': faker.pystr(),
+                'obj_type': 'city',
+                'population': faker.pyint(),
+            }
+            for city_id in city_ids
+        ]
+        + [
+            {
+                'id': faker.uuid4(),
+                'district_id': district_ids[0],
+                'name': faker.pystr(),
+                'obj_type': 'city',
+                'population': faker.pyint(),
+                'is_deleted': True,
+            }
+        ],
+    )
+
+    tree = await region_gateway.get_tree(region_id, depth=2)
+
+    assert str(tree.id) == region_id
+    assert [str(district.id) for district in tree.districts] == district_ids
+    assert [str(city.id) for city in tree.districts[0].cities] == city_ids
+    assert tree.districts[1].cities == []
+
+    tree = await region_gateway.get_tree(region_id, depth=1)
+    assert [str(district.id) for district in tree.districts] == district_ids
+    assert all(district.cities is None for district in tree.districts)
+
+    tree = await region_gateway.get_tree(region_id, depth=0)
+    assert str(tree.id) == region_id
+    assert tree.districts is None
+
+
+async def test_get_region_tree_without_districts(
+    session: AsyncSession, region_gateway: RegionGateway, faker: Faker
+) -> None:
+    region_id = faker.uuid4()
+    await session.execute(
+        insert(Region).values(id=region_id, name=faker.pystr(), capital=faker.pystr())
+    )
+
+    tree = await region_gateway.get_tree(region_id, depth=2)
+
+    assert tree.districts == []
+
+
+async def test_get_deleted_region_tree(
+    session: AsyncSession, region_gateway: RegionGateway, faker: Faker
+) -> None:
+    region_id = faker.uuid4()
+    await session.execute(
+        insert(Region).values(
+            id=region_id, name=faker.pystr(), capital=faker.pystr(), is_deleted=True
+        )
+    )
+
+    assert await region_gateway.get_tree(region_id, depth=2) is None
+
+
+async def test_get_by_uuids(
+    session: AsyncSession, region_gateway: RegionGateway, faker: Faker
+) -> None:
+    region = RegionDM(id=uuid.uuid4(), name=faker.pystr(), capital=faker.pystr())
+    deleted_region = RegionDM(
+        id=uuid.uuid4(), name=faker.pystr(), capital=faker.pystr()
+    )
+    await region_gateway.save(region)
+    await region_gateway.save(deleted_region)
+    await region_gateway.delete_by_uuid(deleted_region.id)
+
+    result = await region_gateway.get_by_uuids(
+        [region.id, deleted_region.id, uuid.uuid4()]
+    )
+
+    assert result == {region.id: region}
@@ -0,0 +1,105 @@
+import time
+import uuid
+from collections.abc import AsyncIterator
+
+import pytest
+from dishka import AsyncContainer, Provider, make_async_container
+from dishka.integrations import fastapi as fastapi_integration
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import PlainTextResponse
+from starlette.types import Receive, Scope, Send
+
+from app.application.interactors.city import GetCityByIdInteractor
+from app.config import Config, PostgresConfig, ReplicaConfig
+from app.infrastructure.db.models import District, Region
+from app.infrastructure.replicas.http import COOKIE, ReadYourWritesMiddleware
+from app.infrastructure.replicas.routing import ReplicaReadUseCase, reads_from_replica
+from app.ioc import ReplicaRoutingProvider
+from app.presentation.api.city import city_router
+
+REGION_ID = uuid.uuid4()
+DISTRICT_ID = uuid.uuid4()
+
+
+@pytest.fixture
+async def replica_container(
+    mock_provider: Provider, test_config: Config, postgres_config: PostgresConfig
+) -> AsyncIterator[AsyncContainer]:
+    replicas = ReplicaConfig(
+        POSTGRES_REPLICA_DSNS=f'postgresql://{postgres_config.user}:{postgres_config.password}@{postgres_config.host}:{postgres_config.port}/{postgres_config.database}',
+        POSTGRES_READ_YOUR_WRITES_SECONDS=5,
+    )
+    container = make_async_container(
+        mock_provider,
+        ReplicaRoutingProvider(mock_provider),
+        context={Config: test_config.model_copy(update={'replicas': replicas})},
+    )
+    yield container
+    await container.close()
+
+
+def client(app) -> AsyncClient:
+    return AsyncClient(transport=ASGITransport(app=app), base_url='http://test')
+
+
+async def test_writes_pin_the_client(
+    replica_container: AsyncContainer, session: AsyncSession
+) -> None:
+    await session.execute(insert(Region).values(id=REGION_ID, name='r', capital='c'))
+    await session.execute(
+        insert(District).values(id=DISTRICT_ID, region_id=REGION_ID, name='d')
+    )
+    app = FastAPI()
+    app.include_router(city_router)
+    app.add_middleware(ReadYourWritesMiddleware, container=replica_container)
+    fastapi_integration.setup_dishka(replica_container, app)
+
+    async with client(app) as http_client:
+        read = await http_client.get('/cities/get_cities')
+        created = await http_client.post(
+            '/cities/create_city',
+            json={
+                'district_id': str(DISTRICT_ID),
+                'name': 'city',
+                'obj_type': 'city',
+                'population': 100,
+            },
+        )
+
+    assert COOKIE not in read.cookies
+    assert created.status_code == 200
+    pinned_until = float(created.cookies[COOKIE])
+    assert time.time() < pinned_until <= time.time() + 5
+    assert 'Max-Age=5' in created.headers['set-cookie']
+
+
+async def test_pinned_client_skips_replicas(
+    replica_container: AsyncContainer,
+) -> None:
+    async with replica_container() as request_container:
+        interactor = await request_container.get(GetCityByIdInteractor)
+    assert isinstance(interactor, ReplicaReadUseCase)
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        async def check() -> bool:
+            return reads_from_replica()
+
+        replica = await ReplicaReadUseCase(check)()
+        await PlainTextResponse(str(replica))(scope, receive, send)
+
+    app = ReadYourWritesMiddleware(app, replica_container)
+    async with client(app) as http_client:
+        fresh = await http_client.get('/')
+        pinned = await http_client.get(
+            '/', headers={'cookie': f'{COOKIE}={time.time() + 5}'}
+        )
+        expired = await http_client.get(
+            '/', headers={'cookie': f'{COOKIE}={time.time() - 1}'}
+        )
+
+    assert fresh.text == 'True'
+    assert pinned.text == 'False'
+    assert expired.text == 'True'
@@ -0,0 +1,252 @@
+import uuid
+from collections.abc import AsyncIterator
+from unittest.mock import create_autospec
+
+import pytest
+from sqlalchemy import event, literal_column, select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.config import PostgresConfig, ReplicaConfig
+from app.domain.entities.city import CityDM
+from app.infrastructure.cache.city import CachedCityGateway, CityCache
+from app.infrastructure.db.main import new_session_maker
+from app.infrastructure.db.models import City
+from app.infrastructure.gateway.city import CityGateway
+from app.infrastructure.replicas.replica_set import ReplicaSet
+from app.infrastructure.replicas.routing import (
+    PrimaryWriteUseCase,
+    ReplicaReadUseCase,
+    client_routing,
+    is_query,
+)
+
+SELECT_ONE = select(literal_column('1'))
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def database_url(config: PostgresConfig, port: int | None = None) -> str:
+    return f'postgresql://{config.user}:{config.password}@{config.host}:{port or config.port}/{config.database}'
+
+
+async def make_session_maker(
+    postgres_config: PostgresConfig, *replica_urls: str
+) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    replica_config = ReplicaConfig(POSTGRES_REPLICA_DSNS=','.join(replica_urls))
+    session_maker = new_session_maker(postgres_config, replica_config=replica_config)
+    yield session_maker
+    await session_maker.kw['bind'].dispose()
+    await session_maker.kw['replicas'].dispose()
+
+
+@pytest.fixture
+async def routed(
+    session_maker: async_sessionmaker[AsyncSession], postgres_config: PostgresConfig
+) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    # The test database stands in for its own replica.
+    async for routed in make_session_maker(
+        postgres_config, database_url(postgres_config)
+    ):
+        yield routed
+
+
+def record_queries(engine: AsyncEngine) -> list[str]:
+    statements = []
+    event.listen(
+        engine.sync_engine,
+        'before_cursor_execute',
+        lambda conn, cursor, statement, *_: statements.append(statement),
+    )
+    return statements
+
+
+async def test_round_robin_skips_ejected_replicas(
+    postgres_config: PostgresConfig,
+) -> None:
+    url = database_url(postgres_config).replace('postgresql:', 'postgresql+psycopg:')
+    first, second = create_async_engine(url), create_async_engine(url)
+    clock = Clock()
+    replicas = ReplicaSet([first, second], ejection=30, clock=clock)
+
+    assert [replicas.pick() for _ in range(3)] == [first, second, first]
+
+    replicas.eject(first)
+    assert [replicas.pick() for _ in range(2)] == [second, second]
+
+    replicas.eject(second)
+    assert replicas.pick() is None
+
+    clock.now = 30
+    assert replicas.pick() is first
+
+
+async def test_query_use_cases_read_from_replica(
+    routed: async_sessionmaker[AsyncSession],
+) -> None:
+    (replica,) = routed.kw['replicas'].engines
+    primary_queries = record_queries(routed.kw['bind'])
+    replica_queries = record_queries(replica)
+
+    async with routed() as session:
+
+        async def execute(statement) -> None:
+            await session.execute(statement)
+
+        await ReplicaReadUseCase(execute)(SELECT_ONE)
+        await PrimaryWriteUseCase(execute)(SELECT_ONE)
+        await session.rollback()
+
+    assert len(replica_queries) == 1
+    assert len(primary_queries) == 1
+
+
+async def test_reads_stay_on_primary_after_a_write(
+    routed: async_sessionmaker[AsyncSession],
+) -> None:
+    (replica,) = routed.kw['replicas'].engines
+    replica_queries = record_queries(replica)
+
+    async with routed() as session:
+
+        async def read() -> None:
+            await session.execute(SELECT_ONE)
+
+        await session.execute(
+            update(City).where(City.id == uuid.uuid4()).values(population=0)
+        )
+        await ReplicaReadUseCase(read)()
+        await session.rollback()
+
+    assert replica_queries == []
+
+
+async def test_pinned_client_reads_from_primary(
+    routed: async_sessionmaker[AsyncSession],
+) -> None:
+    (replica,) = routed.kw['replicas'].engines
+    replica_queries = record_queries(replica)
+
+    async with routed() as session:
+
+        async def read() -> None:
+            await session.execute(SELECT_ONE)
+
+        with client_routing(pinned=True) as client:
+            await ReplicaReadUseCase(read)()
+        await session.rollback()
+
+    assert replica_queries == []
+    assert not client.wrote
+
+
+async def test_stream_reads_from_replica(
+    routed: async_sessionmaker[AsyncSession],
+) -> None:
+    (replica,) = routed.kw['replicas'].engines
+    replica_queries = record_queries(replica)
+
+    async with routed() as session:
+
+        async def stream():
+            result = await session.stream(SELECT_ONE)
+            async for row in result:
+                yield row
+
+        rows = [row async for row in ReplicaReadUseCase(stream)()]
+        await session.rollback()
+
+    assert rows == [(1,)]
+    assert len(replica_queries) == 1
+
+
+async def test_writes_mark_the_client() -> None:
+    async def write() -> None:
+        pass
+
+    with client_routing(pinned=False) as client:
+        await PrimaryWriteUseCase(write)()
+
+    assert client.wrote
+
+
+async def test_unreachable_replica_is_ejected(
+    session_maker: async_sessionmaker[AsyncSession], postgres_config: PostgresConfig
+) -> None:
+    async for routed in make_session_maker(
+        postgres_config.model_copy(update={'connect_timeout': 1}),
+        database_url(postgres_config, port=1),
+    ):
+        replicas = routed.kw['replicas']
+        (replica,) = replicas.engines
+
+        async def read(session: AsyncSession) -> int:
+            return (await session.execute(SELECT_ONE)).scalar_one()
+
+        async with routed() as session:
+            with pytest.raises(OperationalError):
+                await ReplicaReadUseCase(read)(session)
+        assert replicas.is_ejected(replica)
+
+        async with routed() as session:
+            assert await ReplicaReadUseCase(read)(session) == 1
+
+
+def test_query_use_case_names() -> None:
+    class GetCityInteractor: ...
+
+    class SearchCitiesInteractor: ...
+
+    class DeleteCityInteractor: ...
+
+    class UpdateCityCommand: ...
+
+    assert is_query(GetCityInteractor)
+    assert is_query(SearchCitiesInteractor)
+    assert not is_query(DeleteCityInteractor)
+    assert not is_query(UpdateCityCommand)
+
+
+async def test_cache_keeps_replica_rows_from_pinned_clients(
+    session: AsyncSession,
+) -> None:
+    old = CityDM(
+        id=uuid.uuid4(),
+        district_id=uuid.uuid4(),
+        name='old',
+        obj_type='city',
+        population=1,
+    )
+    new = CityDM(old.id, old.district_id, 'new', old.obj_type, old.population)
+    city_gateway = create_autospec(CityGateway, instance=True)
+    cache = CityCache(max_size=10, ttl=60)
+    cached_gateway = CachedCityGateway(city_gateway, cache, session)
+    cache.set(old.id, old)
+
+    city_gateway.update_by_uuid.return_value = old.district_id
+    await cached_gateway.update_by_uuid(new)
+
+    # An unpinned read hits a replica that has not seen the update yet.
+    city_gateway.get_by_uuid.return_value = old
+    assert await ReplicaReadUseCase(cached_gateway.get_by_uuid)(old.id) == old
+    assert len(cache) == 0
+
+    # The writer reads the primary, even past a stale entry.
+    cache.set(old.id, old)
+    city_gateway.get_by_uuid.return_value = new
+    city_gateway.get_by_uuids.return_value = {new.id: new}
+    with client_routing(pinned=True):
+        read = ReplicaReadUseCase(cached_gateway.get_by_uuid)
+        assert await read(old.id) == new
+        assert await cached_gateway.get_by_uuids([old.id]) == {old.id: new}
@@ -0,0 +1,67 @@
+import logging
+import uuid
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import PostgresConfig
+from app.infrastructure.db.main import new_session_maker
+from app.infrastructure.db.slow_query import parameter_shapes
+from app.infrastructure.gateway.city import CityGateway
+
+LOGGER = 'app.infrastructure.db.slow_query'
+
+
+@pytest.fixture
+async def logged_session(
+    postgres_config: PostgresConfig,
+) -> AsyncIterator[AsyncSession]:
+    config = postgres_config.model_copy(
+        update={'slow_query_threshold_ms': 0, 'slow_query_explain': True}
+    )
+    session_maker = new_session_maker(config)
+    async with session_maker() as session:
+        yield session
+        await session.rollback()
+    await session_maker.kw['bind'].dispose()
+
+
+async def test_logs_origin_and_first_plan(
+    logged_session: AsyncSession, caplog: pytest.LogCaptureFixture
+) -> None:
+    gateway = CityGateway(logged_session)
+
+    with caplog.at_level(logging.WARNING, logger=LOGGER):
+        await gateway.get_by_uuid(uuid.uuid4())
+        await gateway.get_by_uuid(uuid.uuid4())
+
+    first, second = (record.getMessage() for record in caplog.records)
+    assert first.startswith('Slow query from CityGateway.get_by_uuid: ')
+    assert "0 rows, parameters {'city_id': 'UUID'}" in first
+    assert 'Scan' in first
+    assert 'Scan' not in second
+
+
+async def test_failed_explain_keeps_the_transaction(
+    logged_session: AsyncSession, caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.WARNING, logger=LOGGER):
+        # Explaining it fails as t2 now exists; the savepoint is rolled back.
+        await logged_session.execute(text('SELECT 1 AS id INTO TEMPORARY t2'))
+        result = await logged_session.execute(text('SELECT count(*) FROM t2'))
+
+    assert result.scalar() == 1
+    assert any(
+        record.getMessage() == 'Could not explain a slow query'
+        for record in caplog.records
+    )
+
+
+def test_parameter_shapes() -> None:
+    assert parameter_shapes({'ids': [1, 2, 3], 'name': 'x'}) == {
+        'ids': 'list[3]',
+        'name': 'str',
+    }
+    assert parameter_shapes([{'id': 1}, {'id': 2}]) == "2 x {'id': 'int'}"
@@ -0,0 +1,59 @@
+import uuid
+from unittest.mock import create_autospec
+
+import pytest
+
+from app.application.interactors.stats import (
+    GetDistrictsStatsByRegionIdInteractor,
+    GetRegionsStatsInteractor,
+    GetRegionStatsInteractor,
+)
+from app.application.interface.stats.stats import PopulationStatsReader
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def get_regions_stats() -> GetRegionsStatsInteractor:
+    stats_gateway = create_autospec(PopulationStatsReader)
+    return GetRegionsStatsInteractor(stats_gateway)
+
+
+async def test_get_regions_stats(get_regions_stats: GetRegionsStatsInteractor) -> None:
+    result = await get_regions_stats()
+
+    get_regions_stats._stats_gateway.get_regions_stats.assert_awaited_once_with()
+    assert result == get_regions_stats._stats_gateway.get_regions_stats.return_value
+
+
+@pytest.fixture
+def get_region_stats() -> GetRegionStatsInteractor:
+    stats_gateway = create_autospec(PopulationStatsReader)
+    return GetRegionStatsInteractor(stats_gateway)
+
+
+async def test_get_region_stats(get_region_stats: GetRegionStatsInteractor) -> None:
+    region_id = uuid.uuid4()
+
+    result = await get_region_stats(region_id)
+
+    get_region_stats._stats_gateway.get_region_stats.assert_awaited_once_with(region_id)
+    assert result == get_region_stats._stats_gateway.get_region_stats.return_value
+
+
+@pytest.fixture
+def get_districts_stats() -> GetDistrictsStatsByRegionIdInteractor:
+    stats_gateway = create_autospec(PopulationStatsReader)
+    return GetDistrictsStatsByRegionIdInteractor(stats_gateway)
+
+
+async def test_get_districts_stats(
+    get_districts_stats: GetDistrictsStatsByRegionIdInteractor,
+) -> None:
+    region_id = uuid.uuid4()
+    stats_gateway = get_districts_stats._stats_gateway
+
+    result = await get_districts_stats(region_id)
+
+    stats_gateway.get_districts_stats_by_region_uuid.assert_awaited_once_with(region_id)
+    assert result == stats_gateway.get_districts_stats_by_region_uuid.return_value
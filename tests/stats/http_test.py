@@ -0,0 +1,100 @@
+import uuid
+from collections.abc import AsyncIterator
+
+import pytest
+from dishka import AsyncContainer
+from dishka.integrations import fastapi as fastapi_integration
+from faker import Faker
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.db.models import City, District, Region
+from app.infrastructure.gateway.stats import PopulationStatsGateway
+from app.presentation.api.stats import stats_router
+
+
+@pytest.fixture
+async def http_app(container: AsyncContainer) -> FastAPI:
+    app = FastAPI()
+    app.include_router(stats_router)
+
+    fastapi_integration.setup_dishka(container, app)
+    return app
+
+
+@pytest.fixture
+async def http_client(http_app: FastAPI) -> AsyncIterator[AsyncClient]:
+    async with AsyncClient(
+        transport=ASGITransport(app=http_app), base_url='http://test'
+    ) as client:
+        yield client
+
+
+async def test_get_stats(
+    session: AsyncSession, http_client: AsyncClient, faker: Faker
+) -> None:
+    region_id = faker.uuid4()
+    district_id = faker.uuid4()
+    await session.execute(
+        insert(Region).values(id=region_id, name=faker.pystr(), capital=faker.pystr())
+    )
+    await session.execute(
+        insert(District).values(id=district_id, region_id=region_id, name='district')
+    )
+    await session.execute(
+        insert(City).values(
+            id=faker.uuid4(),
+            district_id=district_id,
+            name='city',
+            obj_type='city',
+            population=100,
+        )
+    )
+    await PopulationStatsGateway(session).refresh()
+
+    expected_by_obj_type = [{'obj_type': 'city', 'city_count': 1, 'population': 100}]
+
+    result = await http_client.get('/stats/get_regions_stats')
+    assert result.status_code == 200
+    assert result.json() == [
+        {
+            'region_id': region_id,
+            'city_count': 1,
+            'population': 100,
+            'by_obj_type': expected_by_obj_type,
+        }
+    ]
+
+    result = await http_client.get(f'/stats/get_region_stats?region_id={region_id}')
+    assert result.status_code == 200
+    assert result.json()['population'] == 100
+
+    result = await http_client.get(f'/stats/get_districts_stats?region_id={region_id}')
+    assert result.status_code == 200
+    assert result.json() == [
+        {
+            'district_id': district_id,
+            'region_id': region_id,
+            'city_count': 1,
+            'population': 100,
+            'by_obj_type': expected_by_obj_type,
+        }
+    ]
+
+
+async def test_get_stats_not_found(http_client: AsyncClient) -> None:
+    result = await http_client.get('/stats/get_regions_stats')
+    assert result.status_code == 404
+    assert result.json()['detail'] == 'Regions not found'
+
+    result = await http_client.get(f'/stats/get_region_stats?region_id={uuid.uuid4()}')
+    assert result.status_code == 404
+    assert result.json()['detail'] == 'Region not found'
+
+    result = await http_client.get(
+        f'/stats/get_districts_stats?region_id={uuid.uuid4()}'
+    )
+    assert result.status_code == 404
+    assert result.json()['detail'] == 'Districts not found'
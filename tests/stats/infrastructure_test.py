@@ -0,0 +1,187 @@
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.dto.stats import (
+    DistrictStatsDTO,
+    ObjTypeStatsDTO,
+    RegionStatsDTO,
+)
+from app.infrastructure.db.models import City, District, Region
+from app.infrastructure.gateway.stats import PopulationStatsGateway
+from app.infrastructure.stats.refresher import DebouncedStatsRefresher
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+async def stats_gateway(session: AsyncSession) -> PopulationStatsGateway:
+    return PopulationStatsGateway(session=session)
+
+
+@pytest.fixture
+async def region_id(session: AsyncSession) -> uuid.UUID:
+    region_id = uuid.uuid4()
+    await session.execute(
+        insert(Region).values(id=region_id, name='region', capital='capital')
+    )
+    return region_id
+
+
+async def add_district(session: AsyncSession, region_id: uuid.UUID) -> uuid.UUID:
+    district_id = uuid.uuid4()
+    await session.execute(
+        insert(District).values(id=district_id, region_id=region_id, name='district')
+    )
+    return district_id
+
+
+async def add_city(
+    session: AsyncSession,
+    district_id: uuid.UUID,
+    obj_type: str | None,
+    population: int | None,
+) -> uuid.UUID:
+    city_id = uuid.uuid4()
+    await session.execute(
+        insert(City).values(
+            id=city_id,
+            district_id=district_id,
+            name='city',
+            obj_type=obj_type,
+            population=population,
+        )
+    )
+    return city_id
+
+
+async def test_region_stats(
+    session: AsyncSession,
+    stats_gateway: PopulationStatsGateway,
+    region_id: uuid.UUID,
+) -> None:
+    first_district = await add_district(session, region_id)
+    second_district = await add_district(session, region_id)
+    await add_city(session, first_district, 'city', 100)
+    await add_city(session, first_district, 'village', 10)
+    await add_city(session, second_district, 'city', 200)
+    await add_city(session, second_district, None, None)
+    await stats_gateway.refresh()
+
+    result = await stats_gateway.get_region_stats(region_id)
+
+    assert result == RegionStatsDTO(
+        region_id=region_id,
+        city_count=4,
+        population=310,
+        by_obj_type=[
+            ObjTypeStatsDTO(obj_type='city', city_count=2, population=300),
+            ObjTypeStatsDTO(obj_type='village', city_count=1, population=10),
+            ObjTypeStatsDTO(obj_type=None, city_count=1, population=0),
+        ],
+    )
+
+
+async def test_region_stats_without_cities(
+    stats_gateway: PopulationStatsGateway, region_id: uuid.UUID
+) -> None:
+    await stats_gateway.refresh()
+
+    assert await stats_gateway.get_region_stats(region_id) == RegionStatsDTO(
+        region_id=region_id
+    )
+    assert await stats_gateway.get_regions_stats() == [
+        RegionStatsDTO(region_id=region_id)
+    ]
+
+
+async def test_region_stats_deleted_region(
+    session: AsyncSession,
+    stats_gateway: PopulationStatsGateway,
+    region_id: uuid.UUID,
+) -> None:
+    await session.execute(
+        update(Region).where(Region.id == region_id).values(is_deleted=True)
+    )
+    await stats_gateway.refresh()
+
+    assert await stats_gateway.get_region_stats(region_id) is None
+    assert await stats_gateway.get_regions_stats() == []
+
+
+async def test_stats_are_stale_until_refresh(
+    session: AsyncSession,
+    stats_gateway: PopulationStatsGateway,
+    region_id: uuid.UUID,
+) -> None:
+    district_id = await add_district(session, region_id)
+    city_id = await add_city(session, district_id, 'city', 100)
+    await stats_gateway.refresh()
+
+    await session.execute(
+        update(City).where(City.id == city_id).values(is_deleted=True)
+    )
+    stale = await stats_gateway.get_region_stats(region_id)
+    await stats_gateway.refresh()
+    fresh = await stats_gateway.get_region_stats(region_id)
+
+    assert stale.population == 100
+    assert fresh == RegionStatsDTO(region_id=region_id)
+
+
+async def test_districts_stats(
+    session: AsyncSession,
+    stats_gateway: PopulationStatsGateway,
+    region_id: uuid.UUID,
+) -> None:
+    district_id = await add_district(session, region_id)
+    empty_district_id = await add_district(session, region_id)
+    deleted_district_id = await add_district(session, region_id)
+    await add_city(session, district_id, 'city', 100)
+    await add_city(session, deleted_district_id, 'city', 100)
+    await session.execute(
+        update(District)
+        .where(District.id == deleted_district_id)
+        .values(is_deleted=True)
+    )
+    await stats_gateway.refresh()
+
+    result = await stats_gateway.get_districts_stats_by_region_uuid(region_id)
+
+    assert sorted(result, key=lambda stats: stats.district_id) == sorted(
+        [
+            DistrictStatsDTO(
+                district_id=district_id,
+                region_id=region_id,
+                city_count=1,
+                population=100,
+                by_obj_type=[
+                    ObjTypeStatsDTO(obj_type='city', city_count=1, population=100)
+                ],
+            ),
+            DistrictStatsDTO(district_id=empty_district_id, region_id=region_id),
+        ],
+        key=lambda stats: stats.district_id,
+    )
+    region_stats = await stats_gateway.get_region_stats(region_id)
+    assert region_stats.population == 100
+
+
+async def test_refresher_coalesces_requests(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    refresher = DebouncedStatsRefresher(session_maker, delay=0.01)
+
+    for _ in range(5):
+        refresher.request_refresh()
+    await asyncio.sleep(0.2)
+
+    assert refresher.refreshes == 1
+
+    refresher.request_refresh()
+    await refresher.close()
+
+    assert refresher.refreshes == 2
@@ -0,0 +1,68 @@
+import uuid
+from collections.abc import AsyncIterator
+
+import pytest
+from dishka import AsyncContainer, Provider, make_async_container
+from dishka.integrations import fastapi as fastapi_integration
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.config import Config, TracingConfig
+from app.infrastructure.tracing.exporters import InMemorySpanExporter
+from app.infrastructure.tracing.http import TracingMiddleware
+from app.infrastructure.tracing.tracer import Tracer
+from app.ioc import TracingProvider
+from app.presentation.api.city import city_router
+
+TRACE_ID = '4bf92f3577b34da6a3ce929d0e0e4736'
+SPAN_ID = '00f067aa0ba902b7'
+
+
+@pytest.fixture
+async def traced_container(
+    mock_provider: Provider, test_config: Config
+) -> AsyncIterator[AsyncContainer]:
+    config = test_config.model_copy(
+        update={'tracing': TracingConfig(TRACING_EXPORTER='memory')}
+    )
+    container = make_async_container(
+        mock_provider, TracingProvider(mock_provider), context={Config: config}
+    )
+    yield container
+    await container.close()
+
+
+@pytest.fixture
+async def http_client(
+    traced_container: AsyncContainer,
+) -> AsyncIterator[AsyncClient]:
+    app = FastAPI()
+    app.include_router(city_router)
+    app.add_middleware(TracingMiddleware, container=traced_container)
+    fastapi_integration.setup_dishka(traced_container, app)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url='http://test'
+    ) as client:
+        yield client
+
+
+async def test_request_spans(
+    traced_container: AsyncContainer, http_client: AsyncClient
+) -> None:
+    await http_client.get(
+        f'/cities/get_city_by_id?city_id={uuid.uuid4()}',
+        headers={'traceparent': f'00-{TRACE_ID}-{SPAN_ID}-01'},
+    )
+
+    tracer = await traced_container.get(Tracer)
+    (exporter,) = tracer.exporters
+    assert isinstance(exporter, InMemorySpanExporter)
+    interactor, server = exporter.spans
+    assert server.name == 'GET /cities/get_city_by_id'
+    assert server.kind == 'server'
+    assert server.parent_id == SPAN_ID
+    assert server.attributes['http.response.status_code'] == 404
+    assert interactor.name == 'GetCityByIdInteractor'
+    assert interactor.parent_id == server.context.span_id
+    assert interactor.context.trace_id == TRACE_ID
@@ -0,0 +1,118 @@
+import json
+import uuid
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import PostgresConfig
+from app.infrastructure.db.main import new_session_maker
+from app.infrastructure.gateway.city import CityGateway
+from app.infrastructure.tracing.exporters import (
+    InMemorySpanExporter,
+    JsonLinesSpanExporter,
+)
+from app.infrastructure.tracing.propagation import (
+    format_traceparent,
+    parse_traceparent,
+)
+from app.infrastructure.tracing.span import SpanContext
+from app.infrastructure.tracing.tracer import Tracer
+
+TRACE_ID = '4bf92f3577b34da6a3ce929d0e0e4736'
+SPAN_ID = '00f067aa0ba902b7'
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer(exporter: InMemorySpanExporter) -> Tracer:
+    return Tracer([exporter])
+
+
+@pytest.fixture
+async def traced_session(
+    postgres_config: PostgresConfig, tracer: Tracer
+) -> AsyncIterator[AsyncSession]:
+    session_maker = new_session_maker(postgres_config, tracer=tracer)
+    async with session_maker() as session:
+        yield session
+    await session_maker.kw['bind'].dispose()
+
+
+def test_traceparent_round_trip() -> None:
+    context = parse_traceparent(f'00-{TRACE_ID}-{SPAN_ID}-01')
+
+    assert context == SpanContext(TRACE_ID, SPAN_ID, sampled=True)
+    assert format_traceparent(context) == f'00-{TRACE_ID}-{SPAN_ID}-01'
+
+
+@pytest.mark.parametrize(
+    'value',
+    [None, 'garbage', f'00-{"0" * 32}-{SPAN_ID}-01', f'01-{TRACE_ID}-{SPAN_ID}-01'],
+)
+def test_invalid_traceparent_is_ignored(value: str | None) -> None:
+    assert parse_traceparent(value) is None
+
+
+def test_nested_spans(tracer: Tracer, exporter: InMemorySpanExporter) -> None:
+    parent = SpanContext(TRACE_ID, SPAN_ID)
+
+    with pytest.raises(ValueError):
+        with tracer.span('outer', parent=parent) as outer:
+            with tracer.span('inner'):
+                pass
+            raise ValueError
+
+    inner, finished_outer = exporter.spans
+    assert finished_outer is outer
+    assert outer.context.trace_id == inner.context.trace_id == TRACE_ID
+    assert outer.parent_id == SPAN_ID
+    assert inner.parent_id == outer.context.span_id
+    assert outer.error == 'ValueError'
+    assert inner.error is None
+
+
+def test_unsampled_traces_are_not_exported(
+    tracer: Tracer, exporter: InMemorySpanExporter
+) -> None:
+    with tracer.span('request', parent=SpanContext(TRACE_ID, SPAN_ID, False)):
+        with tracer.span('query'):
+            pass
+
+    assert exporter.spans == []
+
+
+def test_json_lines_exporter(tmp_path: Path) -> None:
+    path = tmp_path / 'traces.jsonl'
+    tracer = Tracer([JsonLinesSpanExporter(path)])
+
+    with tracer.span('request', attributes={'http.route': '/cities'}):
+        pass
+    tracer.close()
+
+    (line,) = path.read_text().splitlines()
+    span = json.loads(line)
+    assert span['name'] == 'request'
+    assert span['parentSpanId'] == ''
+    assert span['attributes'] == {'http.route': '/cities'}
+    assert span['status'] == {'code': 'OK'}
+    assert span['endTimeUnixNano'] >= span['startTimeUnixNano']
+
+
+async def test_queries_are_traced(
+    traced_session: AsyncSession, tracer: Tracer, exporter: InMemorySpanExporter
+) -> None:
+    with tracer.span('request') as request:
+        await CityGateway(traced_session).get_by_uuid(uuid.uuid4())
+
+    query, _ = exporter.spans
+    assert query.name == 'SQL SELECT'
+    assert query.kind == 'client'
+    assert query.parent_id == request.context.span_id
+    assert query.attributes['code.function'] == 'CityGateway.get_by_uuid'
+    assert query.attributes['db.rowcount'] == 0
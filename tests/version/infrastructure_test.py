@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.gateway.version import VersionGateway
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+async def version_gateway(session: AsyncSession) -> VersionGateway:
+    return VersionGateway(session=session)
+
+
+async def test_get_unknown_version(version_gateway: VersionGateway) -> None:
+    assert await version_gateway.get_version('unknown') == 0
+
+
+async def test_bump(version_gateway: VersionGateway) -> None:
+    await version_gateway.bump(['first', 'second'])
+    await version_gateway.bump(['first', 'first'])
+
+    assert await version_gateway.get_version('first') == 2
+    assert await version_gateway.get_version('second') == 1
+
+
+async def test_bump_nothing(version_gateway: VersionGateway) -> None:
+    await version_gateway.bump([])
+
+    assert not version_gateway._session.in_transaction()
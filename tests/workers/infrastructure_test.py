@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from app.config import Config, HttpConfig, PostgresConfig
+from app.infrastructure.db.main import split_pool
+from app.infrastructure.workers.supervisor import WorkerSupervisor
+from app.main import http_worker_config
+
+
+def exit_with_error() -> None:
+    raise SystemExit(1)
+
+
+async def test_restarts_exited_workers() -> None:
+    supervisor = WorkerSupervisor(exit_with_error, (), workers=2, check_interval=0.05)
+    task = asyncio.create_task(supervisor.run())
+
+    async with asyncio.timeout(30):
+        while supervisor.restarts < 2:
+            await asyncio.sleep(0.05)
+    supervisor.stop()
+    await task
+
+    assert supervisor.restarts >= 2
+
+
+def test_split_pool(postgres_config: PostgresConfig) -> None:
+    config = postgres_config.model_copy(update={'pool_size': 15, 'max_overflow': 15})
+
+    split = split_pool(config, workers=4)
+
+    assert (split.pool_size, split.max_overflow) == (3, 3)
+    assert split.pool_size * 4 + split.max_overflow * 4 <= 30
+
+
+def test_split_pool_rejects_more_workers_than_connections(
+    postgres_config: PostgresConfig,
+) -> None:
+    config = postgres_config.model_copy(update={'pool_size': 2, 'max_overflow': 0})
+
+    with pytest.raises(ValueError, match='POSTGRES_POOL_SIZE'):
+        split_pool(config, workers=4)
+
+
+def test_http_workers_do_not_cache_entities(test_config: Config) -> None:
+    config = test_config.model_copy(update={'http': HttpConfig(HTTP_WORKERS=3)})
+
+    worker_config = http_worker_config(config)
+
+    assert worker_config.cache.max_size == 0
+    assert worker_config.postgres.pool_size == config.postgres.pool_size // 3